@@ -1,3 +1,4 @@
+import asyncio
 import shutil
 import subprocess
 from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple, Type, Union
@@ -6,6 +7,12 @@ from pydantic import Field, InstanceOf, PrivateAttr, model_validator
 
 from crewai.agents import CacheHandler
 from crewai.agents.agent_builder.base_agent import BaseAgent
+from crewai.agents.context_window import (
+    CompactionPolicy,
+    MessageWindow,
+    SummarizeObservations,
+    TruncateObservations,
+)
 from crewai.agents.crew_agent_executor import CrewAgentExecutor
 from crewai.knowledge.knowledge import Knowledge
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
@@ -17,12 +24,11 @@ from crewai.security import Fingerprint
 from crewai.task import Task
 from crewai.tools import BaseTool
 from crewai.tools.agent_tools.agent_tools import AgentTools
+from crewai.tools.tool_registry import ToolRegistry
 from crewai.utilities import Converter, Prompts
 from crewai.utilities.agent_utils import (
-    get_tool_names,
     load_agent_from_repository,
     parse_tools,
-    render_text_description_and_args,
 )
 from crewai.utilities.constants import TRAINED_AGENTS_DATA_FILE, TRAINING_DATA_FILE
 from crewai.utilities.converter import generate_model_description
@@ -62,6 +68,7 @@ class Agent(BaseAgent):
             function_calling_llm: The language model that will handle the tool calling for this agent, it overrides the crew function_calling_llm.
             max_iter: Maximum number of iterations for an agent to execute a task.
             max_rpm: Maximum number of requests per minute for the agent execution to be respected.
+            max_tpm: Maximum number of LLM tokens per minute for the agent execution to be respected.
             verbose: Whether the agent execution should be in verbose mode.
             allow_delegation: Whether the agent is allowed to delegate tasks to other agents.
             tools: Tools at agents disposal
@@ -107,6 +114,12 @@ class Agent(BaseAgent):
         default=True,
         description="Keep messages under the context window size by summarizing content.",
     )
+    context_compaction: Optional[
+        Union[Literal["truncate", "summarize"], InstanceOf[CompactionPolicy]]
+    ] = Field(
+        default=None,
+        description="Compact older messages before each request so it fits the context window: 'truncate' their tool observations, 'summarize' them in the background, or a custom CompactionPolicy.",
+    )
     max_retry_limit: int = Field(
         default=2,
         description="Maximum number of retries for an agent to execute a task when an error occurs.",
@@ -249,6 +262,103 @@ class Agent(BaseAgent):
             ValueError: If the max execution time is not a positive integer.
             RuntimeError: If the agent execution fails for other reasons.
         """
+        task_prompt = self._prepare_task_execution(task, context, tools)
+
+        try:
+            crewai_event_bus.emit(
+                self,
+                event=AgentExecutionStartedEvent(
+                    agent=self,
+                    tools=self.tools,
+                    task_prompt=task_prompt,
+                    task=task,
+                ),
+            )
+
+            # Determine execution method based on timeout setting
+            if self.max_execution_time is not None:
+                self._validate_max_execution_time()
+                result = self._execute_with_timeout(
+                    task_prompt, task, self.max_execution_time
+                )
+            else:
+                result = self._execute_without_timeout(task_prompt, task)
+
+        except Exception as e:
+            self._handle_execution_error(task, e)
+            result = self.execute_task(task, context, tools)
+
+        return self._complete_task_execution(task, result)
+
+    async def aexecute_task(
+        self,
+        task: Task,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> str:
+        """Execute a task with the agent on the running event loop.
+
+        The agent loop awaits the LLM and tools natively. Preparing the prompt,
+        which may search memories and knowledge, runs in a worker thread.
+
+        Args:
+            task: Task to execute.
+            context: Context to execute the task in.
+            tools: Tools to use for the task.
+
+        Returns:
+            Output of the agent
+
+        Raises:
+            TimeoutError: If execution exceeds the maximum execution time.
+            ValueError: If the max execution time is not a positive integer.
+        """
+        task_prompt = await asyncio.to_thread(
+            self._prepare_task_execution, task, context, tools
+        )
+
+        try:
+            crewai_event_bus.emit(
+                self,
+                event=AgentExecutionStartedEvent(
+                    agent=self,
+                    tools=self.tools,
+                    task_prompt=task_prompt,
+                    task=task,
+                ),
+            )
+
+            if self.max_execution_time is not None:
+                self._validate_max_execution_time()
+                try:
+                    result = await asyncio.wait_for(
+                        self._aexecute_without_timeout(task_prompt, task),
+                        timeout=self.max_execution_time,
+                    )
+                except asyncio.TimeoutError:
+                    raise TimeoutError(
+                        f"Task '{task.description}' execution timed out after {self.max_execution_time} seconds. Consider increasing max_execution_time or optimizing the task."
+                    )
+            else:
+                result = await self._aexecute_without_timeout(task_prompt, task)
+
+        except Exception as e:
+            self._handle_execution_error(task, e)
+            result = await self.aexecute_task(task, context, tools)
+
+        return self._complete_task_execution(task, result)
+
+    def _prepare_task_execution(
+        self,
+        task: Task,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> str:
+        """Build the task prompt and the agent executor for a task execution.
+
+        Returns:
+            The prompt to send to the agent.
+        """
         if self.reasoning:
             try:
                 from crewai.utilities.reasoning_handler import (
@@ -309,6 +419,7 @@ class Agent(BaseAgent):
                 self.crew._entity_memory,
                 self.crew._user_memory,
                 self.crew._external_memory,
+                memory_writer=self.crew._memory_writer,
             )
             memory = contextual_memory.build_context_for_task(task, context)
             if memory.strip() != "":
@@ -384,69 +495,45 @@ class Agent(BaseAgent):
         else:
             task_prompt = self._use_trained_data(task_prompt=task_prompt)
 
-        try:
+        return task_prompt
+
+    def _validate_max_execution_time(self) -> None:
+        if not isinstance(self.max_execution_time, int) or self.max_execution_time <= 0:
+            raise ValueError(
+                "Max Execution time must be a positive integer greater than zero"
+            )
+
+    def _handle_execution_error(self, task: Task, error: Exception) -> None:
+        """Emit the error event and re-raise unless the execution should be retried.
+
+        Timeouts and litellm errors are never retried.
+        """
+        if isinstance(error, TimeoutError) or error.__class__.__module__.startswith(
+            "litellm"
+        ):
             crewai_event_bus.emit(
                 self,
-                event=AgentExecutionStartedEvent(
+                event=AgentExecutionErrorEvent(
                     agent=self,
-                    tools=self.tools,
-                    task_prompt=task_prompt,
                     task=task,
+                    error=str(error),
                 ),
             )
-
-            # Determine execution method based on timeout setting
-            if self.max_execution_time is not None:
-                if (
-                    not isinstance(self.max_execution_time, int)
-                    or self.max_execution_time <= 0
-                ):
-                    raise ValueError(
-                        "Max Execution time must be a positive integer greater than zero"
-                    )
-                result = self._execute_with_timeout(
-                    task_prompt, task, self.max_execution_time
-                )
-            else:
-                result = self._execute_without_timeout(task_prompt, task)
-
-        except TimeoutError as e:
-            # Propagate TimeoutError without retry
+            raise error
+        self._times_executed += 1
+        if self._times_executed > self.max_retry_limit:
             crewai_event_bus.emit(
                 self,
                 event=AgentExecutionErrorEvent(
                     agent=self,
                     task=task,
-                    error=str(e),
+                    error=str(error),
                 ),
             )
-            raise e
-        except Exception as e:
-            if e.__class__.__module__.startswith("litellm"):
-                # Do not retry on litellm errors
-                crewai_event_bus.emit(
-                    self,
-                    event=AgentExecutionErrorEvent(
-                        agent=self,
-                        task=task,
-                        error=str(e),
-                    ),
-                )
-                raise e
-            self._times_executed += 1
-            if self._times_executed > self.max_retry_limit:
-                crewai_event_bus.emit(
-                    self,
-                    event=AgentExecutionErrorEvent(
-                        agent=self,
-                        task=task,
-                        error=str(e),
-                    ),
-                )
-                raise e
-            result = self.execute_task(task, context, tools)
+            raise error
 
-        if self.max_rpm and self._rpm_controller:
+    def _complete_task_execution(self, task: Task, result: str) -> str:
+        if self._rpm_controller:
             self._rpm_controller.stop_rpm_counter()
 
         # If there was any tool in self.tools_results that had result_as_answer
@@ -513,6 +600,26 @@ class Agent(BaseAgent):
             }
         )["output"]
 
+    async def _aexecute_without_timeout(self, task_prompt: str, task: Task) -> str:
+        """Execute a task through the agent executor's async loop.
+
+        Args:
+            task_prompt: The prompt to send to the agent.
+            task: The task being executed.
+
+        Returns:
+            The output of the agent.
+        """
+        result = await self.agent_executor.ainvoke(
+            {
+                "input": task_prompt,
+                "tool_names": self.agent_executor.tools_names,
+                "tools": self.agent_executor.tools_description,
+                "ask_for_human_input": task.human_input,
+            }
+        )
+        return result["output"]
+
     def create_agent_executor(
         self, tools: Optional[List[BaseTool]] = None, task=None
     ) -> None:
@@ -541,6 +648,7 @@ class Agent(BaseAgent):
                 self.response_template.split("{{ .Response }}")[1].strip()
             )
 
+        tool_registry = ToolRegistry(parsed_tools)
         self.agent_executor = CrewAgentExecutor(
             llm=self.llm,
             task=task,
@@ -552,15 +660,49 @@ class Agent(BaseAgent):
             stop_words=stop_words,
             max_iter=self.max_iter,
             tools_handler=self.tools_handler,
-            tools_names=get_tool_names(parsed_tools),
-            tools_description=render_text_description_and_args(parsed_tools),
+            tools_names=tool_registry.names,
+            tools_description=tool_registry.description,
+            tool_registry=tool_registry,
+            context_window=self._create_context_window(),
             step_callback=self.step_callback,
             function_calling_llm=self.function_calling_llm,
             respect_context_window=self.respect_context_window,
             request_within_rpm_limit=(
                 self._rpm_controller.check_or_wait if self._rpm_controller else None
             ),
-            callbacks=[TokenCalcHandler(self._token_process)],
+            arequest_within_rpm_limit=(
+                self._rpm_controller.acquire if self._rpm_controller else None
+            ),
+            callbacks=[
+                TokenCalcHandler(self._token_process, rpm_controller=self._rpm_controller)
+            ],
+        )
+
+    def _create_context_window(self) -> Optional[MessageWindow]:
+        """Create the window keeping the messages of a task within the context window."""
+        if self.context_compaction is None:
+            return None
+        if self.context_compaction == "truncate":
+            policy: CompactionPolicy = TruncateObservations()
+        elif self.context_compaction == "summarize":
+            policy = SummarizeObservations(
+                llm=self.llm,
+                i18n=self.i18n,
+                callbacks=[
+                    TokenCalcHandler(
+                        self._token_process, rpm_controller=self._rpm_controller
+                    )
+                ],
+                request_within_rpm_limit=(
+                    self._rpm_controller.check_or_wait
+                    if self._rpm_controller
+                    else None
+                ),
+            )
+        else:
+            policy = self.context_compaction
+        return MessageWindow(
+            max_tokens=self.llm.get_context_window_size(), policy=policy
         )
 
     def get_delegation_tools(self, agents: List[BaseAgent]):
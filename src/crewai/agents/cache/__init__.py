@@ -1,3 +1,9 @@
+from .backends import CacheBackend, InMemoryCacheBackend, SQLiteCacheBackend
 from .cache_handler import CacheHandler
 
-__all__ = ["CacheHandler"]
+__all__ = [
+    "CacheBackend",
+    "CacheHandler",
+    "InMemoryCacheBackend",
+    "SQLiteCacheBackend",
+]
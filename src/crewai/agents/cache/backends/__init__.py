@@ -0,0 +1,5 @@
+from crewai.agents.cache.backends.base import CacheBackend
+from crewai.agents.cache.backends.memory import InMemoryCacheBackend
+from crewai.agents.cache.backends.sqlite import SQLiteCacheBackend
+
+__all__ = ["CacheBackend", "InMemoryCacheBackend", "SQLiteCacheBackend"]
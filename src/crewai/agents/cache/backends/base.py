@@ -0,0 +1,49 @@
+"""Base class for tool result cache backends."""
+
+import abc
+from typing import Any, Optional
+
+
+class CacheBackend(abc.ABC):
+    """Abstract base class for tool result cache backends.
+
+    A backend stores opaque values under string keys. Key derivation, TTL
+    selection and the decision of what gets cached are handled by
+    ``CacheHandler``; backends only need to honour the expiry they are given
+    and enforce their own size limits.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key``, or None on a miss or expiry.
+
+        Args:
+            key: Cache key produced by ``CacheHandler``
+        """
+        pass
+
+    @abc.abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key``.
+
+        Args:
+            key: Cache key produced by ``CacheHandler``
+            value: Tool output to cache
+            ttl: Seconds until the entry expires, or None to keep it until evicted
+        """
+        pass
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove ``key`` from the cache if present."""
+        pass
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        pass
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        """Return the number of entries currently stored."""
+        pass
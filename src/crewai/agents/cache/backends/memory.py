@@ -0,0 +1,172 @@
+"""In-process tool result cache backend with bounded size."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Literal, Optional
+
+from crewai.agents.cache.backends.base import CacheBackend
+
+EvictionPolicy = Literal["lru", "lfu"]
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the memory footprint of a cached value in bytes."""
+    if isinstance(value, bytes):
+        return len(value)
+    return len(str(value).encode("utf-8"))
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "size", "hits")
+
+    def __init__(self, value: Any, expires_at: Optional[float], size: int) -> None:
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.hits = 1
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Thread-safe in-memory cache with entry/byte limits and LRU or LFU eviction.
+
+    LRU keeps entries in access order. LFU keeps one access-ordered bucket per
+    hit count, so ties between equally used entries are broken by recency.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        eviction_policy: EvictionPolicy = "lru",
+    ) -> None:
+        """Initialize the in-memory backend.
+
+        Args:
+            max_entries: Maximum number of entries to keep, unbounded if None.
+                Defaults to 1024.
+            max_bytes: Maximum total size of stored values, unbounded if None.
+                Defaults to 64 MiB.
+            eviction_policy: "lru" evicts the least recently used entry first,
+                "lfu" the least frequently used one.
+
+        Raises:
+            ValueError: If the eviction policy is unknown or a limit is not positive
+        """
+        if eviction_policy not in ("lru", "lfu"):
+            raise ValueError(
+                f"eviction_policy must be 'lru' or 'lfu', got {eviction_policy!r}"
+            )
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.eviction_policy = eviction_policy
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._frequencies: Dict[int, "OrderedDict[str, None]"] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def total_bytes(self) -> int:
+        """Total estimated size of the stored values."""
+        return self._total_bytes
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._touch(key, entry)
+            return entry.value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        size = estimate_size(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            entry = _Entry(value, expires_at, size)
+            self._entries[key] = entry
+            self._total_bytes += size
+            if self.eviction_policy == "lfu":
+                self._frequencies.setdefault(1, OrderedDict())[key] = None
+            self._evict(protected=key)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._frequencies.clear()
+            self._total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _touch(self, key: str, entry: _Entry) -> None:
+        if self.eviction_policy == "lru":
+            self._entries.move_to_end(key)
+            return
+        bucket = self._frequencies[entry.hits]
+        del bucket[key]
+        if not bucket:
+            del self._frequencies[entry.hits]
+        entry.hits += 1
+        self._frequencies.setdefault(entry.hits, OrderedDict())[key] = None
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.size
+        if self.eviction_policy == "lfu":
+            bucket = self._frequencies[entry.hits]
+            del bucket[key]
+            if not bucket:
+                del self._frequencies[entry.hits]
+
+    def _next_victim(self, protected: str) -> str:
+        if self.eviction_policy == "lru":
+            return next(iter(self._entries))
+        for hits in sorted(self._frequencies):
+            for key in self._frequencies[hits]:
+                if key != protected:
+                    return key
+        return protected
+
+    def _over_capacity(self) -> bool:
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self._total_bytes > self.max_bytes
+
+    def _evict(self, protected: str) -> None:
+        # The entry that was just written is only dropped as a last resort, so
+        # LFU does not immediately discard new keys that start with one hit.
+        while self._entries and self._over_capacity():
+            self._remove(self._next_victim(protected))
@@ -0,0 +1,178 @@
+"""
+SQLite-based tool result cache backend.
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from crewai.agents.cache.backends.base import CacheBackend
+from crewai.agents.cache.backends.memory import EvictionPolicy, estimate_size
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """SQLite-based tool result cache that survives restarts.
+
+    The database runs in WAL mode so several processes on the same node can
+    read and write one warm cache concurrently, through the shared connection
+    pool of the database file. Values are stored as JSON;
+    outputs that are not JSON serializable are stored as their string form.
+    """
+
+    db_path: str
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        eviction_policy: EvictionPolicy = "lru",
+        timeout: float = 30.0,
+    ) -> None:
+        """Initialize SQLite cache backend.
+
+        Args:
+            db_path: Path to the SQLite database file. If not provided, uses
+                    db_storage_path() from utilities.paths.
+            max_entries: Maximum number of entries to keep, unbounded if None.
+            max_bytes: Maximum total size of stored values, unbounded if None.
+            eviction_policy: "lru" or "lfu".
+            timeout: Seconds to wait for a lock held by another process.
+
+        Raises:
+            ValueError: If the eviction policy is unknown
+        """
+        from crewai.utilities.paths import db_storage_path
+        from crewai.utilities.sqlite_pool import get_pool
+
+        if eviction_policy not in ("lru", "lfu"):
+            raise ValueError(
+                f"eviction_policy must be 'lru' or 'lfu', got {eviction_policy!r}"
+            )
+
+        self.db_path = db_path or str(Path(db_storage_path()) / "tool_cache.db")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.eviction_policy = eviction_policy
+        self.timeout = timeout
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._pool = get_pool(self.db_path, timeout=timeout)
+        self.init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return self._pool.connection()
+
+    def init_db(self) -> None:
+        """Create the cache table."""
+        with self._connect() as conn:
+            conn.execute(
+                """
+            CREATE TABLE IF NOT EXISTS tool_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL,
+                last_access REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 1
+            )
+            """
+            )
+            conn.execute(
+                """
+            CREATE INDEX IF NOT EXISTS idx_tool_cache_last_access
+            ON tool_cache(last_access)
+            """
+            )
+            conn.execute(
+                """
+            CREATE INDEX IF NOT EXISTS idx_tool_cache_hits
+            ON tool_cache(hits, last_access)
+            """
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, expires_at FROM tool_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                conn.execute("DELETE FROM tool_cache WHERE key = ?", (key,))
+                return None
+            conn.execute(
+                "UPDATE tool_cache SET last_access = ?, hits = hits + 1 WHERE key = ?",
+                (now, key),
+            )
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        try:
+            serialized = json.dumps(value)
+        except (TypeError, ValueError):
+            serialized = json.dumps(str(value))
+        size = estimate_size(serialized)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._connect() as conn:
+            conn.execute(
+                """
+            INSERT OR REPLACE INTO tool_cache (
+                key, value, size, expires_at, last_access, hits
+            ) VALUES (?, ?, ?, ?, ?, 1)
+            """,
+                (key, serialized, size, expires_at, now),
+            )
+            self._evict(conn, protected=key, now=now)
+
+    def delete(self, key: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM tool_cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM tool_cache")
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM tool_cache").fetchone()
+        return count
+
+    def _evict(self, conn: sqlite3.Connection, protected: str, now: float) -> None:
+        if self.max_entries is None and self.max_bytes is None:
+            return
+
+        conn.execute(
+            "DELETE FROM tool_cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (now,),
+        )
+        count, total = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM tool_cache"
+        ).fetchone()
+        order = (
+            "last_access ASC"
+            if self.eviction_policy == "lru"
+            else "hits ASC, last_access ASC"
+        )
+        victims = conn.execute(
+            f"SELECT key, size FROM tool_cache WHERE key != ? ORDER BY {order}",  # nosec
+            (protected,),
+        )
+        to_delete = []
+        for victim_key, victim_size in victims:
+            over_entries = self.max_entries is not None and count > self.max_entries
+            over_bytes = self.max_bytes is not None and total > self.max_bytes
+            if not (over_entries or over_bytes):
+                break
+            to_delete.append((victim_key,))
+            count -= 1
+            total -= victim_size
+        if to_delete:
+            conn.executemany("DELETE FROM tool_cache WHERE key = ?", to_delete)
@@ -1,15 +1,88 @@
+import ast
+import hashlib
+import json
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel, Field, InstanceOf
+
+from crewai.agents.cache.backends import CacheBackend, InMemoryCacheBackend
 
 
 class CacheHandler(BaseModel):
-    """Callback handler for tool usage."""
+    """Callback handler for tool usage.
+
+    Tool results are stored in a pluggable backend under a key derived from the
+    tool name and a canonical hash of its arguments, so argument order and
+    formatting do not affect cache hits.
+    """
 
-    _cache: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    backend: InstanceOf[CacheBackend] = Field(
+        default_factory=InMemoryCacheBackend,
+        description="Backend storing the cached tool results.",
+    )
+    ttl: Optional[float] = Field(
+        default=None,
+        description="Default time-to-live in seconds for cached results, None to never expire.",
+    )
+    tool_ttls: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-tool time-to-live in seconds, overriding the default ttl.",
+    )
 
     def add(self, tool, input, output):
-        self._cache[f"{tool}-{input}"] = output
+        self.backend.set(self.make_key(tool, input), output, ttl=self._ttl_for(tool))
 
     def read(self, tool, input) -> Optional[str]:
-        return self._cache.get(f"{tool}-{input}")
+        return self.backend.get(self.make_key(tool, input))
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    @staticmethod
+    def make_key(tool: str, input: Any) -> str:
+        """Build the cache key for a tool call.
+
+        String inputs holding a JSON or Python literal object or list are
+        parsed first, so ``'{"a": 1, "b": 2}'`` and ``{"b": 2, "a": 1}`` share
+        one entry. Other strings are kept as they are, so ``"1"`` and ``1``
+        do not. Inputs that cannot be serialized canonically are hashed as
+        they were given.
+        """
+        parsed = CacheHandler._parse_input(input) if isinstance(input, str) else input
+        try:
+            if not CacheHandler._has_string_keys(parsed):
+                # json.dumps would turn 1 and "1" into the same key
+                raise TypeError("keys are not all strings")
+            canonical = json.dumps(
+                parsed, sort_keys=True, separators=(",", ":"), default=str
+            )
+        except (TypeError, ValueError, RecursionError):
+            # Not valid JSON, so it never collides with a canonical key
+            canonical = f"raw:{input if isinstance(input, str) else repr(input)}"
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return f"{tool}-{digest}"
+
+    @staticmethod
+    def _parse_input(input: str) -> Any:
+        for parse in (json.loads, ast.literal_eval):
+            try:
+                parsed = parse(input)
+            except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+                continue
+            if isinstance(parsed, (dict, list)):
+                return parsed
+        return input
+
+    @staticmethod
+    def _has_string_keys(value: Any) -> bool:
+        if isinstance(value, dict):
+            return all(
+                isinstance(key, str) and CacheHandler._has_string_keys(item)
+                for key, item in value.items()
+            )
+        if isinstance(value, (list, tuple)):
+            return all(CacheHandler._has_string_keys(item) for item in value)
+        return True
+
+    def _ttl_for(self, tool: str) -> Optional[float]:
+        return self.tool_ttls.get(tool, self.ttl)
@@ -0,0 +1,276 @@
+"""Token budgeted message history of an agent."""
+
+import math
+import weakref
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from crewai.utilities.i18n import I18N
+from crewai.utilities.logger import Logger
+
+Message = Dict[str, Any]
+
+# Role, separators and formatting tokens every chat message costs
+MESSAGE_OVERHEAD_TOKENS = 4
+# Conservative, so that estimates err on the side of compacting early
+CHARS_PER_TOKEN = 3
+TRUNCATED_MARKER = "\n[... truncated to fit the context window]"
+OBSERVATION = "Observation:"
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Threads writing summaries in the background, shared by every agent."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="crewai-context-summary"
+        )
+    return _executor
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of ``text``, used when no tokenizer is given."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _content(message: Message) -> str:
+    content = message.get("content") or ""
+    return content if isinstance(content, str) else str(content)
+
+
+def _with_content(message: Message, content: str) -> Message:
+    return {**message, "content": content}
+
+
+class CompactionPolicy(ABC):
+    """Strategy shrinking the older messages of a conversation.
+
+    ``compact`` runs before every request of the agent, so policies can
+    prepare ahead of time. It should only replace or remove the messages in
+    ``MessageWindow.compactable``, and leave the budget to the window, which
+    truncates whatever the policy left over it.
+    """
+
+    @abstractmethod
+    def compact(self, messages: List[Message], window: "MessageWindow") -> None:
+        """Shrink ``messages`` in place towards ``window.max_tokens``.
+
+        Args:
+            messages: Messages of the conversation, oldest first
+            window: Window tracking the token counts of the messages
+        """
+        pass
+
+
+class TruncateObservations(CompactionPolicy):
+    """Cut the tool observations of older messages, then drop the oldest.
+
+    Args:
+        keep_chars: Characters of each observation kept, or of the whole
+            message when it holds no observation.
+    """
+
+    def __init__(self, keep_chars: int = 500) -> None:
+        self.keep_chars = keep_chars
+
+    def compact(self, messages: List[Message], window: "MessageWindow") -> None:
+        over = window.total(messages) - window.max_tokens
+        for index in window.compactable(messages):
+            if over <= 0:
+                return
+            message = messages[index]
+            content = _content(message)
+            truncated = self._truncate(content)
+            if truncated is not content:
+                before = window.count(message)
+                messages[index] = _with_content(message, truncated)
+                over -= before - window.count(messages[index])
+
+        while over > 0 and window.compactable(messages):
+            over -= window.count(messages.pop(window.pinned))
+
+    def _truncate(self, content: str) -> str:
+        if content.endswith(TRUNCATED_MARKER):
+            return content
+        start = content.find(OBSERVATION)
+        keep = self.keep_chars + (start + len(OBSERVATION) if start != -1 else 0)
+        if len(content) <= keep + len(TRUNCATED_MARKER):
+            return content
+        return content[:keep] + TRUNCATED_MARKER
+
+
+class SummarizeObservations(CompactionPolicy):
+    """Summarize the older messages in a background thread.
+
+    Once the conversation uses ``start_ratio`` of the budget, the messages
+    outside the pinned prefix and the recent window are summarized while the
+    agent keeps working. The summary replaces them before a later request,
+    unless they changed in the meantime. A request that would exceed the
+    budget waits for the summary in flight.
+
+    Args:
+        llm: LLM writing the summaries.
+        i18n: Prompts of the summaries.
+        callbacks: Callbacks of the summarization calls.
+        start_ratio: Share of the budget from which summaries are prepared.
+        request_within_rpm_limit: Called before every summarization call to
+            wait for the rate limits of the agent.
+    """
+
+    def __init__(
+        self,
+        llm: Any,
+        i18n: Optional[I18N] = None,
+        callbacks: Optional[List[Any]] = None,
+        start_ratio: float = 0.6,
+        request_within_rpm_limit: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        self.llm = llm
+        self.i18n = i18n or I18N()
+        self.callbacks = callbacks or []
+        self.start_ratio = start_ratio
+        self.request_within_rpm_limit = request_within_rpm_limit
+        self._logger = Logger()
+        self._jobs: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def compact(self, messages: List[Message], window: "MessageWindow") -> None:
+        total = window.total(messages)
+        job = self._jobs.get(window)
+        if job is not None and (job[1].done() or total > window.max_tokens):
+            del self._jobs[window]
+            self._apply(messages, *job)
+            total = window.total(messages)
+            job = None
+
+        compactable = window.compactable(messages)
+        if job is None and compactable and total > window.max_tokens * self.start_ratio:
+            snapshot = [messages[index] for index in compactable]
+            if len(snapshot) > 1 or not self._is_summary(snapshot[0]):
+                self._jobs[window] = (snapshot, self._summarize(snapshot))
+
+    def _summarize(self, snapshot: List[Message]) -> "Future[Message]":
+        from crewai.utilities.agent_utils import summarize_messages
+
+        def run() -> Message:
+            summary = [dict(message) for message in snapshot]
+            summarize_messages(
+                summary,
+                self.llm,
+                self.callbacks,
+                self.i18n,
+                request_within_rpm_limit=self.request_within_rpm_limit,
+            )
+            return summary[0]
+
+        return _get_executor().submit(run)
+
+    def _apply(
+        self, messages: List[Message], snapshot: List[Message], future: Future
+    ) -> None:
+        try:
+            summary = future.result()
+        except Exception as e:
+            self._logger.log("error", f"Failed to summarize messages: {e}")
+            return
+
+        positions = {id(message): index for index, message in enumerate(messages)}
+        indexes = [positions.get(id(message)) for message in snapshot]
+        start = indexes[0]
+        if start is None or indexes != list(range(start, start + len(snapshot))):
+            return
+        messages[start : start + len(snapshot)] = [summary]
+
+    def _is_summary(self, message: Message) -> bool:
+        prefix = self.i18n.slice("summary").split("{merged_summary}")[0]
+        return _content(message).startswith(prefix)
+
+
+class MessageWindow:
+    """Keep the messages of an agent within a token budget.
+
+    Token counts are computed once per message and cached, so checking the
+    budget before a request only counts the messages added since the last
+    one. The first ``pinned`` messages, the system prompt and the task, are
+    never compacted, and neither are the ``keep_recent`` latest ones while
+    the older messages can make room. Older messages are handed to the
+    compaction policy; whatever still exceeds the budget afterwards is
+    truncated, the oldest messages first.
+
+    Args:
+        max_tokens: Token budget of the messages of a request.
+        policy: Policy compacting the older messages.
+        tokenizer: Function counting the tokens of a text. Defaults to
+            ``estimate_tokens``.
+        keep_recent: Number of latest messages kept as they are.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int,
+        policy: Optional[CompactionPolicy] = None,
+        tokenizer: Optional[Callable[[str], int]] = None,
+        keep_recent: int = 4,
+    ) -> None:
+        self.max_tokens = max_tokens
+        self.policy = policy or TruncateObservations()
+        self.tokenizer = tokenizer or estimate_tokens
+        self.keep_recent = keep_recent
+        self.pinned = 0
+        self._counts: Dict[int, Tuple[Any, int]] = {}
+
+    def pin(self, count: int) -> None:
+        """Never compact the first ``count`` messages."""
+        self.pinned = count
+
+    def count(self, message: Message) -> int:
+        """Tokens of ``message``, counted once per content."""
+        content = message.get("content")
+        cached = self._counts.get(id(message))
+        if cached is not None and cached[0] is content:
+            return cached[1]
+        tokens = self.tokenizer(_content(message)) + MESSAGE_OVERHEAD_TOKENS
+        self._counts[id(message)] = (content, tokens)
+        return tokens
+
+    def total(self, messages: List[Message]) -> int:
+        """Tokens of all ``messages``."""
+        return sum(self.count(message) for message in messages)
+
+    def compactable(self, messages: List[Message]) -> range:
+        """Indexes of the messages between the pinned prefix and the recent window."""
+        return range(self.pinned, max(self.pinned, len(messages) - self.keep_recent))
+
+    def fit(self, messages: List[Message]) -> None:
+        """Compact ``messages`` in place so they fit in the budget."""
+        self.policy.compact(messages, self)
+        over = self.total(messages) - self.max_tokens
+        if over > 0 and not isinstance(self.policy, TruncateObservations):
+            TruncateObservations().compact(messages, self)
+            over = self.total(messages) - self.max_tokens
+        # The recent messages themselves are too long, typically a huge observation
+        for index in range(self.pinned, len(messages)):
+            if over <= 0:
+                break
+            before = self.count(messages[index])
+            messages[index] = self._clip(messages[index], max(before - over, 0))
+            over -= before - self.count(messages[index])
+
+        if len(self._counts) > 2 * len(messages) + 16:
+            live = {id(message) for message in messages}
+            self._counts = {
+                key: value for key, value in self._counts.items() if key in live
+            }
+
+    def _clip(self, message: Message, tokens: int) -> Message:
+        content = _content(message)
+        count = self.count(message)
+        keep = len(content)
+        while count > tokens and keep > 0:
+            keep = min(keep - 1, int(keep * tokens / count) - len(TRUNCATED_MARKER))
+            keep = max(keep, 0)
+            message = _with_content(message, content[:keep] + TRUNCATED_MARKER)
+            count = self.count(message)
+        return message
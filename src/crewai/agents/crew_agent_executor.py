@@ -1,19 +1,36 @@
-from typing import Any, Callable, Dict, List, Optional, Union
+import asyncio
+import contextlib
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Union,
+)
 
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.agents.agent_builder.base_agent_executor_mixin import CrewAgentExecutorMixin
+from crewai.agents.context_window import MessageWindow
 from crewai.agents.parser import (
     AgentAction,
     AgentFinish,
     OutputParserException,
+    ReActStreamDetector,
 )
 from crewai.agents.tools_handler import ToolsHandler
-from crewai.llm import BaseLLM
+from crewai.llm import BaseLLM, stop_stream_when
+from crewai.memory.memory_writer import MemoryWriter
 from crewai.tools.base_tool import BaseTool
 from crewai.tools.structured_tool import CrewStructuredTool
+from crewai.tools.tool_registry import ToolRegistry
 from crewai.tools.tool_types import ToolResult
 from crewai.utilities import I18N, Printer
 from crewai.utilities.agent_utils import (
+    aenforce_rpm_limit,
+    aget_llm_response,
     enforce_rpm_limit,
     format_message_for_llm,
     get_llm_response,
@@ -25,10 +42,14 @@ from crewai.utilities.agent_utils import (
     has_reached_max_iterations,
     is_context_length_exceeded,
     process_llm_response,
+    summarize_messages,
 )
 from crewai.utilities.constants import MAX_LLM_RETRY, TRAINING_DATA_FILE
 from crewai.utilities.logger import Logger
-from crewai.utilities.tool_utils import execute_tool_and_check_finality
+from crewai.utilities.tool_utils import (
+    aexecute_tool_and_check_finality,
+    execute_tool_and_check_finality,
+)
 from crewai.utilities.training_handler import CrewTrainingHandler
 from crewai.utilities.events.agent_events import (
     AgentLogsStartedEvent,
@@ -59,6 +80,9 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         respect_context_window: bool = False,
         request_within_rpm_limit: Optional[Callable[[], bool]] = None,
         callbacks: List[Any] = [],
+        arequest_within_rpm_limit: Optional[Callable[[], Awaitable[bool]]] = None,
+        tool_registry: Optional[ToolRegistry] = None,
+        context_window: Optional[MessageWindow] = None,
     ):
         self._i18n: I18N = I18N()
         self.llm: BaseLLM = llm
@@ -67,6 +91,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self.crew = crew
         self.prompt = prompt
         self.tools = tools
+        self.tool_registry = tool_registry or ToolRegistry(tools)
         self.tools_names = tools_names
         self.stop = stop_words
         self.max_iter = max_iter
@@ -79,7 +104,9 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self.tools_description = tools_description
         self.function_calling_llm = function_calling_llm
         self.respect_context_window = respect_context_window
+        self.context_window = context_window
         self.request_within_rpm_limit = request_within_rpm_limit
+        self.arequest_within_rpm_limit = arequest_within_rpm_limit
         self.ask_for_human_input = False
         self.messages: List[Dict[str, str]] = []
         self.iterations = 0
@@ -97,14 +124,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         )
 
     def invoke(self, inputs: Dict[str, str]) -> Dict[str, Any]:
-        if "system" in self.prompt:
-            system_prompt = self._format_prompt(self.prompt.get("system", ""), inputs)
-            user_prompt = self._format_prompt(self.prompt.get("user", ""), inputs)
-            self.messages.append(format_message_for_llm(system_prompt, role="system"))
-            self.messages.append(format_message_for_llm(user_prompt))
-        else:
-            user_prompt = self._format_prompt(self.prompt.get("prompt", ""), inputs)
-            self.messages.append(format_message_for_llm(user_prompt))
+        self._setup_messages(inputs)
 
         self._show_start_logs()
 
@@ -129,10 +149,94 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         if self.ask_for_human_input:
             formatted_answer = self._handle_human_feedback(formatted_answer)
 
+        self._save_to_memory(formatted_answer)
+        return {"output": formatted_answer.output}
+
+    async def ainvoke(self, inputs: Dict[str, str]) -> Dict[str, Any]:
+        """Asynchronous counterpart of ``invoke``.
+
+        LLM calls and tool invocations are awaited on the running event loop, so
+        many agent loops can share one thread. Human feedback prompts and memory
+        writes are blocking by nature and run in a worker thread.
+        """
+        self._setup_messages(inputs)
+
+        self._show_start_logs()
+
+        self.ask_for_human_input = bool(inputs.get("ask_for_human_input", False))
+
+        try:
+            formatted_answer = await self._ainvoke_loop()
+        except AssertionError:
+            self._printer.print(
+                content="Agent failed to reach a final answer. This is likely a bug - please report it.",
+                color="red",
+            )
+            raise
+        except Exception as e:
+            handle_unknown_error(self._printer, e)
+            raise e
+
+        if self.ask_for_human_input:
+            formatted_answer = await asyncio.to_thread(
+                self._handle_human_feedback, formatted_answer
+            )
+
+        await asyncio.to_thread(self._save_to_memory, formatted_answer)
+        return {"output": formatted_answer.output}
+
+    def _setup_messages(self, inputs: Dict[str, str]) -> None:
+        if "system" in self.prompt:
+            system_prompt = self._format_prompt(self.prompt.get("system", ""), inputs)
+            user_prompt = self._format_prompt(self.prompt.get("user", ""), inputs)
+            self.messages.append(format_message_for_llm(system_prompt, role="system"))
+            self.messages.append(format_message_for_llm(user_prompt))
+        else:
+            user_prompt = self._format_prompt(self.prompt.get("prompt", ""), inputs)
+            self.messages.append(format_message_for_llm(user_prompt))
+        if self.context_window is not None:
+            self.context_window.pin(len(self.messages))
+
+    def _fit_context_window(self) -> None:
+        """Compact the messages so the next request fits the context window.
+
+        Without a window, an oversized request is only handled once the LLM
+        rejects it, by summarizing all the messages.
+        """
+        if self.context_window is not None:
+            self.context_window.fit(self.messages)
+
+    def _stop_stream_at_action(self) -> ContextManager[None]:
+        """End streamed responses as soon as they hold a complete action.
+
+        The tool is then called right away, instead of after the tokens the
+        model generates until the stop word, or until its end for models not
+        supporting stop words.
+        """
+        if not getattr(self.llm, "stream", False):
+            return contextlib.nullcontext()
+        return stop_stream_when(ReActStreamDetector().feed)
+
+    def _save_to_memory(self, formatted_answer: AgentFinish) -> None:
+        writer = getattr(self.crew, "_memory_writer", None)
+        if isinstance(writer, MemoryWriter):
+            # The executor belongs to this task, so the job saves with its agent and task
+            writer.submit(
+                lambda: self._write_memories(formatted_answer),
+                memories=[
+                    self.crew._short_term_memory,
+                    self.crew._long_term_memory,
+                    self.crew._entity_memory,
+                    self.crew._external_memory,
+                ],
+            )
+            return
+        self._write_memories(formatted_answer)
+
+    def _write_memories(self, formatted_answer: AgentFinish) -> None:
         self._create_short_term_memory(formatted_answer)
         self._create_long_term_memory(formatted_answer)
         self._create_external_memory(formatted_answer)
-        return {"output": formatted_answer.output}
 
     def _invoke_loop(self) -> AgentFinish:
         """
@@ -154,39 +258,20 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
 
                 enforce_rpm_limit(self.request_within_rpm_limit)
 
-                answer = get_llm_response(
-                    llm=self.llm,
-                    messages=self.messages,
-                    callbacks=self.callbacks,
-                    printer=self._printer,
-                )
+                self._fit_context_window()
+                with self._stop_stream_at_action():
+                    answer = get_llm_response(
+                        llm=self.llm,
+                        messages=self.messages,
+                        callbacks=self.callbacks,
+                        printer=self._printer,
+                    )
                 formatted_answer = process_llm_response(answer, self.use_stop_words)
 
                 if isinstance(formatted_answer, AgentAction):
-                    # Extract agent fingerprint if available
-                    fingerprint_context = {}
-                    if (
-                        self.agent
-                        and hasattr(self.agent, "security_config")
-                        and hasattr(self.agent.security_config, "fingerprint")
-                    ):
-                        fingerprint_context = {
-                            "agent_fingerprint": str(
-                                self.agent.security_config.fingerprint
-                            )
-                        }
-
                     tool_result = execute_tool_and_check_finality(
                         agent_action=formatted_answer,
-                        fingerprint_context=fingerprint_context,
-                        tools=self.tools,
-                        i18n=self._i18n,
-                        agent_key=self.agent.key if self.agent else None,
-                        agent_role=self.agent.role if self.agent else None,
-                        tools_handler=self.tools_handler,
-                        task=self.task,
-                        agent=self.agent,
-                        function_calling_llm=self.function_calling_llm,
+                        **self._tool_execution_kwargs(),
                     )
                     formatted_answer = self._handle_agent_action(
                         formatted_answer, tool_result
@@ -232,6 +317,114 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self._show_logs(formatted_answer)
         return formatted_answer
 
+    async def _ainvoke_loop(self) -> AgentFinish:
+        """
+        Asynchronous counterpart of ``_invoke_loop``. The rarely taken recovery
+        paths that summarize messages or force a final answer run in a worker
+        thread.
+        """
+        formatted_answer = None
+        while not isinstance(formatted_answer, AgentFinish):
+            try:
+                if has_reached_max_iterations(self.iterations, self.max_iter):
+                    formatted_answer = await asyncio.to_thread(
+                        handle_max_iterations_exceeded,
+                        formatted_answer,
+                        printer=self._printer,
+                        i18n=self._i18n,
+                        messages=self.messages,
+                        llm=self.llm,
+                        callbacks=self.callbacks,
+                    )
+
+                await aenforce_rpm_limit(
+                    self.request_within_rpm_limit, self.arequest_within_rpm_limit
+                )
+
+                if self.context_window is not None:
+                    # May wait for a summary written in the background
+                    await asyncio.to_thread(self._fit_context_window)
+                with self._stop_stream_at_action():
+                    answer = await aget_llm_response(
+                        llm=self.llm,
+                        messages=self.messages,
+                        callbacks=self.callbacks,
+                        printer=self._printer,
+                    )
+                formatted_answer = process_llm_response(answer, self.use_stop_words)
+
+                if isinstance(formatted_answer, AgentAction):
+                    tool_result = await aexecute_tool_and_check_finality(
+                        agent_action=formatted_answer,
+                        **self._tool_execution_kwargs(),
+                    )
+                    formatted_answer = self._handle_agent_action(
+                        formatted_answer, tool_result
+                    )
+
+                self._invoke_step_callback(formatted_answer)
+                self._append_message(formatted_answer.text, role="assistant")
+
+            except OutputParserException as e:
+                formatted_answer = handle_output_parser_exception(
+                    e=e,
+                    messages=self.messages,
+                    iterations=self.iterations,
+                    log_error_after=self.log_error_after,
+                    printer=self._printer,
+                )
+
+            except Exception as e:
+                if e.__class__.__module__.startswith("litellm"):
+                    # Do not retry on litellm errors
+                    raise e
+                if is_context_length_exceeded(e):
+                    await asyncio.to_thread(
+                        handle_context_length,
+                        respect_context_window=self.respect_context_window,
+                        printer=self._printer,
+                        messages=self.messages,
+                        llm=self.llm,
+                        callbacks=self.callbacks,
+                        i18n=self._i18n,
+                    )
+                    continue
+                else:
+                    handle_unknown_error(self._printer, e)
+                    raise e
+            finally:
+                self.iterations += 1
+
+        assert isinstance(formatted_answer, AgentFinish)
+        self._show_logs(formatted_answer)
+        return formatted_answer
+
+    def _tool_execution_kwargs(self) -> Dict[str, Any]:
+        """Arguments shared by the sync and async tool execution helpers."""
+        # Extract agent fingerprint if available
+        fingerprint_context = {}
+        if (
+            self.agent
+            and hasattr(self.agent, "security_config")
+            and hasattr(self.agent.security_config, "fingerprint")
+        ):
+            fingerprint_context = {
+                "agent_fingerprint": str(self.agent.security_config.fingerprint)
+            }
+
+        return {
+            "fingerprint_context": fingerprint_context,
+            "tools": self.tools,
+            "i18n": self._i18n,
+            "agent_key": self.agent.key if self.agent else None,
+            "agent_role": self.agent.role if self.agent else None,
+            "tools_handler": self.tools_handler,
+            "task": self.task,
+            "agent": self.agent,
+            "function_calling_llm": self.function_calling_llm,
+            "tool_registry": self.tool_registry,
+        }
+
     def _handle_agent_action(
         self, formatted_answer: AgentAction, tool_result: ToolResult
     ) -> Union[AgentAction, AgentFinish]:
@@ -267,6 +460,8 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         """Show logs for the start of agent execution."""
         if self.agent is None:
             raise ValueError("Agent cannot be None")
+        if not crewai_event_bus.has_listeners(AgentLogsStartedEvent):
+            return
 
         crewai_event_bus.emit(
             self.agent,
@@ -284,6 +479,8 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         """Show logs for the agent's execution."""
         if self.agent is None:
             raise ValueError("Agent cannot be None")
+        if not crewai_event_bus.has_listeners(AgentLogsExecutionEvent):
+            return
 
         crewai_event_bus.emit(
             self.agent,
@@ -296,37 +493,13 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         )
 
     def _summarize_messages(self) -> None:
-        messages_groups = []
-        for message in self.messages:
-            content = message["content"]
-            cut_size = self.llm.get_context_window_size()
-            for i in range(0, len(content), cut_size):
-                messages_groups.append({"content": content[i : i + cut_size]})
-
-        summarized_contents = []
-        for group in messages_groups:
-            summary = self.llm.call(
-                [
-                    format_message_for_llm(
-                        self._i18n.slice("summarizer_system_message"), role="system"
-                    ),
-                    format_message_for_llm(
-                        self._i18n.slice("summarize_instruction").format(
-                            group=group["content"]
-                        ),
-                    ),
-                ],
-                callbacks=self.callbacks,
-            )
-            summarized_contents.append({"content": str(summary)})
-
-        merged_summary = " ".join(content["content"] for content in summarized_contents)
-
-        self.messages = [
-            format_message_for_llm(
-                self._i18n.slice("summary").format(merged_summary=merged_summary)
-            )
-        ]
+        summarize_messages(
+            self.messages,
+            self.llm,
+            self.callbacks,
+            self._i18n,
+            request_within_rpm_limit=self.request_within_rpm_limit,
+        )
 
     def _handle_crew_training_output(
         self, result: AgentFinish, human_feedback: Optional[str] = None
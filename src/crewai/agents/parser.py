@@ -1,5 +1,6 @@
+import json
 import re
-from typing import Any, Optional, Union
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
 
 from json_repair import repair_json
 
@@ -10,6 +11,10 @@ MISSING_ACTION_AFTER_THOUGHT_ERROR_MESSAGE = "I did it wrong. Invalid Format: I
 MISSING_ACTION_INPUT_AFTER_ACTION_ERROR_MESSAGE = "I did it wrong. Invalid Format: I missed the 'Action Input:' after 'Action:'. I will do right next, and don't use a tool I have already used.\n"
 FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE = "I did it wrong. Tried to both perform Action and give a Final Answer at the same time, I must do one or the other"
 
+_ACTION = re.compile(r"Action\s*\d*\s*:")
+_ACTION_INPUT = re.compile(r"Action\s*\d*\s*Input\s*\d*\s*:")
+UNABLE_TO_REPAIR_JSON_RESULTS = ['""', "{}"]
+
 
 class AgentAction:
     thought: str
@@ -18,11 +23,20 @@ class AgentAction:
     text: str
     result: str
 
-    def __init__(self, thought: str, tool: str, tool_input: str, text: str):
+    def __init__(
+        self,
+        thought: str,
+        tool: str,
+        tool_input: str,
+        text: str,
+        arguments: Optional[Dict[str, Any]] = None,
+    ):
         self.thought = thought
         self.tool = tool
         self.tool_input = tool_input
         self.text = text
+        # Tool input already parsed as a JSON object, if it was one
+        self.arguments = arguments
 
 
 class AgentFinish:
@@ -43,6 +57,133 @@ class OutputParserException(Exception):
         self.error = error
 
 
+class _ScannedOutput(NamedTuple):
+    thought_end: int
+    action: Optional[str]
+    action_input: Optional[str]
+    final_answer: Optional[str]
+    has_action: bool
+    has_action_input: bool
+    action_input_start: int = -1
+
+
+def _scan(text: str) -> _ScannedOutput:
+    """Locate the thought, action, action input and final answer of an output.
+
+    The final answer follows the last "Final Answer:" and takes precedence.
+    Otherwise the action is the text between the first "Action:" and the
+    first "Action Input:" after it, and the action input runs to the end of
+    the output. The thought ends at the first line starting with "Action", or
+    else with "Final Answer".
+
+    The output is walked once from one "Action" to the next with ``str.find``,
+    matching the markers only where they can start.
+    """
+    thought_end = text.find("\nAction")
+    if thought_end == -1:
+        thought_end = text.find("\nFinal Answer")
+
+    final_at = text.rfind(FINAL_ANSWER_ACTION)
+    if final_at != -1:
+        return _ScannedOutput(
+            thought_end,
+            action=None,
+            action_input=None,
+            final_answer=text[final_at + len(FINAL_ANSWER_ACTION) :],
+            has_action=False,
+            has_action_input=False,
+        )
+
+    action_end = -1
+    has_action_input = False
+    position = text.find("Action")
+    while position != -1:
+        action_input = _ACTION_INPUT.match(text, position)
+        if action_input is not None:
+            has_action_input = True
+            if action_end != -1:
+                return _ScannedOutput(
+                    thought_end,
+                    action=text[action_end:position].strip(),
+                    action_input=text[action_input.end() :].strip(),
+                    final_answer=None,
+                    has_action=True,
+                    has_action_input=True,
+                    action_input_start=action_input.end(),
+                )
+        elif action_end == -1:
+            action = _ACTION.match(text, position)
+            if action is not None:
+                action_end = action.end()
+        position = text.find("Action", position + 1)
+
+    return _ScannedOutput(
+        thought_end,
+        action=None,
+        action_input=None,
+        final_answer=None,
+        has_action=action_end != -1,
+        has_action_input=has_action_input,
+    )
+
+
+def _json_end(text: str, start: int) -> Optional[int]:
+    """Return the end of the JSON object or array at ``start``, once closed."""
+    while start < len(text) and text[start].isspace():
+        start += 1
+    if start == len(text) or text[start] not in "{[":
+        return None
+
+    depth = 0
+    quote: Optional[str] = None
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if quote is not None:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+    return None
+
+
+class ReActStreamDetector:
+    """Tells when a streamed ReAct output holds a complete action.
+
+    Fed with the chunks of a streamed LLM response, it returns the length of
+    the output as soon as the JSON object or array given as action input is
+    closed, so the stream can be stopped and the tool called without waiting
+    for the stop word. A final answer runs to the end of the response, so
+    outputs with one stream to their end, as do actions whose input is not
+    JSON.
+    """
+
+    def __init__(self) -> None:
+        self.text = ""
+
+    def feed(self, chunk: str) -> Optional[int]:
+        self.text += chunk
+        # Only a closing bracket can complete the action input
+        if "}" not in chunk and "]" not in chunk:
+            return None
+        if FINAL_ANSWER_ACTION in self.text:
+            return None
+        scanned = _scan(self.text)
+        if scanned.action_input_start == -1:
+            return None
+        return _json_end(self.text, scanned.action_input_start)
+
+
 class CrewAgentParser:
     """Parses ReAct-style LLM calls that have a single tool input.
 
@@ -85,14 +226,10 @@ class CrewAgentParser:
         return parser.parse(text)
 
     def parse(self, text: str) -> Union[AgentAction, AgentFinish]:
-        thought = self._extract_thought(text)
-        includes_answer = FINAL_ANSWER_ACTION in text
-        regex = (
-            r"Action\s*\d*\s*:[\s]*(.*?)[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*)"
-        )
-        action_match = re.search(regex, text, re.DOTALL)
-        if includes_answer:
-            final_answer = text.split(FINAL_ANSWER_ACTION)[-1].strip()
+        scanned = _scan(text)
+        thought = self._clean_thought(text, scanned.thought_end)
+        if scanned.final_answer is not None:
+            final_answer = scanned.final_answer.strip()
             # Check whether the final answer ends with triple backticks.
             if final_answer.endswith("```"):
                 # Count occurrences of triple backticks in the final answer.
@@ -102,24 +239,25 @@ class CrewAgentParser:
                     final_answer = final_answer[:-3].rstrip()
             return AgentFinish(thought, final_answer, text)
 
-        elif action_match:
-            action = action_match.group(1)
-            clean_action = self._clean_action(action)
+        elif scanned.action is not None and scanned.action_input is not None:
+            clean_action = self._clean_action(scanned.action)
 
-            action_input = action_match.group(2).strip()
+            tool_input = scanned.action_input.strip(" ").strip('"')
+            safe_tool_input, parsed = self._repair_tool_input(tool_input)
 
-            tool_input = action_input.strip(" ").strip('"')
-            safe_tool_input = self._safe_repair_json(tool_input)
-
-            return AgentAction(thought, clean_action, safe_tool_input, text)
+            return AgentAction(
+                thought,
+                clean_action,
+                safe_tool_input,
+                text,
+                arguments=parsed if isinstance(parsed, dict) else None,
+            )
 
-        if not re.search(r"Action\s*\d*\s*:[\s]*(.*?)", text, re.DOTALL):
+        if not scanned.has_action:
             raise OutputParserException(
                 f"{MISSING_ACTION_AFTER_THOUGHT_ERROR_MESSAGE}\n{self._i18n.slice('final_answer_format')}",
             )
-        elif not re.search(
-            r"[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*)", text, re.DOTALL
-        ):
+        elif not scanned.has_action_input:
             raise OutputParserException(
                 MISSING_ACTION_INPUT_AFTER_ACTION_ERROR_MESSAGE,
             )
@@ -134,6 +272,9 @@ class CrewAgentParser:
         thought_index = text.find("\nAction")
         if thought_index == -1:
             thought_index = text.find("\nFinal Answer")
+        return self._clean_thought(text, thought_index)
+
+    def _clean_thought(self, text: str, thought_index: int) -> str:
         if thought_index == -1:
             return ""
         thought = text[:thought_index].strip()
@@ -146,8 +287,10 @@ class CrewAgentParser:
         return text.strip().strip("*").strip()
 
     def _safe_repair_json(self, tool_input: str) -> str:
-        UNABLE_TO_REPAIR_JSON_RESULTS = ['""', "{}"]
+        return self._repair_tool_input(tool_input)[0]
 
+    def _repair_tool_input(self, tool_input: str) -> Tuple[str, Any]:
+        """Repair the tool input, also returning it parsed if it was strict JSON."""
         # Skip repair if the input starts and ends with square brackets
         # Explanation: The JSON parser has issues handling inputs that are enclosed in square brackets ('[]').
         # These are typically valid JSON arrays or strings that do not require repair. Attempting to repair such inputs
@@ -155,15 +298,22 @@ class CrewAgentParser:
         # the structure in a way that changes its meaning. By skipping the repair for inputs that start and end with
         # square brackets, we preserve the integrity of these valid JSON structures and avoid unnecessary modifications.
         if tool_input.startswith("[") and tool_input.endswith("]"):
-            return tool_input
+            return tool_input, None
 
         # Before repair, handle common LLM issues:
         # 1. Replace """ with " to avoid JSON parser errors
 
         tool_input = tool_input.replace('"""', '"')
 
-        result = repair_json(tool_input)
+        parsed = None
+        try:
+            parsed = json.loads(tool_input)
+        except ValueError:
+            result = repair_json(tool_input, skip_json_loads=True)
+        else:
+            # Strict JSON needs no repair, only the formatting repair_json gives it
+            result = "" if parsed == "" else json.dumps(parsed)
         if result in UNABLE_TO_REPAIR_JSON_RESULTS:
-            return tool_input
+            return tool_input, parsed
 
-        return str(result)
+        return str(result), parsed
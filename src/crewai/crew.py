@@ -3,13 +3,15 @@ import json
 import re
 import uuid
 import warnings
-from concurrent.futures import Future
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from copy import copy as shallow_copy
 from hashlib import md5
 from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -33,7 +35,10 @@ from pydantic_core import PydanticCustomError
 from crewai.agent import Agent
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.agents.cache import CacheHandler
+from crewai.crews.concurrency import ExecutorType, iter_kickoffs
+from crewai.crews.crew_template import CrewTemplate
 from crewai.crews.crew_output import CrewOutput
+from crewai.crews.task_graph import TaskGraph
 from crewai.flow.flow_trackable import FlowTrackable
 from crewai.knowledge.knowledge import Knowledge
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
@@ -41,6 +46,7 @@ from crewai.llm import LLM, BaseLLM
 from crewai.memory.entity.entity_memory import EntityMemory
 from crewai.memory.external.external_memory import ExternalMemory
 from crewai.memory.long_term.long_term_memory import LongTermMemory
+from crewai.memory.memory_writer import MemoryWriter
 from crewai.memory.short_term.short_term_memory import ShortTermMemory
 from crewai.memory.user.user_memory import UserMemory
 from crewai.process import Process
@@ -92,11 +98,13 @@ class Crew(FlowTrackable, BaseModel):
         memory: Whether the crew should use memory to store memories of it's execution.
         memory_config: Configuration for the memory to be used for the crew.
         cache: Whether the crew should use a cache to store the results of the tools execution.
+        cache_handler: Cache handler shared by the crew's agents, e.g. one backed by a persistent backend.
         function_calling_llm: The language model that will run the tool calling for all the agents.
         process: The process flow that the crew will follow (e.g., sequential, hierarchical).
         verbose: Indicates the verbosity level for logging during execution.
         config: Configuration settings for the crew.
         max_rpm: Maximum number of requests per minute for the crew execution to be respected.
+        max_tpm: Maximum number of LLM tokens per minute for the crew execution to be respected.
         prompt_file: Path to the prompt json file to be used for the crew.
         id: A unique identifier for the crew instance.
         task_callback: Callback to be executed after each task for every agents execution.
@@ -118,6 +126,7 @@ class Crew(FlowTrackable, BaseModel):
     _entity_memory: Optional[InstanceOf[EntityMemory]] = PrivateAttr()
     _user_memory: Optional[InstanceOf[UserMemory]] = PrivateAttr()
     _external_memory: Optional[InstanceOf[ExternalMemory]] = PrivateAttr()
+    _memory_writer: Optional[MemoryWriter] = PrivateAttr(default=None)
     _train: Optional[bool] = PrivateAttr(default=False)
     _train_iteration: Optional[int] = PrivateAttr()
     _inputs: Optional[Dict[str, Any]] = PrivateAttr(default=None)
@@ -130,6 +139,10 @@ class Crew(FlowTrackable, BaseModel):
 
     name: Optional[str] = Field(default=None)
     cache: bool = Field(default=True)
+    cache_handler: Optional[InstanceOf[CacheHandler]] = Field(
+        default=None,
+        description="Cache handler shared by the crew's agents. A new in-memory handler is used if not set.",
+    )
     tasks: List[Task] = Field(default_factory=list)
     agents: List[BaseAgent] = Field(default_factory=list)
     process: Process = Field(default=Process.sequential)
@@ -204,6 +217,15 @@ class Crew(FlowTrackable, BaseModel):
         default=None,
         description="Maximum number of requests per minute for the crew execution to be respected.",
     )
+    max_tpm: Optional[int] = Field(
+        default=None,
+        description="Maximum number of LLM tokens per minute for the crew execution to be respected.",
+    )
+    max_parallel_tasks: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of tasks running at the same time with the dag process. Unlimited if not set.",
+    )
     prompt_file: Optional[str] = Field(
         default=None,
         description="Path to the prompt json file to be used for the crew.",
@@ -273,14 +295,16 @@ class Crew(FlowTrackable, BaseModel):
     def set_private_attrs(self) -> "Crew":
         """Set private attributes."""
 
-        self._cache_handler = CacheHandler()
+        self._cache_handler = self.cache_handler or CacheHandler()
         event_listener = EventListener()
         event_listener.verbose = self.verbose
         event_listener.formatter.verbose = self.verbose
         self._logger = Logger(verbose=self.verbose)
         if self.output_log_file:
             self._file_handler = FileHandler(self.output_log_file)
-        self._rpm_controller = RPMController(max_rpm=self.max_rpm, logger=self._logger)
+        self._rpm_controller = RPMController(
+            max_rpm=self.max_rpm, max_tpm=self.max_tpm, logger=self._logger
+        )
         if self.function_calling_llm and not isinstance(self.function_calling_llm, LLM):
             self.function_calling_llm = create_llm(self.function_calling_llm)
 
@@ -329,8 +353,25 @@ class Crew(FlowTrackable, BaseModel):
             self._initialize_default_memories()
             self._initialize_user_memory()
 
+        if self.memory_config and self.memory_config.get("background_writes"):
+            # Memories are saved by a background thread, flushed at the end of the kickoff
+            self._memory_writer = MemoryWriter()
+
         return self
 
+    def flush_memory_writes(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the memories queued with ``background_writes`` are saved.
+
+        Args:
+            timeout: Seconds to wait at most.
+
+        Returns:
+            False if the timeout expired first.
+        """
+        if self._memory_writer is None:
+            return True
+        return self._memory_writer.flush(timeout)
+
     @model_validator(mode="after")
     def create_crew_knowledge(self) -> "Crew":
         """Create the knowledge for the crew."""
@@ -391,18 +432,19 @@ class Crew(FlowTrackable, BaseModel):
             for agent in self.agents:
                 if self.cache:
                     agent.set_cache_handler(self._cache_handler)
-                if self.max_rpm:
+                if self.max_rpm or self.max_tpm:
                     agent.set_rpm_controller(self._rpm_controller)
         return self
 
     @model_validator(mode="after")
     def validate_tasks(self):
-        if self.process == Process.sequential:
+        if self.process in (Process.sequential, Process.dag):
+            process_name = "DAG" if self.process == Process.dag else "Sequential"
             for task in self.tasks:
                 if task.agent is None:
                     raise PydanticCustomError(
                         "missing_agent_in_task",
-                        f"Sequential process error: Agent is missing in the task with the following description: {task.description}",  # type: ignore # Argument of type "str" cannot be assigned to parameter "message_template" of type "LiteralString"
+                        f"{process_name} process error: Agent is missing in the task with the following description: {task.description}",  # type: ignore # Argument of type "str" cannot be assigned to parameter "message_template" of type "LiteralString"
                         {},
                     )
 
@@ -617,59 +659,57 @@ class Crew(FlowTrackable, BaseModel):
         inputs: Optional[Dict[str, Any]] = None,
     ) -> CrewOutput:
         try:
-            for before_callback in self.before_kickoff_callbacks:
-                if inputs is None:
-                    inputs = {}
-                inputs = before_callback(inputs)
+            self._prepare_kickoff(inputs)
 
+            if self.process == Process.sequential:
+                result = self._run_sequential_process()
+            elif self.process == Process.hierarchical:
+                result = self._run_hierarchical_process()
+            elif self.process == Process.dag:
+                result = self._execute_dag(self.tasks)
+            else:
+                raise NotImplementedError(
+                    f"The process '{self.process}' is not implemented yet."
+                )
+
+            self.flush_memory_writes()
+            return self._finish_kickoff(result)
+        except Exception as e:
             crewai_event_bus.emit(
                 self,
-                CrewKickoffStartedEvent(crew_name=self.name or "crew", inputs=inputs),
+                CrewKickoffFailedEvent(error=str(e), crew_name=self.name or "crew"),
             )
+            raise
 
-            # Starts the crew to work on its assigned tasks.
-            self._task_output_handler.reset()
-            self._logging_color = "bold_purple"
-
-            if inputs is not None:
-                self._inputs = inputs
-                self._interpolate_inputs(inputs)
-            self._set_tasks_callbacks()
-
-            i18n = I18N(prompt_file=self.prompt_file)
-
-            for agent in self.agents:
-                agent.i18n = i18n
-                # type: ignore[attr-defined] # Argument 1 to "_interpolate_inputs" of "Crew" has incompatible type "dict[str, Any] | None"; expected "dict[str, Any]"
-                agent.crew = self  # type: ignore[attr-defined]
-                agent.set_knowledge(crew_embedder=self.embedder)
-                # TODO: Create an AgentFunctionCalling protocol for future refactoring
-                if not agent.function_calling_llm:  # type: ignore # "BaseAgent" has no attribute "function_calling_llm"
-                    agent.function_calling_llm = self.function_calling_llm  # type: ignore # "BaseAgent" has no attribute "function_calling_llm"
-
-                if not agent.step_callback:  # type: ignore # "BaseAgent" has no attribute "step_callback"
-                    agent.step_callback = self.step_callback  # type: ignore # "BaseAgent" has no attribute "step_callback"
-
-                agent.create_agent_executor()
+    async def akickoff(
+        self,
+        inputs: Optional[Dict[str, Any]] = None,
+    ) -> CrewOutput:
+        """Run the crew natively on the running event loop.
 
-            if self.planning:
-                self._handle_crew_planning()
+        Unlike ``kickoff_async``, which runs ``kickoff`` in a worker thread, every
+        agent loop awaits its LLM calls and tools, so many crews can run
+        concurrently on one event loop. Tasks with ``async_execution`` run as
+        concurrent asyncio tasks. Setup, which may load knowledge and plan the
+        run, happens in a worker thread.
+        """
+        try:
+            await asyncio.to_thread(self._prepare_kickoff, inputs)
 
             if self.process == Process.sequential:
-                result = self._run_sequential_process()
+                result = await self._aexecute_tasks(self.tasks)
             elif self.process == Process.hierarchical:
-                result = self._run_hierarchical_process()
+                self._create_manager_agent()
+                result = await self._aexecute_tasks(self.tasks)
+            elif self.process == Process.dag:
+                result = await self._aexecute_dag(self.tasks)
             else:
                 raise NotImplementedError(
                     f"The process '{self.process}' is not implemented yet."
                 )
 
-            for after_callback in self.after_kickoff_callbacks:
-                result = after_callback(result)
-
-            self.usage_metrics = self.calculate_usage_metrics()
-
-            return result
+            await asyncio.to_thread(self.flush_memory_writes)
+            return self._finish_kickoff(result)
         except Exception as e:
             crewai_event_bus.emit(
                 self,
@@ -677,48 +717,166 @@ class Crew(FlowTrackable, BaseModel):
             )
             raise
 
-    def kickoff_for_each(self, inputs: List[Dict[str, Any]]) -> List[CrewOutput]:
-        """Executes the Crew's workflow for each input in the list and aggregates results."""
-        results: List[CrewOutput] = []
+    def _prepare_kickoff(self, inputs: Optional[Dict[str, Any]] = None) -> None:
+        """Run the before kickoff callbacks, interpolate inputs and set up the agents."""
+        for before_callback in self.before_kickoff_callbacks:
+            if inputs is None:
+                inputs = {}
+            inputs = before_callback(inputs)
 
-        # Initialize the parent crew's usage metrics
-        total_usage_metrics = UsageMetrics()
+        crewai_event_bus.emit(
+            self,
+            CrewKickoffStartedEvent(crew_name=self.name or "crew", inputs=inputs),
+        )
+
+        # Starts the crew to work on its assigned tasks.
+        self._task_output_handler.reset()
+        self._logging_color = "bold_purple"
+
+        if inputs is not None:
+            self._inputs = inputs
+            self._interpolate_inputs(inputs)
+        self._set_tasks_callbacks()
+
+        i18n = I18N(prompt_file=self.prompt_file)
+
+        for agent in self.agents:
+            agent.i18n = i18n
+            # type: ignore[attr-defined] # Argument 1 to "_interpolate_inputs" of "Crew" has incompatible type "dict[str, Any] | None"; expected "dict[str, Any]"
+            agent.crew = self  # type: ignore[attr-defined]
+            agent.set_knowledge(crew_embedder=self.embedder)
+            # TODO: Create an AgentFunctionCalling protocol for future refactoring
+            if not agent.function_calling_llm:  # type: ignore # "BaseAgent" has no attribute "function_calling_llm"
+                agent.function_calling_llm = self.function_calling_llm  # type: ignore # "BaseAgent" has no attribute "function_calling_llm"
+
+            if not agent.step_callback:  # type: ignore # "BaseAgent" has no attribute "step_callback"
+                agent.step_callback = self.step_callback  # type: ignore # "BaseAgent" has no attribute "step_callback"
 
-        for input_data in inputs:
-            crew = self.copy()
+            agent.create_agent_executor()
 
-            output = crew.kickoff(inputs=input_data)
+        if self.planning:
+            self._handle_crew_planning()
 
-            if crew.usage_metrics:
-                total_usage_metrics.add_usage_metrics(crew.usage_metrics)
+    def _finish_kickoff(self, result: CrewOutput) -> CrewOutput:
+        for after_callback in self.after_kickoff_callbacks:
+            result = after_callback(result)
 
-            results.append(output)
+        self.usage_metrics = self.calculate_usage_metrics()
 
+        return result
+
+    def kickoff_for_each(
+        self,
+        inputs: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        executor: ExecutorType = "thread",
+        use_template: bool = False,
+    ) -> List[CrewOutput]:
+        """Executes the Crew's workflow for each input in the list and aggregates results.
+
+        Args:
+            inputs: Inputs to kick the crew off with, one execution per item.
+            max_concurrency: Maximum number of executions running at once. Inputs
+                are executed one after another when not set.
+            executor: Whether concurrent executions run in a "thread" or "process" pool.
+            use_template: Instantiate every execution from a ``CrewTemplate``
+                instead of deep-copying the crew, see ``compile_template``.
+
+        Returns:
+            The crew outputs, in the same order as the inputs.
+        """
+        results: List[Optional[CrewOutput]] = [None] * len(inputs)
+        for index, output in self.kickoff_for_each_iter(
+            inputs,
+            max_concurrency=max_concurrency,
+            executor=executor,
+            use_template=use_template,
+        ):
+            results[index] = output
+        return cast(List[CrewOutput], results)
+
+    def kickoff_for_each_iter(
+        self,
+        inputs: Iterable[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        executor: ExecutorType = "thread",
+        use_template: bool = False,
+    ) -> Iterator[Tuple[int, CrewOutput]]:
+        """Executes the Crew's workflow for each input, yielding results as they complete.
+
+        Inputs are consumed lazily and at most ``max_concurrency`` crew copies are
+        alive at once, so memory stays flat for arbitrarily many inputs.
+
+        Args:
+            inputs: Inputs to kick the crew off with, one execution per item.
+            max_concurrency: Maximum number of executions running at once. Inputs
+                are executed one after another when not set.
+            executor: Whether concurrent executions run in a "thread" or "process" pool.
+            use_template: Instantiate every execution from a ``CrewTemplate``
+                instead of deep-copying the crew, see ``compile_template``.
+
+        Yields:
+            Tuples of (input index, crew output) in completion order.
+        """
+        total_usage_metrics = UsageMetrics()
         self.usage_metrics = total_usage_metrics
+
+        for index, output, usage_metrics in iter_kickoffs(
+            self,
+            inputs,
+            max_concurrency=1 if max_concurrency is None else max_concurrency,
+            executor=executor,
+            use_template=use_template,
+        ):
+            if usage_metrics:
+                total_usage_metrics.add_usage_metrics(usage_metrics)
+            yield index, output
+
         self._task_output_handler.reset()
-        return results
 
     async def kickoff_async(self, inputs: Optional[Dict[str, Any]] = {}) -> CrewOutput:
         """Asynchronous kickoff method to start the crew execution."""
         return await asyncio.to_thread(self.kickoff, inputs)
 
-    async def kickoff_for_each_async(self, inputs: List[Dict]) -> List[CrewOutput]:
-        crew_copies = [self.copy() for _ in inputs]
-
-        async def run_crew(crew, input_data):
-            return await crew.kickoff_async(inputs=input_data)
+    async def kickoff_for_each_async(
+        self,
+        inputs: List[Dict],
+        max_concurrency: Optional[int] = None,
+        use_template: bool = False,
+    ) -> List[CrewOutput]:
+        """Asynchronously executes the Crew's workflow for each input.
 
-        tasks = [
-            asyncio.create_task(run_crew(crew_copies[i], inputs[i]))
-            for i in range(len(inputs))
-        ]
+        Args:
+            inputs: Inputs to kick the crew off with, one execution per item.
+            max_concurrency: Maximum number of executions running at once. All
+                inputs run at once when not set.
+            use_template: Instantiate every execution from a ``CrewTemplate``
+                instead of deep-copying the crew, see ``compile_template``.
 
-        results = await asyncio.gather(*tasks)
+        Returns:
+            The crew outputs, in the same order as the inputs.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
 
+        results: List[Any] = [None] * len(inputs)
         total_usage_metrics = UsageMetrics()
-        for crew in crew_copies:
-            if crew.usage_metrics:
-                total_usage_metrics.add_usage_metrics(crew.usage_metrics)
+        pending_inputs = iter(enumerate(inputs))
+        crew_factory = (
+            self.compile_template().instantiate if use_template else self.copy
+        )
+
+        # Each worker copies the crew only when it picks up an input, so no more
+        # than max_concurrency copies are alive at a time.
+        async def run_crews():
+            for index, input_data in pending_inputs:
+                crew = crew_factory()
+                results[index] = await crew.kickoff_async(inputs=input_data)
+                if crew.usage_metrics:
+                    total_usage_metrics.add_usage_metrics(crew.usage_metrics)
+
+        workers = min(max_concurrency or len(inputs), len(inputs))
+        await asyncio.gather(*(run_crews() for _ in range(workers)))
 
         self.usage_metrics = total_usage_metrics
         self._task_output_handler.reset()
@@ -882,6 +1040,304 @@ class Crew(FlowTrackable, BaseModel):
 
         return self._create_crew_output(task_outputs)
 
+    async def _aexecute_tasks(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int] = 0,
+        was_replayed: bool = False,
+    ) -> CrewOutput:
+        """Asynchronous counterpart of ``_execute_tasks``.
+
+        Tasks with ``async_execution`` are scheduled as asyncio tasks on the
+        running loop instead of threads and are awaited before the next
+        synchronous task, exactly like their futures in ``_execute_tasks``.
+        """
+        task_outputs: List[TaskOutput] = []
+        pending: List[Tuple[Task, "asyncio.Task[TaskOutput]", int]] = []
+        last_sync_output: Optional[TaskOutput] = None
+
+        for task_index, task in enumerate(tasks):
+            if start_index is not None and task_index < start_index:
+                if task.output:
+                    if task.async_execution:
+                        task_outputs.append(task.output)
+                    else:
+                        task_outputs = [task.output]
+                        last_sync_output = task.output
+                continue
+
+            agent_to_use = self._get_agent_to_use(task)
+            if agent_to_use is None:
+                raise ValueError(
+                    f"No agent available for task: {task.description}. Ensure that either the task has an assigned agent or a manager agent is provided."
+                )
+
+            tools_for_task = task.tools or agent_to_use.tools or []
+            tools_for_task = self._prepare_tools(
+                agent_to_use,
+                task,
+                cast(Union[List[Tool], List[BaseTool]], tools_for_task),
+            )
+
+            self._log_task_start(task, agent_to_use.role)
+
+            if isinstance(task, ConditionalTask):
+                # Pending tasks must be done before their outputs are inspected
+                if pending:
+                    await asyncio.wait([pending_task for _, pending_task, _ in pending])
+                skipped_task_output = self._handle_conditional_task(
+                    task,
+                    task_outputs,
+                    cast(List[Tuple[Task, Future[TaskOutput], int]], pending),
+                    task_index,
+                    was_replayed,
+                )
+                if skipped_task_output:
+                    task_outputs.append(skipped_task_output)
+                    continue
+
+            if task.async_execution:
+                context = self._get_context(
+                    task, [last_sync_output] if last_sync_output else []
+                )
+                pending_task = asyncio.ensure_future(
+                    task.aexecute(
+                        agent=agent_to_use,
+                        context=context,
+                        tools=cast(List[BaseTool], tools_for_task),
+                    )
+                )
+                pending.append((task, pending_task, task_index))
+            else:
+                if pending:
+                    task_outputs = await self._aprocess_async_tasks(
+                        pending, was_replayed
+                    )
+                    pending.clear()
+
+                context = self._get_context(task, task_outputs)
+                task_output = await task.aexecute(
+                    agent=agent_to_use,
+                    context=context,
+                    tools=cast(List[BaseTool], tools_for_task),
+                )
+                task_outputs.append(task_output)
+                self._process_task_result(task, task_output)
+                self._store_execution_log(task, task_output, task_index, was_replayed)
+
+        if pending:
+            task_outputs = await self._aprocess_async_tasks(pending, was_replayed)
+
+        return self._create_crew_output(task_outputs)
+
+    async def _aprocess_async_tasks(
+        self,
+        pending: List[Tuple[Task, "asyncio.Task[TaskOutput]", int]],
+        was_replayed: bool = False,
+    ) -> List[TaskOutput]:
+        await asyncio.wait([pending_task for _, pending_task, _ in pending])
+        # Finished asyncio tasks expose result() like concurrent futures
+        return self._process_async_tasks(
+            cast(List[Tuple[Task, Future[TaskOutput], int]], pending), was_replayed
+        )
+
+    def _execute_dag(
+        self,
+        tasks: List[Task],
+        start_index: int = 0,
+        was_replayed: bool = False,
+    ) -> CrewOutput:
+        """Executes every task as soon as the tasks in its context are done.
+
+        Independent tasks run concurrently in a thread pool, bounded by
+        ``max_parallel_tasks``. Tasks before ``start_index`` are considered done,
+        their outputs having been restored by ``replay``.
+
+        Returns:
+            CrewOutput: Final output of the crew, the last task being the main output
+        """
+        graph = TaskGraph(tasks)
+        task_outputs, done = self._restore_dag_outputs(tasks, start_index)
+        running: Dict[Future[TaskOutput], int] = {}
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_parallel_tasks or max(len(tasks), 1),
+            thread_name_prefix="crewai-task",
+        )
+        try:
+            while len(done) < len(tasks):
+                for index, agent, context, tools in self._start_dag_tasks(
+                    graph, done, running.values(), task_outputs, was_replayed
+                ):
+                    future = pool.submit(
+                        tasks[index].execute_sync,
+                        agent=agent,
+                        context=context,
+                        tools=tools,
+                    )
+                    running[future] = index
+                if not running:
+                    raise self._stuck_dag_error(graph, done)
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index = running.pop(future)
+                    self._complete_dag_task(
+                        tasks[index],
+                        index,
+                        future.result(),
+                        task_outputs,
+                        done,
+                        was_replayed,
+                    )
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        return self._create_crew_output(
+            [task_outputs[index] for index in sorted(task_outputs)]
+        )
+
+    async def _aexecute_dag(
+        self,
+        tasks: List[Task],
+        start_index: int = 0,
+        was_replayed: bool = False,
+    ) -> CrewOutput:
+        """Asynchronous counterpart of ``_execute_dag``.
+
+        Ready tasks are scheduled as asyncio tasks on the running loop instead of
+        a thread pool.
+        """
+        graph = TaskGraph(tasks)
+        task_outputs, done = self._restore_dag_outputs(tasks, start_index)
+        running: Dict["asyncio.Task[TaskOutput]", int] = {}
+        try:
+            while len(done) < len(tasks):
+                for index, agent, context, tools in self._start_dag_tasks(
+                    graph, done, running.values(), task_outputs, was_replayed
+                ):
+                    pending_task = asyncio.ensure_future(
+                        tasks[index].aexecute(agent=agent, context=context, tools=tools)
+                    )
+                    running[pending_task] = index
+                if not running:
+                    raise self._stuck_dag_error(graph, done)
+                finished, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for pending_task in finished:
+                    index = running.pop(pending_task)
+                    self._complete_dag_task(
+                        tasks[index],
+                        index,
+                        pending_task.result(),
+                        task_outputs,
+                        done,
+                        was_replayed,
+                    )
+        finally:
+            for pending_task in running:
+                pending_task.cancel()
+
+        return self._create_crew_output(
+            [task_outputs[index] for index in sorted(task_outputs)]
+        )
+
+    def _stuck_dag_error(self, graph: TaskGraph, done: Set[int]) -> RuntimeError:
+        stuck = [
+            f"'{graph.tasks[index].name or graph.tasks[index].description}'"
+            for index in range(len(graph.tasks))
+            if index not in done
+        ]
+        return RuntimeError(
+            f"DAG process error: tasks {', '.join(stuck)} can never start, "
+            "the tasks in their context cannot be completed."
+        )
+
+    def _restore_dag_outputs(
+        self, tasks: List[Task], start_index: int
+    ) -> Tuple[Dict[int, TaskOutput], Set[int]]:
+        task_outputs = {
+            index: task.output
+            for index, task in enumerate(tasks[:start_index])
+            if task.output
+        }
+        return task_outputs, set(range(start_index))
+
+    def _start_dag_tasks(
+        self,
+        graph: TaskGraph,
+        done: Set[int],
+        running: Iterable[int],
+        task_outputs: Dict[int, TaskOutput],
+        was_replayed: bool,
+    ) -> List[Tuple[int, BaseAgent, str, List[BaseTool]]]:
+        """Prepares the tasks that can start now, skipping conditional tasks.
+
+        Skipping a conditional task may unblock the tasks depending on it, so
+        ready tasks are collected until no more tasks are skipped.
+        """
+        started = set(running)
+        launches: List[Tuple[int, BaseAgent, str, List[BaseTool]]] = []
+        skipped = True
+        while skipped:
+            skipped = False
+            for index in graph.runnable(done, started):
+                if (
+                    self.max_parallel_tasks is not None
+                    and len(started) >= self.max_parallel_tasks
+                ):
+                    break
+                task = graph.tasks[index]
+                agent_to_use = self._get_agent_to_use(task)
+                if agent_to_use is None:
+                    raise ValueError(
+                        f"No agent available for task: {task.description}. Ensure that either the task has an assigned agent or a manager agent is provided."
+                    )
+
+                tools_for_task = self._prepare_tools(
+                    agent_to_use,
+                    task,
+                    cast(
+                        Union[List[Tool], List[BaseTool]],
+                        task.tools or agent_to_use.tools or [],
+                    ),
+                )
+
+                self._log_task_start(task, agent_to_use.role)
+
+                if isinstance(task, ConditionalTask):
+                    previous_output = task_outputs.get(index - 1)
+                    skipped_task_output = self._handle_conditional_task(
+                        task,
+                        [previous_output] if previous_output else [],
+                        [],
+                        index,
+                        was_replayed,
+                    )
+                    if skipped_task_output:
+                        task_outputs[index] = skipped_task_output
+                        done.add(index)
+                        skipped = True
+                        continue
+
+                context = self._get_context(task, [])
+                launches.append((index, agent_to_use, context, tools_for_task))
+                started.add(index)
+        return launches
+
+    def _complete_dag_task(
+        self,
+        task: Task,
+        task_index: int,
+        task_output: TaskOutput,
+        task_outputs: Dict[int, TaskOutput],
+        done: Set[int],
+        was_replayed: bool,
+    ) -> None:
+        task_outputs[task_index] = task_output
+        done.add(task_index)
+        self._process_task_result(task, task_output)
+        self._store_execution_log(task, task_output, task_index, was_replayed)
+
     def _handle_conditional_task(
         self,
         task: ConditionalTask,
@@ -1141,6 +1597,8 @@ class Crew(FlowTrackable, BaseModel):
             self.tasks[i].output = task_output
 
         self._logging_color = "bold_blue"
+        if self.process == Process.dag:
+            return self._execute_dag(self.tasks, start_index, True)
         result = self._execute_tasks(self.tasks, start_index, True)
         return result
 
@@ -1178,6 +1636,18 @@ class Crew(FlowTrackable, BaseModel):
 
         return required_inputs
 
+    def compile_template(self) -> CrewTemplate:
+        """Compile the crew into a template for cheap repeated instantiation.
+
+        Every crew instantiated from the template shares LLMs, tools, knowledge,
+        memories, the tool cache and the rate limiter with this crew, and gets
+        fresh agents and tasks holding only per-run state.
+
+        Returns:
+            CrewTemplate: A template whose ``instantiate`` returns a runnable crew.
+        """
+        return CrewTemplate(self)
+
     def copy(self):
         """
         Creates a deep copy of the Crew instance.
@@ -1193,10 +1663,12 @@ class Crew(FlowTrackable, BaseModel):
             "_execution_span",
             "_file_handler",
             "_cache_handler",
+            "cache_handler",
             "_short_term_memory",
             "_long_term_memory",
             "_entity_memory",
             "_external_memory",
+            "_memory_writer",
             "agents",
             "tasks",
             "knowledge_sources",
@@ -1256,6 +1728,7 @@ class Crew(FlowTrackable, BaseModel):
             knowledge=existing_knowledge,
             manager_agent=manager_agent,
             manager_llm=manager_llm,
+            cache_handler=self.cache_handler,
         )
 
         return copied_crew
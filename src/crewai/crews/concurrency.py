@@ -0,0 +1,153 @@
+"""Bounded worker pools for running one crew over many inputs."""
+
+import multiprocessing
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Tuple,
+)
+
+from crewai.crews.crew_output import CrewOutput
+from crewai.types.usage_metrics import UsageMetrics
+
+if TYPE_CHECKING:
+    from crewai.crew import Crew
+
+ExecutorType = Literal["thread", "process"]
+
+KickoffResult = Tuple[int, CrewOutput, Optional[UsageMetrics]]
+
+CrewFactory = Callable[[], "Crew"]
+
+_worker_crew_factory: Optional[CrewFactory] = None
+
+
+def _kickoff_copy(
+    crew_factory: CrewFactory, input_data: Dict[str, Any]
+) -> Tuple[CrewOutput, Optional[UsageMetrics]]:
+    run = crew_factory()
+    output = run.kickoff(inputs=input_data)
+    return output, run.usage_metrics
+
+
+def _init_process_worker(crew_factory: CrewFactory) -> None:
+    global _worker_crew_factory
+    _worker_crew_factory = crew_factory
+
+
+def _kickoff_in_process(
+    input_data: Dict[str, Any],
+) -> Tuple[CrewOutput, Optional[UsageMetrics]]:
+    if _worker_crew_factory is None:
+        raise RuntimeError("Process worker was not initialized with a crew.")
+    return _kickoff_copy(_worker_crew_factory, input_data)
+
+
+def _create_executor(
+    crew_factory: CrewFactory, max_concurrency: int, executor: ExecutorType
+) -> Executor:
+    if executor == "thread":
+        return ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="crewai-kickoff"
+        )
+    # Forked workers inherit the crew instead of receiving a pickled copy, which
+    # keeps LLM clients and other unpicklable members usable where fork exists.
+    context = (
+        multiprocessing.get_context("fork")
+        if "fork" in multiprocessing.get_all_start_methods()
+        else None
+    )
+    return ProcessPoolExecutor(
+        max_workers=max_concurrency,
+        mp_context=context,
+        initializer=_init_process_worker,
+        initargs=(crew_factory,),
+    )
+
+
+def iter_kickoffs(
+    crew: "Crew",
+    inputs: Iterable[Dict[str, Any]],
+    max_concurrency: int = 1,
+    executor: ExecutorType = "thread",
+    use_template: bool = False,
+) -> Iterator[KickoffResult]:
+    """Run a fresh copy of ``crew`` for every input and yield results as they finish.
+
+    Inputs are consumed lazily and at most ``max_concurrency`` copies exist at
+    any time, so memory stays flat regardless of how many inputs are given.
+
+    Args:
+        crew: Crew used as the template for every execution.
+        inputs: Inputs to kick the crew off with.
+        max_concurrency: Maximum number of executions running at once.
+        executor: "thread" runs executions in a thread pool, "process" in a
+            process pool. Event handlers registered in the parent process do not
+            receive events emitted inside process workers.
+        use_template: Build every execution from a ``CrewTemplate`` that shares
+            immutable members such as LLMs, tools and memories instead of
+            deep-copying the crew.
+
+    Yields:
+        Tuples of (input index, crew output, usage metrics) in completion order.
+
+    Raises:
+        ValueError: If max_concurrency is lower than 1 or the executor is unknown
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    if executor not in ("thread", "process"):
+        raise ValueError(f"executor must be 'thread' or 'process', got {executor!r}")
+
+    crew_factory: CrewFactory = (
+        crew.compile_template().instantiate if use_template else crew.copy
+    )
+    indexed_inputs = enumerate(inputs)
+
+    if max_concurrency == 1 and executor == "thread":
+        for index, input_data in indexed_inputs:
+            output, usage_metrics = _kickoff_copy(crew_factory, input_data)
+            yield index, output, usage_metrics
+        return
+
+    pool = _create_executor(crew_factory, max_concurrency, executor)
+    pending: Dict[Future, int] = {}
+
+    def submit_next() -> bool:
+        item = next(indexed_inputs, None)
+        if item is None:
+            return False
+        index, input_data = item
+        if executor == "process":
+            future = pool.submit(_kickoff_in_process, input_data)
+        else:
+            future = pool.submit(_kickoff_copy, crew_factory, input_data)
+        pending[future] = index
+        return True
+
+    try:
+        while len(pending) < max_concurrency and submit_next():
+            pass
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                output, usage_metrics = future.result()
+                submit_next()
+                yield index, output, usage_metrics
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
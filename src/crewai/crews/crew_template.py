@@ -0,0 +1,114 @@
+import uuid
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from crewai.agent import Agent
+from crewai.agents.agent_builder.base_agent import BaseAgent
+from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from crewai.agents.tools_handler import ToolsHandler
+from crewai.task import Task
+from crewai.utilities.task_output_storage_handler import TaskOutputStorageHandler
+
+if TYPE_CHECKING:
+    from crewai.crew import Crew
+
+
+class CrewTemplate:
+    """Compiled blueprint that cheaply instantiates a crew for repeated runs.
+
+    ``Crew.copy()`` dumps, re-validates and deep-copies the whole crew for every
+    run. A template instead makes shallow copies that share everything that does
+    not change between executions: LLM clients, tools and their schemas and
+    descriptions, knowledge, memories and their embedders, the tool cache, the
+    rate limiter and the I18N prompts. Only per-run state is created for each
+    instance: task outputs and counters, agent executors, tool results and usage
+    tracking.
+
+    Agents that are not ``Agent`` instances, such as adapted third-party agents,
+    are still cloned with ``copy()`` since their internal state is not known.
+    """
+
+    def __init__(self, crew: "Crew") -> None:
+        self.crew = crew
+
+    def instantiate(self) -> "Crew":
+        """Create a crew ready to be kicked off independently of other instances."""
+        agent_mapping: Dict[int, BaseAgent] = {}
+
+        def instantiate_agent(agent: BaseAgent) -> BaseAgent:
+            if id(agent) not in agent_mapping:
+                agent_mapping[id(agent)] = self._instantiate_agent(agent)
+            return agent_mapping[id(agent)]
+
+        agents = [instantiate_agent(agent) for agent in self.crew.agents]
+        manager_agent = (
+            instantiate_agent(self.crew.manager_agent)
+            if self.crew.manager_agent
+            else None
+        )
+
+        task_mapping: Dict[int, Task] = {}
+        tasks: List[Task] = []
+        for task in self.crew.tasks:
+            run_task = self._instantiate_task(
+                task, instantiate_agent(task.agent) if task.agent else None
+            )
+            task_mapping[id(task)] = run_task
+            tasks.append(run_task)
+
+        for run_task, task in zip(tasks, self.crew.tasks):
+            if isinstance(task.context, list):
+                run_task.context = [
+                    task_mapping.get(id(context_task), context_task)
+                    for context_task in task.context
+                ]
+
+        run = self.crew.model_copy(
+            update={
+                "id": uuid.uuid4(),
+                "agents": agents,
+                "tasks": tasks,
+                "manager_agent": manager_agent,
+                "usage_metrics": None,
+            }
+        )
+        run._task_output_handler = TaskOutputStorageHandler()
+        run._inputs = None
+        run._logging_color = "bold_purple"
+        return run
+
+    @staticmethod
+    def _instantiate_agent(agent: BaseAgent) -> BaseAgent:
+        if not isinstance(agent, Agent):
+            return agent.copy()
+
+        run_agent = agent.model_copy(
+            update={
+                "id": uuid.uuid4(),
+                "agent_executor": None,
+                "tools_results": [],
+                "tools_handler": ToolsHandler(cache=agent.tools_handler.cache),
+            }
+        )
+        run_agent._token_process = TokenProcess()
+        run_agent._times_executed = 0
+        return run_agent
+
+    @staticmethod
+    def _instantiate_task(task: Task, agent: Optional[BaseAgent]) -> Task:
+        run_task = task.model_copy(
+            update={
+                "id": uuid.uuid4(),
+                "agent": agent,
+                "tools": list(task.tools) if task.tools else [],
+                "output": None,
+                "used_tools": 0,
+                "tools_errors": 0,
+                "delegations": 0,
+                "retry_count": 0,
+                "processed_by_agents": set(),
+                "start_time": None,
+                "end_time": None,
+            }
+        )
+        run_task._thread = None
+        return run_task
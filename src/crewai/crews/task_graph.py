@@ -0,0 +1,57 @@
+"""Dependency graph used to schedule the tasks of a ``Process.dag`` crew."""
+
+from typing import Dict, Iterable, List, Set
+
+from crewai.task import Task
+from crewai.tasks.conditional_task import ConditionalTask
+
+
+class TaskGraph:
+    """Tasks of a crew indexed by position together with the tasks they wait on.
+
+    A task depends on every task listed in its ``context``. A ``ConditionalTask``
+    also depends on the task right before it, since its condition is evaluated
+    on that task's output. Tasks without an explicit ``context`` have no
+    dependencies and receive no context. Crew validation guarantees that a
+    context only references earlier tasks, so the graph is acyclic.
+    """
+
+    def __init__(self, tasks: List[Task]) -> None:
+        self.tasks = tasks
+        positions: Dict[int, int] = {id(task): index for index, task in enumerate(tasks)}
+        self.dependencies: List[Set[int]] = []
+
+        for index, task in enumerate(tasks):
+            dependencies: Set[int] = set()
+            if isinstance(task.context, list):
+                dependencies.update(
+                    positions[id(context_task)]
+                    for context_task in task.context
+                    if id(context_task) in positions
+                )
+            if isinstance(task, ConditionalTask) and index > 0:
+                dependencies.add(index - 1)
+            self.dependencies.append(dependencies)
+
+    def runnable(self, done: Set[int], running: Iterable[int]) -> List[int]:
+        """Indices of tasks that can start now, in crew order.
+
+        A task can start once all its dependencies are done and its agent is not
+        busy with another task, since an agent runs a single executor at a time.
+
+        Args:
+            done: Indices of finished or skipped tasks.
+            running: Indices of tasks currently being executed.
+        """
+        running = set(running)
+        busy_agents = {id(self.tasks[index].agent) for index in running}
+        runnable: List[int] = []
+        for index, dependencies in enumerate(self.dependencies):
+            if index in done or index in running or not dependencies <= done:
+                continue
+            agent_id = id(self.tasks[index].agent)
+            if agent_id in busy_agents:
+                continue
+            busy_agents.add(agent_id)
+            runnable.append(index)
+        return runnable
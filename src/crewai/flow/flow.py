@@ -1,15 +1,22 @@
 import asyncio
+import contextlib
+import contextvars
 import copy
+import functools
 import inspect
 import logging
+import time
+from concurrent.futures import Executor
 from typing import (
     Any,
+    AsyncIterator,
     Callable,
     Dict,
     Generic,
     List,
     Optional,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -380,6 +387,41 @@ def and_(*conditions: Union[str, dict, Callable]) -> dict:
     return {"type": "AND", "methods": methods}
 
 
+# Maps a trigger to the (listener, bit) pairs it fires, see build_trigger_index
+TriggerIndex = Dict[str, List[Tuple[str, int]]]
+
+
+def build_trigger_index(
+    listeners: Dict[str, Tuple[str, List[str]]], routers: Set[str]
+) -> Tuple[TriggerIndex, TriggerIndex, Dict[str, int]]:
+    """Index routers and listeners by the triggers they wait on.
+
+    OR listeners are indexed with a zero bit. Every trigger of an AND listener
+    gets its own bit, and the listener fires once the bits received cover its
+    mask. Entries keep the declaration order of the listeners.
+
+    Returns:
+        The router index, the listener index and the mask of each AND listener.
+    """
+    router_triggers: TriggerIndex = {}
+    listener_triggers: TriggerIndex = {}
+    and_masks: Dict[str, int] = {}
+
+    for listener_name, (condition_type, methods) in listeners.items():
+        index = router_triggers if listener_name in routers else listener_triggers
+        if condition_type == "AND":
+            bits: Dict[str, int] = {}
+            for method in methods:
+                bits.setdefault(method, 1 << len(bits))
+            and_masks[listener_name] = (1 << len(bits)) - 1
+        else:
+            bits = dict.fromkeys(methods, 0)
+        for method, bit in bits.items():
+            index.setdefault(method, []).append((listener_name, bit))
+
+    return router_triggers, listener_triggers, and_masks
+
+
 class FlowMeta(type):
     def __new__(mcs, name, bases, dct):
         cls = super().__new__(mcs, name, bases, dct)
@@ -421,13 +463,33 @@ class FlowMeta(type):
         setattr(cls, "_routers", routers)
         setattr(cls, "_router_paths", router_paths)
 
+        router_triggers, listener_triggers, and_masks = build_trigger_index(
+            listeners, routers
+        )
+        setattr(cls, "_router_triggers", router_triggers)
+        setattr(cls, "_listener_triggers", listener_triggers)
+        setattr(cls, "_and_masks", and_masks)
+
         return cls
 
 
 class Flow(Generic[T], metaclass=FlowMeta):
     """Base class for all flows.
 
-    Type parameter T must be either Dict[str, Any] or a subclass of BaseModel."""
+    Type parameter T must be either Dict[str, Any] or a subclass of BaseModel.
+
+    Concurrency is configured with class attributes:
+
+    - ``max_concurrency`` caps the number of methods of a flow run executing at
+      the same time, None for no limit.
+    - ``method_concurrency`` caps the concurrent executions of individual
+      methods, by method name.
+    - ``sync_executor`` runs synchronous methods in an executor so that they
+      execute in parallel. Without it they run on the event loop thread, one
+      at a time.
+
+    Methods over a limit wait for a slot, and the time they waited is reported
+    by the method execution events."""
 
     _printer = Printer()
 
@@ -435,7 +497,13 @@ class Flow(Generic[T], metaclass=FlowMeta):
     _listeners: Dict[str, tuple[str, List[str]]] = {}
     _routers: Set[str] = set()
     _router_paths: Dict[str, List[str]] = {}
+    _router_triggers: TriggerIndex = {}
+    _listener_triggers: TriggerIndex = {}
+    _and_masks: Dict[str, int] = {}
     initial_state: Union[Type[T], T, None] = None
+    max_concurrency: Optional[int] = None
+    method_concurrency: Dict[str, int] = {}
+    sync_executor: Optional[Executor] = None
 
     def __class_getitem__(cls: Type["Flow"], item: Type[T]) -> Type["Flow"]:
         class _FlowGeneric(cls):  # type: ignore
@@ -458,9 +526,19 @@ class Flow(Generic[T], metaclass=FlowMeta):
         # Initialize basic instance attributes
         self._methods: Dict[str, Callable] = {}
         self._method_execution_counts: Dict[str, int] = {}
-        self._pending_and_listeners: Dict[str, Set[str]] = {}
+        # Bits of the triggers each AND listener has received so far
+        self._pending_and_listeners: Dict[str, int] = {}
         self._method_outputs: List[Any] = []  # List to store all method outputs
         self._persistence: Optional[FlowPersistence] = persistence
+        self._flow_semaphore: Optional[asyncio.Semaphore] = None
+        self._method_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._running_methods = 0
+        self._waiting_methods = 0
+
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+        if any(limit < 1 for limit in self.method_concurrency.values()):
+            raise ValueError("method_concurrency limits must be positive integers")
 
         # Initialize state with initial values
         self._state = self._create_initial_state()
@@ -736,6 +814,15 @@ class Flow(Generic[T], metaclass=FlowMeta):
         Returns:
             The final output from the flow, which is the result of the last executed method.
         """
+        # Semaphores are bound to the event loop of the run using them
+        self._flow_semaphore = (
+            asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        )
+        self._method_semaphores = {
+            method_name: asyncio.Semaphore(limit)
+            for method_name, limit in self.method_concurrency.items()
+        }
+
         if inputs:
             # Override the id in the state if it exists in inputs
             if "id" in inputs:
@@ -786,6 +873,9 @@ class Flow(Generic[T], metaclass=FlowMeta):
         ]
         await asyncio.gather(*tasks)
 
+        if self._persistence is not None:
+            await asyncio.to_thread(self._persistence.flush)
+
         final_output = self._method_outputs[-1] if self._method_outputs else None
 
         crewai_event_bus.emit(
@@ -829,38 +919,51 @@ class Flow(Generic[T], metaclass=FlowMeta):
             dumped_params = {f"_{i}": arg for i, arg in enumerate(args)} | (
                 kwargs or {}
             )
-            crewai_event_bus.emit(
-                self,
-                MethodExecutionStartedEvent(
-                    type="method_execution_started",
-                    method_name=method_name,
-                    flow_name=self.__class__.__name__,
-                    params=dumped_params,
-                    state=self._copy_state(),
-                ),
-            )
+            enqueued_at = time.perf_counter()
+            async with self._method_slot(method_name):
+                queued_seconds = time.perf_counter() - enqueued_at
+                # Copying the state is costly, skip it when nobody listens
+                if crewai_event_bus.has_listeners(MethodExecutionStartedEvent):
+                    crewai_event_bus.emit(
+                        self,
+                        MethodExecutionStartedEvent(
+                            type="method_execution_started",
+                            method_name=method_name,
+                            flow_name=self.__class__.__name__,
+                            params=dumped_params,
+                            state=self._copy_state(),
+                            queued_seconds=queued_seconds,
+                            running_methods=self._running_methods,
+                            waiting_methods=self._waiting_methods,
+                        ),
+                    )
 
-            result = (
-                await method(*args, **kwargs)
-                if asyncio.iscoroutinefunction(method)
-                else method(*args, **kwargs)
-            )
+                started_at = time.perf_counter()
+                result = (
+                    await method(*args, **kwargs)
+                    if asyncio.iscoroutinefunction(method)
+                    else await self._run_sync_method(method, *args, **kwargs)
+                )
+                execution_seconds = time.perf_counter() - started_at
 
             self._method_outputs.append(result)
             self._method_execution_counts[method_name] = (
                 self._method_execution_counts.get(method_name, 0) + 1
             )
 
-            crewai_event_bus.emit(
-                self,
-                MethodExecutionFinishedEvent(
-                    type="method_execution_finished",
-                    method_name=method_name,
-                    flow_name=self.__class__.__name__,
-                    state=self._copy_state(),
-                    result=result,
-                ),
-            )
+            if crewai_event_bus.has_listeners(MethodExecutionFinishedEvent):
+                crewai_event_bus.emit(
+                    self,
+                    MethodExecutionFinishedEvent(
+                        type="method_execution_finished",
+                        method_name=method_name,
+                        flow_name=self.__class__.__name__,
+                        state=self._copy_state(),
+                        result=result,
+                        queued_seconds=queued_seconds,
+                        execution_seconds=execution_seconds,
+                    ),
+                )
 
             return result
         except Exception as e:
@@ -875,6 +978,46 @@ class Flow(Generic[T], metaclass=FlowMeta):
             )
             raise e
 
+    @contextlib.asynccontextmanager
+    async def _method_slot(self, method_name: str) -> AsyncIterator[None]:
+        """Wait for the concurrency limits of the flow and of the method.
+
+        Only the method body holds the slot, not the listeners it triggers, so
+        a chain of methods cannot deadlock on its own limits.
+        """
+        # The method limit comes first so that a method waiting on its own
+        # limit does not hold one of the flow slots
+        semaphores = [
+            semaphore
+            for semaphore in (
+                self._method_semaphores.get(method_name),
+                self._flow_semaphore,
+            )
+            if semaphore is not None
+        ]
+        async with contextlib.AsyncExitStack() as stack:
+            self._waiting_methods += 1
+            try:
+                for semaphore in semaphores:
+                    await stack.enter_async_context(semaphore)
+            finally:
+                self._waiting_methods -= 1
+            self._running_methods += 1
+            try:
+                yield
+            finally:
+                self._running_methods -= 1
+
+    async def _run_sync_method(self, method: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run a synchronous method in ``sync_executor``, or inline without one."""
+        if self.sync_executor is None:
+            return method(*args, **kwargs)
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            self.sync_executor,
+            functools.partial(context.run, method, *args, **kwargs),
+        )
+
     async def _execute_listeners(self, trigger_method: str, result: Any) -> None:
         """
         Executes all listeners and routers triggered by a method completion.
@@ -963,31 +1106,24 @@ class Flow(Generic[T], metaclass=FlowMeta):
           * AND: Triggers only when all conditions are met
         - Maintains state for AND conditions using _pending_and_listeners
         - Separates router and normal listener evaluation
+        - Only visits the listeners of trigger_method, using the index built
+          when the flow class is created
         """
+        index = self._router_triggers if router_only else self._listener_triggers
         triggered = []
-        for listener_name, (condition_type, methods) in self._listeners.items():
-            is_router = listener_name in self._routers
-
-            if router_only != is_router:
+        for listener_name, bit in index.get(trigger_method, ()):
+            if not bit:
+                # OR condition, any trigger runs the listener
+                triggered.append(listener_name)
                 continue
 
-            if condition_type == "OR":
-                # If the trigger_method matches any in methods, run this
-                if trigger_method in methods:
-                    triggered.append(listener_name)
-            elif condition_type == "AND":
-                # Initialize pending methods for this listener if not already done
-                if listener_name not in self._pending_and_listeners:
-                    self._pending_and_listeners[listener_name] = set(methods)
-                # Remove the trigger method from pending methods
-                if trigger_method in self._pending_and_listeners[listener_name]:
-                    self._pending_and_listeners[listener_name].discard(trigger_method)
-
-                if not self._pending_and_listeners[listener_name]:
-                    # All required methods have been executed
-                    triggered.append(listener_name)
-                    # Reset pending methods for this listener
-                    self._pending_and_listeners.pop(listener_name, None)
+            received = self._pending_and_listeners.get(listener_name, 0) | bit
+            if received == self._and_masks[listener_name]:
+                # All required methods have been executed, reset for the next round
+                triggered.append(listener_name)
+                self._pending_and_listeners.pop(listener_name, None)
+            else:
+                self._pending_and_listeners[listener_name] = received
 
         return triggered
 
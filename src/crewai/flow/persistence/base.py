@@ -51,3 +51,11 @@ class FlowPersistence(abc.ABC):
             The most recent state as a dictionary, or None if no state exists
         """
         pass
+
+    def flush(self) -> None:
+        """Wait until every state saved so far is durably stored.
+
+        Implementations that write in the background should override this
+        method. Flows call it once their execution completes.
+        """
+        pass
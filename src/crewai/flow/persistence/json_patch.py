@@ -0,0 +1,106 @@
+"""Minimal JSON Patch (RFC 6902) support for flow state deltas.
+
+Only the ``add``, ``remove`` and ``replace`` operations are produced and
+understood, which is all that is needed to describe the difference between
+two JSON documents.
+"""
+
+from typing import Any, Dict, List
+
+JsonPatch = List[Dict[str, Any]]
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _same(old: Any, new: Any) -> bool:
+    # 1 == 1.0 == True in Python but not in JSON
+    return type(old) is type(new) and old == new
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> JsonPatch:
+    """Return the operations turning the JSON document ``old`` into ``new``.
+
+    Objects are compared key by key and lists of equal length item by item.
+    Items appended to a list are added one by one, any other list change
+    replaces the whole list.
+    """
+    if _same(old, new):
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        patch: JsonPatch = []
+        for key in old:
+            if key not in new:
+                patch.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                patch.append({"op": "add", "path": child, "value": value})
+            else:
+                patch.extend(make_patch(old[key], value, child))
+        return patch
+
+    if isinstance(old, list) and isinstance(new, list):
+        if len(old) == len(new):
+            patch = []
+            for index, (old_item, new_item) in enumerate(zip(old, new)):
+                patch.extend(make_patch(old_item, new_item, f"{path}/{index}"))
+            return patch
+        if len(new) > len(old) and all(map(_same, old, new)):
+            return [
+                {"op": "add", "path": f"{path}/-", "value": value}
+                for value in new[len(old) :]
+            ]
+
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(document: Any, patch: JsonPatch) -> Any:
+    """Apply ``patch`` to ``document`` in place and return the result.
+
+    The document itself is returned unless an operation replaces the root.
+
+    Raises:
+        ValueError: If an operation is unknown or its path does not exist
+    """
+    for operation in patch:
+        op, path = operation["op"], operation["path"]
+        if path == "":
+            if op not in ("add", "replace"):
+                raise ValueError(f"Cannot {op} the document root")
+            document = operation["value"]
+            continue
+
+        *parents, last = [_unescape(token) for token in path.split("/")[1:]]
+        target = document
+        try:
+            for token in parents:
+                target = target[int(token) if isinstance(target, list) else token]
+
+            if isinstance(target, list):
+                if op == "add":
+                    if last == "-":
+                        target.append(operation["value"])
+                    else:
+                        target.insert(int(last), operation["value"])
+                elif op == "replace":
+                    target[int(last)] = operation["value"]
+                elif op == "remove":
+                    del target[int(last)]
+                else:
+                    raise ValueError(f"Unsupported patch operation: {op}")
+            elif op in ("add", "replace"):
+                target[last] = operation["value"]
+            elif op == "remove":
+                del target[last]
+            else:
+                raise ValueError(f"Unsupported patch operation: {op}")
+        except (KeyError, IndexError, TypeError) as e:
+            raise ValueError(f"Invalid patch path {path!r}: {e}") from e
+    return document
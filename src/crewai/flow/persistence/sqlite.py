@@ -4,13 +4,36 @@ SQLite-based implementation of flow state persistence.
 
 import json
 import sqlite3
+import threading
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Literal, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
 from crewai.flow.persistence.base import FlowPersistence
+from crewai.flow.persistence.json_patch import apply_patch, make_patch
+from crewai.utilities.sqlite_pool import SQLiteBatchWriter, get_pool
+
+PersistenceMode = Literal["snapshot", "delta"]
+
+
+@dataclass
+class _StateBase:
+    """Last state persisted for a flow, which the next delta is computed from."""
+
+    state: Dict[str, Any]
+    deltas: int = 0
+
+
+@dataclass
+class _Write:
+    flow_uuid: str
+    method_name: str
+    timestamp: str
+    payload: str
+    is_snapshot: bool
 
 
 class SQLiteFlowPersistence(FlowPersistence):
@@ -19,19 +42,38 @@ class SQLiteFlowPersistence(FlowPersistence):
     This class provides a simple, file-based persistence implementation using SQLite.
     It's suitable for development and testing, or for production use cases with
     moderate performance requirements.
+
+    In the default "snapshot" mode every save stores the full state. In "delta"
+    mode a save only stores a JSON patch against the previous state, and a full
+    snapshot is written every ``compaction_interval`` saves, replacing the
+    older snapshot and deltas of the flow. Delta writes are queued and group
+    committed by a background thread, so saving does not wait on the disk;
+    ``flush`` and ``load_state`` wait for pending writes.
+
+    Connections come from the shared pool of the database file.
     """
 
     db_path: str
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        mode: PersistenceMode = "snapshot",
+        compaction_interval: int = 50,
+    ):
         """Initialize SQLite persistence.
 
         Args:
             db_path: Path to the SQLite database file. If not provided, uses
                     db_storage_path() from utilities.paths.
+            mode: "snapshot" to store the full state on every save, "delta" to
+                store JSON patches between periodic snapshots.
+            compaction_interval: Number of deltas after which a full snapshot
+                is written in "delta" mode.
 
         Raises:
-            ValueError: If db_path is invalid
+            ValueError: If db_path is invalid, the mode is unknown or the
+                compaction interval is not positive
         """
         from crewai.utilities.paths import db_storage_path
 
@@ -40,13 +82,28 @@ class SQLiteFlowPersistence(FlowPersistence):
 
         if not path:
             raise ValueError("Database path must be provided")
+        if mode not in ("snapshot", "delta"):
+            raise ValueError(f"mode must be 'snapshot' or 'delta', got {mode!r}")
+        if compaction_interval < 1:
+            raise ValueError("compaction_interval must be a positive integer")
 
         self.db_path = path  # Now mypy knows this is str
+        self.mode = mode
+        self.compaction_interval = compaction_interval
+        self._pool = get_pool(path)
+        self._state_lock = threading.Lock()
+        self._bases: Dict[str, _StateBase] = {}
+        self._snapshot_ids: Dict[str, int] = {}
+        self._writer = SQLiteBatchWriter(
+            self._pool,
+            on_error=self._on_write_error,
+            name="crewai-flow-persistence",
+        )
         self.init_db()
 
     def init_db(self) -> None:
         """Create the necessary tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.transaction() as conn:
             conn.execute(
                 """
             CREATE TABLE IF NOT EXISTS flow_states (
@@ -65,6 +122,24 @@ class SQLiteFlowPersistence(FlowPersistence):
             ON flow_states(flow_uuid)
             """
             )
+            conn.execute(
+                """
+            CREATE TABLE IF NOT EXISTS flow_state_deltas (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                flow_uuid TEXT NOT NULL,
+                snapshot_id INTEGER NOT NULL,
+                method_name TEXT NOT NULL,
+                timestamp DATETIME NOT NULL,
+                patch_json TEXT NOT NULL
+            )
+            """
+            )
+            conn.execute(
+                """
+            CREATE INDEX IF NOT EXISTS idx_flow_state_deltas_snapshot
+            ON flow_state_deltas(snapshot_id, id)
+            """
+            )
 
     def save_state(
         self,
@@ -78,7 +153,14 @@ class SQLiteFlowPersistence(FlowPersistence):
             flow_uuid: Unique identifier for the flow instance
             method_name: Name of the method that just completed
             state_data: Current state data (either dict or Pydantic model)
+
+        Raises:
+            RuntimeError: If a previous delta write failed
         """
+        if self.mode == "delta":
+            self._save_delta(flow_uuid, method_name, state_data)
+            return
+
         # Convert state_data to dict, handling both Pydantic and dict cases
         if isinstance(state_data, BaseModel):
             state_dict = dict(state_data)  # Use dict() for better type compatibility
@@ -89,7 +171,7 @@ class SQLiteFlowPersistence(FlowPersistence):
                 f"state_data must be either a Pydantic BaseModel or dict, got {type(state_data)}"
             )
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.transaction() as conn:
             conn.execute(
                 """
             INSERT INTO flow_states (
@@ -110,25 +192,162 @@ class SQLiteFlowPersistence(FlowPersistence):
     def load_state(self, flow_uuid: str) -> Optional[Dict[str, Any]]:
         """Load the most recent state for a given flow UUID.
 
+        Pending delta writes are flushed first, and the deltas stored after the
+        latest snapshot are applied to it.
+
         Args:
             flow_uuid: Unique identifier for the flow instance
 
         Returns:
             The most recent state as a dictionary, or None if no state exists
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
+        self.flush()
+        loaded = self._load_latest(flow_uuid)
+        return loaded[1] if loaded else None
+
+    def flush(self) -> None:
+        """Wait until every queued delta write has been committed.
+
+        Raises:
+            RuntimeError: If a queued write failed
+        """
+        self._raise_write_error(self._writer.flush)
+
+    def _load_latest(
+        self, flow_uuid: str
+    ) -> Optional[Tuple[int, Dict[str, Any], int]]:
+        """Return the latest snapshot id, the state it resolves to and its delta count."""
+        with self._pool.transaction() as conn:
+            row = conn.execute(
                 """
-            SELECT state_json
+            SELECT id, state_json
             FROM flow_states
             WHERE flow_uuid = ?
             ORDER BY id DESC
             LIMIT 1
             """,
                 (flow_uuid,),
+            ).fetchone()
+            if row is None:
+                return None
+            snapshot_id, state_json = row
+            patches = conn.execute(
+                """
+            SELECT patch_json
+            FROM flow_state_deltas
+            WHERE snapshot_id = ?
+            ORDER BY id
+            """,
+                (snapshot_id,),
+            ).fetchall()
+
+        state = json.loads(state_json)
+        for (patch_json,) in patches:
+            state = apply_patch(state, json.loads(patch_json))
+        return snapshot_id, state, len(patches)
+
+    def _save_delta(
+        self,
+        flow_uuid: str,
+        method_name: str,
+        state_data: Union[Dict[str, Any], BaseModel],
+    ) -> None:
+        if isinstance(state_data, BaseModel):
+            state = state_data.model_dump(mode="json")
+        elif isinstance(state_data, dict):
+            # Round trip through JSON to detach the copy from the live state
+            state = json.loads(json.dumps(state_data))
+        else:
+            raise ValueError(
+                f"state_data must be either a Pydantic BaseModel or dict, got {type(state_data)}"
             )
-            row = cursor.fetchone()
+        self._raise_write_error(self._writer.raise_error)
+
+        with self._state_lock:
+            base = self._bases.get(flow_uuid)
+            if base is None:
+                loaded = self._load_latest(flow_uuid)
+                if loaded is not None:
+                    self._snapshot_ids[flow_uuid] = loaded[0]
+                    base = _StateBase(state=loaded[1], deltas=loaded[2])
+
+            if base is None or base.deltas >= self.compaction_interval:
+                payload = json.dumps(state)
+                self._bases[flow_uuid] = _StateBase(state=state)
+                is_snapshot = True
+            else:
+                patch = make_patch(base.state, state)
+                if not patch:
+                    return
+                payload = json.dumps(patch)
+                base.state = state
+                base.deltas += 1
+                is_snapshot = False
+
+            write = _Write(
+                flow_uuid=flow_uuid,
+                method_name=method_name,
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                payload=payload,
+                is_snapshot=is_snapshot,
+            )
+            self._writer.submit(lambda conn: self._write(conn, write))
+
+    def _on_write_error(self, error: Exception) -> None:
+        # Deltas computed against lost writes are meaningless, start over
+        # from a snapshot on the next save
+        with self._state_lock:
+            self._bases.clear()
+
+    def _write(self, conn: sqlite3.Connection, write: _Write) -> None:
+        if not write.is_snapshot:
+            conn.execute(
+                """
+            INSERT INTO flow_state_deltas (
+                flow_uuid,
+                snapshot_id,
+                method_name,
+                timestamp,
+                patch_json
+            ) VALUES (?, ?, ?, ?, ?)
+            """,
+                (
+                    write.flow_uuid,
+                    self._snapshot_ids[write.flow_uuid],
+                    write.method_name,
+                    write.timestamp,
+                    write.payload,
+                ),
+            )
+            return
+
+        cursor = conn.execute(
+            """
+        INSERT INTO flow_states (
+            flow_uuid,
+            method_name,
+            timestamp,
+            state_json
+        ) VALUES (?, ?, ?, ?)
+        """,
+            (write.flow_uuid, write.method_name, write.timestamp, write.payload),
+        )
+        snapshot_id = cursor.lastrowid
+        assert snapshot_id is not None
+        self._snapshot_ids[write.flow_uuid] = snapshot_id
+        # Compaction: the new snapshot supersedes everything stored before it
+        conn.execute(
+            "DELETE FROM flow_state_deltas WHERE flow_uuid = ? AND snapshot_id < ?",
+            (write.flow_uuid, snapshot_id),
+        )
+        conn.execute(
+            "DELETE FROM flow_states WHERE flow_uuid = ? AND id < ?",
+            (write.flow_uuid, snapshot_id),
+        )
 
-        if row:
-            return json.loads(row[0])
-        return None
+    @staticmethod
+    def _raise_write_error(check: Callable[[], None]) -> None:
+        try:
+            check()
+        except Exception as error:
+            raise RuntimeError(f"Failed to persist flow states: {error}") from error
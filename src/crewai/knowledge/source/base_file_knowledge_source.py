@@ -1,8 +1,18 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-
-from pydantic import Field, field_validator
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import Field, PrivateAttr, field_validator
 
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
@@ -24,6 +34,15 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
     content: Dict[Path, str] = Field(init=False, default_factory=dict)
     storage: Optional[KnowledgeStorage] = Field(default=None)
     safe_file_paths: List[Path] = Field(default_factory=list)
+    stream: bool = Field(
+        default=False,
+        description="Read the files lazily while adding them instead of loading their content up front. Peak memory is then bounded by save_batch_size rather than by the file size, and chunks are not kept in memory.",
+    )
+
+    # Loaded text of every file with the end offset and position of its segments
+    _segment_ends: Dict[Path, Tuple[str, List[Tuple[int, int]]]] = PrivateAttr(
+        default_factory=dict
+    )
 
     @field_validator("file_path", "file_paths", mode="before")
     def validate_file_path(cls, v, info):
@@ -43,7 +62,8 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
         """Post-initialization method to load content."""
         self.safe_file_paths = self._process_file_paths()
         self.validate_content()
-        self.content = self.load_content()
+        if not self.stream:
+            self.content = self.load_content()
 
     @abstractmethod
     def load_content(self) -> Dict[Path, str]:
@@ -67,6 +87,73 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
                     color="red",
                 )
 
+    def _load_segments(
+        self, read_segments: Callable[[Path], Iterable[Tuple[str, int]]]
+    ) -> Dict[Path, str]:
+        """Read the whole text of every file, remembering where its segments end.
+
+        Args:
+            read_segments: Yields the text and position of each segment of a file.
+        """
+        content: Dict[Path, str] = {}
+        for path in self.safe_file_paths:
+            path = self.convert_to_path(path)
+            parts: List[str] = []
+            ends: List[Tuple[int, int]] = []
+            length = 0
+            for text, position in read_segments(path):
+                parts.append(text)
+                length += len(text)
+                ends.append((length, position))
+            content[path] = "".join(parts)
+            self._segment_ends[path] = (content[path], ends)
+        return content
+
+    def _add_segments(
+        self,
+        unit: str,
+        read_segments: Callable[[Path], Iterable[Tuple[str, int]]],
+    ) -> None:
+        """Chunk every file and save the chunks in batches.
+
+        Files are read as they are chunked when streaming, otherwise their
+        loaded ``content`` is chunked.
+
+        Args:
+            unit: Name of the segment position, such as "row" or "page".
+            read_segments: Yields the text and position of each segment of a file.
+        """
+
+        def chunks():
+            if self.stream:
+                for path in self.safe_file_paths:
+                    yield from self._stream_chunks(
+                        read_segments(path), unit, {"file": str(path)}
+                    )
+                return
+            for path, text in self.content.items():
+                yield from self._content_chunks(path, text, unit)
+
+        self._save_chunks(chunks(), keep=not self.stream)
+
+    def _content_chunks(
+        self, path: Path, text: str, unit: str
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        metadata: Dict[str, Any] = {"file": str(path)}
+        loaded, ends = self._segment_ends.get(path, (None, []))
+        if loaded is not text:
+            # The content was set after loading, so the positions are unknown
+            for chunk in self._chunk_text(text):
+                yield chunk, dict(metadata)
+            return
+
+        starts = [0] + [end for end, _ in ends[:-1]]
+        segments = (
+            (text[start:end], position)
+            for start, (end, position) in zip(starts, ends)
+        )
+        yield from self._stream_chunks(segments, unit, metadata)
+
     def _save_documents(self):
         """Save the documents to the storage."""
         if self.storage:
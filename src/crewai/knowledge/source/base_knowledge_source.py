@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.knowledge.utils.chunker import ChunkingStrategy, TextChunker
 
 
 class BaseKnowledgeSource(BaseModel, ABC):
@@ -12,6 +13,15 @@ class BaseKnowledgeSource(BaseModel, ABC):
 
     chunk_size: int = 4000
     chunk_overlap: int = 200
+    chunking: ChunkingStrategy = Field(
+        default="characters",
+        description="Boundary chunks end on: paragraph, sentence, record (one per line) or characters to slice fixed windows. Defaults to characters, which keeps the chunks, and their ids, of existing collections.",
+    )
+    tokenizer: Optional[Callable[[str], int]] = Field(
+        default=None,
+        exclude=True,
+        description="Returns the number of tokens of a text. chunk_size and chunk_overlap are measured with it, in characters if not set.",
+    )
     chunks: List[str] = Field(default_factory=list)
     chunk_embeddings: List[np.ndarray] = Field(default_factory=list)
 
@@ -19,6 +29,11 @@ class BaseKnowledgeSource(BaseModel, ABC):
     storage: Optional[KnowledgeStorage] = Field(default=None)
     metadata: Dict[str, Any] = Field(default_factory=dict)  # Currently unused
     collection_name: Optional[str] = Field(default=None)
+    save_batch_size: int = Field(
+        default=100,
+        ge=1,
+        description="Number of chunks written to the storage at once when streaming content.",
+    )
 
     @abstractmethod
     def validate_content(self) -> Any:
@@ -34,12 +49,67 @@ class BaseKnowledgeSource(BaseModel, ABC):
         """Return the list of embeddings for the chunks."""
         return self.chunk_embeddings
 
+    def _chunker(self) -> TextChunker:
+        return TextChunker(
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap,
+            strategy=self.chunking,
+            tokenizer=self.tokenizer,
+        )
+
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+        return self._chunker().split(text)
+
+    def _stream_chunks(
+        self,
+        segments: Iterable[Tuple[str, int]],
+        unit: str,
+        metadata: Dict[str, Any],
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Chunk a stream of text segments without holding the whole text.
+
+        Every chunk comes with ``metadata`` plus the range of segment positions
+        it covers, stored as ``{unit}_start`` and ``{unit}_end``.
+
+        Args:
+            segments: Pairs of text and position, such as a row or page number.
+            unit: Name of the position, used for the metadata keys.
+            metadata: Provenance shared by every chunk, such as the file name.
+        """
+        for chunk, first, last in self._chunker().chunk(segments):
+            yield chunk, {**metadata, f"{unit}_start": first, f"{unit}_end": last}
+
+    def _save_chunks(
+        self, chunks: Iterable[Tuple[str, Dict[str, Any]]], keep: bool = True
+    ) -> None:
+        """Save chunks and their metadata to the storage in batches.
+
+        Args:
+            chunks: Pairs of chunk text and metadata, typically from ``_stream_chunks``.
+            keep: Whether to also keep the chunks in ``self.chunks``.
+        """
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+
+        documents: List[str] = []
+        metadatas: List[Dict[str, Any]] = []
+        for chunk, chunk_metadata in chunks:
+            documents.append(chunk)
+            metadatas.append(chunk_metadata)
+            if len(documents) >= self.save_batch_size:
+                self._save_batch(documents, metadatas, keep)
+                documents, metadatas = [], []
+        if documents:
+            self._save_batch(documents, metadatas, keep)
+
+    def _save_batch(
+        self, documents: List[str], metadatas: List[Dict[str, Any]], keep: bool
+    ) -> None:
+        if keep:
+            self.chunks.extend(documents)
+        if self.storage:
+            self.storage.save(documents, metadatas)
 
     def _save_documents(self):
         """
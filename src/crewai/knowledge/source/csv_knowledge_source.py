@@ -1,6 +1,6 @@
 import csv
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, Tuple
 
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
 
@@ -10,31 +10,17 @@ class CSVKnowledgeSource(BaseFileKnowledgeSource):
 
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess CSV file content."""
-        content_dict = {}
-        for file_path in self.safe_file_paths:
-            with open(file_path, "r", encoding="utf-8") as csvfile:
-                reader = csv.reader(csvfile)
-                content = ""
-                for row in reader:
-                    content += " ".join(row) + "\n"
-                content_dict[file_path] = content
-        return content_dict
+        return self._load_segments(self._read_rows)
+
+    def _read_rows(self, file_path: Path) -> Iterator[Tuple[str, int]]:
+        """Yield the text of every row with its 1-based row number."""
+        with open(file_path, "r", encoding="utf-8", newline="") as csvfile:
+            for row_number, row in enumerate(csv.reader(csvfile), start=1):
+                yield " ".join(row) + "\n", row_number
 
     def add(self) -> None:
         """
         Add CSV file content to the knowledge source, chunk it, compute embeddings,
         and save the embeddings.
         """
-        content_str = (
-            str(self.content) if isinstance(self.content, dict) else self.content
-        )
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
-
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+        self._add_segments("row", self._read_rows)
@@ -1,5 +1,17 @@
+import csv
+import io
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlparse
 
 from pydantic import Field, field_validator
@@ -26,6 +38,10 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
     chunks: List[str] = Field(default_factory=list)
     content: Dict[Path, Dict[str, str]] = Field(default_factory=dict)
     safe_file_paths: List[Path] = Field(default_factory=list)
+    stream: bool = Field(
+        default=False,
+        description="Read the workbooks row by row while adding them instead of loading every sheet up front. Requires openpyxl and .xlsx files.",
+    )
 
     @field_validator("file_path", "file_paths", mode="before")
     def validate_file_path(cls, v, info):
@@ -98,7 +114,8 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
             self.file_paths = self.file_path
         self.safe_file_paths = self._process_file_paths()
         self.validate_content()
-        self.content = self._load_content()
+        if not self.stream:
+            self.content = self._load_content()
 
     def _load_content(self) -> Dict[Path, Dict[str, str]]:
         """Load and preprocess Excel file content from multiple sheets.
@@ -142,28 +159,63 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
                 f"{missing_package} is not installed. Please install it with: pip install {missing_package}"
             )
 
+    def _import_openpyxl(self):
+        """Dynamically import openpyxl."""
+        try:
+            import openpyxl
+
+            return openpyxl
+        except ImportError:
+            raise ImportError(
+                "openpyxl is not installed. Please install it with: pip install openpyxl"
+            )
+
+    def _iter_sheets(self) -> Iterator[Tuple[Path, str, Iterable[Tuple[str, int]]]]:
+        """Yield the file, name and rows of every sheet.
+
+        Rows are read lazily from the workbooks when streaming, otherwise they
+        are parsed from the loaded CSV content, where a quoted cell may span
+        several lines.
+        """
+        if not self.stream:
+            for file_path, sheets in self.content.items():
+                for sheet_name, sheet_content in sheets.items():
+                    yield file_path, sheet_name, self._read_rows(
+                        csv.reader(io.StringIO(sheet_content))
+                    )
+            return
+
+        openpyxl = self._import_openpyxl()
+        for file_path in self.safe_file_paths:
+            workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                for worksheet in workbook.worksheets:
+                    yield file_path, worksheet.title, self._read_rows(
+                        worksheet.iter_rows(values_only=True)
+                    )
+            finally:
+                workbook.close()
+
+    def _read_rows(self, rows: Iterable[Sequence[Any]]) -> Iterator[Tuple[str, int]]:
+        """Yield every row of a sheet as a CSV line with its 1-based row number."""
+        line = io.StringIO()
+        writer = csv.writer(line, lineterminator="\n")
+        for row_number, row in enumerate(rows, 1):
+            writer.writerow(["" if value is None else value for value in row])
+            yield line.getvalue(), row_number
+            line.seek(0)
+            line.truncate()
+
     def add(self) -> None:
         """
         Add Excel file content to the knowledge source, chunk it, compute embeddings,
         and save the embeddings.
         """
-        # Convert dictionary values to a single string if content is a dictionary
-        # Updated to account for .xlsx workbooks with multiple tabs/sheets
-        content_str = ""
-        for value in self.content.values():
-            if isinstance(value, dict):
-                for sheet_value in value.values():
-                    content_str += str(sheet_value) + "\n"
-            else:
-                content_str += str(value) + "\n"
-
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
-
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+
+        def chunks():
+            for file_path, sheet_name, rows in self._iter_sheets():
+                yield from self._stream_chunks(
+                    rows, "row", {"file": str(file_path), "sheet": sheet_name}
+                )
+
+        self._save_chunks(chunks(), keep=not self.stream)
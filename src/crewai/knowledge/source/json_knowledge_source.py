@@ -1,22 +1,40 @@
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, Tuple
 
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
 
 
 class JSONKnowledgeSource(BaseFileKnowledgeSource):
-    """A knowledge source that stores and queries JSON file content using embeddings."""
+    """A knowledge source that stores and queries JSON file content using embeddings.
+
+    Files with a ``.jsonl`` extension are read as JSON Lines, one record per line,
+    which keeps memory bounded when the source is streamed. Regular JSON files
+    are parsed at once and split into records by their top-level entries.
+    """
 
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess JSON file content."""
-        content: Dict[Path, str] = {}
-        for path in self.safe_file_paths:
-            path = self.convert_to_path(path)
-            with open(path, "r", encoding="utf-8") as json_file:
-                data = json.load(json_file)
-            content[path] = self._json_to_text(data)
-        return content
+        return self._load_segments(self._read_records)
+
+    def _read_records(self, path: Path) -> Iterator[Tuple[str, int]]:
+        """Yield the text of every top-level record with its 0-based index."""
+        with open(path, "r", encoding="utf-8") as json_file:
+            if path.suffix == ".jsonl":
+                for index, line in enumerate(json_file):
+                    if line.strip():
+                        yield self._json_to_text(json.loads(line)) + "\n", index
+                return
+            data = json.load(json_file)
+
+        if isinstance(data, dict):
+            for index, (key, value) in enumerate(data.items()):
+                yield f"{key}: {self._json_to_text(value, 1)}\n", index
+        elif isinstance(data, list):
+            for index, item in enumerate(data):
+                yield f"- {self._json_to_text(item, 1)}\n", index
+        else:
+            yield self._json_to_text(data), 0
 
     def _json_to_text(self, data: Any, level: int = 0) -> str:
         """Recursively convert JSON data to a text representation."""
@@ -37,16 +55,4 @@ class JSONKnowledgeSource(BaseFileKnowledgeSource):
         Add JSON file content to the knowledge source, chunk it, compute embeddings,
         and save the embeddings.
         """
-        content_str = (
-            str(self.content) if isinstance(self.content, dict) else self.content
-        )
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
-
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+        self._add_segments("record", self._read_records)
@@ -0,0 +1,118 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, List, Sequence, Tuple
+
+from crewai.utilities.logger import Logger
+
+# Rough number of characters per token, used to report token throughput
+# without depending on the tokenizer of the configured embedder.
+CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class IngestionStats:
+    """Summary of a knowledge ingestion run."""
+
+    chunks: int = 0
+    embedded: int = 0
+    skipped: int = 0
+    batches: int = 0
+    retries: int = 0
+    estimated_tokens: int = 0
+    seconds: float = 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.embedded / self.seconds if self.seconds else 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self.estimated_tokens / self.seconds if self.seconds else 0.0
+
+
+class EmbeddingPipeline:
+    """Embeds documents in batches spread over a pool of worker threads.
+
+    Every batch is retried with exponential backoff, so a rate limited or
+    flaky embedding provider does not fail a whole ingestion run.
+
+    Args:
+        embedder: Chroma compatible embedding function, called with a list of
+            documents and returning one embedding per document.
+        batch_size: Number of documents sent to the embedder per call.
+        max_workers: Number of batches embedded concurrently.
+        max_retries: Number of retries for a failing batch before giving up.
+        backoff: Seconds to wait before the first retry, doubled on every retry.
+    """
+
+    def __init__(
+        self,
+        embedder: Callable[[List[str]], Sequence[Any]],
+        batch_size: int = 100,
+        max_workers: int = 4,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.embedder = embedder
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+    def embed(self, documents: List[str], stats: IngestionStats) -> List[Any]:
+        """Embed ``documents`` and return their embeddings in the same order.
+
+        Batch, retry and throughput counters are added to ``stats``.
+        """
+        if not documents:
+            return []
+
+        batches = [
+            documents[start : start + self.batch_size]
+            for start in range(0, len(documents), self.batch_size)
+        ]
+        started_at = time.perf_counter()
+        if len(batches) == 1 or self.max_workers == 1:
+            results = [self._embed_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(batches)),
+                thread_name_prefix="crewai-embedding",
+            ) as pool:
+                results = list(pool.map(self._embed_batch, batches))
+
+        stats.seconds += time.perf_counter() - started_at
+        stats.batches += len(batches)
+        stats.retries += sum(retries for _, retries in results)
+        stats.embedded += len(documents)
+        stats.estimated_tokens += sum(len(doc) for doc in documents) // CHARS_PER_TOKEN
+        return [embedding for embeddings, _ in results for embedding in embeddings]
+
+    def _embed_batch(self, batch: List[str]) -> Tuple[List[Any], int]:
+        """Embed a single batch, returning its embeddings and the retries it took."""
+        attempt = 0
+        while True:
+            try:
+                embeddings = list(self.embedder(batch))
+                if len(embeddings) != len(batch):
+                    raise ValueError(
+                        f"Embedder returned {len(embeddings)} embeddings for {len(batch)} documents"
+                    )
+                return embeddings, attempt
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff * (2**attempt)
+                attempt += 1
+                Logger(verbose=True).log(
+                    "warning",
+                    f"Embedding batch failed ({e}), retrying in {delay:.1f}s "
+                    f"({attempt}/{self.max_retries})",
+                    "yellow",
+                )
+                time.sleep(delay)
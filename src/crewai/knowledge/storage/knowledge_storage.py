@@ -4,7 +4,7 @@ import io
 import logging
 import os
 import shutil
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import chromadb
 import chromadb.errors
@@ -13,9 +13,14 @@ from chromadb.api.types import OneOrMany
 from chromadb.config import Settings
 
 from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
+from crewai.knowledge.storage.embedding_pipeline import (
+    EmbeddingPipeline,
+    IngestionStats,
+)
 from crewai.utilities import EmbeddingConfigurator
 from crewai.utilities.chromadb import sanitize_collection_name
 from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
+from crewai.utilities.embedding_cache import CachedEmbeddingFunction
 from crewai.utilities.logger import Logger
 from crewai.utilities.paths import db_storage_path
 
@@ -41,19 +46,40 @@ class KnowledgeStorage(BaseKnowledgeStorage):
     """
     Extends Storage to handle embeddings for memory entries, improving
     search efficiency.
+
+    Documents are identified by the SHA-256 of their content, so saving a
+    document that is already stored does not embed it again. New documents
+    are embedded in batches of ``embedding_batch_size`` by up to
+    ``embedding_workers`` concurrent workers, retrying failed batches up to
+    ``embedding_max_retries`` times. Statistics of the last save are kept in
+    ``last_ingestion``.
     """
 
     collection: Optional[chromadb.Collection] = None
     collection_name: Optional[str] = "knowledge"
     app: Optional[ClientAPI] = None
+    last_ingestion: Optional[IngestionStats] = None
+
+    # Number of ids looked up per existence query, well below SQLite's
+    # limit on bound variables.
+    ID_LOOKUP_SIZE = 500
 
     def __init__(
         self,
         embedder: Optional[Dict[str, Any]] = None,
         collection_name: Optional[str] = None,
+        embedding_batch_size: int = 100,
+        embedding_workers: int = 4,
+        embedding_max_retries: int = 3,
     ):
         self.collection_name = collection_name
         self._set_embedder_config(embedder)
+        self.embedding_pipeline = EmbeddingPipeline(
+            self.embedder,
+            batch_size=embedding_batch_size,
+            max_workers=embedding_workers,
+            max_retries=embedding_max_retries,
+        )
 
     def search(
         self,
@@ -125,13 +151,13 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         self,
         documents: List[str],
         metadata: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
-    ):
+    ) -> IngestionStats:
         if not self.collection:
             raise Exception("Collection not initialized")
 
         try:
             # Create a dictionary to store unique documents
-            unique_docs = {}
+            unique_docs: Dict[str, Tuple[str, Any]] = {}
 
             # Generate IDs and create a mapping of id -> (document, metadata)
             for idx, doc in enumerate(documents):
@@ -144,27 +170,29 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                         doc_metadata = metadata
                 unique_docs[doc_id] = (doc, doc_metadata)
 
-            # Prepare filtered lists for ChromaDB
-            filtered_docs = []
-            filtered_metadata = []
-            filtered_ids = []
-
-            # Build the filtered lists
-            for doc_id, (doc, meta) in unique_docs.items():
-                filtered_docs.append(doc)
-                filtered_metadata.append(meta)
-                filtered_ids.append(doc_id)
+            stats = IngestionStats(chunks=len(unique_docs))
+            existing_ids = self._existing_ids(list(unique_docs))
+            stats.skipped = len(existing_ids)
+
+            new_ids = [doc_id for doc_id in unique_docs if doc_id not in existing_ids]
+            if new_ids:
+                new_docs = [unique_docs[doc_id][0] for doc_id in new_ids]
+                embeddings = self.embedding_pipeline.embed(new_docs, stats)
+                self.collection.upsert(
+                    ids=new_ids,
+                    documents=new_docs,
+                    embeddings=embeddings,
+                    metadatas=self._metadatas_or_none(new_ids, unique_docs),
+                )
 
-            # If we have no metadata at all, set it to None
-            final_metadata: Optional[OneOrMany[chromadb.Metadata]] = (
-                None if all(m is None for m in filtered_metadata) else filtered_metadata
-            )
+            # Stored documents keep their embedding, only their metadata may change
+            stored_ids = [doc_id for doc_id in unique_docs if doc_id in existing_ids]
+            stored_metadata = self._metadatas_or_none(stored_ids, unique_docs)
+            if stored_ids and stored_metadata is not None:
+                self.collection.update(ids=stored_ids, metadatas=stored_metadata)
 
-            self.collection.upsert(
-                documents=filtered_docs,
-                metadatas=final_metadata,
-                ids=filtered_ids,
-            )
+            self.last_ingestion = stats
+            return stats
         except chromadb.errors.InvalidDimensionException as e:
             Logger(verbose=True).log(
                 "error",
@@ -180,6 +208,26 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             Logger(verbose=True).log("error", f"Failed to upsert documents: {e}", "red")
             raise
 
+    def _existing_ids(self, ids: List[str]) -> Set[str]:
+        """Return the subset of ``ids`` already stored in the collection."""
+        if not self.collection:
+            return set()
+        existing: Set[str] = set()
+        for start in range(0, len(ids), self.ID_LOOKUP_SIZE):
+            fetched = self.collection.get(
+                ids=ids[start : start + self.ID_LOOKUP_SIZE], include=[]
+            )
+            existing.update(fetched["ids"])
+        return existing
+
+    @staticmethod
+    def _metadatas_or_none(
+        ids: List[str], unique_docs: Dict[str, Tuple[str, Any]]
+    ) -> Optional[OneOrMany[chromadb.Metadata]]:
+        metadatas = [unique_docs[doc_id][1] for doc_id in ids]
+        # If we have no metadata at all, set it to None
+        return None if all(m is None for m in metadatas) else metadatas
+
     def _create_default_embedding_function(self):
         from chromadb.utils.embedding_functions.openai_embedding_function import (
             OpenAIEmbeddingFunction,
@@ -199,5 +247,5 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         self.embedder = (
             EmbeddingConfigurator().configure_embedder(embedder)
             if embedder
-            else self._create_default_embedding_function()
+            else CachedEmbeddingFunction(self._create_default_embedding_function())
         )
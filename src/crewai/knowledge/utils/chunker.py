@@ -0,0 +1,168 @@
+"""Boundary-aware text chunking shared by the knowledge sources."""
+
+import re
+from collections import deque
+from typing import (
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Pattern,
+    Tuple,
+    TypeVar,
+)
+
+ChunkingStrategy = Literal["paragraph", "sentence", "record", "characters"]
+
+P = TypeVar("P")
+
+_PARAGRAPHS = re.compile(r".*?(?:\n[ \t]*\n\s*|\Z)", re.S)
+_SENTENCES = re.compile(r".*?(?:[.!?]+(?=\s|\Z)|\n|\Z)\s*", re.S)
+_RECORDS = re.compile(r".*?(?:\n|\Z)", re.S)
+_WORDS = re.compile(r"\S+\s*|\s+")
+
+# Units tried in order until a piece fits in a chunk, words being the last
+# boundary before falling back to slicing characters.
+_SPLIT_LEVELS = {
+    "paragraph": [_PARAGRAPHS, _SENTENCES, _WORDS],
+    "sentence": [_SENTENCES, _WORDS],
+    "record": [_RECORDS, _WORDS],
+}
+
+
+class TextChunker:
+    """Splits text into chunks of at most ``chunk_size`` tokens.
+
+    Text is cut into units (paragraphs, sentences or records) that are packed
+    greedily into chunks, so chunks end on a boundary instead of in the middle
+    of a word. A unit larger than a chunk is split on the next finer boundary,
+    down to words and finally characters. Consecutive chunks share their
+    trailing units up to ``chunk_overlap`` tokens. Every unit is tokenized once
+    and enters and leaves the chunk window once, so chunking is linear in the
+    size of the text.
+
+    The "characters" strategy keeps the historical behavior of slicing fixed
+    windows of ``chunk_size`` characters every ``chunk_size - chunk_overlap``
+    characters, ignoring the tokenizer.
+
+    Args:
+        chunk_size: Maximum number of tokens per chunk.
+        chunk_overlap: Number of tokens repeated at the start of the next chunk.
+        strategy: Boundary respected when splitting the text.
+        tokenizer: Returns the number of tokens of a text. Defaults to counting
+            characters, which keeps ``chunk_size`` compatible with the
+            character based slicing.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int,
+        chunk_overlap: int = 0,
+        strategy: ChunkingStrategy = "characters",
+        tokenizer: Optional[Callable[[str], int]] = None,
+    ):
+        if chunk_overlap >= chunk_size:
+            raise ValueError("chunk_overlap must be smaller than chunk_size")
+        if strategy != "characters" and strategy not in _SPLIT_LEVELS:
+            raise ValueError(f"Unknown chunking strategy: {strategy}")
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.strategy = strategy
+        self.count_tokens = tokenizer or len
+
+    def split(self, text: str) -> List[str]:
+        """Split a single text into chunks."""
+        return [chunk for chunk, _, _ in self.chunk([(text, 0)])]
+
+    def chunk(self, segments: Iterable[Tuple[str, P]]) -> Iterator[Tuple[str, P, P]]:
+        """Chunk a stream of text segments, such as the rows or pages of a file.
+
+        Only about one chunk of text is held at a time. Segment ends are treated
+        as boundaries.
+
+        Yields:
+            Tuples of (chunk, position of its first segment, position of its last segment).
+        """
+        if self.strategy == "characters":
+            yield from self._chunk_characters(segments)
+            return
+
+        window: Deque[Tuple[str, int, P]] = deque()
+        tokens = 0
+        has_new_units = False
+        for text, position in segments:
+            for unit, unit_tokens in self._units(text, 0):
+                if window and tokens + unit_tokens > self.chunk_size:
+                    if has_new_units:
+                        yield self._join(window)
+                        has_new_units = False
+                    # Keep the trailing units that fit in the overlap
+                    while window and (
+                        tokens > self.chunk_overlap
+                        or tokens + unit_tokens > self.chunk_size
+                    ):
+                        tokens -= window.popleft()[1]
+                window.append((unit, unit_tokens, position))
+                tokens += unit_tokens
+                has_new_units = True
+
+        if has_new_units:
+            yield self._join(window)
+
+    def _units(self, text: str, level: int) -> Iterator[Tuple[str, int]]:
+        levels: List[Pattern[str]] = _SPLIT_LEVELS[self.strategy]
+        for match in levels[level].finditer(text):
+            piece = match.group()
+            if not piece:
+                continue
+            piece_tokens = self.count_tokens(piece)
+            if piece_tokens <= self.chunk_size:
+                yield piece, piece_tokens
+            elif level + 1 < len(levels):
+                yield from self._units(piece, level + 1)
+            else:
+                # A single word larger than a chunk, cut it proportionally
+                width = max(1, len(piece) * self.chunk_size // piece_tokens)
+                for start in range(0, len(piece), width):
+                    part = piece[start : start + width]
+                    yield part, self.count_tokens(part)
+
+    @staticmethod
+    def _join(window: Deque[Tuple[str, int, P]]) -> Tuple[str, P, P]:
+        return "".join(unit for unit, _, _ in window), window[0][2], window[-1][2]
+
+    def _chunk_characters(
+        self, segments: Iterable[Tuple[str, P]]
+    ) -> Iterator[Tuple[str, P, P]]:
+        step = self.chunk_size - self.chunk_overlap
+        buffer = ""
+        offset = 0  # Position of the buffer start in the concatenated text
+        spans: Deque[Tuple[int, int, P]] = deque()
+
+        def emit(start: int, end: int) -> Tuple[str, P, P]:
+            covered = [position for s, e, position in spans if s < end and e > start]
+            return buffer[start - offset : end - offset], covered[0], covered[-1]
+
+        for text, position in segments:
+            if not text:
+                continue
+            end = offset + len(buffer) + len(text)
+            spans.append((end - len(text), end, position))
+            buffer += text
+            start = offset
+            while offset + len(buffer) - start >= self.chunk_size:
+                yield emit(start, start + self.chunk_size)
+                start += step
+            # Trim once per segment rather than once per chunk to stay linear
+            buffer = buffer[start - offset :]
+            offset = start
+            while spans and spans[0][1] <= offset:
+                spans.popleft()
+
+        for start in range(0, len(buffer), step):
+            yield emit(
+                offset + start, offset + min(start + self.chunk_size, len(buffer))
+            )
@@ -1,18 +1,25 @@
+import asyncio
+import inspect
 import json
 import logging
 import os
+import re
 import sys
 import threading
 import warnings
 from collections import defaultdict
 from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import (
     Any,
+    Callable,
     DefaultDict,
     Dict,
+    Iterator,
     List,
     Literal,
     Optional,
+    Tuple,
     Type,
     TypedDict,
     Union,
@@ -44,7 +51,7 @@ with warnings.catch_warnings():
     from litellm.litellm_core_utils.get_supported_openai_params import (
         get_supported_openai_params,
     )
-    from litellm.types.utils import ModelResponse
+    from litellm.types.utils import ModelResponse, Usage
     from litellm.utils import supports_response_schema
 
 
@@ -52,6 +59,7 @@ import io
 from typing import TextIO
 
 from crewai.llms.base_llm import BaseLLM
+from crewai.llms.response_cache import LLMResponseCache
 from crewai.utilities.events import crewai_event_bus
 from crewai.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededException,
@@ -254,6 +262,35 @@ LLM_CONTEXT_WINDOW_SIZES = {
 DEFAULT_CONTEXT_WINDOW_SIZE = 8192
 CONTEXT_WINDOW_USAGE_RATIO = 0.85
 
+# Word sized pieces in which cached responses are replayed to stream consumers
+_REPLAY_CHUNKS = re.compile(r"\s*\S+|\s+", re.S)
+
+
+# Guards the callback lists of litellm, which calls made concurrently update
+_callbacks_lock = threading.Lock()
+
+# Called with every streamed chunk, returns the length of the response to keep
+# once it is complete
+_stream_stop: ContextVar[Optional[Callable[[str], Optional[int]]]] = ContextVar(
+    "crewai_stream_stop", default=None
+)
+
+
+@contextmanager
+def stop_stream_when(complete: Callable[[str], Optional[int]]) -> Iterator[None]:
+    """Stop the streamed responses of the LLM calls made in the block early.
+
+    Args:
+        complete: Called with every chunk received. Returns the length of the
+            response received so far to keep once it is complete, which ends
+            the stream, or None to keep streaming.
+    """
+    token = _stream_stop.set(complete)
+    try:
+        yield
+    finally:
+        _stream_stop.reset(token)
+
 
 @contextmanager
 def suppress_warnings():
@@ -311,6 +348,7 @@ class LLM(BaseLLM):
         callbacks: List[Any] = [],
         reasoning_effort: Optional[Literal["none", "low", "medium", "high"]] = None,
         stream: bool = False,
+        cache: Optional[Union[bool, LLMResponseCache]] = None,
         **kwargs,
     ):
         self.model = model
@@ -337,6 +375,7 @@ class LLM(BaseLLM):
         self.additional_params = kwargs
         self.is_anthropic = self._is_anthropic_model(model)
         self.stream = stream
+        self.cache = LLMResponseCache() if cache is True else (cache or None)
 
         litellm.drop_params = True
 
@@ -439,6 +478,9 @@ class LLM(BaseLLM):
         chunk_count = 0
         usage_info = None
         tool_calls = None
+        # The output of a tool run while streaming becomes part of the response
+        ran_tool = False
+        stopped_early = False
 
         accumulated_tool_args: DefaultDict[int, AccumulatedToolArgs] = defaultdict(
             AccumulatedToolArgs
@@ -447,10 +489,12 @@ class LLM(BaseLLM):
         # --- 2) Make sure stream is set to True and include usage metrics
         params["stream"] = True
         params["stream_options"] = {"include_usage": True}
+        stop = _stream_stop.get()
 
         try:
             # --- 3) Process each chunk in the stream
-            for chunk in litellm.completion(**params):
+            stream = litellm.completion(**params)
+            for chunk in stream:
                 chunk_count += 1
                 last_chunk = chunk
 
@@ -513,6 +557,7 @@ class LLM(BaseLLM):
                                     )
                                     if result is not None:
                                         chunk_content = result
+                                        ran_tool = True
 
                 except Exception as e:
                     logging.debug(f"Error extracting content from chunk: {e}")
@@ -523,12 +568,31 @@ class LLM(BaseLLM):
                     # Add the chunk content to the full response
                     full_response += chunk_content
 
+                    # Cut the response where the consumer found it complete
+                    keep = stop(chunk_content) if stop is not None else None
+                    if keep is not None:
+                        chunk_content = chunk_content[
+                            : max(0, len(chunk_content) - len(full_response) + keep)
+                        ]
+                        full_response = full_response[:keep]
+
                     # Emit the chunk event
                     assert hasattr(crewai_event_bus, "emit")
-                    crewai_event_bus.emit(
-                        self,
-                        event=LLMStreamChunkEvent(chunk=chunk_content),
-                    )
+                    if (keep is None or chunk_content) and (
+                        crewai_event_bus.has_listeners(LLMStreamChunkEvent)
+                    ):
+                        crewai_event_bus.emit(
+                            self,
+                            event=LLMStreamChunkEvent(chunk=chunk_content),
+                        )
+
+                    if keep is not None:
+                        # Stop the generation, the provider reports no usage then
+                        close = getattr(stream, "close", None)
+                        if callable(close):
+                            close()
+                        stopped_early = True
+                        break
             # --- 4) Fallback to non-streaming if no content received
             if not full_response.strip() and chunk_count == 0:
                 logging.warning(
@@ -592,7 +656,11 @@ class LLM(BaseLLM):
                     "No content received from streaming response. Received empty chunks or failed to extract content."
                 )
 
-            # --- 7) Check for tool calls in the final response
+            # --- 7) Estimate the usage the provider did not report
+            if stopped_early and not usage_info:
+                usage_info = self._estimate_usage(params, full_response)
+
+            # --- 8) Check for tool calls in the final response
             tool_calls = None
             try:
                 if last_chunk:
@@ -619,24 +687,28 @@ class LLM(BaseLLM):
                                 tool_calls = getattr(message, "tool_calls")
             except Exception as e:
                 logging.debug(f"Error checking for tool calls: {e}")
-            # --- 8) If no tool calls or no available functions, return the text response directly
+            # --- 9) If no tool calls or no available functions, return the text response directly
 
             if not tool_calls or not available_functions:
                 # Log token usage if available in streaming mode
                 self._handle_streaming_callbacks(callbacks, usage_info, last_chunk)
                 # Emit completion event and return response
+                if not ran_tool and not stopped_early:
+                    self._cache_response(params, full_response)
                 self._handle_emit_call_events(full_response, LLMCallType.LLM_CALL)
                 return full_response
 
-            # --- 9) Handle tool calls if present
+            # --- 10) Handle tool calls if present
             tool_result = self._handle_tool_call(tool_calls, available_functions)
             if tool_result is not None:
                 return tool_result
 
-            # --- 10) Log token usage if available in streaming mode
+            # --- 11) Log token usage if available in streaming mode
             self._handle_streaming_callbacks(callbacks, usage_info, last_chunk)
 
-            # --- 11) Emit completion event and return response
+            # --- 12) Emit completion event and return response
+            if not ran_tool and not stopped_early:
+                self._cache_response(params, full_response)
             self._handle_emit_call_events(full_response, LLMCallType.LLM_CALL)
             return full_response
 
@@ -660,6 +732,31 @@ class LLM(BaseLLM):
             )
             raise Exception(f"Failed to get streaming response: {str(e)}")
 
+    def _estimate_usage(self, params: Dict[str, Any], response: str) -> Usage:
+        """Estimate the usage of a streamed response stopped before its end.
+
+        Args:
+            params: Parameters used for the completion call
+            response: The part of the response that was kept
+
+        Returns:
+            Usage: Token counts of the messages and of the kept response
+        """
+        messages = params.get("messages") or []
+        try:
+            prompt_tokens = litellm.token_counter(model=self.model, messages=messages)
+            completion_tokens = litellm.token_counter(model=self.model, text=response)
+        except Exception as e:
+            logging.debug(f"Error counting tokens, estimating from length: {e}")
+            characters = sum(len(str(message.get("content") or "")) for message in messages)
+            prompt_tokens = characters // 4
+            completion_tokens = len(response) // 4
+        return Usage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        )
+
     def _handle_streaming_tool_calls(
         self,
         tool_calls: List[ChatCompletionDeltaToolCall],
@@ -677,13 +774,14 @@ class LLM(BaseLLM):
                     tool_call.function.arguments
                 )
             assert hasattr(crewai_event_bus, "emit")
-            crewai_event_bus.emit(
-                self,
-                event=LLMStreamChunkEvent(
-                    tool_call=tool_call.to_dict(),
-                    chunk=tool_call.function.arguments,
-                ),
-            )
+            if crewai_event_bus.has_listeners(LLMStreamChunkEvent):
+                crewai_event_bus.emit(
+                    self,
+                    event=LLMStreamChunkEvent(
+                        tool_call=tool_call.to_dict(),
+                        chunk=tool_call.function.arguments,
+                    ),
+                )
 
             if (
                 current_tool_accumulator.function.name
@@ -771,13 +869,85 @@ class LLM(BaseLLM):
             # for consistent handling in the rest of the codebase
             raise LLMContextLengthExceededException(str(e))
 
-        # --- 2) Extract response message and content
+        # --- 2) Process the response and any tool calls
+        response_message, text_response = self._process_completion_response(
+            response, params, callbacks
+        )
+        tool_calls = getattr(response_message, "tool_calls", [])
+        if not tool_calls or not available_functions:
+            self._cache_response(params, text_response)
+            self._handle_emit_call_events(text_response, LLMCallType.LLM_CALL)
+            return text_response
+
+        tool_result = self._handle_tool_call(tool_calls, available_functions)
+        if tool_result is not None:
+            return tool_result
+
+        self._cache_response(params, text_response)
+        self._handle_emit_call_events(text_response, LLMCallType.LLM_CALL)
+        return text_response
+
+    async def _ahandle_non_streaming_response(
+        self,
+        params: Dict[str, Any],
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Handle a non-streaming response from the LLM without blocking the event loop.
+
+        Args:
+            params: Parameters for the completion call
+            callbacks: Optional list of callback functions
+            available_functions: Dict of available functions
+
+        Returns:
+            str: The response text
+        """
+        try:
+            response = await litellm.acompletion(**params)
+        except ContextWindowExceededError as e:
+            raise LLMContextLengthExceededException(str(e))
+
+        response_message, text_response = self._process_completion_response(
+            response, params, callbacks
+        )
+        tool_calls = getattr(response_message, "tool_calls", [])
+        if not tool_calls or not available_functions:
+            self._cache_response(params, text_response)
+            self._handle_emit_call_events(text_response, LLMCallType.LLM_CALL)
+            return text_response
+
+        tool_result = await self._ahandle_tool_call(tool_calls, available_functions)
+        if tool_result is not None:
+            return tool_result
+
+        self._cache_response(params, text_response)
+        self._handle_emit_call_events(text_response, LLMCallType.LLM_CALL)
+        return text_response
+
+    def _process_completion_response(
+        self,
+        response: Any,
+        params: Dict[str, Any],
+        callbacks: Optional[List[Any]] = None,
+    ) -> Tuple[Any, str]:
+        """Extract the message from a completion response and report its usage.
+
+        Args:
+            response: The completion response returned by litellm
+            params: Parameters used for the completion call
+            callbacks: Optional list of callback functions
+
+        Returns:
+            Tuple[Any, str]: The response message and its text content
+        """
+        # --- 1) Extract response message and content
         response_message = cast(Choices, cast(ModelResponse, response).choices)[
             0
         ].message
         text_response = response_message.content or ""
 
-        # --- 3) Handle callbacks with usage info
+        # --- 2) Handle callbacks with usage info
         if callbacks and len(callbacks) > 0:
             for callback in callbacks:
                 if hasattr(callback, "log_success_event"):
@@ -790,22 +960,7 @@ class LLM(BaseLLM):
                             end_time=0,
                         )
 
-        # --- 4) Check for tool calls
-        tool_calls = getattr(response_message, "tool_calls", [])
-
-        # --- 5) If no tool calls or no available functions, return the text response directly
-        if not tool_calls or not available_functions:
-            self._handle_emit_call_events(text_response, LLMCallType.LLM_CALL)
-            return text_response
-
-        # --- 6) Handle tool calls if present
-        tool_result = self._handle_tool_call(tool_calls, available_functions)
-        if tool_result is not None:
-            return tool_result
-
-        # --- 7) If tool call handling didn't return a result, emit completion event and return text response
-        self._handle_emit_call_events(text_response, LLMCallType.LLM_CALL)
-        return text_response
+        return response_message, text_response
 
     def _handle_tool_call(
         self,
@@ -838,51 +993,115 @@ class LLM(BaseLLM):
                 fn = available_functions[function_name]
 
                 # --- 3.2) Execute function
-                assert hasattr(crewai_event_bus, "emit")
-                started_at = datetime.now()
-                crewai_event_bus.emit(
-                    self,
-                    event=ToolUsageStartedEvent(
-                        tool_name=function_name,
-                        tool_args=function_args,
-                    ),
-                )
+                started_at = self._emit_tool_call_started(function_name, function_args)
                 result = fn(**function_args)
-                crewai_event_bus.emit(
-                    self,
-                    event=ToolUsageFinishedEvent(
-                        output=result,
-                        tool_name=function_name,
-                        tool_args=function_args,
-                        started_at=started_at,
-                        finished_at=datetime.now(),
-                    ),
-                )
 
                 # --- 3.3) Emit success event
-                self._handle_emit_call_events(result, LLMCallType.TOOL_CALL)
+                self._emit_tool_call_finished(
+                    function_name, function_args, started_at, result
+                )
                 return result
             except Exception as e:
                 # --- 3.4) Handle execution errors
-                fn = available_functions.get(
-                    function_name, lambda: None
-                )  # Ensure fn is always a callable
-                logging.error(f"Error executing function '{function_name}': {e}")
-                assert hasattr(crewai_event_bus, "emit")
-                crewai_event_bus.emit(
-                    self,
-                    event=LLMCallFailedEvent(error=f"Tool execution error: {str(e)}"),
-                )
-                crewai_event_bus.emit(
-                    self,
-                    event=ToolUsageErrorEvent(
-                        tool_name=function_name,
-                        tool_args=function_args,
-                        error=f"Tool execution error: {str(e)}"
-                    ),
+                self._emit_tool_call_failed(function_name, function_args, e)
+        return None
+
+    async def _ahandle_tool_call(
+        self,
+        tool_calls: List[Any],
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """Handle a tool call from the LLM on the running event loop.
+
+        Coroutine functions are awaited directly, regular functions run in a
+        worker thread so they cannot block other coroutines.
+
+        Args:
+            tool_calls: List of tool calls from the LLM
+            available_functions: Dict of available functions
+
+        Returns:
+            Optional[str]: The result of the tool call, or None if no tool call was made
+        """
+        if not tool_calls or not available_functions:
+            return None
+
+        tool_call = tool_calls[0]
+        function_name = tool_call.function.name
+        function_args = {}
+
+        if function_name in available_functions:
+            try:
+                function_args = json.loads(tool_call.function.arguments)
+                fn = available_functions[function_name]
+
+                started_at = self._emit_tool_call_started(function_name, function_args)
+                if inspect.iscoroutinefunction(fn):
+                    result = await fn(**function_args)
+                else:
+                    result = await asyncio.to_thread(fn, **function_args)
+
+                self._emit_tool_call_finished(
+                    function_name, function_args, started_at, result
                 )
+                return result
+            except Exception as e:
+                self._emit_tool_call_failed(function_name, function_args, e)
         return None
 
+    def _emit_tool_call_started(
+        self, function_name: str, function_args: Dict[str, Any]
+    ) -> datetime:
+        assert hasattr(crewai_event_bus, "emit")
+        started_at = datetime.now()
+        if crewai_event_bus.has_listeners(ToolUsageStartedEvent):
+            crewai_event_bus.emit(
+                self,
+                event=ToolUsageStartedEvent(
+                    tool_name=function_name,
+                    tool_args=function_args,
+                ),
+            )
+        return started_at
+
+    def _emit_tool_call_finished(
+        self,
+        function_name: str,
+        function_args: Dict[str, Any],
+        started_at: datetime,
+        result: Any,
+    ) -> None:
+        if crewai_event_bus.has_listeners(ToolUsageFinishedEvent):
+            crewai_event_bus.emit(
+                self,
+                event=ToolUsageFinishedEvent(
+                    output=result,
+                    tool_name=function_name,
+                    tool_args=function_args,
+                    started_at=started_at,
+                    finished_at=datetime.now(),
+                ),
+            )
+        self._handle_emit_call_events(result, LLMCallType.TOOL_CALL)
+
+    def _emit_tool_call_failed(
+        self, function_name: str, function_args: Dict[str, Any], error: Exception
+    ) -> None:
+        logging.error(f"Error executing function '{function_name}': {error}")
+        assert hasattr(crewai_event_bus, "emit")
+        crewai_event_bus.emit(
+            self,
+            event=LLMCallFailedEvent(error=f"Tool execution error: {str(error)}"),
+        )
+        crewai_event_bus.emit(
+            self,
+            event=ToolUsageErrorEvent(
+                tool_name=function_name,
+                tool_args=function_args,
+                error=f"Tool execution error: {str(error)}"
+            ),
+        )
+
     def call(
         self,
         messages: Union[str, List[Dict[str, str]]],
@@ -913,41 +1132,24 @@ class LLM(BaseLLM):
             ValueError: If response format is not supported
             LLMContextLengthExceededException: If input exceeds model's context limit
         """
-        # --- 1) Emit call started event
-        assert hasattr(crewai_event_bus, "emit")
-        crewai_event_bus.emit(
-            self,
-            event=LLMCallStartedEvent(
-                messages=messages,
-                tools=tools,
-                callbacks=callbacks,
-                available_functions=available_functions,
-            ),
-        )
+        # --- 1) Emit the started event, validate and normalize the messages
+        messages = self._start_call(messages, tools, callbacks, available_functions)
 
-        # --- 2) Validate parameters before proceeding with the call
-        self._validate_call_params()
-
-        # --- 3) Convert string messages to proper format if needed
-        if isinstance(messages, str):
-            messages = [{"role": "user", "content": messages}]
-
-        # --- 4) Handle O1 model special case (system messages not supported)
-        if "o1" in self.model.lower():
-            for message in messages:
-                if message.get("role") == "system":
-                    message["role"] = "assistant"
-
-        # --- 5) Set up callbacks if provided
+        # --- 2) Set up callbacks if provided
         with suppress_warnings():
             if callbacks and len(callbacks) > 0:
                 self.set_callbacks(callbacks)
 
             try:
-                # --- 6) Prepare parameters for the completion call
+                # --- 3) Prepare parameters for the completion call
                 params = self._prepare_completion_params(messages, tools)
 
-                # --- 7) Make the completion call and handle response
+                # --- 4) Answer from the response cache when possible
+                cached_response = self._get_cached_response(params)
+                if cached_response is not None:
+                    return cached_response
+
+                # --- 5) Make the completion call and handle response
                 if self.stream:
                     return self._handle_streaming_response(
                         params, callbacks, available_functions
@@ -963,13 +1165,144 @@ class LLM(BaseLLM):
                 # whether to summarize the content or abort based on the respect_context_window flag
                 raise
             except Exception as e:
-                assert hasattr(crewai_event_bus, "emit")
-                crewai_event_bus.emit(
-                    self,
-                    event=LLMCallFailedEvent(error=str(e)),
+                self._handle_call_failure(e)
+                raise
+
+    async def acall(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> Union[str, Any]:
+        """Asynchronous counterpart of ``call`` built on ``litellm.acompletion``.
+
+        The request is awaited on the running event loop, so many concurrent
+        calls share a single thread. Streaming responses are still consumed
+        through the synchronous stream handler in a worker thread.
+
+        Args:
+            messages: Input messages for the LLM.
+            tools: Optional list of tool schemas for function calling.
+            callbacks: Optional list of callback functions to be executed
+                      during and after the LLM call.
+            available_functions: Optional dict mapping function names to callables
+                               that can be invoked by the LLM.
+
+        Returns:
+            Union[str, Any]: Either a text response from the LLM (str) or
+                           the result of a tool function call (Any).
+
+        Raises:
+            TypeError: If messages format is invalid
+            ValueError: If response format is not supported
+            LLMContextLengthExceededException: If input exceeds model's context limit
+        """
+        messages = self._start_call(messages, tools, callbacks, available_functions)
+
+        with suppress_warnings():
+            if callbacks and len(callbacks) > 0:
+                self.set_callbacks(callbacks)
+
+            try:
+                params = self._prepare_completion_params(messages, tools)
+
+                cached_response = self._get_cached_response(params)
+                if cached_response is not None:
+                    return cached_response
+
+                if self.stream:
+                    return await asyncio.to_thread(
+                        self._handle_streaming_response,
+                        params,
+                        callbacks,
+                        available_functions,
+                    )
+                return await self._ahandle_non_streaming_response(
+                    params, callbacks, available_functions
                 )
-                logging.error(f"LiteLLM call failed: {str(e)}")
+
+            except LLMContextLengthExceededException:
                 raise
+            except Exception as e:
+                self._handle_call_failure(e)
+                raise
+
+    def _start_call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, str]]:
+        """Emit the call started event and prepare the messages for the call.
+
+        Returns:
+            List[Dict[str, str]]: The messages in the format expected by litellm
+
+        Raises:
+            ValueError: If response format is not supported
+        """
+        # --- 1) Emit call started event
+        assert hasattr(crewai_event_bus, "emit")
+        if crewai_event_bus.has_listeners(LLMCallStartedEvent):
+            crewai_event_bus.emit(
+                self,
+                event=LLMCallStartedEvent(
+                    messages=messages,
+                    tools=tools,
+                    callbacks=callbacks,
+                    available_functions=available_functions,
+                ),
+            )
+
+        # --- 2) Validate parameters before proceeding with the call
+        self._validate_call_params()
+
+        # --- 3) Convert string messages to proper format if needed
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+
+        # --- 4) Handle O1 model special case (system messages not supported)
+        if "o1" in self.model.lower():
+            for message in messages:
+                if message.get("role") == "system":
+                    message["role"] = "assistant"
+
+        return messages
+
+    def _handle_call_failure(self, error: Exception) -> None:
+        assert hasattr(crewai_event_bus, "emit")
+        crewai_event_bus.emit(
+            self,
+            event=LLMCallFailedEvent(error=str(error)),
+        )
+        logging.error(f"LiteLLM call failed: {str(error)}")
+
+    def _get_cached_response(self, params: Dict[str, Any]) -> Optional[str]:
+        """Return the cached response to ``params`` and emit its events, if any.
+
+        When streaming, the cached response is replayed as chunk events so that
+        stream consumers behave as if the provider had answered.
+        """
+        if self.cache is None:
+            return None
+        response = self.cache.get(params)
+        if response is None:
+            return None
+
+        if self.stream:
+            assert hasattr(crewai_event_bus, "emit")
+            if crewai_event_bus.has_listeners(LLMStreamChunkEvent):
+                for chunk in _REPLAY_CHUNKS.findall(response):
+                    crewai_event_bus.emit(self, event=LLMStreamChunkEvent(chunk=chunk))
+        self._handle_emit_call_events(response, LLMCallType.LLM_CALL)
+        return response
+
+    def _cache_response(self, params: Dict[str, Any], response: str) -> None:
+        """Store a complete text response, tool results are never cached."""
+        if self.cache is not None and response.strip():
+            self.cache.set(params, response)
 
     def _handle_emit_call_events(self, response: Any, call_type: LLMCallType):
         """Handle the events for the LLM call.
@@ -979,10 +1312,11 @@ class LLM(BaseLLM):
             call_type (str): The type of call, either "tool_call" or "llm_call".
         """
         assert hasattr(crewai_event_bus, "emit")
-        crewai_event_bus.emit(
-            self,
-            event=LLMCallCompletedEvent(response=response, call_type=call_type),
-        )
+        if crewai_event_bus.has_listeners(LLMCallCompletedEvent):
+            crewai_event_bus.emit(
+                self,
+                event=LLMCallCompletedEvent(response=response, call_type=call_type),
+            )
 
     def _format_messages_for_provider(
         self, messages: List[Dict[str, str]]
@@ -1127,7 +1461,7 @@ class LLM(BaseLLM):
         Attempt to keep a single set of callbacks in litellm by removing old
         duplicates and adding new ones.
         """
-        with suppress_warnings():
+        with suppress_warnings(), _callbacks_lock:
             callback_types = [type(callback) for callback in callbacks]
             for callback in litellm.success_callback[:]:
                 if type(callback) in callback_types:
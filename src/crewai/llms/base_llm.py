@@ -1,5 +1,9 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from crewai.llms.response_cache import LLMResponseCache
 
 
 class BaseLLM(ABC):
@@ -17,11 +21,15 @@ class BaseLLM(ABC):
     Attributes:
         stop (list): A list of stop sequences that the LLM should use to stop generation.
             This is used by the CrewAgentExecutor and other components.
+        cache (LLMResponseCache, optional): Response cache consulted before calling
+            the provider, None when caching is disabled. Custom implementations
+            can use it through its ``get`` and ``set`` methods.
     """
 
     model: str
     temperature: Optional[float] = None
     stop: Optional[List[str]] = None
+    cache: Optional["LLMResponseCache"] = None
 
     def __init__(
         self,
@@ -73,6 +81,39 @@ class BaseLLM(ABC):
         """
         pass
 
+    async def acall(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> Union[str, Any]:
+        """Asynchronously call the LLM with the given messages.
+
+        The default implementation runs ``call`` in a worker thread. Implementations
+        with a native async client should override it so that concurrent calls do
+        not each hold a thread.
+
+        Args:
+            messages: Input messages for the LLM.
+            tools: Optional list of tool schemas for function calling.
+            callbacks: Optional list of callback functions to be executed
+                      during and after the LLM call.
+            available_functions: Optional dict mapping function names to callables
+                               that can be invoked by the LLM.
+
+        Returns:
+            Either a text response from the LLM (str) or
+            the result of a tool function call (Any).
+        """
+        return await asyncio.to_thread(
+            self.call,
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+        )
+
     def supports_stop_words(self) -> bool:
         """Check if the LLM supports stop words.
 
@@ -0,0 +1,182 @@
+"""Response cache consulted by ``LLM.call`` before reaching the provider."""
+
+import hashlib
+import json
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from crewai.agents.cache.backends import CacheBackend, InMemoryCacheBackend
+
+# Request parameters that change what a model answers. Anything else, such as
+# credentials, timeouts or the stream flag, does not affect the cache key.
+CACHE_KEY_PARAMS = (
+    "model",
+    "tools",
+    "temperature",
+    "top_p",
+    "n",
+    "stop",
+    "max_tokens",
+    "presence_penalty",
+    "frequency_penalty",
+    "logit_bias",
+    "response_format",
+    "seed",
+    "reasoning_effort",
+)
+
+_TRAILING_SPACES = re.compile(r"[ \t]+$", re.M)
+
+
+def normalize_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop formatting differences that do not change the meaning of a prompt.
+
+    Line endings are unified and leading, trailing and end of line whitespace
+    is removed from text contents. Keys other than the role, content and tool
+    call identifiers are ignored.
+    """
+    normalized = []
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            content = _TRAILING_SPACES.sub("", content.replace("\r\n", "\n")).strip()
+        entry = {"role": message.get("role"), "content": content}
+        for key in ("name", "tool_call_id", "tool_calls"):
+            if message.get(key) is not None:
+                entry[key] = message[key]
+        normalized.append(entry)
+    return normalized
+
+
+def _digest(value: Any) -> str:
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Cache of LLM text responses keyed by the request that produced them.
+
+    The exact tier stores responses in a ``CacheBackend`` under a hash of the
+    model, the normalized messages, the tools and the sampling parameters, so
+    identical requests are answered without calling the provider. It is meant
+    for test and evaluation runs, which replay the same prompts many times.
+
+    The optional semantic tier embeds the messages of every cached request.
+    On an exact miss, it returns the response of the most similar cached
+    request with the same parameters and roles, provided their cosine
+    similarity reaches ``similarity_threshold``. Its index lives in memory.
+
+    Args:
+        backend: Stores responses, defaults to an in-memory LRU of 1024 entries
+            and 64 MiB.
+            Use a ``SQLiteCacheBackend`` to keep responses across runs.
+        ttl: Seconds a response stays valid, None to keep it until evicted.
+        embedder: Embedding function enabling the semantic tier, called with a
+            list of texts and returning one vector per text.
+        similarity_threshold: Minimum cosine similarity of a semantic hit.
+        max_semantic_entries: Number of requests kept in the semantic index.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: Optional[float] = None,
+        embedder: Optional[Callable[[List[str]], Sequence[Any]]] = None,
+        similarity_threshold: float = 0.95,
+        max_semantic_entries: int = 1024,
+    ):
+        if not 0 < similarity_threshold <= 1:
+            raise ValueError("similarity_threshold must be in (0, 1]")
+        self.backend = (
+            backend if backend is not None else InMemoryCacheBackend()
+        )
+        self.ttl = ttl
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self.max_semantic_entries = max_semantic_entries
+        self.hits = 0
+        self.misses = 0
+        self._semantic_index: Dict[str, List[Tuple[np.ndarray, str]]] = {}
+        self._semantic_size = 0
+        self._lock = threading.Lock()
+
+    def make_key(self, params: Dict[str, Any]) -> str:
+        """Build the exact cache key of completion ``params``."""
+        return _digest(
+            {
+                "messages": normalize_messages(params.get("messages", [])),
+                **self._request_params(params),
+            }
+        )
+
+    def get(self, params: Dict[str, Any]) -> Optional[str]:
+        """Return the cached response for completion ``params``, or None."""
+        response = self.backend.get(self.make_key(params))
+        if response is None and self.embedder is not None:
+            response = self._semantic_get(params)
+        with self._lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return response
+
+    def set(self, params: Dict[str, Any], response: str) -> None:
+        """Store ``response`` as the answer to completion ``params``."""
+        key = self.make_key(params)
+        self.backend.set(key, response, ttl=self.ttl)
+        if self.embedder is not None:
+            self._semantic_add(params, key)
+
+    def clear(self) -> None:
+        self.backend.clear()
+        with self._lock:
+            self._semantic_index.clear()
+            self._semantic_size = 0
+
+    @staticmethod
+    def _request_params(params: Dict[str, Any]) -> Dict[str, Any]:
+        return {name: params.get(name) for name in CACHE_KEY_PARAMS}
+
+    def _semantic_scope(self, params: Dict[str, Any]) -> str:
+        """Requests only match semantically when everything but their text is equal."""
+        roles = [message.get("role") for message in params.get("messages", [])]
+        return _digest({"roles": roles, **self._request_params(params)})
+
+    def _embed_messages(self, params: Dict[str, Any]) -> np.ndarray:
+        text = "\n\n".join(
+            str(message["content"])
+            for message in normalize_messages(params.get("messages", []))
+        )
+        (embedding,) = self.embedder([text])  # type: ignore[misc]
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _semantic_get(self, params: Dict[str, Any]) -> Optional[str]:
+        with self._lock:
+            candidates = list(self._semantic_index.get(self._semantic_scope(params), []))
+        if not candidates:
+            return None
+
+        vector = self._embed_messages(params)
+        similarities = np.stack([candidate for candidate, _ in candidates]) @ vector
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+        return self.backend.get(candidates[best][1])
+
+    def _semantic_add(self, params: Dict[str, Any], key: str) -> None:
+        vector = self._embed_messages(params)
+        scope = self._semantic_scope(params)
+        with self._lock:
+            self._semantic_index.setdefault(scope, []).append((vector, key))
+            self._semantic_size += 1
+            while self._semantic_size > self.max_semantic_entries:
+                # Drop the oldest entry of the largest scope
+                largest = max(self._semantic_index.values(), key=len)
+                largest.pop(0)
+                self._semantic_size -= 1
@@ -1,4 +1,8 @@
-from typing import Any, Dict, Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from crewai.memory import (
     EntityMemory,
@@ -7,9 +11,42 @@ from crewai.memory import (
     ShortTermMemory,
     UserMemory,
 )
+from crewai.memory.memory_writer import MemoryWriter
+from crewai.utilities.events.crewai_event_bus import crewai_event_bus
+from crewai.utilities.events.memory_events import MemoryRetrievalCompletedEvent
+
+_executor: Optional[ThreadPoolExecutor] = None
+# Fetch still running for each memory, so a source that hangs holds one thread
+_in_flight: Dict[int, Future] = {}
+_in_flight_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Threads querying memories, shared by every agent."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=16, thread_name_prefix="crewai-memory-retrieval"
+        )
+    return _executor
 
 
 class ContextualMemory:
+    """Builds the memory context of a task from every configured memory.
+
+    The memories are queried concurrently. ``memory_config`` can bound how long
+    building the context waits for them: ``retrieval_timeout`` is the number
+    of seconds to wait for each source, either one number or a mapping from
+    source name ("ltm", "stm", "entity", "external", "user") to seconds, and
+    ``retrieval_budget`` caps the time spent waiting for all of them. The
+    section of a source answering too late is left out of the context, and the
+    source is skipped as long as that fetch is still running. A
+    ``MemoryRetrievalCompletedEvent`` reports how long each source took.
+
+    With ``read_your_writes``, the memories still queued by ``memory_writer``
+    are saved before querying, so earlier tasks of the crew are always found.
+    """
+
     def __init__(
         self,
         memory_config: Optional[Dict[str, Any]],
@@ -18,11 +55,23 @@ class ContextualMemory:
         em: EntityMemory,
         um: UserMemory,
         exm: ExternalMemory,
+        memory_writer: Optional[MemoryWriter] = None,
     ):
         if memory_config is not None:
             self.memory_provider = memory_config.get("provider")
+            self.retrieval_timeout: Union[None, float, Dict[str, float]] = (
+                memory_config.get("retrieval_timeout")
+            )
+            self.retrieval_budget: Optional[float] = memory_config.get(
+                "retrieval_budget"
+            )
+            self.read_your_writes: bool = memory_config.get("read_your_writes", False)
         else:
             self.memory_provider = None
+            self.retrieval_timeout = None
+            self.retrieval_budget = None
+            self.read_your_writes = False
+        self.memory_writer = memory_writer
         self.stm = stm
         self.ltm = ltm
         self.em = em
@@ -39,15 +88,124 @@ class ContextualMemory:
         if query == "":
             return ""
 
-        context = []
-        context.append(self._fetch_ltm_context(task.description))
-        context.append(self._fetch_stm_context(query))
-        context.append(self._fetch_entity_context(query))
-        context.append(self._fetch_external_context(query))
+        if self.read_your_writes and self.memory_writer is not None:
+            self.memory_writer.flush()
+
+        sources: List[Tuple[str, Any, Callable[[], Optional[str]]]] = [
+            ("ltm", self.ltm, lambda: self._fetch_ltm_context(task.description)),
+            ("stm", self.stm, lambda: self._fetch_stm_context(query)),
+            ("entity", self.em, lambda: self._fetch_entity_context(query)),
+            ("external", self.exm, lambda: self._fetch_external_context(query)),
+        ]
         if self.memory_provider == "mem0":
-            context.append(self._fetch_user_context(query))
+            sources.append(("user", self.um, lambda: self._fetch_user_context(query)))
+
+        context = self._fetch_concurrently(
+            [source for source in sources if source[1] is not None]
+        )
         return "\n".join(filter(None, context))
 
+    def _source_timeout(self, name: str) -> Optional[float]:
+        if isinstance(self.retrieval_timeout, dict):
+            return self.retrieval_timeout.get(name)
+        return self.retrieval_timeout
+
+    def _fetch_concurrently(
+        self, sources: List[Tuple[str, Any, Callable[[], Optional[str]]]]
+    ) -> List[Optional[str]]:
+        """Run the fetches in parallel and return their results in order.
+
+        A fetch that has not answered when its timeout or the budget expires
+        contributes None. It keeps running in the background, its result is
+        discarded, and the memory it queries contributes None until it ends.
+        """
+        if not sources:
+            return []
+
+        with _in_flight_lock:
+            busy = {id(memory) for _, memory, _ in sources if id(memory) in _in_flight}
+
+        def timed(fetch: Callable[[], Optional[str]]) -> Tuple[Optional[str], float]:
+            started_at = time.perf_counter()
+            result = fetch()
+            return result, time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        unbounded = self.retrieval_timeout is None and self.retrieval_budget is None
+        futures: List[Optional[Future]] = []
+        if len(sources) == 1 and unbounded and not busy:
+            # Nothing to overlap or bound, skip the thread hop
+            future: Future = Future()
+            try:
+                future.set_result(timed(sources[0][2]))
+            except Exception as e:
+                future.set_exception(e)
+            futures.append(future)
+        else:
+            for _, memory, fetch in sources:
+                if id(memory) in busy:
+                    futures.append(None)
+                else:
+                    futures.append(self._submit(memory, timed, fetch))
+
+        results: List[Optional[str]] = []
+        for (name, _, _), future in zip(sources, futures):
+            if future is None:
+                self._emit_retrieval(name, "skipped", 0.0)
+                results.append(None)
+                continue
+            deadlines = [
+                started_at + limit
+                for limit in (self._source_timeout(name), self.retrieval_budget)
+                if limit is not None
+            ]
+            wait = (
+                max(0.0, min(deadlines) - time.perf_counter()) if deadlines else None
+            )
+            try:
+                result, elapsed = future.result(timeout=wait)
+            except FutureTimeoutError:
+                self._emit_retrieval(name, "timeout", time.perf_counter() - started_at)
+                results.append(None)
+                continue
+            except Exception as e:
+                self._emit_retrieval(
+                    name, "failed", time.perf_counter() - started_at, error=str(e)
+                )
+                raise
+            self._emit_retrieval(name, "completed", elapsed)
+            results.append(result)
+        return results
+
+    @staticmethod
+    def _submit(memory: Any, timed: Callable, fetch: Callable) -> Future:
+        key = id(memory)
+        future = _get_executor().submit(timed, fetch)
+        with _in_flight_lock:
+            _in_flight[key] = future
+
+        def done(_: Future) -> None:
+            with _in_flight_lock:
+                if _in_flight.get(key) is future:
+                    del _in_flight[key]
+
+        future.add_done_callback(done)
+        return future
+
+    def _emit_retrieval(
+        self, source: str, status: str, elapsed: float, error: Optional[str] = None
+    ) -> None:
+        if crewai_event_bus.has_listeners(MemoryRetrievalCompletedEvent):
+            crewai_event_bus.emit(
+                self,
+                MemoryRetrievalCompletedEvent(
+                    source=source,
+                    status=status,  # type: ignore[arg-type]
+                    elapsed_seconds=elapsed,
+                    error=error,
+                ),
+            )
+
     def _fetch_stm_context(self, query) -> str:
         """
         Fetches recent relevant insights from STM related to the task's description and expected_output,
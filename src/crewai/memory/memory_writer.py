@@ -0,0 +1,91 @@
+import atexit
+import contextlib
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+
+class MemoryWriter:
+    """Background thread saving memories off the critical path of tasks.
+
+    Jobs run one after the other, in the order they were queued. The jobs
+    queued while the thread was busy run as one batch, during which the
+    documents saved to storages supporting batching, such as ``RAGStorage``,
+    are added to their collection together and embedded with a single call.
+
+    Args:
+        max_batch_size: Number of jobs run in one batch at most.
+    """
+
+    def __init__(self, max_batch_size: int = 64) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer")
+        self.max_batch_size = max_batch_size
+        self._queue: Deque[Tuple[Callable[[], None], Sequence[Any]]] = deque()
+        self._in_progress = 0
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+
+    def submit(self, job: Callable[[], None], memories: Sequence[Any] = ()) -> None:
+        """Queue a job saving to ``memories``.
+
+        Args:
+            job: Function saving the memories.
+            memories: Memories the job saves to, whose storages are batched.
+        """
+        with self._condition:
+            self._queue.append((job, memories))
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="crewai-memory-writer", daemon=True
+                )
+                self._worker.start()
+                atexit.register(self.flush)
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued job has run.
+
+        Returns:
+            False if the timeout expired first.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._queue and not self._in_progress, timeout
+            )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: bool(self._queue))
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(len(self._queue), self.max_batch_size))
+                ]
+                self._in_progress = len(batch)
+
+            try:
+                self._run_batch(batch)
+            finally:
+                with self._condition:
+                    self._in_progress = 0
+                    self._condition.notify_all()
+
+    @staticmethod
+    def _run_batch(batch: List[Tuple[Callable[[], None], Sequence[Any]]]) -> None:
+        storages: Dict[int, Any] = {}
+        for _, memories in batch:
+            for memory in memories:
+                storage = getattr(memory, "storage", None)
+                if hasattr(storage, "batch"):
+                    storages[id(storage)] = storage
+
+        with contextlib.ExitStack() as stack:
+            for storage in storages.values():
+                stack.enter_context(storage.batch())
+            for job, _ in batch:
+                try:
+                    job()
+                except Exception as e:
+                    logging.error(f"Failed to save memories: {e}")
@@ -9,6 +9,7 @@ from crewai.utilities import Printer
 from crewai.utilities.crew_json_encoder import CrewJSONEncoder
 from crewai.utilities.errors import DatabaseError, DatabaseOperationError
 from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite_pool import get_pool
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,7 @@ class KickoffTaskOutputsSQLiteStorage:
             db_path = str(Path(db_storage_path()) / "latest_kickoff_task_outputs.db")
         self.db_path = db_path
         self._printer: Printer = Printer()
+        self._pool = get_pool(self.db_path)
         self._initialize_db()
 
     def _initialize_db(self) -> None:
@@ -39,7 +41,7 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If database initialization fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.transaction() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -54,8 +56,6 @@ class KickoffTaskOutputsSQLiteStorage:
                     )
                 """
                 )
-
-                conn.commit()
         except sqlite3.Error as e:
             error_msg = DatabaseError.format_error(DatabaseError.INIT_ERROR, e)
             logger.error(error_msg)
@@ -82,7 +82,7 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If saving the task output fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.transaction() as conn:
                 conn.execute("BEGIN TRANSACTION")
                 cursor = conn.cursor()
                 cursor.execute(
@@ -100,7 +100,6 @@ class KickoffTaskOutputsSQLiteStorage:
                         was_replayed,
                     ),
                 )
-                conn.commit()
         except sqlite3.Error as e:
             error_msg = DatabaseError.format_error(DatabaseError.SAVE_ERROR, e)
             logger.error(error_msg)
@@ -125,7 +124,7 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If updating the task output fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.transaction() as conn:
                 conn.execute("BEGIN TRANSACTION")
                 cursor = conn.cursor()
 
@@ -143,7 +142,6 @@ class KickoffTaskOutputsSQLiteStorage:
                 values.append(task_index)
 
                 cursor.execute(query, tuple(values))
-                conn.commit()
 
                 if cursor.rowcount == 0:
                     logger.warning(f"No row found with task_index {task_index}. No update performed.")
@@ -164,7 +162,7 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If loading task outputs fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.transaction() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                 SELECT *
@@ -203,11 +201,10 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If deleting task outputs fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.transaction() as conn:
                 conn.execute("BEGIN TRANSACTION")
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM latest_kickoff_task_outputs")
-                conn.commit()
         except sqlite3.Error as e:
             error_msg = DatabaseError.format_error(DatabaseError.DELETE_ERROR, e)
             logger.error(error_msg)
@@ -1,27 +1,84 @@
+import hashlib
 import json
+import re
 import sqlite3
+import time
+from datetime import datetime as _datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 from crewai.utilities import Printer
 from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite_pool import get_pool
+
+_WORDS = re.compile(r"\w+")
+
+
+def task_hash(task_description: str) -> str:
+    """Hash a task description, ignoring differences in whitespace."""
+    normalized = " ".join(task_description.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _words(text: str) -> set:
+    return set(_WORDS.findall(text.lower()))
+
+
+def _parse_timestamp(value: str) -> float:
+    """Read the stored datetime string, either a Unix time or an ISO date."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return _datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return time.time()
 
 
 class LTMSQLiteStorage:
     """
     An updated SQLite storage class for LTM data storage.
+
+    Memories are looked up by a hash of their task description and ordered by
+    a numeric timestamp, both indexed. With ``similarity_search`` enabled, a
+    full text index also finds the memories of near-identical tasks, such as
+    the same task interpolated with other inputs, when not enough memories of
+    the exact task exist.
+
+    Args:
+        db_path: Path to the SQLite database file.
+        similarity_search: Also return memories of similar tasks, using FTS5.
+        similarity_threshold: Minimum share of words two task descriptions
+            must have in common to be considered similar.
+        max_rows_per_task: Number of memories kept per task, oldest first out.
+        max_age_seconds: Age after which memories are deleted.
     """
 
     def __init__(
-        self, db_path: Optional[str] = None
+        self,
+        db_path: Optional[str] = None,
+        similarity_search: bool = False,
+        similarity_threshold: float = 0.8,
+        max_rows_per_task: Optional[int] = None,
+        max_age_seconds: Optional[float] = None,
     ) -> None:
         if db_path is None:
             # Get the parent directory of the default db path and create our db file there
             db_path = str(Path(db_storage_path()) / "long_term_memory_storage.db")
+        if not 0 < similarity_threshold <= 1:
+            raise ValueError("similarity_threshold must be in (0, 1]")
+        if max_rows_per_task is not None and max_rows_per_task < 1:
+            raise ValueError("max_rows_per_task must be a positive integer")
         self.db_path = db_path
+        self.similarity_search = similarity_search
+        self.similarity_threshold = similarity_threshold
+        self.max_rows_per_task = max_rows_per_task
+        self.max_age_seconds = max_age_seconds
         self._printer: Printer = Printer()
         # Ensure parent directory exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._pool = get_pool(self.db_path)
         self._initialize_db()
 
     def _initialize_db(self):
@@ -29,7 +86,7 @@ class LTMSQLiteStorage:
         Initializes the SQLite database and creates LTM table
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.transaction() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -38,18 +95,95 @@ class LTMSQLiteStorage:
                         task_description TEXT,
                         metadata TEXT,
                         datetime TEXT,
-                        score REAL
+                        score REAL,
+                        task_hash TEXT,
+                        created_at REAL
                     )
                 """
                 )
-
-                conn.commit()
+                self._migrate(conn)
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_ltm_task_hash
+                    ON long_term_memories(task_hash, created_at)
+                """
+                )
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_ltm_created_at
+                    ON long_term_memories(created_at)
+                """
+                )
+                if self.similarity_search:
+                    self._create_fts_index(conn)
         except sqlite3.Error as e:
             self._printer.print(
                 content=f"MEMORY ERROR: An error occurred during database initialization: {e}",
                 color="red",
             )
 
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """Add the indexed columns to databases created by earlier versions."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(long_term_memories)")}
+        for column, column_type in (("task_hash", "TEXT"), ("created_at", "REAL")):
+            if column not in columns:
+                conn.execute(
+                    f"ALTER TABLE long_term_memories ADD COLUMN {column} {column_type}"  # nosec
+                )
+        rows = conn.execute(
+            """
+            SELECT id, task_description, datetime
+            FROM long_term_memories
+            WHERE task_hash IS NULL OR created_at IS NULL
+        """
+        ).fetchall()
+        conn.executemany(
+            "UPDATE long_term_memories SET task_hash = ?, created_at = ? WHERE id = ?",
+            [
+                (task_hash(description or ""), _parse_timestamp(stored_at), row_id)
+                for row_id, description, stored_at in rows
+            ],
+        )
+
+    def _create_fts_index(self, conn: sqlite3.Connection) -> None:
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'long_term_memories_fts'"
+        ).fetchone()
+        conn.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS long_term_memories_fts
+            USING fts5(
+                task_description,
+                content='long_term_memories',
+                content_rowid='id'
+            )
+        """
+        )
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS long_term_memories_fts_insert
+            AFTER INSERT ON long_term_memories BEGIN
+                INSERT INTO long_term_memories_fts(rowid, task_description)
+                VALUES (new.id, new.task_description);
+            END
+        """
+        )
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS long_term_memories_fts_delete
+            AFTER DELETE ON long_term_memories BEGIN
+                INSERT INTO long_term_memories_fts(
+                    long_term_memories_fts, rowid, task_description
+                ) VALUES ('delete', old.id, old.task_description);
+            END
+        """
+        )
+        if not exists:
+            # Index the memories stored before similarity search was enabled
+            conn.execute(
+                "INSERT INTO long_term_memories_fts(long_term_memories_fts) VALUES ('rebuild')"
+            )
+
     def save(
         self,
         task_description: str,
@@ -58,17 +192,27 @@ class LTMSQLiteStorage:
         score: Union[int, float],
     ) -> None:
         """Saves data to the LTM table with error handling."""
+        description_hash = task_hash(task_description)
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.transaction() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
-                INSERT INTO long_term_memories (task_description, metadata, datetime, score)
-                VALUES (?, ?, ?, ?)
+                INSERT INTO long_term_memories (
+                    task_description, metadata, datetime, score, task_hash, created_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?)
             """,
-                    (task_description, json.dumps(metadata), datetime, score),
+                    (
+                        task_description,
+                        json.dumps(metadata),
+                        datetime,
+                        score,
+                        description_hash,
+                        _parse_timestamp(datetime),
+                    ),
                 )
-                conn.commit()
+                self._apply_retention(conn, description_hash)
         except sqlite3.Error as e:
             self._printer.print(
                 content=f"MEMORY ERROR: An error occurred while saving to LTM: {e}",
@@ -78,21 +222,31 @@ class LTMSQLiteStorage:
     def load(
         self, task_description: str, latest_n: int
     ) -> Optional[List[Dict[str, Any]]]:
-        """Queries the LTM table by task description with error handling."""
+        """Queries the LTM table by task description with error handling.
+
+        Memories of the task come first, most recent first. With similarity
+        search enabled, memories of similar tasks fill the remaining places,
+        most similar first.
+        """
+        description_hash = task_hash(task_description)
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.transaction() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
-                    f"""
+                    """
                     SELECT metadata, datetime, score
                     FROM long_term_memories
-                    WHERE task_description = ?
-                    ORDER BY datetime DESC, score ASC
-                    LIMIT {latest_n}
-                """,  # nosec
-                    (task_description,),
+                    WHERE task_hash = ?
+                    ORDER BY created_at DESC, score ASC
+                    LIMIT ?
+                """,
+                    (description_hash, latest_n),
                 )
                 rows = cursor.fetchall()
+                if self.similarity_search and len(rows) < latest_n:
+                    rows += self._load_similar(
+                        conn, task_description, description_hash, latest_n - len(rows)
+                    )
                 if rows:
                     return [
                         {
@@ -110,15 +264,100 @@ class LTMSQLiteStorage:
             )
         return None
 
+    def _load_similar(
+        self,
+        conn: sqlite3.Connection,
+        task_description: str,
+        description_hash: str,
+        limit: int,
+        candidates: int = 50,
+    ) -> List[Any]:
+        """Return memories of other tasks sharing most words with the task."""
+        words = _words(task_description)
+        if not words:
+            return []
+        query = " OR ".join(f'"{word}"' for word in sorted(words))
+        matches = conn.execute(
+            """
+            SELECT m.metadata, m.datetime, m.score, m.task_description, m.created_at
+            FROM long_term_memories_fts
+            JOIN long_term_memories AS m ON m.id = long_term_memories_fts.rowid
+            WHERE long_term_memories_fts MATCH ? AND m.task_hash != ?
+            ORDER BY bm25(long_term_memories_fts)
+            LIMIT ?
+        """,
+            (query, description_hash, candidates),
+        ).fetchall()
+
+        scored = []
+        for metadata, stored_at, score, description, created_at in matches:
+            other = _words(description or "")
+            similarity = len(words & other) / len(words | other)
+            if similarity >= self.similarity_threshold:
+                scored.append((similarity, created_at or 0.0, (metadata, stored_at, score)))
+        scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+        return [row for _, _, row in scored[:limit]]
+
+    def _apply_retention(self, conn: sqlite3.Connection, description_hash: str) -> None:
+        if self.max_rows_per_task is not None:
+            conn.execute(
+                """
+                DELETE FROM long_term_memories
+                WHERE task_hash = ? AND id NOT IN (
+                    SELECT id FROM long_term_memories
+                    WHERE task_hash = ?
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT ?
+                )
+            """,
+                (description_hash, description_hash, self.max_rows_per_task),
+            )
+        if self.max_age_seconds is not None:
+            conn.execute(
+                "DELETE FROM long_term_memories WHERE created_at < ?",
+                (time.time() - self.max_age_seconds,),
+            )
+
+    def compact(self) -> None:
+        """Apply the retention policies to the memories of every task."""
+        try:
+            with self._pool.transaction() as conn:
+                if self.max_rows_per_task is not None:
+                    conn.execute(
+                        """
+                        DELETE FROM long_term_memories
+                        WHERE id IN (
+                            SELECT id FROM (
+                                SELECT id, ROW_NUMBER() OVER (
+                                    PARTITION BY task_hash
+                                    ORDER BY created_at DESC, id DESC
+                                ) AS position
+                                FROM long_term_memories
+                            )
+                            WHERE position > ?
+                        )
+                    """,
+                        (self.max_rows_per_task,),
+                    )
+                if self.max_age_seconds is not None:
+                    conn.execute(
+                        "DELETE FROM long_term_memories WHERE created_at < ?",
+                        (time.time() - self.max_age_seconds,),
+                    )
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"MEMORY ERROR: An error occurred while compacting LTM: {e}",
+                color="red",
+            )
+
     def reset(
         self,
     ) -> None:
         """Resets the LTM table with error handling."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.transaction() as conn:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM long_term_memories")
-                conn.commit()
 
         except sqlite3.Error as e:
             self._printer.print(
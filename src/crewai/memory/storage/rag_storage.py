@@ -3,8 +3,9 @@ import io
 import logging
 import os
 import shutil
+import threading
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from chromadb.api import ClientAPI
 
@@ -53,6 +54,7 @@ class RAGStorage(BaseRAGStorage):
 
         self.allow_reset = allow_reset
         self.path = path
+        self._batched = threading.local()
         self._initialize_app()
 
     def _set_embedder_config(self):
@@ -138,10 +140,36 @@ class RAGStorage(BaseRAGStorage):
             logging.error(f"Error during {self.type} search: {str(e)}")
             return []
 
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Add the documents saved by this thread in the block in one call.
+
+        Their embeddings are then computed in a single request.
+        """
+        self._batched.documents = []
+        try:
+            yield
+        finally:
+            documents, self._batched.documents = self._batched.documents, None
+            if documents:
+                try:
+                    self.collection.add(
+                        documents=[text for text, _ in documents],
+                        metadatas=[metadata for _, metadata in documents],
+                        ids=[str(uuid.uuid4()) for _ in documents],
+                    )
+                except Exception as e:
+                    logging.error(f"Error during {self.type} save: {str(e)}")
+
     def _generate_embedding(self, text: str, metadata: Dict[str, Any]) -> None:  # type: ignore
         if not hasattr(self, "app") or not hasattr(self, "collection"):
             self._initialize_app()
 
+        batched = getattr(getattr(self, "_batched", None), "documents", None)
+        if batched is not None:
+            batched.append((text, metadata or {}))
+            return
+
         self.collection.add(
             documents=[text],
             metadatas=[metadata or {}],
@@ -2,22 +2,34 @@
 
 from __future__ import annotations
 
-import sqlite3
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+from crewai.utilities.sqlite_pool import SQLiteBatchWriter, SQLiteConnectionPool
 
 
 class CommunicationLogger:
-    """Logs messages exchanged between agents into an SQLite database."""
+    """Logs messages exchanged between agents into an SQLite database.
+
+    With ``background=True`` messages are committed in batches by a writer
+    thread, and ``fetch_all`` waits for the pending ones.
+    """
 
-    def __init__(self, db_path: str | Path = "communications.db") -> None:
+    def __init__(
+        self, db_path: str | Path = "communications.db", background: bool = False
+    ) -> None:
         self._db_path = Path(db_path)
-        self._conn = sqlite3.connect(self._db_path)
+        self._pool = SQLiteConnectionPool(self._db_path)
+        self._writer: Optional[SQLiteBatchWriter] = (
+            SQLiteBatchWriter(self._pool, name="crewai-communication-logger")
+            if background
+            else None
+        )
         self._create_table()
 
     def _create_table(self) -> None:
-        with self._conn:
-            self._conn.execute(
+        with self._pool.transaction() as conn:
+            conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS messages (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -28,15 +40,27 @@ class CommunicationLogger:
             )
 
     def log(self, queue: str, message: str) -> None:
-        with self._conn:
-            self._conn.execute(
+        if self._writer is not None:
+            self._writer.write(
                 "INSERT INTO messages (queue, message) VALUES (?, ?)", (queue, message)
             )
+            return
+        self._pool.execute(
+            "INSERT INTO messages (queue, message) VALUES (?, ?)", (queue, message)
+        )
+
+    def log_many(self, messages: List[Tuple[str, str]]) -> None:
+        """Log several ``(queue, message)`` pairs in a single transaction."""
+        self._pool.executemany(
+            "INSERT INTO messages (queue, message) VALUES (?, ?)", messages
+        )
 
     def fetch_all(self) -> List[Tuple[int, str, str]]:
-        cursor = self._conn.cursor()
-        cursor.execute("SELECT id, queue, message FROM messages")
-        return cursor.fetchall()
+        if self._writer is not None:
+            self._writer.flush()
+        return self._pool.execute("SELECT id, queue, message FROM messages")
 
     def close(self) -> None:
-        self._conn.close()
+        if self._writer is not None:
+            self._writer.flush()
+        self._pool.close()
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import inspect
 import json
@@ -19,6 +20,7 @@ from typing import (
     Tuple,
     Type,
     Union,
+    cast,
     get_args,
     get_origin,
 )
@@ -401,105 +403,157 @@ class Task(BaseModel):
     ) -> TaskOutput:
         """Run the core execution logic of the task."""
         try:
-            agent = agent or self.agent
-            self.agent = agent
-            if not agent:
-                raise Exception(
-                    f"The task '{self.description}' has no agent assigned, therefore it can't be executed directly and should be executed in a Crew using a specific process that support that, like hierarchical."
-                )
+            agent, tools = self._start_execution(agent, context, tools)
+            result = agent.execute_task(
+                task=self,
+                context=context,
+                tools=tools,
+            )
 
-            self.start_time = datetime.datetime.now()
+            retry_context = self._complete_execution(agent, result)
+            if retry_context is not None:
+                return self._execute_core(agent, retry_context, tools)
+            return cast(TaskOutput, self.output)
+        except Exception as e:
+            self.end_time = datetime.datetime.now()
+            crewai_event_bus.emit(self, TaskFailedEvent(error=str(e), task=self))
+            raise e  # Re-raise the exception after emitting the event
 
-            self.prompt_context = context
-            tools = tools or self.tools or []
+    async def aexecute(
+        self,
+        agent: Optional[BaseAgent] = None,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> TaskOutput:
+        """Execute the task on the running event loop.
 
-            self.processed_by_agents.add(agent.role)
-            crewai_event_bus.emit(self, TaskStartedEvent(context=context, task=self))
-            result = agent.execute_task(
+        Unlike ``execute_async`` no thread is started, the agent loop is awaited
+        through ``BaseAgent.aexecute_task``.
+        """
+        try:
+            agent, tools = self._start_execution(agent, context, tools)
+            result = await agent.aexecute_task(
                 task=self,
                 context=context,
                 tools=tools,
             )
 
-            pydantic_output, json_output = self._export_output(result)
-            task_output = TaskOutput(
-                name=self.name,
-                description=self.description,
-                expected_output=self.expected_output,
-                raw=result,
-                pydantic=pydantic_output,
-                json_dict=json_output,
-                agent=agent.role,
-                output_format=self._get_output_format(),
+            # Guardrails and output conversion may call an LLM synchronously
+            retry_context = await asyncio.to_thread(
+                self._complete_execution, agent, result
             )
+            if retry_context is not None:
+                return await self.aexecute(agent, retry_context, tools)
+            return cast(TaskOutput, self.output)
+        except Exception as e:
+            self.end_time = datetime.datetime.now()
+            crewai_event_bus.emit(self, TaskFailedEvent(error=str(e), task=self))
+            raise e
 
-            if self._guardrail:
-                guardrail_result = process_guardrail(
-                    output=task_output,
-                    guardrail=self._guardrail,
-                    retry_count=self.retry_count
-                )
-                if not guardrail_result.success:
-                    if self.retry_count >= self.max_retries:
-                        raise Exception(
-                            f"Task failed guardrail validation after {self.max_retries} retries. "
-                            f"Last error: {guardrail_result.error}"
-                        )
-
-                    self.retry_count += 1
-                    context = self.i18n.errors("validation_error").format(
-                        guardrail_result_error=guardrail_result.error,
-                        task_output=task_output.raw,
-                    )
-                    printer = Printer()
-                    printer.print(
-                        content=f"Guardrail blocked, retrying, due to: {guardrail_result.error}\n",
-                        color="yellow",
-                    )
-                    return self._execute_core(agent, context, tools)
+    def _start_execution(
+        self,
+        agent: Optional[BaseAgent],
+        context: Optional[str],
+        tools: Optional[List[Any]],
+    ) -> Tuple[BaseAgent, List[Any]]:
+        agent = agent or self.agent
+        self.agent = agent
+        if not agent:
+            raise Exception(
+                f"The task '{self.description}' has no agent assigned, therefore it can't be executed directly and should be executed in a Crew using a specific process that support that, like hierarchical."
+            )
 
-                if guardrail_result.result is None:
-                    raise Exception(
-                        "Task guardrail returned None as result. This is not allowed."
-                    )
+        self.start_time = datetime.datetime.now()
 
-                if isinstance(guardrail_result.result, str):
-                    task_output.raw = guardrail_result.result
-                    pydantic_output, json_output = self._export_output(
-                        guardrail_result.result
-                    )
-                    task_output.pydantic = pydantic_output
-                    task_output.json_dict = json_output
-                elif isinstance(guardrail_result.result, TaskOutput):
-                    task_output = guardrail_result.result
+        self.prompt_context = context
+        tools = tools or self.tools or []
 
-            self.output = task_output
-            self.end_time = datetime.datetime.now()
+        self.processed_by_agents.add(agent.role)
+        crewai_event_bus.emit(self, TaskStartedEvent(context=context, task=self))
+        return agent, tools
 
-            if self.callback:
-                self.callback(self.output)
+    def _complete_execution(self, agent: BaseAgent, result: str) -> Optional[str]:
+        """Build the task output from the agent's result and run the callbacks.
 
-            crew = self.agent.crew  # type: ignore[union-attr]
-            if crew and crew.task_callback and crew.task_callback != self.callback:
-                crew.task_callback(self.output)
+        Returns:
+            The context to execute the task again with when the guardrail
+            rejected the output, None once the output is final.
+        """
+        pydantic_output, json_output = self._export_output(result)
+        task_output = TaskOutput(
+            name=self.name,
+            description=self.description,
+            expected_output=self.expected_output,
+            raw=result,
+            pydantic=pydantic_output,
+            json_dict=json_output,
+            agent=agent.role,
+            output_format=self._get_output_format(),
+        )
 
-            if self.output_file:
-                content = (
-                    json_output
-                    if json_output
-                    else (
-                        pydantic_output.model_dump_json() if pydantic_output else result
+        if self._guardrail:
+            guardrail_result = process_guardrail(
+                output=task_output,
+                guardrail=self._guardrail,
+                retry_count=self.retry_count
+            )
+            if not guardrail_result.success:
+                if self.retry_count >= self.max_retries:
+                    raise Exception(
+                        f"Task failed guardrail validation after {self.max_retries} retries. "
+                        f"Last error: {guardrail_result.error}"
                     )
+
+                self.retry_count += 1
+                context = self.i18n.errors("validation_error").format(
+                    guardrail_result_error=guardrail_result.error,
+                    task_output=task_output.raw,
+                )
+                printer = Printer()
+                printer.print(
+                    content=f"Guardrail blocked, retrying, due to: {guardrail_result.error}\n",
+                    color="yellow",
+                )
+                return context
+
+            if guardrail_result.result is None:
+                raise Exception(
+                    "Task guardrail returned None as result. This is not allowed."
+                )
+
+            if isinstance(guardrail_result.result, str):
+                task_output.raw = guardrail_result.result
+                pydantic_output, json_output = self._export_output(
+                    guardrail_result.result
+                )
+                task_output.pydantic = pydantic_output
+                task_output.json_dict = json_output
+            elif isinstance(guardrail_result.result, TaskOutput):
+                task_output = guardrail_result.result
+
+        self.output = task_output
+        self.end_time = datetime.datetime.now()
+
+        if self.callback:
+            self.callback(self.output)
+
+        crew = self.agent.crew  # type: ignore[union-attr]
+        if crew and crew.task_callback and crew.task_callback != self.callback:
+            crew.task_callback(self.output)
+
+        if self.output_file:
+            content = (
+                json_output
+                if json_output
+                else (
+                    pydantic_output.model_dump_json() if pydantic_output else result
                 )
-                self._save_file(content)
-            crewai_event_bus.emit(
-                self, TaskCompletedEvent(output=task_output, task=self)
             )
-            return task_output
-        except Exception as e:
-            self.end_time = datetime.datetime.now()
-            crewai_event_bus.emit(self, TaskFailedEvent(error=str(e), task=self))
-            raise e  # Re-raise the exception after emitting the event
+            self._save_file(content)
+        crewai_event_bus.emit(
+            self, TaskCompletedEvent(output=task_output, task=self)
+        )
+        return None
 
     def _process_guardrail(self, task_output: TaskOutput) -> GuardrailResult:
         assert self._guardrail is not None
@@ -221,13 +221,15 @@ class CrewStructuredTool:
 
         if inspect.iscoroutinefunction(self.func):
             return await self.func(**parsed_args, **kwargs)
-        else:
-            # Run sync functions in a thread pool
-            import asyncio
 
-            return await asyncio.get_event_loop().run_in_executor(
-                None, lambda: self.func(**parsed_args, **kwargs)
-            )
+        # Run sync functions in a thread pool so they don't block the event loop
+        result = await asyncio.to_thread(self.func, **parsed_args, **kwargs)
+
+        # Tools wrapping a coroutine function return an awaitable from a sync _run
+        if asyncio.iscoroutine(result):
+            return await result
+
+        return result
 
     def _run(self, *args, **kwargs) -> Any:
         """Legacy method for compatibility."""
@@ -0,0 +1,136 @@
+import re
+from difflib import SequenceMatcher
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence
+
+from crewai.utilities.agent_utils import (
+    get_tool_names,
+    render_text_description_and_args,
+)
+
+_SEPARATORS = re.compile(r"[\s_\-]+")
+
+FUZZY_MATCH_THRESHOLD = 0.85
+
+
+def _alias(name: str) -> str:
+    """Name ignoring case and whether words are separated by spaces, _ or -."""
+    return _SEPARATORS.sub(" ", name.casefold()).strip()
+
+
+class ToolRegistry:
+    """Tools of an agent, indexed once for looking them up by name.
+
+    The name an agent asks for is first looked up in a dict of the tool
+    names, ignoring case and surrounding spaces, then in a dict of aliases
+    also ignoring word separators. Only when both miss are the names compared
+    with ``SequenceMatcher``, skipping the tools whose name length alone rules
+    out a close enough match. The rendered descriptions and the argument names
+    of the tools are computed once as well.
+
+    Args:
+        tools: Tools of the agent.
+        max_cached_misses: Number of fuzzy lookups remembered.
+    """
+
+    def __init__(self, tools: Sequence[Any], max_cached_misses: int = 256) -> None:
+        self.tools: List[Any] = list(tools)
+        self.max_cached_misses = max_cached_misses
+        self._by_name: Dict[str, Any] = {}
+        self._exact: Dict[str, Any] = {}
+        self._aliases: Dict[str, Any] = {}
+        self._lowered: List[str] = []
+        for tool in self.tools:
+            lowered = tool.name.lower().strip()
+            self._by_name.setdefault(tool.name, tool)
+            self._exact.setdefault(lowered, tool)
+            self._aliases.setdefault(_alias(tool.name), tool)
+            self._lowered.append(lowered)
+        self._fuzzy: Dict[str, Optional[Any]] = {}
+        self._argument_names: Dict[str, FrozenSet[str]] = {}
+        self._names: Optional[str] = None
+        self._description: Optional[str] = None
+        self._plain_description: Optional[str] = None
+
+    @property
+    def names(self) -> str:
+        """Comma-separated names of the tools."""
+        if self._names is None:
+            self._names = get_tool_names(self.tools)
+        return self._names
+
+    @property
+    def description(self) -> str:
+        """Descriptions of the tools with their arguments, one per line."""
+        if self._description is None:
+            self._description = render_text_description_and_args(self.tools)
+        return self._description
+
+    @property
+    def plain_description(self) -> str:
+        """Descriptions of the tools separated by ``--`` lines."""
+        if self._plain_description is None:
+            self._plain_description = "\n--\n".join(
+                tool.description for tool in self.tools
+            )
+        return self._plain_description
+
+    def get(self, name: str) -> Optional[Any]:
+        """Return the tool named exactly ``name``."""
+        return self._by_name.get(name)
+
+    def match(self, name: str) -> Optional[Any]:
+        """Return the tool named ``name``, ignoring case and word separators."""
+        return self._exact.get(name.lower().strip()) or self._aliases.get(_alias(name))
+
+    def select(self, name: str) -> Optional[Any]:
+        """Return the tool ``name`` refers to, allowing for small typos.
+
+        Falls back to the tool whose name is most similar to ``name``, if its
+        ``SequenceMatcher`` ratio exceeds ``FUZZY_MATCH_THRESHOLD``.
+        """
+        tool = self.match(name)
+        if tool is not None:
+            return tool
+
+        query = name.lower().strip()
+        if query in self._fuzzy:
+            return self._fuzzy[query]
+        tool = self._closest(query)
+        if len(self._fuzzy) >= self.max_cached_misses:
+            self._fuzzy.clear()
+        self._fuzzy[query] = tool
+        return tool
+
+    def _closest(self, query: str) -> Optional[Any]:
+        # The ratio is at most 2 * min(len) / (len + len), so the tools are
+        # compared from the most promising length down, until none can win
+        candidates = []
+        for index, lowered in enumerate(self._lowered):
+            total = len(lowered) + len(query)
+            bound = 2 * min(len(lowered), len(query)) / total if total else 1.0
+            if bound > FUZZY_MATCH_THRESHOLD:
+                candidates.append((-bound, index))
+        candidates.sort()
+
+        matcher = SequenceMatcher(None, b=query)
+        best_ratio, best_index = FUZZY_MATCH_THRESHOLD, None
+        for negative_bound, index in candidates:
+            if -negative_bound < best_ratio:
+                break
+            matcher.set_seq1(self._lowered[index])
+            if matcher.quick_ratio() < best_ratio:
+                continue
+            ratio = matcher.ratio()
+            if ratio > best_ratio or (
+                ratio == best_ratio and best_index is not None and index < best_index
+            ):
+                best_ratio, best_index = ratio, index
+        return self.tools[best_index] if best_index is not None else None
+
+    def argument_names(self, tool: Any) -> FrozenSet[str]:
+        """Names of the arguments in the JSON schema of ``tool``."""
+        names = self._argument_names.get(tool.name)
+        if names is None:
+            names = frozenset(tool.args_schema.model_json_schema()["properties"])
+            self._argument_names[tool.name] = names
+        return names
@@ -2,10 +2,9 @@ import ast
 import datetime
 import json
 import time
-from difflib import SequenceMatcher
 from json import JSONDecodeError
 from textwrap import dedent
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import json5
 from json_repair import repair_json
@@ -15,11 +14,8 @@ from crewai.task import Task
 from crewai.telemetry import Telemetry
 from crewai.tools.structured_tool import CrewStructuredTool
 from crewai.tools.tool_calling import InstructorToolCalling, ToolCalling
+from crewai.tools.tool_registry import ToolRegistry
 from crewai.utilities import I18N, Converter, Printer
-from crewai.utilities.agent_utils import (
-    get_tool_names,
-    render_text_description_and_args,
-)
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.events.tool_usage_events import (
     ToolSelectionErrorEvent,
@@ -64,6 +60,7 @@ class ToolUsage:
       tools_description: Description of the tools available for the agent.
       tools_names: Names of the tools available for the agent.
       function_calling_llm: Language model to be used for the tool usage.
+      tool_registry: Index of the tools, built from them unless the agent shares its own.
     """
 
     def __init__(
@@ -75,6 +72,7 @@ class ToolUsage:
         agent: Optional[Union["BaseAgent", "LiteAgent"]] = None,
         action: Any = None,
         fingerprint_context: Optional[Dict[str, str]] = None,
+        tool_registry: Optional[ToolRegistry] = None,
     ) -> None:
         self._i18n: I18N = agent.i18n if agent else I18N()
         self._printer: Printer = Printer()
@@ -83,8 +81,9 @@ class ToolUsage:
         self._max_parsing_attempts: int = 3
         self._remember_format_after_usages: int = 3
         self.agent = agent
-        self.tools_description = render_text_description_and_args(tools)
-        self.tools_names = get_tool_names(tools)
+        self.tool_registry = tool_registry or ToolRegistry(tools)
+        self.tools_description = self.tool_registry.description
+        self.tools_names = self.tool_registry.names
         self.tools_handler = tools_handler
         self.tools = tools
         self.task = task
@@ -107,6 +106,42 @@ class ToolUsage:
     def use(
         self, calling: Union[ToolCalling, InstructorToolCalling], tool_string: str
     ) -> str:
+        tool = self._resolve_tool(calling)
+        if isinstance(tool, str):
+            return tool
+
+        if self._is_add_image_tool(tool):
+            try:
+                result = self._use(tool_string=tool_string, tool=tool, calling=calling)
+                return result
+
+            except Exception as e:
+                return self._handle_use_exception(e)
+
+        return f"{self._use(tool_string=tool_string, tool=tool, calling=calling)}"
+
+    async def ause(
+        self, calling: Union[ToolCalling, InstructorToolCalling], tool_string: str
+    ) -> str:
+        """Asynchronous counterpart of ``use`` that awaits the tool's ``ainvoke``."""
+        tool = self._resolve_tool(calling)
+        if isinstance(tool, str):
+            return tool
+
+        if self._is_add_image_tool(tool):
+            try:
+                return await self._ause(
+                    tool_string=tool_string, tool=tool, calling=calling
+                )
+            except Exception as e:
+                return self._handle_use_exception(e)
+
+        return f"{await self._ause(tool_string=tool_string, tool=tool, calling=calling)}"
+
+    def _resolve_tool(
+        self, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Union[CrewStructuredTool, str]:
+        """Select the tool for the calling, or return the error to report to the agent."""
         if isinstance(calling, ToolUsageErrorException):
             error = calling.message
             if self.agent and self.agent.verbose:
@@ -116,39 +151,102 @@ class ToolUsage:
             return error
 
         try:
-            tool = self._select_tool(calling.tool_name)
+            return self._select_tool(calling.tool_name)
         except Exception as e:
-            error = getattr(e, "message", str(e))
-            if self.task:
-                self.task.increment_tools_errors()
-            if self.agent and self.agent.verbose:
-                self._printer.print(content=f"\n\n{error}\n", color="red")
-            return error
+            return self._handle_use_exception(e)
 
-        if (
+    def _is_add_image_tool(self, tool: Any) -> bool:
+        return (
             isinstance(tool, CrewStructuredTool)
             and tool.name == self._i18n.tools("add_image")["name"]  # type: ignore
-        ):
-            try:
-                result = self._use(tool_string=tool_string, tool=tool, calling=calling)
-                return result
+        )
+
+    def _handle_use_exception(self, e: Exception) -> str:
+        error = getattr(e, "message", str(e))
+        if self.task:
+            self.task.increment_tools_errors()
+        if self.agent and self.agent.verbose:
+            self._printer.print(content=f"\n\n{error}\n", color="red")
+        return error
+
+    def _use(
+        self,
+        tool_string: str,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> str:
+        early_result = self._start_use(tool, calling)
+        if early_result is not None:
+            return early_result
 
+        started_at = time.time()
+        result, from_cache = self._read_cached_result(calling)
+        available_tool = self._get_available_tool(tool)
+
+        usage_limit_result = self._handle_usage_limit(available_tool, tool)
+        if usage_limit_result is not None:
+            return usage_limit_result
+
+        if result is None:
+            try:
+                self._track_delegation(calling)
+                result = self._invoke_tool(tool, calling)
             except Exception as e:
-                error = getattr(e, "message", str(e))
-                if self.task:
-                    self.task.increment_tools_errors()
-                if self.agent and self.agent.verbose:
-                    self._printer.print(content=f"\n\n{error}\n", color="red")
-                return error
+                error = self._handle_invocation_error(tool, calling, e)
+                if error is not None:
+                    return error  # type: ignore # No return value expected
+                return self.use(calling=calling, tool_string=tool_string)  # type: ignore # No return value expected
 
-        return f"{self._use(tool_string=tool_string, tool=tool, calling=calling)}"
+            self._cache_result(available_tool, calling, result)
 
-    def _use(
+        return self._finish_use(
+            tool, calling, available_tool, result, from_cache, started_at
+        )
+
+    async def _ause(
         self,
         tool_string: str,
         tool: CrewStructuredTool,
         calling: Union[ToolCalling, InstructorToolCalling],
     ) -> str:
+        early_result = self._start_use(tool, calling)
+        if early_result is not None:
+            return early_result
+
+        started_at = time.time()
+        result, from_cache = self._read_cached_result(calling)
+        available_tool = self._get_available_tool(tool)
+
+        usage_limit_result = self._handle_usage_limit(available_tool, tool)
+        if usage_limit_result is not None:
+            return usage_limit_result
+
+        if result is None:
+            try:
+                self._track_delegation(calling)
+                result = await self._ainvoke_tool(tool, calling)
+            except Exception as e:
+                error = self._handle_invocation_error(tool, calling, e)
+                if error is not None:
+                    return error
+                return await self.ause(calling=calling, tool_string=tool_string)
+
+            self._cache_result(available_tool, calling, result)
+
+        return self._finish_use(
+            tool, calling, available_tool, result, from_cache, started_at
+        )
+
+    def _start_use(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> Optional[str]:
+        """Emit the tool usage started event.
+
+        Returns:
+            The message for the agent when the same call was just made, None otherwise.
+        """
         if self._check_tool_repeated_usage(calling=calling):  # type: ignore # _check_tool_repeated_usage of "ToolUsage" does not return a value (it only ever returns None)
             try:
                 result = self._i18n.errors("task_repeated_usage").format(
@@ -166,7 +264,7 @@ class ToolUsage:
                 if self.task:
                     self.task.increment_tools_errors()
 
-        if self.agent:
+        if self.agent and crewai_event_bus.has_listeners(ToolUsageStartedEvent):
             event_data = {
                 "agent_key": self.agent.key,
                 "agent_role": self.agent.role,
@@ -180,26 +278,24 @@ class ToolUsage:
                 event_data.update(self.agent.fingerprint)
 
             crewai_event_bus.emit(self,ToolUsageStartedEvent(**event_data))
-            
-        started_at = time.time()
-        from_cache = False
-        result = None  # type: ignore
+        return None
 
+    def _read_cached_result(
+        self, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Tuple[Any, bool]:
+        result = None  # type: ignore
         if self.tools_handler and self.tools_handler.cache:
             result = self.tools_handler.cache.read(
                 tool=calling.tool_name, input=calling.arguments
             )  # type: ignore
-            from_cache = result is not None
+        return result, result is not None
 
-        available_tool = next(
-            (
-                available_tool
-                for available_tool in self.tools
-                if available_tool.name == tool.name
-            ),
-            None,
-        )
+    def _get_available_tool(self, tool: CrewStructuredTool) -> Any:
+        return self.tool_registry.get(tool.name)
 
+    def _handle_usage_limit(
+        self, available_tool: Any, tool: CrewStructuredTool
+    ) -> Optional[str]:
         usage_limit_error = self._check_usage_limit(available_tool, tool.name)
         if usage_limit_error:
             try:
@@ -210,77 +306,125 @@ class ToolUsage:
             except Exception:
                 if self.task:
                     self.task.increment_tools_errors()
+        return None
 
-        if result is None:
+    def _track_delegation(
+        self, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> None:
+        if calling.tool_name in [
+            "Delegate work to coworker",
+            "Ask question to coworker",
+        ]:
+            coworker = calling.arguments.get("coworker") if calling.arguments else None
+            if self.task:
+                self.task.increment_delegations(coworker)
+
+    def _invoke_tool(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> Any:
+        if calling.arguments:
             try:
-                if calling.tool_name in [
-                    "Delegate work to coworker",
-                    "Ask question to coworker",
-                ]:
-                    coworker = (
-                        calling.arguments.get("coworker") if calling.arguments else None
-                    )
-                    if self.task:
-                        self.task.increment_delegations(coworker)
-
-                if calling.arguments:
-                    try:
-                        acceptable_args = tool.args_schema.model_json_schema()[
-                            "properties"
-                        ].keys()  # type: ignore
-                        arguments = {
-                            k: v
-                            for k, v in calling.arguments.items()
-                            if k in acceptable_args
-                        }
-                        # Add fingerprint metadata if available
-                        arguments = self._add_fingerprint_metadata(arguments)
-                        result = tool.invoke(input=arguments)
-                    except Exception:
-                        arguments = calling.arguments
-                        # Add fingerprint metadata if available
-                        arguments = self._add_fingerprint_metadata(arguments)
-                        result = tool.invoke(input=arguments)
-                else:
-                    # Add fingerprint metadata even to empty arguments
-                    arguments = self._add_fingerprint_metadata({})
-                    result = tool.invoke(input=arguments)
-            except Exception as e:
-                self.on_tool_error(tool=tool, tool_calling=calling, e=e)
-                self._run_attempts += 1
-                if self._run_attempts > self._max_parsing_attempts:
-                    self._telemetry.tool_usage_error(llm=self.function_calling_llm)
-                    error_message = self._i18n.errors("tool_usage_exception").format(
-                        error=e, tool=tool.name, tool_inputs=tool.description
-                    )
-                    error = ToolUsageErrorException(
-                        f"\n{error_message}.\nMoving on then. {self._i18n.slice('format').format(tool_names=self.tools_names)}"
-                    ).message
-                    if self.task:
-                        self.task.increment_tools_errors()
-                    if self.agent and self.agent.verbose:
-                        self._printer.print(
-                            content=f"\n\n{error_message}\n", color="red"
-                        )
-                    return error  # type: ignore # No return value expected
+                arguments = self._acceptable_arguments(tool, calling)
+                return tool.invoke(input=arguments)
+            except Exception:
+                arguments = calling.arguments
+                # Add fingerprint metadata if available
+                arguments = self._add_fingerprint_metadata(arguments)
+                return tool.invoke(input=arguments)
+        # Add fingerprint metadata even to empty arguments
+        arguments = self._add_fingerprint_metadata({})
+        return tool.invoke(input=arguments)
+
+    async def _ainvoke_tool(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> Any:
+        if calling.arguments:
+            try:
+                arguments = self._acceptable_arguments(tool, calling)
+                return await tool.ainvoke(input=arguments)
+            except Exception:
+                arguments = self._add_fingerprint_metadata(calling.arguments)
+                return await tool.ainvoke(input=arguments)
+        arguments = self._add_fingerprint_metadata({})
+        return await tool.ainvoke(input=arguments)
 
-                if self.task:
-                    self.task.increment_tools_errors()
-                return self.use(calling=calling, tool_string=tool_string)  # type: ignore # No return value expected
+    def _acceptable_arguments(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> Dict[str, Any]:
+        acceptable_args = self.tool_registry.argument_names(tool)
+        arguments = {
+            k: v for k, v in (calling.arguments or {}).items() if k in acceptable_args
+        }
+        # Add fingerprint metadata if available
+        return self._add_fingerprint_metadata(arguments)
 
-            if self.tools_handler:
-                should_cache = True
-                if (
-                    hasattr(available_tool, "cache_function")
-                    and available_tool.cache_function  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
-                ):
-                    should_cache = available_tool.cache_function(  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
-                        calling.arguments, result
-                    )
+    def _handle_invocation_error(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        e: Exception,
+    ) -> Optional[str]:
+        """Record a failed tool invocation.
+
+        Returns:
+            The error for the agent once the attempts are exhausted, or None when
+            the tool should be tried again.
+        """
+        self.on_tool_error(tool=tool, tool_calling=calling, e=e)
+        self._run_attempts += 1
+        if self._run_attempts > self._max_parsing_attempts:
+            self._telemetry.tool_usage_error(llm=self.function_calling_llm)
+            error_message = self._i18n.errors("tool_usage_exception").format(
+                error=e, tool=tool.name, tool_inputs=tool.description
+            )
+            error = ToolUsageErrorException(
+                f"\n{error_message}.\nMoving on then. {self._i18n.slice('format').format(tool_names=self.tools_names)}"
+            ).message
+            if self.task:
+                self.task.increment_tools_errors()
+            if self.agent and self.agent.verbose:
+                self._printer.print(content=f"\n\n{error_message}\n", color="red")
+            return error
 
-                self.tools_handler.on_tool_use(
-                    calling=calling, output=result, should_cache=should_cache
+        if self.task:
+            self.task.increment_tools_errors()
+        return None
+
+    def _cache_result(
+        self,
+        available_tool: Any,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        result: Any,
+    ) -> None:
+        if self.tools_handler:
+            should_cache = True
+            if (
+                hasattr(available_tool, "cache_function")
+                and available_tool.cache_function  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
+            ):
+                should_cache = available_tool.cache_function(  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
+                    calling.arguments, result
                 )
+
+            self.tools_handler.on_tool_use(
+                calling=calling, output=result, should_cache=should_cache
+            )
+
+    def _finish_use(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        available_tool: Any,
+        result: Any,
+        from_cache: bool,
+        started_at: float,
+    ) -> str:
         self._telemetry.tool_usage(
             llm=self.function_calling_llm,
             tool_name=tool.name,
@@ -370,22 +514,9 @@ class ToolUsage:
         return None
 
     def _select_tool(self, tool_name: str) -> Any:
-        order_tools = sorted(
-            self.tools,
-            key=lambda tool: SequenceMatcher(
-                None, tool.name.lower().strip(), tool_name.lower().strip()
-            ).ratio(),
-            reverse=True,
-        )
-        for tool in order_tools:
-            if (
-                tool.name.lower().strip() == tool_name.lower().strip()
-                or SequenceMatcher(
-                    None, tool.name.lower().strip(), tool_name.lower().strip()
-                ).ratio()
-                > 0.85
-            ):
-                return tool
+        tool = self.tool_registry.select(tool_name)
+        if tool is not None:
+            return tool
         if self.task:
             self.task.increment_tools_errors()
         tool_selection_data: Dict[str, Any] = {
@@ -418,10 +549,7 @@ class ToolUsage:
 
     def _render(self) -> str:
         """Render the tool name and description in plain text."""
-        descriptions = []
-        for tool in self.tools:
-            descriptions.append(tool.description)
-        return "\n--\n".join(descriptions)
+        return self.tool_registry.plain_description
 
     def _function_calling(
         self, tool_string: str
@@ -458,7 +586,13 @@ class ToolUsage:
         tool_name = self.action.tool
         tool = self._select_tool(tool_name)
         try:
-            arguments = self._validate_tool_input(self.action.tool_input)
+            parsed = getattr(self.action, "arguments", None)
+            # The parser hands over tool inputs that were already strict JSON objects
+            arguments = (
+                dict(parsed)
+                if isinstance(parsed, dict)
+                else self._validate_tool_input(self.action.tool_input)
+            )
 
         except Exception:
             if raise_error:
@@ -528,7 +662,6 @@ class ToolUsage:
             if isinstance(arguments, dict):
                 return arguments
         except (ValueError, SyntaxError):
-            repaired_input = repair_json(tool_input)
             pass  # Continue to the next parsing attempt
 
         # Attempt 3: Parse as JSON5
@@ -584,6 +717,8 @@ class ToolUsage:
         tool_calling: Union[ToolCalling, InstructorToolCalling],
         e: Exception,
     ) -> None:
+        if not crewai_event_bus.has_listeners(ToolUsageErrorEvent):
+            return
         event_data = self._prepare_event_data(tool, tool_calling)
         crewai_event_bus.emit(self, ToolUsageErrorEvent(**{**event_data, "error": e}))
 
@@ -595,6 +730,8 @@ class ToolUsage:
         started_at: float,
         result: Any,
     ) -> None:
+        if not crewai_event_bus.has_listeners(ToolUsageFinishedEvent):
+            return
         finished_at = time.time()
         event_data = self._prepare_event_data(tool, tool_calling)
         event_data.update(
@@ -1,6 +1,7 @@
+import asyncio
 import json
 import re
-from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Union
 
 from crewai.agents.parser import (
     FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE,
@@ -20,6 +21,7 @@ from crewai.utilities.errors import AgentRepositoryError
 from crewai.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededException,
 )
+from crewai.utilities.summarizer import Summarizer
 from rich.console import Console
 from crewai.cli.config import Settings
 
@@ -140,6 +142,17 @@ def enforce_rpm_limit(
         request_within_rpm_limit()
 
 
+async def aenforce_rpm_limit(
+    request_within_rpm_limit: Optional[Callable[[], bool]] = None,
+    arequest_within_rpm_limit: Optional[Callable[[], Awaitable[bool]]] = None,
+) -> None:
+    """Enforce the requests per minute (RPM) limit without blocking the event loop."""
+    if arequest_within_rpm_limit:
+        await arequest_within_rpm_limit()
+    elif request_within_rpm_limit:
+        await asyncio.to_thread(request_within_rpm_limit)
+
+
 def get_llm_response(
     llm: Union[LLM, BaseLLM],
     messages: List[Dict[str, str]],
@@ -158,6 +171,31 @@ def get_llm_response(
             color="red",
         )
         raise e
+    return _validate_llm_response(answer, printer)
+
+
+async def aget_llm_response(
+    llm: Union[LLM, BaseLLM],
+    messages: List[Dict[str, str]],
+    callbacks: List[Any],
+    printer: Printer,
+) -> str:
+    """Await the LLM and return the response, handling any invalid responses."""
+    try:
+        answer = await llm.acall(
+            messages,
+            callbacks=callbacks,
+        )
+    except Exception as e:
+        printer.print(
+            content=f"Error during LLM call: {e}",
+            color="red",
+        )
+        raise e
+    return _validate_llm_response(answer, printer)
+
+
+def _validate_llm_response(answer: Any, printer: Printer) -> str:
     if not answer:
         printer.print(
             content="Received None or empty response from LLM call.",
@@ -328,45 +366,27 @@ def summarize_messages(
     llm: Any,
     callbacks: List[Any],
     i18n: Any,
+    request_within_rpm_limit: Optional[Callable[[], bool]] = None,
 ) -> None:
     """Summarize messages to fit within context window.
 
+    The messages are summarized in chunks summarized concurrently, see
+    ``Summarizer``.
+
     Args:
         messages: List of messages to summarize
         llm: LLM instance for summarization
         callbacks: List of callbacks for LLM
         i18n: I18N instance for messages
+        request_within_rpm_limit: Called before every LLM call to respect the
+            rate limits
     """
-    messages_string = " ".join([message["content"] for message in messages])
-    messages_groups = []
-
-    cut_size = llm.get_context_window_size()
-
-    for i in range(0, len(messages_string), cut_size):
-        messages_groups.append({"content": messages_string[i : i + cut_size]})
-
-    summarized_contents = []
-
-    total_groups = len(messages_groups)
-    for idx, group in enumerate(messages_groups, 1):
-        Printer().print(
-            content=f"Summarizing {idx}/{total_groups}...",
-            color="yellow",
-        )
-        summary = llm.call(
-            [
-                format_message_for_llm(
-                    i18n.slice("summarizer_system_message"), role="system"
-                ),
-                format_message_for_llm(
-                    i18n.slice("summarize_instruction").format(group=group["content"]),
-                ),
-            ],
-            callbacks=callbacks,
-        )
-        summarized_contents.append({"content": str(summary)})
-
-    merged_summary = " ".join(content["content"] for content in summarized_contents)
+    merged_summary = Summarizer(
+        llm,
+        callbacks=callbacks,
+        i18n=i18n,
+        request_within_rpm_limit=request_within_rpm_limit,
+    ).summarize([message["content"] for message in messages])
 
     messages.clear()
     messages.append(
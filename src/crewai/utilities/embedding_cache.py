@@ -0,0 +1,213 @@
+"""Cache of query embeddings shared by the memory and knowledge stores."""
+
+import hashlib
+import inspect
+import json
+import uuid
+import warnings
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from chromadb import Documents, EmbeddingFunction, Embeddings
+from chromadb.api.types import Space
+
+from crewai.agents.cache.backends import InMemoryCacheBackend, SQLiteCacheBackend
+
+
+class EmbeddingCache:
+    """LRU cache of embeddings in memory, optionally backed by a SQLite file.
+
+    Entries found on disk are promoted to the in-memory cache, so a warm disk
+    cache makes identical queries free across runs.
+
+    Args:
+        max_entries: Number of embeddings kept in memory.
+        db_path: SQLite file persisting embeddings across runs, disabled if None.
+    """
+
+    def __init__(self, max_entries: int = 1024, db_path: Optional[str] = None):
+        self.memory = InMemoryCacheBackend(max_entries=max_entries, max_bytes=None)
+        self.disk = SQLiteCacheBackend(db_path=db_path) if db_path else None
+
+    def get(self, key: str, persistent: bool = True) -> Optional[np.ndarray]:
+        """Return the embedding cached under ``key``.
+
+        Args:
+            key: Cache key of the embedding.
+            persistent: Whether to look the key up on disk on a memory miss.
+        """
+        embedding = self.memory.get(key)
+        if embedding is None and persistent and self.disk is not None:
+            stored = self.disk.get(key)
+            if stored is not None:
+                embedding = np.asarray(stored, dtype=np.float32)
+                self.memory.set(key, embedding)
+        return embedding
+
+    def set(self, key: str, embedding: Any, persistent: bool = True) -> None:
+        """Cache ``embedding`` under ``key``.
+
+        Args:
+            key: Cache key of the embedding.
+            embedding: Vector to cache.
+            persistent: Whether to also write the embedding to disk.
+        """
+        embedding = np.asarray(embedding, dtype=np.float32)
+        self.memory.set(key, embedding)
+        if persistent and self.disk is not None:
+            self.disk.set(key, embedding.tolist())
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+
+_embedding_cache: Optional[EmbeddingCache] = EmbeddingCache()
+
+
+def configure_embedding_cache(
+    max_entries: int = 1024, db_path: Optional[str] = None, enabled: bool = True
+) -> None:
+    """Replace the process wide query embedding cache.
+
+    Args:
+        max_entries: Number of embeddings kept in memory.
+        db_path: SQLite file persisting embeddings across runs, disabled if None.
+        enabled: Disable caching entirely when False.
+    """
+    global _embedding_cache
+    _embedding_cache = (
+        EmbeddingCache(max_entries=max_entries, db_path=db_path) if enabled else None
+    )
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    return _embedding_cache
+
+
+class _Unstable(Exception):
+    """Raised for values that are not identified the same way across runs."""
+
+
+def _stable(value: Any) -> Any:
+    """Describe ``value`` as JSON that is the same in every run.
+
+    Raises:
+        _Unstable: If no such description can be derived.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise _Unstable(value)
+        return {key: _stable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_stable(item) for item in value]
+
+    # Functions and classes are identified by where they are defined, which
+    # is ambiguous for lambdas and for those defined inside functions
+    if inspect.isfunction(value) or inspect.isclass(value) or inspect.isbuiltin(value):
+        name = f"{value.__module__}.{value.__qualname__}"
+        if "<" in name:
+            raise _Unstable(value)
+        return {"callable": name}
+
+    get_config = getattr(value, "get_config", None)
+    if callable(get_config):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            try:
+                config = get_config()
+            except Exception as e:
+                raise _Unstable(value) from e
+        if isinstance(config, dict):
+            return {
+                "class": _stable(type(value))["callable"],
+                "config": _stable(config),
+            }
+    raise _Unstable(value)
+
+
+def embedder_namespace(embedder_config: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Identify an embedder configuration without keeping its secrets.
+
+    Custom embedders are identified by their class and ``get_config()``.
+    Returns None when the configuration holds objects that cannot be
+    identified across runs, such as lambdas or embedders without a
+    configuration, whose embeddings are then only cached in memory.
+    """
+    if not embedder_config:
+        return "default"
+    try:
+        stable = _stable(embedder_config)
+    except _Unstable:
+        return None
+    serialized = json.dumps(stable, sort_keys=True)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class CachedEmbeddingFunction(EmbeddingFunction[Documents]):
+    """Embedding function that serves repeated queries from the embedding cache.
+
+    Only queries are cached: documents are usually embedded once when stored,
+    while the same query is searched in several stores, for instance by every
+    memory consulted for a task. Everything else is delegated to the wrapped
+    function, including the name and configuration Chroma persists with a
+    collection.
+
+    Args:
+        embedding_function: Function used on a cache miss.
+        namespace: Identifies the embedder, see ``embedder_namespace``. When
+            None, embeddings are only cached in memory, for this function.
+    """
+
+    def __init__(
+        self,
+        embedding_function: EmbeddingFunction,
+        namespace: Optional[str] = "default",
+    ) -> None:
+        self.embedding_function = embedding_function
+        self.persistent = namespace is not None
+        self.namespace = (
+            namespace if namespace is not None else f"local-{uuid.uuid4().hex}"
+        )
+
+    def __call__(self, input: Documents) -> Embeddings:
+        return self.embedding_function(input)
+
+    def embed_query(self, input: Documents) -> Embeddings:
+        cache = get_embedding_cache()
+        if cache is None:
+            return self.embedding_function.embed_query(input)
+
+        keys = [self._key(text) for text in input]
+        embeddings: List[Optional[np.ndarray]] = [
+            cache.get(key, self.persistent) for key in keys
+        ]
+        missing = [index for index, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            computed = self.embedding_function.embed_query([input[i] for i in missing])
+            for index, embedding in zip(missing, computed):
+                cache.set(keys[index], embedding, self.persistent)
+                embeddings[index] = np.asarray(embedding, dtype=np.float32)
+        return [embedding for embedding in embeddings if embedding is not None]
+
+    def _key(self, text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.namespace}:{digest}"
+
+    def name(self) -> str:
+        return self.embedding_function.name()
+
+    def get_config(self) -> Dict[str, Any]:
+        return self.embedding_function.get_config()
+
+    def is_legacy(self) -> bool:
+        return self.embedding_function.is_legacy()
+
+    def default_space(self) -> Space:
+        return self.embedding_function.default_space()
+
+    def supported_spaces(self) -> List[Space]:
+        return self.embedding_function.supported_spaces()
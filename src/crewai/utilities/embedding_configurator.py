@@ -4,6 +4,11 @@ from typing import Any, Dict, Optional, cast
 from chromadb import Documents, EmbeddingFunction, Embeddings
 from chromadb.api.types import validate_embedding_function
 
+from crewai.utilities.embedding_cache import (
+    CachedEmbeddingFunction,
+    embedder_namespace,
+)
+
 
 class EmbeddingConfigurator:
     def __init__(self):
@@ -25,7 +30,20 @@ class EmbeddingConfigurator:
         self,
         embedder_config: Optional[Dict[str, Any]] = None,
     ) -> EmbeddingFunction:
-        """Configures and returns an embedding function based on the provided config."""
+        """Configures and returns an embedding function based on the provided config.
+
+        The function is wrapped in a ``CachedEmbeddingFunction`` so repeated
+        queries with the same configuration are embedded only once.
+        """
+        return CachedEmbeddingFunction(
+            self._configure_embedder(embedder_config),
+            embedder_namespace(embedder_config),
+        )
+
+    def _configure_embedder(
+        self,
+        embedder_config: Optional[Dict[str, Any]] = None,
+    ) -> EmbeddingFunction:
         if embedder_config is None:
             return self._create_default_embedding_function()
 
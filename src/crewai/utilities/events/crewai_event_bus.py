@@ -1,19 +1,49 @@
+import asyncio
+import atexit
 import threading
+import time
 from contextlib import contextmanager
-from typing import Any, Callable, Dict, List, Type, TypeVar, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, cast
 
 from blinker import Signal
 
 from crewai.utilities.events.base_events import BaseEvent
 from crewai.utilities.events.event_types import EventTypes
+from crewai.utilities.events.handler_queue import BackgroundHandler, OverflowPolicy
 
 EventT = TypeVar("EventT", bound=BaseEvent)
 
 
+class ConditionalHandler:
+    """Event handler only called while its condition holds.
+
+    Args:
+        handler: Function called with the source and the event.
+        when: Function telling whether the handler is currently interested.
+    """
+
+    def __init__(self, handler: Callable[[Any, Any], Any], when: Callable[[], bool]):
+        self.handler = handler
+        self.when = when
+        self.__name__ = getattr(handler, "__name__", repr(handler))
+
+    def __call__(self, source: Any, event: BaseEvent) -> None:
+        if self.when():
+            self.handler(source, event)
+
+
 class CrewAIEventsBus:
     """
     A singleton event bus that uses blinker signals for event handling.
     Allows both internal (Flow/Crew) and external event handling.
+
+    The handlers of each event class are resolved once and cached, so emitting
+    an event nobody listens to costs a dictionary lookup. Handlers registered
+    with ``background=True``, and coroutine handlers, run on a worker thread
+    behind a bounded queue instead of on the emitting thread.
+
+    Emitters building costly events check ``has_listeners`` first, so those
+    events are never constructed when no handler would receive them.
     """
 
     _instance = None
@@ -31,9 +61,20 @@ class CrewAIEventsBus:
         """Initialize the event bus internal state"""
         self._signal = Signal("crewai_event_bus")
         self._handlers: Dict[Type[BaseEvent], List[Callable]] = {}
+        # Handlers of every event class emitted so far, with the type they
+        # were registered for, in registration order
+        self._dispatch_cache: Dict[
+            Type[BaseEvent], List[Tuple[Type[BaseEvent], Callable]]
+        ] = {}
+        self._background_handlers: List[BackgroundHandler] = []
 
     def on(
-        self, event_type: Type[EventT]
+        self,
+        event_type: Type[EventT],
+        background: bool = False,
+        max_queue_size: int = 1000,
+        overflow: OverflowPolicy = "drop",
+        when: Optional[Callable[[], bool]] = None,
     ) -> Callable[[Callable[[Any, EventT], None]], Callable[[Any, EventT], None]]:
         """
         Decorator to register an event handler for a specific event type.
@@ -45,16 +86,29 @@ class CrewAIEventsBus:
             ):
                 print(f"👍 Agent '{event.agent}' completed task")
                 print(f"   Output: {event.output}")
+
+        Args:
+            event_type: Class of the events to handle, subclasses included
+            background: Run the handler on a worker thread so that it does not
+                slow down the code emitting events. Coroutine functions always
+                run in the background.
+            max_queue_size: Number of events a background handler can lag behind
+            overflow: "drop" discards events arriving when the queue is full,
+                "coalesce" replaces the queued event of the same type instead
+            when: Only call the handler while this returns True. A handler
+                whose condition is False does not count as a listener, which
+                lets emitters skip building events it would ignore.
         """
 
         def decorator(
             handler: Callable[[Any, EventT], None],
         ) -> Callable[[Any, EventT], None]:
-            if event_type not in self._handlers:
-                self._handlers[event_type] = []
-            self._handlers[event_type].append(
-                cast(Callable[[Any, EventT], None], handler)
-            )
+            listener: Callable = handler
+            if background or asyncio.iscoroutinefunction(handler):
+                listener = BackgroundHandler(handler, max_queue_size, overflow)
+            if when is not None:
+                listener = ConditionalHandler(listener, when)
+            self._register(event_type, listener)
             return handler
 
         return decorator
@@ -67,27 +121,90 @@ class CrewAIEventsBus:
             source: The object emitting the event
             event: The event instance to emit
         """
-        for event_type, handlers in self._handlers.items():
-            if isinstance(event, event_type):
-                for handler in handlers:
-                    try:
-                        handler(source, event)
-                    except Exception as e:
-                        print(
-                            f"[EventBus Error] Handler '{handler.__name__}' failed for event '{event_type.__name__}': {e}"
-                        )
-
-        self._signal.send(source, event=event)
+        handlers = self._dispatch_cache.get(type(event))
+        if handlers is None:
+            handlers = self._resolve_handlers(type(event))
+
+        for event_type, handler in handlers:
+            try:
+                handler(source, event)
+            except Exception as e:
+                print(
+                    f"[EventBus Error] Handler '{handler.__name__}' failed for event '{event_type.__name__}': {e}"
+                )
+
+        if self._signal.receivers:
+            self._signal.send(source, event=event)
+
+    def has_listeners(self, event_type: Type[BaseEvent]) -> bool:
+        """Tell whether emitting an event of ``event_type`` would reach a handler.
+
+        Usage:
+            if crewai_event_bus.has_listeners(LLMStreamChunkEvent):
+                crewai_event_bus.emit(self, LLMStreamChunkEvent(chunk=chunk))
+
+        Args:
+            event_type: Exact class of the event about to be emitted
+        """
+        if self._signal.receivers:
+            return True
+        handlers = self._dispatch_cache.get(event_type)
+        if handlers is None:
+            handlers = self._resolve_handlers(event_type)
+        return any(
+            not isinstance(handler, ConditionalHandler) or handler.when()
+            for _, handler in handlers
+        )
 
     def register_handler(
         self, event_type: Type[EventTypes], handler: Callable[[Any, EventTypes], None]
     ) -> None:
         """Register an event handler for a specific event type"""
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        self._handlers[event_type].append(
-            cast(Callable[[Any, EventTypes], None], handler)
-        )
+        self._register(event_type, cast(Callable[[Any, EventTypes], None], handler))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until background handlers have handled every queued event.
+
+        Args:
+            timeout: Seconds to wait at most, None to wait indefinitely
+
+        Returns:
+            False if some events were still queued when the timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for handler in list(self._background_handlers):
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not handler.join(remaining):
+                return False
+        return True
+
+    def _register(self, event_type: Type[BaseEvent], handler: Callable) -> None:
+        with self._lock:
+            if event_type not in self._handlers:
+                self._handlers[event_type] = []
+            self._handlers[event_type].append(handler)
+            if isinstance(handler, ConditionalHandler):
+                handler = handler.handler
+            if isinstance(handler, BackgroundHandler):
+                if not self._background_handlers:
+                    # Give queued events a chance to be handled before exiting
+                    atexit.register(self.flush, 5.0)
+                self._background_handlers.append(handler)
+            self._dispatch_cache = {}
+
+    def _resolve_handlers(
+        self, event_class: Type[BaseEvent]
+    ) -> List[Tuple[Type[BaseEvent], Callable]]:
+        """Collect and cache the handlers of an event class."""
+        with self._lock:
+            handlers = [
+                (event_type, handler)
+                for event_type, registered in self._handlers.items()
+                if issubclass(event_class, event_type)
+                for handler in registered
+            ]
+            self._dispatch_cache[event_class] = handlers
+        return handlers
 
     @contextmanager
     def scoped_handlers(self):
@@ -104,11 +221,17 @@ class CrewAIEventsBus:
             # Handlers are cleared after the context
         """
         previous_handlers = self._handlers.copy()
-        self._handlers.clear()
+        previous_background_handlers = list(self._background_handlers)
+        with self._lock:
+            self._handlers.clear()
+            self._dispatch_cache = {}
         try:
             yield
         finally:
-            self._handlers = previous_handlers
+            with self._lock:
+                self._handlers = previous_handlers
+                self._background_handlers = previous_background_handlers
+                self._dispatch_cache = {}
 
 
 # Global instance
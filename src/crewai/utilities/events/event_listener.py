@@ -91,6 +91,9 @@ class EventListener(BaseEventListener):
             self._initialized = True
             self.formatter = ConsoleFormatter(verbose=True)
 
+    def _console_enabled(self) -> bool:
+        return self.formatter.verbose
+
     # ----------- CREW EVENTS -----------
 
     def setup_listeners(self, crewai_event_bus):
@@ -327,8 +330,10 @@ class EventListener(BaseEventListener):
                 )
 
         # ----------- LLM EVENTS -----------
+        # These only render in verbose mode, so they do not make LLM calls
+        # build their events otherwise
 
-        @crewai_event_bus.on(LLMCallStartedEvent)
+        @crewai_event_bus.on(LLMCallStartedEvent, when=self._console_enabled)
         def on_llm_call_started(source, event: LLMCallStartedEvent):
             # Capture the returned tool branch and update the current_tool_branch reference
             thinking_branch = self.formatter.handle_llm_call_started(
@@ -339,7 +344,7 @@ class EventListener(BaseEventListener):
             if thinking_branch is not None:
                 self.formatter.current_tool_branch = thinking_branch
 
-        @crewai_event_bus.on(LLMCallCompletedEvent)
+        @crewai_event_bus.on(LLMCallCompletedEvent, when=self._console_enabled)
         def on_llm_call_completed(source, event: LLMCallCompletedEvent):
             self.formatter.handle_llm_call_completed(
                 self.formatter.current_tool_branch,
@@ -347,7 +352,7 @@ class EventListener(BaseEventListener):
                 self.formatter.current_crew_tree,
             )
 
-        @crewai_event_bus.on(LLMCallFailedEvent)
+        @crewai_event_bus.on(LLMCallFailedEvent, when=self._console_enabled)
         def on_llm_call_failed(source, event: LLMCallFailedEvent):
             self.formatter.handle_llm_call_failed(
                 self.formatter.current_tool_branch,
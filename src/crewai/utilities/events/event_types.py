@@ -56,6 +56,7 @@ from .knowledge_events import (
     KnowledgeQueryFailedEvent,
     KnowledgeSearchQueryFailedEvent,
 )
+from .memory_events import MemoryRetrievalCompletedEvent
 
 EventTypes = Union[
     CrewKickoffStartedEvent,
@@ -96,4 +97,5 @@ EventTypes = Union[
     KnowledgeQueryCompletedEvent,
     KnowledgeQueryFailedEvent,
     KnowledgeSearchQueryFailedEvent,
+    MemoryRetrievalCompletedEvent,
 ]
@@ -34,6 +34,9 @@ class MethodExecutionStartedEvent(FlowEvent):
     method_name: str
     state: Union[Dict[str, Any], BaseModel]
     params: Optional[Dict[str, Any]] = None
+    queued_seconds: float = 0.0
+    running_methods: int = 0
+    waiting_methods: int = 0
     type: str = "method_execution_started"
 
 
@@ -44,6 +47,8 @@ class MethodExecutionFinishedEvent(FlowEvent):
     method_name: str
     result: Any = None
     state: Union[Dict[str, Any], BaseModel]
+    queued_seconds: float = 0.0
+    execution_seconds: Optional[float] = None
     type: str = "method_execution_finished"
 
 
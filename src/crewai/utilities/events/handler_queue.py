@@ -0,0 +1,111 @@
+"""Bounded queues running event handlers off the emitting thread."""
+
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Literal, Optional, Type
+
+from crewai.utilities.events.base_events import BaseEvent
+
+OverflowPolicy = Literal["drop", "coalesce"]
+
+
+class BackgroundHandler:
+    """Event handler running on its own worker thread behind a bounded queue.
+
+    Calling the handler only queues the event, so a slow handler does not
+    delay the code emitting events. Events are handled in the order they were
+    queued. When the queue is full, the "drop" policy discards the new event,
+    while "coalesce" replaces the queued event of the same type with the new
+    one, and drops the new event if there is none.
+
+    Coroutine functions are awaited on an event loop owned by the worker.
+
+    Args:
+        handler: Function called with the source and the event.
+        max_queue_size: Number of events waiting to be handled.
+        overflow: What to do with events arriving when the queue is full.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Any, Any], Any],
+        max_queue_size: int = 1000,
+        overflow: OverflowPolicy = "drop",
+    ) -> None:
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be a positive integer")
+        if overflow not in ("drop", "coalesce"):
+            raise ValueError(f"overflow must be 'drop' or 'coalesce', got {overflow!r}")
+        self.handler = handler
+        self.__name__ = getattr(handler, "__name__", repr(handler))
+        self.max_queue_size = max_queue_size
+        self.overflow = overflow
+        self.dropped = 0
+        self.coalesced = 0
+        # Queued [source, event] pairs, mutable so coalescing replaces in place
+        self._queue: Deque[List[Any]] = deque()
+        self._latest: Dict[Type[BaseEvent], List[Any]] = {}
+        self._in_progress = 0
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __call__(self, source: Any, event: BaseEvent) -> None:
+        with self._condition:
+            if len(self._queue) >= self.max_queue_size:
+                pending = self._latest.get(type(event))
+                if self.overflow == "coalesce" and pending is not None:
+                    pending[:] = [source, event]
+                    self.coalesced += 1
+                else:
+                    self.dropped += 1
+                return
+
+            item = [source, event]
+            self._queue.append(item)
+            self._latest[type(event)] = item
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name=f"crewai-event-handler-{self.__name__}",
+                    daemon=True,
+                )
+                self._worker.start()
+            self._condition.notify_all()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued event has been handled.
+
+        Returns:
+            False if the timeout expired first.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._queue and not self._in_progress, timeout
+            )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: bool(self._queue))
+                item = self._queue.popleft()
+                source, event = item
+                if self._latest.get(type(event)) is item:
+                    del self._latest[type(event)]
+                self._in_progress += 1
+
+            try:
+                result = self.handler(source, event)
+                if asyncio.iscoroutine(result):
+                    if self._loop is None:
+                        self._loop = asyncio.new_event_loop()
+                    self._loop.run_until_complete(result)
+            except Exception as e:
+                print(
+                    f"[EventBus Error] Handler '{self.__name__}' failed for event '{type(event).__name__}': {e}"
+                )
+            finally:
+                with self._condition:
+                    self._in_progress -= 1
+                    self._condition.notify_all()
@@ -0,0 +1,13 @@
+from typing import Literal, Optional
+
+from crewai.utilities.events.base_events import BaseEvent
+
+
+class MemoryRetrievalCompletedEvent(BaseEvent):
+    """Event emitted when a memory source was queried to build a task context."""
+
+    type: str = "memory_retrieval_completed"
+    source: str  # "ltm", "stm", "entity", "external" or "user"
+    status: Literal["completed", "timeout", "failed", "skipped"]
+    elapsed_seconds: float
+    error: Optional[str] = None
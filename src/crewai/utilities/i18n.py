@@ -1,11 +1,20 @@
 import json
 import os
+from functools import lru_cache
 from typing import Dict, Optional, Union
 
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 """Internationalization support for CrewAI prompts and messages."""
 
+
+@lru_cache(maxsize=32)
+def _read_prompts(path: str, mtime_ns: int) -> Dict[str, Dict[str, str]]:
+    """Parse a prompt file once per version so every I18N instance shares it."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 class I18N(BaseModel):
     """Handles loading and retrieving internationalized prompts."""
     _prompts: Dict[str, Dict[str, str]] = PrivateAttr()
@@ -19,14 +28,14 @@ class I18N(BaseModel):
         """Load prompts from a JSON file."""
         try:
             if self.prompt_file:
-                with open(self.prompt_file, "r", encoding="utf-8") as f:
-                    self._prompts = json.load(f)
+                prompts_path = self.prompt_file
             else:
                 dir_path = os.path.dirname(os.path.realpath(__file__))
                 prompts_path = os.path.join(dir_path, "../translations/en.json")
 
-                with open(prompts_path, "r", encoding="utf-8") as f:
-                    self._prompts = json.load(f)
+            self._prompts = _read_prompts(
+                prompts_path, os.stat(prompts_path).st_mtime_ns
+            )
         except FileNotFoundError:
             raise Exception(f"Prompt file '{self.prompt_file}' not found.")
         except json.JSONDecodeError:
@@ -1,77 +1,137 @@
+import asyncio
 import threading
 import time
-from typing import Optional
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, PrivateAttr, model_validator
+from pydantic import BaseModel, Field, PrivateAttr
 
 from crewai.utilities.logger import Logger
 
 """Controls request rate limiting for API calls."""
 
+WINDOW_SECONDS = 60.0
+
 
 class RPMController(BaseModel):
-    """Manages requests per minute limiting."""
+    """Manages requests per minute limiting.
+
+    Keeps a sliding window of request start times. When the window is full a
+    caller reserves the slot that frees up next and sleeps only until then,
+    outside the lock, so one caller over the limit never blocks the others.
+    An optional tokens per minute budget is enforced from the usage reported
+    through ``record_tokens``. Requests whose usage is not reported yet are
+    reserved in the budget at the average usage of the recent requests, so
+    callers waiting for the budget are spread out like request slots instead
+    of all starting when it frees up.
+    """
 
     max_rpm: Optional[int] = Field(default=None)
+    max_tpm: Optional[int] = Field(default=None)
     logger: Logger = Field(default_factory=lambda: Logger(verbose=False))
-    _current_rpm: int = PrivateAttr(default=0)
-    _timer: Optional[threading.Timer] = PrivateAttr(default=None)
-    _lock: Optional[threading.Lock] = PrivateAttr(default=None)
-    _shutdown_flag: bool = PrivateAttr(default=False)
-
-    @model_validator(mode="after")
-    def reset_counter(self):
-        if self.max_rpm is not None:
-            if not self._shutdown_flag:
-                self._lock = threading.Lock()
-                self._reset_request_count()
-        return self
-
-    def check_or_wait(self):
-        if self.max_rpm is None:
-            return True
-
-        def _check_and_increment():
-            if self.max_rpm is not None and self._current_rpm < self.max_rpm:
-                self._current_rpm += 1
-                return True
-            elif self.max_rpm is not None:
-                self.logger.log(
-                    "info", "Max RPM reached, waiting for next minute to start."
-                )
-                self._wait_for_next_minute()
-                self._current_rpm = 1
-                return True
-            return True
+    _requests: Deque[float] = PrivateAttr(default_factory=deque)
+    _tokens: Deque[Tuple[float, int]] = PrivateAttr(default_factory=deque)
+    _token_total: int = PrivateAttr(default=0)
+    _token_reservations: List[Tuple[float, int]] = PrivateAttr(default_factory=list)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def check_or_wait(self) -> bool:
+        """Block the calling thread until a request is allowed."""
+        wait = self._reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return True
 
-        if self._lock:
-            with self._lock:
-                return _check_and_increment()
-        else:
-            return _check_and_increment()
+    async def acquire(self) -> bool:
+        """Wait without blocking the event loop until a request is allowed."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+    def record_tokens(self, tokens: int) -> None:
+        """Count tokens used by a completed request against the TPM budget."""
+        if self.max_tpm is None or tokens <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            started = [
+                index
+                for index, (start, _) in enumerate(self._token_reservations)
+                if start <= now
+            ]
+            if started:
+                # The usage replaces the estimate of the oldest started request
+                self._token_reservations.pop(
+                    min(started, key=lambda index: self._token_reservations[index][0])
+                )
+            self._tokens.append((now, tokens))
+            self._token_total += tokens
 
     def stop_rpm_counter(self):
-        if self._timer:
-            self._timer.cancel()
-            self._timer = None
-
-    def _wait_for_next_minute(self):
-        time.sleep(60)
-        self._current_rpm = 0
-
-    def _reset_request_count(self):
-        def _reset():
-            self._current_rpm = 0
-            if not self._shutdown_flag:
-                self._timer = threading.Timer(60.0, self._reset_request_count)
-                self._timer.start()
-
-        if self._lock:
-            with self._lock:
-                _reset()
-        else:
-            _reset()
-
-        if self._timer:
-            self._shutdown_flag = True
-            self._timer.cancel()
+        """Kept for compatibility, the sliding window needs no background timer."""
+        pass
+
+    def _sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+    def _reserve(self) -> float:
+        """Reserve the earliest allowed start time and return the seconds until it."""
+        if self.max_rpm is None and self.max_tpm is None:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            token_start = self._token_budget_available_at(now)
+            request_start = now
+            if self.max_rpm is not None:
+                window_start = now - WINDOW_SECONDS
+                while self._requests and self._requests[0] <= window_start:
+                    self._requests.popleft()
+                if len(self._requests) >= self.max_rpm:
+                    request_start = self._requests.popleft() + WINDOW_SECONDS
+                self._requests.append(max(request_start, token_start))
+            if self.max_tpm is not None:
+                self._token_reservations.append(
+                    (max(request_start, token_start), self._tokens_per_request())
+                )
+
+        if request_start > now and request_start >= token_start:
+            self.logger.log("info", "Max RPM reached, waiting for next minute to start.")
+        elif token_start > now:
+            self.logger.log(
+                "info",
+                f"Max TPM reached, waiting {token_start - now:.1f}s for token budget.",
+            )
+        return max(request_start, token_start) - now
+
+    def _token_budget_available_at(self, now: float) -> float:
+        if self.max_tpm is None:
+            return now
+
+        window_start = now - WINDOW_SECONDS
+        while self._tokens and self._tokens[0][0] <= window_start:
+            _, tokens = self._tokens.popleft()
+            self._token_total -= tokens
+        self._token_reservations = [
+            reservation
+            for reservation in self._token_reservations
+            if reservation[0] > window_start
+        ]
+        usage = sorted([*self._tokens, *self._token_reservations])
+        remaining = self._token_total + sum(
+            tokens for _, tokens in self._token_reservations
+        )
+        if remaining < self.max_tpm:
+            return now
+
+        for used_at, tokens in usage:
+            remaining -= tokens
+            if remaining < self.max_tpm:
+                return max(used_at + WINDOW_SECONDS, now)
+        return now
+
+    def _tokens_per_request(self) -> int:
+        if not self._tokens:
+            return 0
+        return self._token_total // len(self._tokens)
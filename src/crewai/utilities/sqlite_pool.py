@@ -0,0 +1,246 @@
+"""Shared SQLite access layer of the built-in storages."""
+
+import atexit
+import logging
+import queue
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+WriteOperation = Callable[[sqlite3.Connection], None]
+
+
+class _PooledConnection(sqlite3.Connection):
+    """Connection class supporting weak references, which sqlite3's lacks."""
+
+
+class SQLiteConnectionPool:
+    """Thread-local connections to one SQLite database.
+
+    Each thread reuses its own connection instead of opening one per
+    operation, which also keeps its prepared statements cached. Connections
+    run in WAL mode with ``synchronous=NORMAL``, so readers do not block the
+    writer and commits do not wait for a full disk sync. A connection is
+    closed when its thread ends or when the pool is closed.
+
+    Use ``get_pool`` to share the pool of a database file between storages.
+
+    Args:
+        db_path: Path to the SQLite database file.
+        timeout: Seconds to wait for a lock held by another connection.
+        cached_statements: Number of prepared statements kept per connection.
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        timeout: float = 30.0,
+        cached_statements: int = 256,
+    ) -> None:
+        self.db_path = str(db_path)
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._connections: "weakref.WeakSet[_PooledConnection]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def connection(self) -> sqlite3.Connection:
+        """Return the connection of the calling thread, opening it on first use.
+
+        Raises:
+            sqlite3.ProgrammingError: If the pool was closed
+        """
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            return conn
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot use a closed connection pool")
+
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            cached_statements=self.cached_statements,
+            check_same_thread=False,
+            factory=_PooledConnection,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._local.connection = conn
+        with self._lock:
+            self._connections.add(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the block in a transaction, committed unless the block raises."""
+        conn = self.connection()
+        with conn:
+            yield conn
+
+    def execute(self, sql: str, parameters: Sequence[Any] = ()) -> List[Any]:
+        """Run one statement in its own transaction and return the fetched rows."""
+        with self.transaction() as conn:
+            return conn.execute(sql, parameters).fetchall()
+
+    def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> None:
+        """Run one statement for every row in a single transaction."""
+        with self.transaction() as conn:
+            conn.executemany(sql, rows)
+
+    def close(self) -> None:
+        """Close every connection of the pool."""
+        with self._lock:
+            self._closed = True
+            connections = list(self._connections)
+            self._connections = weakref.WeakSet()
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+
+_pools: Dict[str, SQLiteConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: Union[str, Path], timeout: float = 30.0) -> SQLiteConnectionPool:
+    """Return the pool shared by every storage using the database ``db_path``.
+
+    Args:
+        db_path: Path to the SQLite database file.
+        timeout: Lock timeout of the connections, used when creating the pool.
+    """
+    key = str(Path(db_path).resolve())
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            pool = _pools[key] = SQLiteConnectionPool(db_path, timeout=timeout)
+        return pool
+
+
+class SQLiteBatchWriter:
+    """Background thread committing queued writes in batches.
+
+    Callers only queue their writes and return immediately. The writer
+    commits everything queued so far in one transaction, and consecutive
+    writes of the same statement are run with a single ``executemany``.
+
+    A failed batch is rolled back and its error is raised by the next call
+    to ``flush`` or ``raise_error``.
+
+    Args:
+        pool: Pool providing the connection of the writer thread.
+        max_batch_size: Number of writes committed in one transaction at most.
+        on_error: Called on the writer thread with the error of a failed batch.
+        name: Name of the writer thread.
+    """
+
+    def __init__(
+        self,
+        pool: SQLiteConnectionPool,
+        max_batch_size: int = 1000,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        name: str = "crewai-sqlite-writer",
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer")
+        self.pool = pool
+        self.max_batch_size = max_batch_size
+        self.on_error = on_error
+        self.name = name
+        self._queue: "queue.Queue[Union[WriteOperation, tuple]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._error: Optional[Exception] = None
+
+    def write(self, sql: str, parameters: Sequence[Any] = ()) -> None:
+        """Queue a statement."""
+        self._submit((sql, tuple(parameters)))
+
+    def submit(self, operation: WriteOperation) -> None:
+        """Queue a function called with the connection of the writer."""
+        self._submit(operation)
+
+    def flush(self) -> None:
+        """Wait until every queued write has been committed.
+
+        Raises:
+            sqlite3.Error: If a queued write failed
+        """
+        if self._thread is not None:
+            self._queue.join()
+        self.raise_error()
+
+    def raise_error(self) -> None:
+        """Raise the error of the last failed batch, once.
+
+        Raises:
+            sqlite3.Error: If a queued write failed
+        """
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _submit(self, item: Union[WriteOperation, tuple]) -> None:
+        if self._thread is None:
+            with self._thread_lock:
+                if self._thread is None:
+                    thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                    thread.start()
+                    atexit.register(self._flush_at_exit)
+                    self._thread = thread
+        self._queue.put(item)
+
+    def _flush_at_exit(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Failed to commit queued SQLite writes: {e}")
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with self.pool.transaction() as conn:
+                    self._apply(conn, batch)
+            except Exception as e:
+                logger.error(f"Failed to commit queued SQLite writes: {e}")
+                self._error = e
+                if self.on_error is not None:
+                    self.on_error(e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _apply(conn: sqlite3.Connection, batch: List[Union[WriteOperation, tuple]]) -> None:
+        index = 0
+        while index < len(batch):
+            item = batch[index]
+            index += 1
+            if callable(item):
+                item(conn)
+                continue
+            sql, parameters = item
+            rows = [parameters]
+            # Group the following writes of the same statement
+            while index < len(batch):
+                following = batch[index]
+                if callable(following) or following[0] != sql:
+                    break
+                rows.append(following[1])
+                index += 1
+            if len(rows) == 1:
+                conn.execute(sql, parameters)
+            else:
+                conn.executemany(sql, rows)
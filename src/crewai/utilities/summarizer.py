@@ -0,0 +1,187 @@
+"""Concurrent map-reduce summarization of texts too long for one LLM call."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence
+
+from crewai.agents.context_window import estimate_tokens
+from crewai.utilities.i18n import I18N
+from crewai.utilities.printer import Printer
+
+MAX_CACHED_SUMMARIES = 512
+
+# Summaries of chunks, shared by all summarizers since a conversation is
+# summarized again by a new one every time it outgrows the context window
+_summaries: "OrderedDict[str, str]" = OrderedDict()
+_summaries_lock = threading.Lock()
+
+
+class Summarizer:
+    """Summarize texts with concurrent chunk summaries, reduced hierarchically.
+
+    The texts are split into chunks of about ``chunk_tokens``, each starting
+    with the last ``overlap_tokens`` of the previous one so that no passage
+    loses its context at a boundary. Texts are only split when they do not
+    fit in a chunk by themselves, so the chunks of a conversation that grew
+    since it was last summarized are the same up to its former end, and their
+    summaries are taken from a cache. The other chunks are summarized
+    concurrently by up to ``max_workers`` threads. As long as the summaries
+    together exceed a chunk, they are summarized again the same way.
+
+    Args:
+        llm: LLM writing the summaries.
+        callbacks: Callbacks of the summarization calls.
+        i18n: Prompts of the summaries.
+        max_workers: Maximum number of concurrent summarization calls.
+        chunk_tokens: Tokens of text summarized per call. Defaults to half
+            the context window of ``llm``.
+        overlap_tokens: Tokens a chunk repeats from the previous one.
+        tokenizer: Function counting the tokens of a text. Defaults to
+            ``estimate_tokens``.
+        max_rounds: Maximum number of times summaries are summarized again.
+        request_within_rpm_limit: Called before every summarization call to
+            wait for the rate limits of the agent.
+    """
+
+    def __init__(
+        self,
+        llm: Any,
+        callbacks: Optional[List[Any]] = None,
+        i18n: Optional[I18N] = None,
+        max_workers: int = 4,
+        chunk_tokens: Optional[int] = None,
+        overlap_tokens: int = 200,
+        tokenizer: Optional[Callable[[str], int]] = None,
+        max_rounds: int = 3,
+        request_within_rpm_limit: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        self.llm = llm
+        self.callbacks = callbacks or []
+        self.i18n = i18n or I18N()
+        self.max_workers = max_workers
+        self.chunk_tokens = chunk_tokens or max(llm.get_context_window_size() // 2, 1)
+        self.overlap_tokens = min(overlap_tokens, self.chunk_tokens // 4)
+        self.tokenizer = tokenizer or estimate_tokens
+        self.max_rounds = max_rounds
+        self.request_within_rpm_limit = request_within_rpm_limit
+        self._printer = Printer()
+
+    def summarize(self, texts: Sequence[str]) -> str:
+        """Return a summary of ``texts``, read in order."""
+        summaries = self._map(self.split(texts))
+        for _ in range(self.max_rounds):
+            merged = " ".join(summaries)
+            if len(summaries) == 1 or self.tokenizer(merged) <= self.chunk_tokens:
+                return merged
+            summaries = self._map(self.split(summaries))
+        return " ".join(summaries)
+
+    def split(self, texts: Sequence[str]) -> List[str]:
+        """Group ``texts`` into overlapping chunks of about ``chunk_tokens``."""
+        chunks: List[str] = []
+        current: List[str] = []
+        size = 0
+        for text in texts:
+            for piece in self._pieces(text):
+                tokens = self.tokenizer(piece)
+                if current and size + tokens > self.chunk_tokens:
+                    chunks.append("\n".join(current))
+                    overlap = self._tail(chunks[-1])
+                    current = [overlap] if overlap else []
+                    size = self.tokenizer(overlap) if overlap else 0
+                current.append(piece)
+                size += tokens
+        if current:
+            chunks.append("\n".join(current))
+        return chunks
+
+    def _pieces(self, text: str) -> List[str]:
+        limit = self.chunk_tokens - self.overlap_tokens
+        tokens = self.tokenizer(text)
+        if tokens <= limit:
+            return [text]
+
+        size = max(int(len(text) * limit / tokens), 1)
+        pieces = []
+        start = 0
+        while start < len(text):
+            end = start + size
+            if end < len(text):
+                # Cut after a whitespace rather than inside a word
+                space = text.rfind(" ", start + size // 2, end)
+                if space != -1:
+                    end = space + 1
+            pieces.append(text[start:end])
+            start = end
+        return pieces
+
+    def _tail(self, chunk: str) -> str:
+        if self.overlap_tokens <= 0:
+            return ""
+        chars = int(len(chunk) * self.overlap_tokens / max(self.tokenizer(chunk), 1))
+        tail = chunk[-chars:] if chars else ""
+        space = tail.find(" ")
+        return tail[space + 1 :] if space != -1 else tail
+
+    def _map(self, chunks: List[str]) -> List[str]:
+        summaries: List[Optional[str]] = [self._cached(chunk) for chunk in chunks]
+        missing = [index for index, summary in enumerate(summaries) if summary is None]
+        for index in missing:
+            self._printer.print(
+                content=f"Summarizing {index + 1}/{len(chunks)}...",
+                color="yellow",
+            )
+
+        if len(missing) == 1:
+            summaries[missing[0]] = self._summarize_chunk(chunks[missing[0]])
+        elif missing:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(missing))
+            ) as pool:
+                results = pool.map(
+                    self._summarize_chunk, [chunks[index] for index in missing]
+                )
+                for index, summary in zip(missing, results):
+                    summaries[index] = summary
+        return [summary or "" for summary in summaries]
+
+    def _key(self, chunk: str) -> str:
+        model = getattr(self.llm, "model", type(self.llm).__name__)
+        instruction = self.i18n.slice("summarize_instruction")
+        return hashlib.sha256(f"{model}\0{instruction}\0{chunk}".encode()).hexdigest()
+
+    def _cached(self, chunk: str) -> Optional[str]:
+        key = self._key(chunk)
+        with _summaries_lock:
+            summary = _summaries.get(key)
+            if summary is not None:
+                _summaries.move_to_end(key)
+            return summary
+
+    def _summarize_chunk(self, chunk: str) -> str:
+        if self.request_within_rpm_limit:
+            self.request_within_rpm_limit()
+        summary = str(
+            self.llm.call(
+                [
+                    {
+                        "role": "system",
+                        "content": self.i18n.slice("summarizer_system_message"),
+                    },
+                    {
+                        "role": "user",
+                        "content": self.i18n.slice("summarize_instruction")
+                        .format(group=chunk)
+                        .rstrip(),
+                    },
+                ],
+                callbacks=self.callbacks,
+            )
+        )
+        with _summaries_lock:
+            _summaries[self._key(chunk)] = summary
+            while len(_summaries) > MAX_CACHED_SUMMARIES:
+                _summaries.popitem(last=False)
+        return summary
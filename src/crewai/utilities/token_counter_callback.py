@@ -1,15 +1,23 @@
 import warnings
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.types.utils import Usage
 
 from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
 
+if TYPE_CHECKING:
+    from crewai.utilities.rpm_controller import RPMController
+
 
 class TokenCalcHandler(CustomLogger):
-    def __init__(self, token_cost_process: Optional[TokenProcess]):
+    def __init__(
+        self,
+        token_cost_process: Optional[TokenProcess],
+        rpm_controller: Optional["RPMController"] = None,
+    ):
         self.token_cost_process = token_cost_process
+        self.rpm_controller = rpm_controller
 
     def log_success_event(
         self,
@@ -26,6 +34,8 @@ class TokenCalcHandler(CustomLogger):
             if isinstance(response_obj, dict) and "usage" in response_obj:
                 usage: Usage = response_obj["usage"]
                 if usage:
+                    if self.rpm_controller and getattr(usage, "total_tokens", None):
+                        self.rpm_controller.record_tokens(usage.total_tokens)
                     self.token_cost_process.sum_successful_requests(1)
                     if hasattr(usage, "prompt_tokens"):
                         self.token_cost_process.sum_prompt_tokens(usage.prompt_tokens)
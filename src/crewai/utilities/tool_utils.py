@@ -1,8 +1,10 @@
+import asyncio
 from typing import Any, Dict, List, Optional
 
 from crewai.agents.parser import AgentAction
 from crewai.security import Fingerprint
 from crewai.tools.structured_tool import CrewStructuredTool
+from crewai.tools.tool_registry import ToolRegistry
 from crewai.tools.tool_types import ToolResult
 from crewai.tools.tool_usage import ToolUsage, ToolUsageErrorException
 from crewai.utilities.i18n import I18N
@@ -19,6 +21,7 @@ def execute_tool_and_check_finality(
     agent: Optional[Any] = None,
     function_calling_llm: Optional[Any] = None,
     fingerprint_context: Optional[Dict[str, str]] = None,
+    tool_registry: Optional[ToolRegistry] = None,
 ) -> ToolResult:
     """Execute a tool and check if the result should be treated as a final answer.
 
@@ -32,59 +35,138 @@ def execute_tool_and_check_finality(
         task: Optional task for tool execution
         agent: Optional agent instance for tool execution
         function_calling_llm: Optional LLM for function calling
+        tool_registry: Optional index of the tools, built from them when missing
 
     Returns:
         ToolResult containing the execution result and whether it should be treated as a final answer
     """
+    tool_registry = tool_registry or ToolRegistry(tools)
     try:
-        tool_name_to_tool_map = {tool.name: tool for tool in tools}
-
-        if agent_key and agent_role and agent:
-            fingerprint_context = fingerprint_context or {}
-            if agent:
-                if hasattr(agent, "set_fingerprint") and callable(
-                    agent.set_fingerprint
-                ):
-                    if isinstance(fingerprint_context, dict):
-                        try:
-                            fingerprint_obj = Fingerprint.from_dict(fingerprint_context)
-                            agent.set_fingerprint(fingerprint_obj)
-                        except Exception as e:
-                            raise ValueError(f"Failed to set fingerprint: {e}")
-
-        # Create tool usage instance
-        tool_usage = ToolUsage(
+        tool_usage = _prepare_tool_usage(
+            agent_action,
+            tools,
+            agent_key=agent_key,
+            agent_role=agent_role,
             tools_handler=tools_handler,
-            tools=tools,
-            function_calling_llm=function_calling_llm,
             task=task,
             agent=agent,
-            action=agent_action,
+            function_calling_llm=function_calling_llm,
+            fingerprint_context=fingerprint_context,
+            tool_registry=tool_registry,
         )
-
-        # Parse tool calling
         tool_calling = tool_usage.parse_tool_calling(agent_action.text)
 
         if isinstance(tool_calling, ToolUsageErrorException):
             return ToolResult(tool_calling.message, False)
 
-        # Check if tool name matches
-        if tool_calling.tool_name.casefold().strip() in [
-            name.casefold().strip() for name in tool_name_to_tool_map
-        ] or tool_calling.tool_name.casefold().replace("_", " ") in [
-            name.casefold().strip() for name in tool_name_to_tool_map
-        ]:
+        if tool_registry.match(tool_calling.tool_name) is not None:
             tool_result = tool_usage.use(tool_calling, agent_action.text)
-            tool = tool_name_to_tool_map.get(tool_calling.tool_name)
+            tool = tool_registry.get(tool_calling.tool_name)
             if tool:
                 return ToolResult(tool_result, tool.result_as_answer)
 
-        # Handle invalid tool name
-        tool_result = i18n.errors("wrong_tool_name").format(
-            tool=tool_calling.tool_name,
-            tools=", ".join([tool.name.casefold() for tool in tools]),
-        )
-        return ToolResult(tool_result, False)
+        return _wrong_tool_name_result(tool_calling.tool_name, tools, i18n)
 
     except Exception as e:
         raise e
+
+
+async def aexecute_tool_and_check_finality(
+    agent_action: AgentAction,
+    tools: List[CrewStructuredTool],
+    i18n: I18N,
+    agent_key: Optional[str] = None,
+    agent_role: Optional[str] = None,
+    tools_handler: Optional[Any] = None,
+    task: Optional[Any] = None,
+    agent: Optional[Any] = None,
+    function_calling_llm: Optional[Any] = None,
+    fingerprint_context: Optional[Dict[str, str]] = None,
+    tool_registry: Optional[ToolRegistry] = None,
+) -> ToolResult:
+    """Asynchronous counterpart of ``execute_tool_and_check_finality``.
+
+    The tool is awaited through ``CrewStructuredTool.ainvoke``, so coroutine
+    tools run on the caller's event loop and sync tools in a worker thread.
+
+    Returns:
+        ToolResult containing the execution result and whether it should be treated as a final answer
+    """
+    tool_registry = tool_registry or ToolRegistry(tools)
+    tool_usage = _prepare_tool_usage(
+        agent_action,
+        tools,
+        agent_key=agent_key,
+        agent_role=agent_role,
+        tools_handler=tools_handler,
+        task=task,
+        agent=agent,
+        function_calling_llm=function_calling_llm,
+        fingerprint_context=fingerprint_context,
+        tool_registry=tool_registry,
+    )
+    if function_calling_llm:
+        # Unparsable actions are converted by the function calling LLM
+        tool_calling = await asyncio.to_thread(
+            tool_usage.parse_tool_calling, agent_action.text
+        )
+    else:
+        tool_calling = tool_usage.parse_tool_calling(agent_action.text)
+
+    if isinstance(tool_calling, ToolUsageErrorException):
+        return ToolResult(tool_calling.message, False)
+
+    if tool_registry.match(tool_calling.tool_name) is not None:
+        tool_result = await tool_usage.ause(tool_calling, agent_action.text)
+        tool = tool_registry.get(tool_calling.tool_name)
+        if tool:
+            return ToolResult(tool_result, tool.result_as_answer)
+
+    return _wrong_tool_name_result(tool_calling.tool_name, tools, i18n)
+
+
+def _prepare_tool_usage(
+    agent_action: AgentAction,
+    tools: List[CrewStructuredTool],
+    agent_key: Optional[str] = None,
+    agent_role: Optional[str] = None,
+    tools_handler: Optional[Any] = None,
+    task: Optional[Any] = None,
+    agent: Optional[Any] = None,
+    function_calling_llm: Optional[Any] = None,
+    fingerprint_context: Optional[Dict[str, str]] = None,
+    tool_registry: Optional[ToolRegistry] = None,
+) -> ToolUsage:
+    if agent_key and agent_role and agent:
+        fingerprint_context = fingerprint_context or {}
+        if agent:
+            if hasattr(agent, "set_fingerprint") and callable(agent.set_fingerprint):
+                if isinstance(fingerprint_context, dict):
+                    try:
+                        fingerprint_obj = Fingerprint.from_dict(fingerprint_context)
+                        agent.set_fingerprint(fingerprint_obj)
+                    except Exception as e:
+                        raise ValueError(f"Failed to set fingerprint: {e}")
+
+    # Create tool usage instance
+    tool_usage = ToolUsage(
+        tools_handler=tools_handler,
+        tools=tools,
+        function_calling_llm=function_calling_llm,
+        task=task,
+        agent=agent,
+        action=agent_action,
+        tool_registry=tool_registry,
+    )
+
+    return tool_usage
+
+
+def _wrong_tool_name_result(
+    tool_name: str, tools: List[CrewStructuredTool], i18n: I18N
+) -> ToolResult:
+    tool_result = i18n.errors("wrong_tool_name").format(
+        tool=tool_name,
+        tools=", ".join([tool.name.casefold() for tool in tools]),
+    )
+    return ToolResult(tool_result, False)
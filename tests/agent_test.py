@@ -285,10 +285,9 @@ def test_cache_hitting():
 
     output = agent.execute_task(task1)
     output = agent.execute_task(task2)
-    assert cache_handler._cache == {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-    }
+    assert len(cache_handler.backend) == 2
+    assert cache_handler.read("multiplier", {"first_number": 2, "second_number": 6}) == 12
+    assert cache_handler.read("multiplier", {"first_number": 3, "second_number": 3}) == 9
 
     task = Task(
         description="What is 2 times 6 times 3? Return only the number",
@@ -298,11 +297,8 @@ def test_cache_hitting():
     output = agent.execute_task(task)
     assert output == "36"
 
-    assert cache_handler._cache == {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-        "multiplier-{'first_number': 12, 'second_number': 3}": 36,
-    }
+    assert len(cache_handler.backend) == 3
+    assert cache_handler.read("multiplier", {"first_number": 12, "second_number": 3}) == 36
     received_events = []
 
     @crewai_event_bus.on(ToolUsageFinishedEvent)
@@ -361,10 +357,8 @@ def test_disabling_cache_for_agent():
 
     output = agent.execute_task(task1)
     output = agent.execute_task(task2)
-    assert cache_handler._cache != {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-    }
+    assert cache_handler.read("multiplier", {"first_number": 2, "second_number": 6}) is None
+    assert cache_handler.read("multiplier", {"first_number": 3, "second_number": 3}) is None
 
     task = Task(
         description="What is 2 times 6 times 3? Return only the number",
@@ -374,11 +368,7 @@ def test_disabling_cache_for_agent():
     output = agent.execute_task(task)
     assert output == "36"
 
-    assert cache_handler._cache != {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-        "multiplier-{'first_number': 12, 'second_number': 3}": 36,
-    }
+    assert len(cache_handler.backend) == 0
 
     with patch.object(CacheHandler, "read") as read:
         read.return_value = "0"
@@ -676,7 +666,7 @@ def test_agent_respect_the_max_rpm_set(capsys):
         allow_delegation=False,
     )
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_sleep") as moveon:
         moveon.return_value = True
         task = Task(
             description="Use tool logic for `get_final_answer` but fon't give you final answer yet, instead keep using it unless you're told to give your final answer",
@@ -722,7 +712,7 @@ def test_agent_respect_the_max_rpm_set_over_crew_rpm(capsys):
 
     crew = Crew(agents=[agent], tasks=[task], max_rpm=1, verbose=True)
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_sleep") as moveon:
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
@@ -781,7 +771,7 @@ def test_agent_without_max_rpm_respects_crew_rpm(capsys):
     # Set crew's max_rpm to 1 to trigger RPM limit
     crew = Crew(agents=[agent1, agent2], tasks=tasks, max_rpm=1, verbose=True)
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_sleep") as moveon:
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
@@ -2253,3 +2243,116 @@ def test_agent_from_repository_without_org_set(
         "No organization currently set. We recommend setting one before using: `crewai org switch <org_id>` command.",
         style="yellow",
     )
+
+
+@pytest.mark.asyncio
+async def test_agent_aexecute_task_awaits_llm_and_async_tools():
+    calls = []
+
+    @tool
+    async def multiplier(first_number: int, second_number: int) -> int:
+        """Useful for when you need to multiply two numbers together."""
+        calls.append((first_number, second_number))
+        return first_number * second_number
+
+    responses = iter(
+        [
+            'Thought: I should multiply\nAction: multiplier\nAction Input: {"first_number": 3, "second_number": 4}',
+            "Thought: I know the answer\nFinal Answer: 12",
+        ]
+    )
+
+    async def fake_acall(self, messages, *args, **kwargs):
+        return next(responses)
+
+    agent = Agent(
+        role="Math",
+        goal="Multiply numbers",
+        backstory="You are great at math.",
+        tools=[multiplier],
+        llm=LLM(model="gpt-4o-mini"),
+    )
+    task = Task(
+        description="What is 3 times 4?",
+        expected_output="The product",
+        agent=agent,
+    )
+
+    with (
+        patch.object(LLM, "acall", autospec=True, side_effect=fake_acall),
+        patch.object(LLM, "call") as call,
+    ):
+        result = await agent.aexecute_task(task)
+
+    assert result == "12"
+    assert calls == [(3, 4)]
+    call.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_agent_aexecute_task_converts_actions_off_the_event_loop():
+    import threading
+
+    from crewai.tools.tool_usage import ToolUsage
+
+    parse_threads = []
+    original_parse = ToolUsage.parse_tool_calling
+
+    def parse_tool_calling(self, tool_string):
+        parse_threads.append(threading.current_thread())
+        return original_parse(self, tool_string)
+
+    @tool
+    def multiplier(first_number: int, second_number: int) -> int:
+        """Useful for when you need to multiply two numbers together."""
+        return first_number * second_number
+
+    responses = iter(
+        [
+            'Thought: I should multiply\nAction: multiplier\nAction Input: {"first_number": 3, "second_number": 4}',
+            "Thought: I know the answer\nFinal Answer: 12",
+        ]
+    )
+
+    async def fake_acall(self, messages, *args, **kwargs):
+        return next(responses)
+
+    agent = Agent(
+        role="Math",
+        goal="Multiply numbers",
+        backstory="You are great at math.",
+        tools=[multiplier],
+        llm=LLM(model="gpt-4o-mini"),
+        function_calling_llm=LLM(model="gpt-4o-mini"),
+    )
+    task = Task(description="What is 3 times 4?", expected_output="The product")
+
+    with (
+        patch.object(LLM, "acall", autospec=True, side_effect=fake_acall),
+        patch.object(ToolUsage, "parse_tool_calling", parse_tool_calling),
+    ):
+        result = await agent.aexecute_task(task)
+
+    assert result == "12"
+    assert parse_threads and parse_threads[0] is not threading.current_thread()
+
+
+@pytest.mark.asyncio
+async def test_agent_aexecute_task_respects_max_execution_time():
+    import asyncio
+
+    async def slow_acall(self, messages, *args, **kwargs):
+        await asyncio.sleep(5)
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        llm=LLM(model="gpt-4o-mini"),
+        max_execution_time=1,
+    )
+    task = Task(description="Wait", expected_output="Nothing", agent=agent)
+
+    with patch.object(LLM, "acall", autospec=True, side_effect=slow_acall):
+        with pytest.raises(TimeoutError):
+            await agent.aexecute_task(task)
@@ -0,0 +1,153 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from crewai.agents.cache import (
+    CacheHandler,
+    InMemoryCacheBackend,
+    SQLiteCacheBackend,
+)
+from crewai.agents.cache.backends.memory import DEFAULT_MAX_BYTES, DEFAULT_MAX_ENTRIES
+from crewai.agents.tools_handler import ToolsHandler
+from crewai.tools.cache_tools.cache_tools import CacheTools
+from crewai.tools.tool_calling import ToolCalling
+
+
+def test_argument_order_does_not_change_key():
+    handler = CacheHandler()
+    handler.add("multiplier", {"a": 1, "b": 2}, 2)
+
+    assert handler.read("multiplier", {"b": 2, "a": 1}) == 2
+    assert handler.read("multiplier", '{"b": 2, "a": 1}') == 2
+    assert handler.read("multiplier", "{'a': 1, 'b': 2}") == 2
+    assert handler.read("multiplier", {"a": 1, "b": 3}) is None
+    assert handler.read("other_tool", {"a": 1, "b": 2}) is None
+
+
+def test_cache_tools_reads_canonical_entry():
+    handler = CacheHandler()
+    tools_handler = ToolsHandler(cache=handler)
+    tools_handler.on_tool_use(
+        calling=ToolCalling(tool_name="multiplier", arguments={"x": 2, "y": 6}),
+        output="12",
+    )
+
+    cache_tools = CacheTools(cache_handler=handler)
+    assert cache_tools.hit_cache("tool:multiplier|input:{'y': 6, 'x': 2}") == "12"
+
+
+def test_unusual_inputs_get_a_key():
+    handler = CacheHandler()
+    cache_tools = CacheTools(cache_handler=handler)
+
+    for input in ["{1: 'a', 'b': 2}", "{[1]: 2}", "{1, [2]}", "[" * 10_000]:
+        handler.add("tool", input, "result")
+        assert handler.read("tool", input) == "result"
+        assert cache_tools.hit_cache(f"tool:tool|input:{input}") == "result"
+
+
+def test_distinct_inputs_get_distinct_keys():
+    assert CacheHandler.make_key("tool", "1") != CacheHandler.make_key("tool", 1)
+    assert CacheHandler.make_key("tool", "'x'") != CacheHandler.make_key("tool", "x")
+    assert CacheHandler.make_key("tool", "{1: 'a'}") != CacheHandler.make_key(
+        "tool", "{'1': 'a'}"
+    )
+
+
+def test_lru_eviction_by_entries():
+    backend = InMemoryCacheBackend(max_entries=2)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    backend.get("a")
+    backend.set("c", 3)
+
+    assert backend.get("a") == 1
+    assert backend.get("b") is None
+    assert backend.get("c") == 3
+
+
+def test_lfu_eviction_keeps_frequently_used_entries():
+    backend = InMemoryCacheBackend(max_entries=2, eviction_policy="lfu")
+    backend.set("a", 1)
+    backend.set("b", 2)
+    backend.get("b")
+    backend.get("b")
+    backend.get("a")
+    backend.set("c", 3)
+
+    assert len(backend) == 2
+    assert backend.get("a") is None
+    assert backend.get("b") == 2
+    assert backend.get("c") == 3
+
+
+def test_eviction_by_bytes():
+    backend = InMemoryCacheBackend(max_bytes=10)
+    backend.set("a", "12345")
+    backend.set("b", "12345")
+    backend.set("c", "1")
+
+    assert backend.get("a") is None
+    assert backend.total_bytes == 6
+    backend.set("too-big", "x" * 11)
+    assert backend.get("too-big") is None
+
+
+def test_default_cache_is_bounded():
+    handler = CacheHandler()
+    for index in range(DEFAULT_MAX_ENTRIES + 10):
+        handler.add("search", {"query": index}, "result")
+
+    assert len(handler.backend) == DEFAULT_MAX_ENTRIES
+    assert handler.backend.max_bytes == DEFAULT_MAX_BYTES
+    assert handler.read("search", {"query": 0}) is None
+
+
+def test_invalid_eviction_policy():
+    with pytest.raises(ValueError):
+        InMemoryCacheBackend(eviction_policy="fifo")  # type: ignore[arg-type]
+
+
+def test_per_tool_ttl():
+    handler = CacheHandler(ttl=100, tool_ttls={"search": 1})
+    with patch("time.monotonic", return_value=1000.0):
+        handler.add("search", {"q": "x"}, "result")
+        handler.add("multiplier", {"a": 1}, 1)
+
+    with patch("time.monotonic", return_value=1002.0):
+        assert handler.read("search", {"q": "x"}) is None
+        assert handler.read("multiplier", {"a": 1}) == 1
+
+    with patch("time.monotonic", return_value=1101.0):
+        assert handler.read("multiplier", {"a": 1}) is None
+
+
+def test_sqlite_backend_survives_restart(tmp_path):
+    db_path = os.path.join(tmp_path, "tool_cache.db")
+    handler = CacheHandler(backend=SQLiteCacheBackend(db_path=db_path))
+    handler.add("multiplier", {"a": 1, "b": 2}, {"value": 2})
+
+    reopened = CacheHandler(backend=SQLiteCacheBackend(db_path=db_path))
+    assert reopened.read("multiplier", {"b": 2, "a": 1}) == {"value": 2}
+
+
+def test_sqlite_backend_ttl_and_eviction(tmp_path):
+    db_path = os.path.join(tmp_path, "tool_cache.db")
+    backend = SQLiteCacheBackend(db_path=db_path, max_entries=2)
+
+    with patch("time.time", return_value=1000.0):
+        backend.set("a", "1", ttl=5)
+        backend.set("b", "2")
+    with patch("time.time", return_value=1001.0):
+        backend.get("b")
+        backend.set("c", "3")
+
+    assert len(backend) == 2
+    with patch("time.time", return_value=1002.0):
+        assert backend.get("a") is None
+        assert backend.get("b") == "2"
+        assert backend.get("c") == "3"
+
+    backend.clear()
+    assert len(backend) == 0
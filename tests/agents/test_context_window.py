@@ -0,0 +1,221 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from crewai import Agent, Task
+from crewai.agents.context_window import (
+    TRUNCATED_MARKER,
+    MessageWindow,
+    SummarizeObservations,
+    TruncateObservations,
+)
+
+
+def _conversation(observations):
+    messages = [
+        {"role": "system", "content": "You are a researcher."},
+        {"role": "user", "content": "Find out everything about AI."},
+    ]
+    for index, observation in enumerate(observations):
+        messages.append(
+            {
+                "role": "assistant",
+                "content": f"Thought: step {index}\nAction: search\n"
+                f'Action Input: {{"query": "AI"}}\nObservation: {observation}',
+            }
+        )
+    return messages
+
+
+def _window(max_tokens, **kwargs):
+    window = MessageWindow(max_tokens=max_tokens, tokenizer=len, **kwargs)
+    window.pin(2)
+    return window
+
+
+def test_token_counts_are_cached_per_message():
+    tokenizer = MagicMock(side_effect=len)
+    window = MessageWindow(max_tokens=10_000, tokenizer=tokenizer)
+    messages = _conversation(["a", "b"])
+
+    window.fit(messages)
+    window.fit(messages)
+    assert tokenizer.call_count == 4
+
+    messages.append({"role": "assistant", "content": "Thought: done"})
+    window.fit(messages)
+    assert tokenizer.call_count == 5
+
+
+def test_messages_within_budget_are_left_alone():
+    messages = _conversation(["x" * 100] * 3)
+    original = [dict(message) for message in messages]
+
+    _window(10_000).fit(messages)
+
+    assert messages == original
+
+
+def test_old_observations_are_truncated_first():
+    messages = _conversation(["x" * 1000] * 6)
+    pinned = [dict(message) for message in messages[:2]]
+    recent = [dict(message) for message in messages[-2:]]
+    window = _window(3500, policy=TruncateObservations(keep_chars=50), keep_recent=2)
+
+    window.fit(messages)
+
+    assert window.total(messages) <= 3500
+    assert len(messages) == 8
+    assert messages[:2] == pinned
+    assert messages[-2:] == recent
+    assert messages[2]["content"].startswith("Thought: step 0\nAction: search")
+    assert messages[2]["content"].endswith("Observation: " + "x" * 49 + TRUNCATED_MARKER)
+
+
+def test_oldest_messages_are_dropped_when_truncation_is_not_enough():
+    messages = _conversation(["x" * 1000] * 6)
+    window = _window(2300, policy=TruncateObservations(keep_chars=50), keep_recent=2)
+
+    window.fit(messages)
+
+    assert window.total(messages) <= 2300
+    assert messages[2]["content"].startswith("Thought: step")
+    assert messages[-1]["content"].endswith("x" * 1000)
+    assert len(messages) < 8
+
+
+def test_huge_recent_observation_is_clipped():
+    messages = _conversation(["x" * 100, "x" * 100_000])
+    window = _window(5000)
+
+    window.fit(messages)
+
+    assert window.total(messages) <= 5000
+    assert messages[-1]["content"].startswith("Thought: step 1")
+    assert messages[-1]["content"].endswith(TRUNCATED_MARKER)
+
+
+def test_summaries_are_prepared_in_the_background():
+    llm = MagicMock()
+    llm.get_context_window_size.return_value = 100_000
+    llm.call.return_value = "The agent searched for AI."
+    policy = SummarizeObservations(llm=llm, start_ratio=0.5)
+    window = _window(4000, policy=policy, keep_recent=1)
+    messages = _conversation(["x" * 500] * 4)
+
+    window.fit(messages)
+    assert len(messages) == 6
+    policy._jobs[window][1].result(timeout=5)
+
+    latest = messages[-1]
+    window.fit(messages)
+
+    assert len(messages) == 4
+    assert messages[2]["content"].startswith("This is a summary of our conversation")
+    assert "The agent searched for AI." in messages[2]["content"]
+    assert messages[3] is latest
+    llm.call.assert_called_once()
+
+
+def test_stale_summaries_are_discarded():
+    llm = MagicMock()
+    llm.get_context_window_size.return_value = 100_000
+    llm.call.return_value = "The agent searched for AI."
+    policy = SummarizeObservations(llm=llm, start_ratio=0.5)
+    window = _window(4000, policy=policy, keep_recent=1)
+    messages = _conversation(["x" * 500] * 4)
+
+    window.fit(messages)
+    policy._jobs[window][1].result(timeout=5)
+    del messages[3]
+    window.fit(messages)
+
+    assert not any(
+        message["content"].startswith("This is a summary") for message in messages
+    )
+
+
+def test_agent_fits_messages_before_each_request():
+    agent = Agent(
+        role="Researcher",
+        goal="Research",
+        backstory="Researcher",
+        llm="gpt-4o-mini",
+        context_compaction="truncate",
+    )
+    task = Task(description="Research AI", expected_output="A report", agent=agent)
+    agent.create_agent_executor(task=task)
+    executor = agent.agent_executor
+    assert isinstance(executor.context_window.policy, TruncateObservations)
+    assert executor.context_window.max_tokens == agent.llm.get_context_window_size()
+
+    with patch.object(
+        MessageWindow, "fit", autospec=True
+    ) as fit, patch(
+        "crewai.agents.crew_agent_executor.get_llm_response",
+        return_value="Thought: done\nFinal Answer: AI is great",
+    ):
+        executor.invoke({"input": "Research AI", "tool_names": "", "tools": ""})
+
+    fit.assert_called_once_with(executor.context_window, executor.messages)
+    assert executor.context_window.pinned == 2
+
+
+def test_agent_summaries_respect_its_rate_limits():
+    agent = Agent(
+        role="Researcher",
+        goal="Research",
+        backstory="Researcher",
+        llm="gpt-4o-mini",
+        max_rpm=10,
+        context_compaction="summarize",
+    )
+    task = Task(description="Research AI", expected_output="A report", agent=agent)
+
+    agent.create_agent_executor(task=task)
+    policy = agent.agent_executor.context_window.policy
+
+    assert isinstance(policy, SummarizeObservations)
+    assert policy.request_within_rpm_limit == agent._rpm_controller.check_or_wait
+    assert policy.callbacks[0].rpm_controller is agent._rpm_controller
+
+
+def test_agent_has_no_window_by_default():
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    task = Task(description="Research AI", expected_output="A report", agent=agent)
+
+    agent.create_agent_executor(task=task)
+
+    assert agent.agent_executor.context_window is None
+
+
+@pytest.mark.asyncio
+async def test_async_agent_fits_messages_off_the_event_loop():
+    from crewai import LLM
+
+    agent = Agent(
+        role="Researcher",
+        goal="Research",
+        backstory="Researcher",
+        llm=LLM(model="gpt-4o-mini"),
+        context_compaction="truncate",
+    )
+    task = Task(description="Research AI", expected_output="A report", agent=agent)
+    fit_threads = []
+
+    async def fake_acall(self, messages, *args, **kwargs):
+        return "Thought: done\nFinal Answer: AI is great"
+
+    with (
+        patch.object(
+            MessageWindow,
+            "fit",
+            autospec=True,
+            side_effect=lambda *_: fit_threads.append(threading.current_thread()),
+        ),
+        patch.object(LLM, "acall", autospec=True, side_effect=fake_acall),
+    ):
+        assert await agent.aexecute_task(task) == "AI is great"
+
+    assert fit_threads and fit_threads[0] is not threading.current_thread()
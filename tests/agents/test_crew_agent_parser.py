@@ -5,7 +5,7 @@ from crewai.agents.crew_agent_executor import (
     AgentFinish,
     OutputParserException,
 )
-from crewai.agents.parser import CrewAgentParser
+from crewai.agents.parser import CrewAgentParser, ReActStreamDetector
 
 
 @pytest.fixture
@@ -365,6 +365,69 @@ def test_integration_valid_and_invalid(parser):
     assert isinstance(results[3], OutputParserException)
 
 
+def test_strict_json_tool_input_is_handed_over_parsed(parser):
+    text = 'Thought: Search\nAction: search\nAction Input: {"query": "SF", "limit": 3}'
+    result = parser.parse(text)
+    assert result.tool_input == '{"query": "SF", "limit": 3}'
+    assert result.arguments == {"query": "SF", "limit": 3}
+
+
+def test_repaired_tool_input_is_not_handed_over(parser):
+    text = "Thought: Search\nAction: search\nAction Input: {'query': 'SF'}"
+    result = parser.parse(text)
+    assert result.tool_input == '{"query": "SF"}'
+    assert result.arguments is None
+
+
+def test_numbered_action_and_last_final_answer(parser):
+    action = parser.parse(
+        'Thought: Search first\nAction 1: search\nAction 1 Input 1: {"query": "SF"}'
+    )
+    assert action.thought == "Thought: Search first"
+    assert action.tool == "search"
+    assert action.arguments == {"query": "SF"}
+
+    finish = parser.parse(
+        "Thought: Done\nFinal Answer: draft\nFinal Answer: 100 degrees\n```"
+    )
+    assert finish.thought == "Thought: Done"
+    assert finish.output == "100 degrees"
+
+
+def test_action_input_before_action_is_a_format_error(parser):
+    with pytest.raises(OutputParserException) as exc_info:
+        parser.parse("Thought: Oops\nAction Input: SF\nAction: search")
+    assert "I missed the" not in exc_info.value.error
+
+
+def _feed(text, size=4):
+    detector = ReActStreamDetector()
+    for start in range(0, len(text), size):
+        end = detector.feed(text[start : start + size])
+        if end is not None:
+            return detector.text[:end]
+    return None
+
+
+def test_stream_detector_completes_at_closing_json():
+    text = (
+        'Thought: Search\nAction: search\nAction Input: {"q": "a}b\\"c", "n": [1, {"z": 2}]}'
+        "\nObservation: made up"
+    )
+    complete = _feed(text)
+    assert complete == text.split("\nObservation")[0]
+    assert CrewAgentParser.parse_text(complete).arguments == {
+        "q": 'a}b"c',
+        "n": [1, {"z": 2}],
+    }
+
+
+def test_stream_detector_waits_for_the_end_of_other_outputs():
+    assert _feed("Thought: Done\nFinal Answer: {\"a\": 1}\nMore") is None
+    assert _feed("Thought: Search\nAction: search\nAction Input: weather [SF]") is None
+    assert _feed('Thought: Search\nAction: search\nAction Input: {"q": [1, 2]') is None
+
+
 class MockAgent:
     def increment_formatting_errors(self):
         pass
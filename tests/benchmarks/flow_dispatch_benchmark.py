@@ -0,0 +1,94 @@
+"""Measure listener dispatch on a 500-method flow.
+
+The flow is a binary tree of listeners below a single start method, with an
+AND listener joining every pair of siblings, so each completed method fires a
+handful of listeners out of hundreds. The indexed dispatch of ``Flow`` is
+compared to the previous implementation, which scanned every listener after
+every method.
+
+Run with ``python -m tests.benchmarks.flow_dispatch_benchmark``.
+"""
+
+import time
+from typing import Any, Dict, List, Set, Tuple, Type
+
+from crewai.flow.flow import Flow, FlowMeta, and_, listen, start
+
+
+def build_flow(nodes: int, name: str, bases: Tuple[type, ...]) -> Type[Flow]:
+    """Build a flow of ``nodes`` methods, the metaclass only sees its own dict."""
+
+    def method():
+        return lambda self: None
+
+    dct: Dict[str, Any] = {"step_0": start()(method())}
+    index = 1
+    while len(dct) < nodes:
+        dct[f"step_{index}"] = listen(f"step_{(index - 1) // 2}")(method())
+        if index % 2 == 0 and len(dct) < nodes:
+            # Join the two children of the same parent
+            dct[f"join_{index}"] = listen(
+                and_(f"step_{index - 1}", f"step_{index}")
+            )(method())
+        index += 1
+    return FlowMeta(name, bases, dct)
+
+
+class LegacyDispatchMixin:
+    """Linear scan over every listener, as done before the trigger index."""
+
+    _listeners: Dict[str, Any]
+    _routers: Set[str]
+    _legacy_pending: Dict[str, Set[str]]
+
+    def _find_triggered_methods(self, trigger_method: str, router_only: bool) -> List[str]:
+        pending = self.__dict__.setdefault("_legacy_pending", {})
+        triggered = []
+        for listener_name, (condition_type, methods) in self._listeners.items():
+            if router_only != (listener_name in self._routers):
+                continue
+            if condition_type == "OR":
+                if trigger_method in methods:
+                    triggered.append(listener_name)
+            else:
+                if listener_name not in pending:
+                    pending[listener_name] = set(methods)
+                pending[listener_name].discard(trigger_method)
+                if not pending[listener_name]:
+                    triggered.append(listener_name)
+                    pending.pop(listener_name, None)
+        return triggered
+
+
+def dispatch_seconds(flow: Flow, triggers: List[str], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for trigger in triggers:
+            flow._find_triggered_methods(trigger, router_only=True)
+            flow._find_triggered_methods(trigger, router_only=False)
+    return time.perf_counter() - started
+
+
+def kickoff_seconds(flow_class: Type[Flow]) -> float:
+    flow = flow_class()
+    started = time.perf_counter()
+    flow.kickoff()
+    return time.perf_counter() - started
+
+
+def main(nodes: int = 500, rounds: int = 20) -> None:
+    indexed_class = build_flow(nodes, "IndexedFlow", (Flow,))
+    legacy_class = build_flow(nodes, "LegacyFlow", (LegacyDispatchMixin, Flow))
+    triggers = [*indexed_class._listeners, *indexed_class._start_methods]
+    print(f"{len(triggers)} methods, {rounds * len(triggers)} completed methods dispatched")
+    print(f"{'dispatch':<10} {'steps/s':>12} {'kickoff (s)':>12}")
+    for name, flow_class in (("legacy", legacy_class), ("indexed", indexed_class)):
+        seconds = dispatch_seconds(flow_class(), triggers, rounds)
+        print(
+            f"{name:<10} {rounds * len(triggers) / seconds:>12.0f} "
+            f"{kickoff_seconds(flow_class):>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
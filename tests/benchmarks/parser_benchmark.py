@@ -0,0 +1,130 @@
+"""Measure ReAct output parsing on the LLM outputs recorded in the cassettes.
+
+Every assistant message of ``tests/cassettes`` containing an action or a final
+answer is parsed, and the arguments of actions are parsed as ``ToolUsage``
+does. The single pass parser, which hands strict JSON arguments over already
+parsed, is compared to the previous implementation, which searched the output
+with several regular expressions, always ran ``repair_json`` and parsed the
+arguments again.
+
+Run with ``python -m tests.benchmarks.parser_benchmark``.
+"""
+
+import gzip
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Union
+
+import yaml
+from json_repair import repair_json
+
+from crewai.agents.parser import (
+    FINAL_ANSWER_ACTION,
+    AgentAction,
+    AgentFinish,
+    CrewAgentParser,
+    OutputParserException,
+)
+
+CASSETTES = Path(__file__).resolve().parent.parent / "cassettes"
+
+
+def load_corpus() -> List[str]:
+    outputs = []
+    for path in sorted(CASSETTES.rglob("*.yaml")):
+        cassette = yaml.safe_load(path.read_text()) or {}
+        for interaction in cassette.get("interactions") or []:
+            body = (interaction.get("response") or {}).get("body") or {}
+            content = body.get("string")
+            if isinstance(content, bytes):
+                try:
+                    content = gzip.decompress(content).decode()
+                except OSError:
+                    continue
+            try:
+                response = json.loads(content)
+            except (TypeError, ValueError):
+                continue
+            if not isinstance(response, dict):
+                continue
+            for choice in response.get("choices") or []:
+                message = (choice.get("message") or {}).get("content")
+                if isinstance(message, str) and (
+                    "Action:" in message or FINAL_ANSWER_ACTION in message
+                ):
+                    outputs.append(message)
+    return outputs
+
+
+class LegacyCrewAgentParser(CrewAgentParser):
+    """Regex searches over the whole output, as done before the single pass."""
+
+    def parse(self, text: str) -> Union[AgentAction, AgentFinish]:
+        thought = self._extract_thought(text)
+        regex = r"Action\s*\d*\s*:[\s]*(.*?)[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*)"
+        action_match = re.search(regex, text, re.DOTALL)
+        if FINAL_ANSWER_ACTION in text:
+            final_answer = text.split(FINAL_ANSWER_ACTION)[-1].strip()
+            return AgentFinish(thought, final_answer, text)
+        if action_match:
+            tool_input = action_match.group(2).strip().strip(" ").strip('"')
+            if not (tool_input.startswith("[") and tool_input.endswith("]")):
+                repaired = repair_json(tool_input.replace('"""', '"'))
+                if repaired not in ['""', "{}"]:
+                    tool_input = str(repaired)
+            return AgentAction(
+                thought, self._clean_action(action_match.group(1)), tool_input, text
+            )
+        if not re.search(r"Action\s*\d*\s*:[\s]*(.*?)", text, re.DOTALL):
+            raise OutputParserException("missing action")
+        re.search(r"[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*)", text, re.DOTALL)
+        raise OutputParserException("missing action input")
+
+
+def arguments_of(action: AgentAction) -> Any:
+    if isinstance(action.arguments, dict):
+        return dict(action.arguments)
+    try:
+        return json.loads(action.tool_input)
+    except ValueError:
+        return json.loads(str(repair_json(action.tool_input, skip_json_loads=True)))
+
+
+def parse_seconds(
+    parse: Callable[[str], Union[AgentAction, AgentFinish]],
+    corpus: List[str],
+    rounds: int,
+) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for output in corpus:
+            try:
+                result = parse(output)
+            except OutputParserException:
+                continue
+            if isinstance(result, AgentAction):
+                arguments_of(result)
+    return time.perf_counter() - started
+
+
+def main(rounds: int = 200) -> None:
+    corpus = load_corpus()
+    actions = [output for output in corpus if "Action Input:" in output]
+    print(f"{len(corpus)} recorded outputs, {len(actions)} with an action")
+    print(f"{'parser':<12} {'outputs/s':>12} {'actions/s':>12}")
+    for name, parser in (
+        ("legacy", LegacyCrewAgentParser()),
+        ("single pass", CrewAgentParser()),
+    ):
+        outputs_seconds = parse_seconds(parser.parse, corpus, rounds)
+        actions_seconds = parse_seconds(parser.parse, actions, rounds * 10)
+        print(
+            f"{name:<12} {rounds * len(corpus) / outputs_seconds:>12.0f} "
+            f"{rounds * 10 * len(actions) / actions_seconds:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
 """Test Agent creation and execution basic functionality."""
 
+import asyncio
 import hashlib
 import json
+import threading
+import time
 from concurrent.futures import Future
 from unittest import mock
 from unittest.mock import ANY, MagicMock, patch
@@ -963,7 +966,7 @@ def test_api_calls_throttling(capsys):
 
     crew = Crew(agents=[agent], tasks=[task], max_rpm=1, verbose=True)
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_sleep") as moveon:
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
@@ -1403,6 +1406,242 @@ def test_kickoff_for_each_error_handling():
             crew.kickoff_for_each(inputs=inputs)
 
 
+def _topic_crew() -> Crew:
+    agent = Agent(
+        role="{topic} Researcher",
+        goal="Express hot takes on {topic}.",
+        backstory="You have a lot of experience with {topic}.",
+    )
+    task = Task(
+        description="Give me an analysis around {topic}.",
+        expected_output="1 bullet point about {topic} that's under 15 words.",
+        agent=agent,
+    )
+    return Crew(agents=[agent], tasks=[task])
+
+
+def test_kickoff_for_each_bounded_concurrency():
+    """Tests that kickoff_for_each runs inputs in parallel without exceeding the limit."""
+    import threading
+    import time
+
+    inputs = [{"topic": f"topic {i}"} for i in range(8)]
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def fake_kickoff(self, inputs=None):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        self.usage_metrics = UsageMetrics(total_tokens=10, successful_requests=1)
+        return CrewOutput(raw=inputs["topic"], tasks_output=[])
+
+    crew = _topic_crew()
+    with patch.object(Crew, "kickoff", autospec=True, side_effect=fake_kickoff):
+        results = crew.kickoff_for_each(inputs=inputs, max_concurrency=3)
+
+    assert [result.raw for result in results] == [i["topic"] for i in inputs]
+    assert 1 < peak <= 3
+    assert crew.usage_metrics.total_tokens == 80
+    assert crew.usage_metrics.successful_requests == 8
+
+
+def test_kickoff_for_each_iter_yields_in_completion_order():
+    """Tests that the iterator variant yields each result as soon as it completes."""
+    import time
+
+    inputs = [{"topic": "slow"}, {"topic": "fast"}]
+
+    def fake_kickoff(self, inputs=None):
+        time.sleep(0.2 if inputs["topic"] == "slow" else 0)
+        return CrewOutput(raw=inputs["topic"], tasks_output=[])
+
+    crew = _topic_crew()
+    with patch.object(Crew, "kickoff", autospec=True, side_effect=fake_kickoff):
+        completed = list(crew.kickoff_for_each_iter(inputs, max_concurrency=2))
+
+    assert [(index, output.raw) for index, output in completed] == [
+        (1, "fast"),
+        (0, "slow"),
+    ]
+
+
+def test_kickoff_for_each_iter_consumes_inputs_lazily():
+    """Tests that only max_concurrency inputs are pulled before results are consumed."""
+    pulled = []
+
+    def generate_inputs():
+        for i in range(100):
+            pulled.append(i)
+            yield {"topic": str(i)}
+
+    def fake_kickoff(self, inputs=None):
+        return CrewOutput(raw=inputs["topic"], tasks_output=[])
+
+    crew = _topic_crew()
+    with patch.object(Crew, "kickoff", autospec=True, side_effect=fake_kickoff):
+        iterator = crew.kickoff_for_each_iter(generate_inputs(), max_concurrency=4)
+        next(iterator)
+        assert len(pulled) <= 5
+        iterator.close()
+
+
+def test_kickoff_for_each_process_executor():
+    """Tests that kickoff_for_each can run executions in a process pool."""
+    import multiprocessing
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("process executor test relies on fork")
+
+    inputs = [{"topic": "dog"}, {"topic": "cat"}]
+
+    def fake_kickoff(self, inputs=None):
+        self.usage_metrics = UsageMetrics(total_tokens=5)
+        return CrewOutput(raw=inputs["topic"], tasks_output=[])
+
+    crew = _topic_crew()
+    with patch.object(Crew, "kickoff", autospec=True, side_effect=fake_kickoff):
+        results = crew.kickoff_for_each(
+            inputs=inputs, max_concurrency=2, executor="process"
+        )
+
+    assert [result.raw for result in results] == ["dog", "cat"]
+    assert crew.usage_metrics.total_tokens == 10
+
+
+def test_kickoff_for_each_invalid_concurrency():
+    crew = _topic_crew()
+    with pytest.raises(ValueError):
+        crew.kickoff_for_each(inputs=[{"topic": "dog"}], max_concurrency=0)
+
+
+def test_crew_template_shares_immutable_members():
+    """Tests that template instances share LLMs, tools and memories but not run state."""
+    agent = Agent(
+        role="Researcher",
+        goal="Research {topic}.",
+        backstory="You are an expert on {topic}.",
+        tools=[],
+    )
+    first = Task(
+        description="Research {topic}.",
+        expected_output="Notes.",
+        agent=agent,
+    )
+    second = Task(
+        description="Summarize {topic}.",
+        expected_output="Summary.",
+        agent=agent,
+        context=[first],
+    )
+    crew = Crew(agents=[agent], tasks=[first, second], max_rpm=10)
+    first.output = TaskOutput(description="done", raw="stale", agent="Researcher")
+
+    template = crew.compile_template()
+    run_a = template.instantiate()
+    run_b = template.instantiate()
+
+    assert run_a is not run_b and run_a.id != crew.id != run_b.id
+    run_agent = run_a.agents[0]
+    assert run_agent is not agent
+    assert run_agent.llm is agent.llm
+    assert run_agent.tools_handler.cache is agent.tools_handler.cache
+    assert run_a._rpm_controller is crew._rpm_controller
+    assert run_a.tasks[0].agent is run_agent
+    assert run_a.tasks[1].agent is run_agent
+    assert run_a.tasks[1].context == [run_a.tasks[0]]
+    assert run_a.tasks[0].output is None
+    assert run_a.tasks[0] is not run_b.tasks[0]
+
+    run_a.tasks[0].interpolate_inputs_and_add_conversation_history({"topic": "AI"})
+    assert run_a.tasks[0].description == "Research AI."
+    assert first.description == "Research {topic}."
+    assert run_b.tasks[0].description == "Research {topic}."
+
+
+def test_crew_template_shares_memories():
+    crew = _topic_crew()
+    crew._short_term_memory = MagicMock()
+    crew._entity_memory = MagicMock()
+
+    run = crew.compile_template().instantiate()
+
+    assert run._short_term_memory is crew._short_term_memory
+    assert run._entity_memory is crew._entity_memory
+
+
+def test_kickoff_for_each_with_template_skips_copy():
+    """Tests that use_template instantiates runs without deep-copying the crew."""
+    inputs = [{"topic": "dog"}, {"topic": "cat"}]
+    run_crews = []
+
+    def fake_kickoff(self, inputs=None):
+        run_crews.append(self)
+        return CrewOutput(raw=inputs["topic"], tasks_output=[])
+
+    crew = _topic_crew()
+    with (
+        patch.object(Crew, "kickoff", autospec=True, side_effect=fake_kickoff),
+        patch.object(Crew, "copy") as copy,
+    ):
+        results = crew.kickoff_for_each(
+            inputs=inputs, max_concurrency=2, use_template=True
+        )
+
+    copy.assert_not_called()
+    assert [result.raw for result in results] == ["dog", "cat"]
+    assert len({id(run) for run in run_crews}) == 2
+    assert all(run is not crew for run in run_crews)
+
+
+@pytest.mark.asyncio
+async def test_kickoff_for_each_async_with_template_skips_copy():
+    async def fake_kickoff_async(inputs=None):
+        return inputs["topic"]
+
+    crew = _topic_crew()
+    with (
+        patch.object(Crew, "kickoff_async", side_effect=fake_kickoff_async),
+        patch.object(Crew, "copy") as copy,
+    ):
+        results = await crew.kickoff_for_each_async(
+            [{"topic": "dog"}, {"topic": "cat"}], use_template=True
+        )
+
+    copy.assert_not_called()
+    assert results == ["dog", "cat"]
+
+
+@pytest.mark.asyncio
+async def test_kickoff_for_each_async_bounded_concurrency():
+    """Tests that kickoff_for_each_async never runs more than max_concurrency crews."""
+    import asyncio
+
+    running = 0
+    peak = 0
+
+    async def fake_kickoff_async(inputs=None):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return inputs["topic"]
+
+    crew = _topic_crew()
+    inputs = [{"topic": str(i)} for i in range(10)]
+    with patch.object(Crew, "kickoff_async", side_effect=fake_kickoff_async):
+        results = await crew.kickoff_for_each_async(inputs, max_concurrency=2)
+
+    assert results == [str(i) for i in range(10)]
+    assert peak == 2
+
+
 @pytest.mark.asyncio
 async def test_kickoff_async_basic_functionality_and_output():
     """Tests the basic functionality and output of kickoff_async."""
@@ -4652,3 +4891,247 @@ def test_reset_agent_knowledge_with_only_agent_knowledge(researcher, writer):
         mock_reset_agent_knowledge.assert_called_once_with(
             [mock_ks_research, mock_ks_writer]
         )
+
+
+@pytest.mark.asyncio
+async def test_crew_akickoff_runs_on_event_loop():
+    """Tests that akickoff awaits every LLM call instead of using the blocking path."""
+    researcher = Agent(
+        role="Researcher",
+        goal="Research {topic}",
+        backstory="You research topics.",
+        llm=LLM(model="gpt-4o-mini"),
+    )
+    first = Task(
+        description="Research {topic}",
+        expected_output="Notes",
+        agent=researcher,
+        async_execution=True,
+    )
+    second = Task(
+        description="Summarize the notes",
+        expected_output="Summary",
+        agent=researcher,
+    )
+    crew = Crew(agents=[researcher], tasks=[first, second])
+
+    async def fake_acall(self, messages, *args, **kwargs):
+        return f"Thought: done\nFinal Answer: answer {len(messages)}"
+
+    with (
+        patch.object(LLM, "acall", autospec=True, side_effect=fake_acall),
+        patch.object(LLM, "call") as call,
+        patch.object(Task, "execute_async") as execute_async,
+    ):
+        result = await crew.akickoff(inputs={"topic": "AI"})
+
+    call.assert_not_called()
+    execute_async.assert_not_called()
+    assert first.description == "Research AI"
+    assert [output.raw for output in result.tasks_output] == [
+        first.output.raw,
+        second.output.raw,
+    ]
+    assert result.raw.startswith("answer")
+
+
+def _dag_agents(count):
+    return [
+        Agent(role=f"Agent {i}", goal="Work", backstory="You work.")
+        for i in range(count)
+    ]
+
+
+def test_dag_process_runs_independent_tasks_concurrently():
+    first_agent, second_agent, third_agent = _dag_agents(3)
+    first = Task(description="First", expected_output="out", agent=first_agent)
+    second = Task(description="Second", expected_output="out", agent=second_agent)
+    merge = Task(
+        description="Merge",
+        expected_output="out",
+        agent=third_agent,
+        context=[first, second],
+    )
+    crew = Crew(
+        agents=[first_agent, second_agent, third_agent],
+        tasks=[first, second, merge],
+        process=Process.dag,
+    )
+    barrier = threading.Barrier(2, timeout=5)
+    contexts = {}
+
+    def fake_execute_sync(self, agent=None, context=None, tools=None):
+        contexts[self.description] = context
+        if self is not merge:
+            # Both independent tasks must be running for the barrier to open
+            barrier.wait()
+        self.output = TaskOutput(
+            description=self.description, raw=f"{self.description} done", agent=agent.role
+        )
+        return self.output
+
+    with patch.object(
+        Task, "execute_sync", autospec=True, side_effect=fake_execute_sync
+    ):
+        result = crew.kickoff()
+
+    assert [output.raw for output in result.tasks_output] == [
+        "First done",
+        "Second done",
+        "Merge done",
+    ]
+    assert result.raw == "Merge done"
+    assert contexts["First"] == ""
+    assert "First done" in contexts["Merge"] and "Second done" in contexts["Merge"]
+
+
+def test_dag_process_respects_parallelism_limit_and_busy_agents():
+    first_agent, second_agent = _dag_agents(2)
+    tasks = [
+        Task(description="Task 1", expected_output="out", agent=first_agent),
+        Task(description="Task 2", expected_output="out", agent=first_agent),
+        Task(description="Task 3", expected_output="out", agent=second_agent),
+        Task(description="Task 4", expected_output="out", agent=second_agent),
+    ]
+    crew = Crew(
+        agents=[first_agent, second_agent],
+        tasks=tasks,
+        process=Process.dag,
+        max_parallel_tasks=2,
+    )
+    lock = threading.Lock()
+    running_agents = []
+    peak = 0
+
+    def fake_execute_sync(self, agent=None, context=None, tools=None):
+        nonlocal peak
+        with lock:
+            assert agent.role not in running_agents
+            running_agents.append(agent.role)
+            peak = max(peak, len(running_agents))
+        time.sleep(0.05)
+        with lock:
+            running_agents.remove(agent.role)
+        return TaskOutput(description=self.description, raw="done", agent=agent.role)
+
+    with patch.object(
+        Task, "execute_sync", autospec=True, side_effect=fake_execute_sync
+    ):
+        result = crew.kickoff()
+
+    assert len(result.tasks_output) == 4
+    assert peak == 2
+
+
+def test_dag_process_skips_conditional_task():
+    first_agent, second_agent, third_agent = _dag_agents(3)
+    first = Task(description="First", expected_output="out", agent=first_agent)
+    conditional = ConditionalTask(
+        description="Conditional",
+        expected_output="out",
+        agent=second_agent,
+        condition=lambda output: "retry" in output.raw,
+    )
+    last = Task(
+        description="Last",
+        expected_output="out",
+        agent=third_agent,
+        context=[conditional],
+    )
+    crew = Crew(
+        agents=[first_agent, second_agent, third_agent],
+        tasks=[first, conditional, last],
+        process=Process.dag,
+    )
+
+    def fake_execute_sync(self, agent=None, context=None, tools=None):
+        return TaskOutput(
+            description=self.description, raw=f"{self.description} done", agent=agent.role
+        )
+
+    with patch.object(
+        Task, "execute_sync", autospec=True, side_effect=fake_execute_sync
+    ) as execute_sync:
+        result = crew.kickoff()
+
+    assert [call.args[0] for call in execute_sync.call_args_list] == [first, last]
+    assert [output.raw for output in result.tasks_output] == [
+        "First done",
+        "",
+        "Last done",
+    ]
+
+
+def test_dag_process_requires_agents():
+    with pytest.raises(
+        pydantic_core._pydantic_core.ValidationError, match="DAG process error"
+    ):
+        Crew(
+            agents=[],
+            tasks=[Task(description="Task", expected_output="out")],
+            process=Process.dag,
+        )
+
+
+def test_dag_process_raises_when_tasks_cannot_start():
+    first_agent, second_agent, third_agent = _dag_agents(3)
+    first = Task(description="First", expected_output="out", agent=first_agent)
+    second = Task(description="Second", expected_output="out", agent=second_agent)
+    third = Task(
+        description="Third", expected_output="out", agent=third_agent, context=[second]
+    )
+    crew = Crew(
+        agents=[first_agent, second_agent, third_agent],
+        tasks=[first, second, third],
+        process=Process.dag,
+    )
+    # Context changed after validation, the two tasks wait on each other
+    second.context = [third]
+
+    def fake_execute_sync(self, agent=None, context=None, tools=None):
+        return TaskOutput(description=self.description, raw="done", agent=agent.role)
+
+    with patch.object(
+        Task, "execute_sync", autospec=True, side_effect=fake_execute_sync
+    ) as execute_sync:
+        with pytest.raises(RuntimeError, match="tasks 'Second', 'Third' can never"):
+            crew.kickoff()
+
+    assert [call.args[0] for call in execute_sync.call_args_list] == [first]
+
+
+@pytest.mark.asyncio
+async def test_dag_process_akickoff_runs_ready_tasks_together():
+    first_agent, second_agent, third_agent = _dag_agents(3)
+    first = Task(description="First", expected_output="out", agent=first_agent)
+    second = Task(description="Second", expected_output="out", agent=second_agent)
+    merge = Task(
+        description="Merge",
+        expected_output="out",
+        agent=third_agent,
+        context=[first, second],
+    )
+    crew = Crew(
+        agents=[first_agent, second_agent, third_agent],
+        tasks=[first, second, merge],
+        process=Process.dag,
+    )
+    started = []
+    both_started = asyncio.Event()
+
+    async def fake_aexecute(self, agent=None, context=None, tools=None):
+        started.append(self.description)
+        if self is not merge:
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=5)
+        self.output = TaskOutput(
+            description=self.description, raw=f"{self.description} done", agent=agent.role
+        )
+        return self.output
+
+    with patch.object(Task, "aexecute", autospec=True, side_effect=fake_aexecute):
+        result = await crew.akickoff()
+
+    assert started == ["First", "Second", "Merge"]
+    assert result.raw == "Merge done"
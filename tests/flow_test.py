@@ -1,6 +1,8 @@
 """Test Flow creation and execution basic functionality."""
 
 import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import pytest
@@ -755,3 +757,182 @@ def test_multiple_routers_from_same_trigger():
     assert execution_order.index("anemia_analysis") > execution_order.index(
         "anemia_router"
     )
+
+
+def test_trigger_index_lists_only_listeners_of_each_trigger():
+    """Test that dispatch visits the listeners indexed under the trigger."""
+
+    class IndexedFlow(Flow):
+        @start()
+        def begin(self):
+            pass
+
+        @listen(begin)
+        def first(self):
+            pass
+
+        @router(first)
+        def route(self):
+            return "done"
+
+        @listen(and_(begin, first, "done"))
+        def join(self):
+            pass
+
+        @listen(or_("done", begin))
+        def either(self):
+            pass
+
+    assert IndexedFlow._listener_triggers == {
+        "begin": [("first", 0), ("join", 1), ("either", 0)],
+        "first": [("join", 2)],
+        "done": [("join", 4), ("either", 0)],
+    }
+    assert IndexedFlow._router_triggers == {"first": [("route", 0)]}
+    assert IndexedFlow._and_masks == {"join": 7}
+
+    flow = IndexedFlow()
+    assert flow._find_triggered_methods("begin", router_only=False) == [
+        "first",
+        "either",
+    ]
+    assert flow._find_triggered_methods("first", router_only=False) == []
+    assert flow._find_triggered_methods("done", router_only=False) == [
+        "join",
+        "either",
+    ]
+    assert flow._pending_and_listeners == {}
+    assert flow._find_triggered_methods("unknown", router_only=False) == []
+
+
+def test_flow_max_concurrency_limits_parallel_methods():
+    """Test that max_concurrency bounds the listeners running at once."""
+    running = []
+    peak = []
+
+    async def work():
+        running.append(1)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+
+    class FanOutFlow(Flow):
+        max_concurrency = 2
+
+        @start()
+        def begin(self):
+            pass
+
+        @listen(begin)
+        async def first(self):
+            await work()
+
+        @listen(begin)
+        async def second(self):
+            await work()
+
+        @listen(begin)
+        async def third(self):
+            await work()
+
+        @listen(begin)
+        async def fourth(self):
+            await work()
+
+    started_events = []
+    finished_events = []
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(MethodExecutionStartedEvent)
+        def handle_method_start(source, event):
+            started_events.append(event)
+
+        @crewai_event_bus.on(MethodExecutionFinishedEvent)
+        def handle_method_finish(source, event):
+            finished_events.append(event)
+
+        FanOutFlow().kickoff()
+
+    assert max(peak) == 2
+    assert all(event.running_methods <= 2 for event in started_events)
+    # "fourth" was still waiting when "third" got its slot
+    assert max(event.waiting_methods for event in started_events) == 1
+    queued = {event.method_name: event.queued_seconds for event in finished_events}
+    assert queued["third"] > 0.005 and queued["fourth"] > 0.005
+    assert all(event.execution_seconds is not None for event in finished_events)
+
+
+def test_flow_method_concurrency_limits_a_single_method():
+    """Test that method_concurrency serializes concurrent runs of a method."""
+    running = []
+    peak = []
+
+    class JoinFlow(Flow):
+        method_concurrency = {"handle": 1}
+
+        @start()
+        def left(self):
+            pass
+
+        @start()
+        def right(self):
+            pass
+
+        @listen(or_(left, right))
+        async def handle(self):
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+    flow = JoinFlow()
+    flow.kickoff()
+
+    assert flow._method_execution_counts["handle"] == 2
+    assert max(peak) == 1
+
+
+def test_flow_sync_executor_runs_sync_methods_in_parallel():
+    """Test that sync listeners run concurrently in the configured executor."""
+    barrier = threading.Barrier(3, timeout=5)
+    threads = set()
+
+    def work():
+        threads.add(threading.current_thread().name)
+        barrier.wait()
+
+    class ThreadedFlow(Flow):
+        sync_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="flow")
+
+        @start()
+        def begin(self):
+            pass
+
+        @listen(begin)
+        def first(self):
+            work()
+
+        @listen(begin)
+        def second(self):
+            work()
+
+        @listen(begin)
+        def third(self):
+            work()
+
+    ThreadedFlow().kickoff()
+
+    assert len(threads) == 3
+    assert all(name.startswith("flow") for name in threads)
+
+
+def test_flow_rejects_invalid_concurrency_limits():
+    class InvalidFlow(Flow):
+        max_concurrency = 0
+
+        @start()
+        def begin(self):
+            pass
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        InvalidFlow()
@@ -2,7 +2,7 @@
 
 from pathlib import Path
 from typing import List, Union
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -13,6 +13,7 @@ from crewai.knowledge.source.json_knowledge_source import JSONKnowledgeSource
 from crewai.knowledge.source.pdf_knowledge_source import PDFKnowledgeSource
 from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
 from crewai.knowledge.source.text_file_knowledge_source import TextFileKnowledgeSource
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
 
 
 @pytest.fixture(autouse=True)
@@ -547,6 +548,25 @@ def test_excel_knowledge_source(mock_vector_db, tmpdir):
     mock_vector_db.query.assert_called_once()
 
 
+def test_excel_cells_spanning_lines_stay_in_their_row(tmpdir):
+    excel_path = Path(tmpdir.join("data.xlsx"))
+    excel_path.touch()
+    content = {
+        excel_path: {"People": 'Name,Notes\nBrandon,"Likes\nhiking"\nAlice,Reads\n'}
+    }
+    with patch.object(ExcelKnowledgeSource, "_load_content", return_value=content):
+        excel_source = ExcelKnowledgeSource(file_paths=[excel_path])
+
+    [(_, sheet_name, rows)] = list(excel_source._iter_sheets())
+
+    assert sheet_name == "People"
+    assert list(rows) == [
+        ("Name,Notes\n", 1),
+        ('Brandon,"Likes\nhiking"\n', 2),
+        ("Alice,Reads\n", 3),
+    ]
+
+
 @pytest.mark.vcr
 def test_docling_source(mock_vector_db):
     docling_source = CrewDoclingSource(
@@ -603,3 +623,120 @@ def test_file_path_validation():
         match="file_path/file_paths must be a Path, str, or a list of these types",
     ):
         PDFKnowledgeSource()
+
+
+def test_stream_chunks_matches_chunk_text():
+    source = StringKnowledgeSource(
+        content="", chunk_size=10, chunk_overlap=3, chunking="characters"
+    )
+    segments = [("row one\n", 1), ("", 2), ("second row here\n", 3), ("x\n", 4)]
+    text = "".join(segment for segment, _ in segments)
+
+    streamed = list(source._stream_chunks(segments, "row", {"file": "data.csv"}))
+
+    assert [chunk for chunk, _ in streamed] == source._chunk_text(text)
+    assert streamed[0][1] == {"file": "data.csv", "row_start": 1, "row_end": 3}
+    assert streamed[-1][1] == {"file": "data.csv", "row_start": 3, "row_end": 4}
+
+
+def test_csv_knowledge_source_streams_rows_in_batches(tmpdir):
+    csv_path = Path(tmpdir.join("people.csv"))
+    with open(csv_path, "w", encoding="utf-8") as f:
+        for i in range(50):
+            f.write(f"person{i},{20 + i},city{i}\n")
+    storage = MagicMock(spec=KnowledgeStorage)
+
+    csv_source = CSVKnowledgeSource(
+        file_paths=[csv_path],
+        stream=True,
+        chunk_size=100,
+        chunk_overlap=0,
+        save_batch_size=4,
+        storage=storage,
+    )
+    csv_source.add()
+
+    assert csv_source.content == {}
+    assert csv_source.chunks == []
+    saved = [call.args for call in storage.save.call_args_list]
+    assert all(len(documents) <= 4 for documents, _ in saved)
+    documents = [doc for batch, _ in saved for doc in batch]
+    metadatas = [meta for _, batch in saved for meta in batch]
+    assert documents[0].startswith("person0 20 city0\n")
+    assert metadatas[0]["file"] == str(csv_path)
+    assert metadatas[0]["row_start"] == 1
+    assert metadatas[-1]["row_end"] == 50
+
+
+def test_json_lines_knowledge_source_tracks_records(tmpdir):
+    jsonl_path = Path(tmpdir.join("records.jsonl"))
+    with open(jsonl_path, "w", encoding="utf-8") as f:
+        f.write('{"name": "Brandon"}\n\n{"name": "Alice"}\n')
+    storage = MagicMock(spec=KnowledgeStorage)
+
+    json_source = JSONKnowledgeSource(file_paths=[jsonl_path], storage=storage)
+    json_source.add()
+
+    assert json_source.content[jsonl_path] == "name: Brandon\n\nname: Alice\n\n"
+    documents, metadatas = storage.save.call_args.args
+    assert documents == ["name: Brandon\n\nname: Alice\n\n"]
+    assert metadatas == [{"file": str(jsonl_path), "record_start": 0, "record_end": 2}]
+
+
+def test_loaded_file_content_is_read_once(tmpdir):
+    text_path = Path(tmpdir.join("notes.txt"))
+    text_path.write_text("first line\nsecond line\n", encoding="utf-8")
+    storage = MagicMock(spec=KnowledgeStorage)
+
+    with patch.object(
+        TextFileKnowledgeSource,
+        "_read_lines",
+        autospec=True,
+        side_effect=TextFileKnowledgeSource._read_lines,
+    ) as read_lines:
+        source = TextFileKnowledgeSource(file_paths=[text_path], storage=storage)
+        source.add()
+
+    assert read_lines.call_count == 1
+    documents, metadatas = storage.save.call_args.args
+    assert documents == ["first line\nsecond line\n"]
+    assert metadatas == [{"file": str(text_path), "line_start": 1, "line_end": 2}]
+
+
+def test_changed_file_content_is_added(tmpdir):
+    text_path = Path(tmpdir.join("notes.txt"))
+    text_path.write_text("original\n", encoding="utf-8")
+    storage = MagicMock(spec=KnowledgeStorage)
+
+    source = TextFileKnowledgeSource(file_paths=[text_path], storage=storage)
+    source.content[text_path] = "cleaned up\n"
+    source.add()
+
+    documents, metadatas = storage.save.call_args.args
+    assert documents == ["cleaned up\n"]
+    assert metadatas == [{"file": str(text_path)}]
+
+
+def test_excel_knowledge_source_streams_sheets(tmpdir):
+    import openpyxl
+
+    excel_path = Path(tmpdir.join("data.xlsx"))
+    workbook = openpyxl.Workbook()
+    people = workbook.active
+    people.title = "people"
+    people.append(["Name", "Age"])
+    people.append(["Brandon", 30])
+    cities = workbook.create_sheet("cities")
+    cities.append(["City"])
+    cities.append(["Chicago"])
+    workbook.save(excel_path)
+    storage = MagicMock(spec=KnowledgeStorage)
+
+    excel_source = ExcelKnowledgeSource(
+        file_paths=[excel_path], stream=True, storage=storage
+    )
+    excel_source.add()
+
+    documents, metadatas = storage.save.call_args.args
+    assert documents == ["Name,Age\nBrandon,30\n", "City\nChicago\n"]
+    assert [meta["sheet"] for meta in metadatas] == ["people", "cities"]
@@ -0,0 +1,86 @@
+import pytest
+
+from crewai.knowledge.source.csv_knowledge_source import CSVKnowledgeSource
+from crewai.knowledge.source.excel_knowledge_source import ExcelKnowledgeSource
+from crewai.knowledge.source.json_knowledge_source import JSONKnowledgeSource
+from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
+from crewai.knowledge.utils.chunker import TextChunker
+
+TEXT = (
+    "CrewAI orchestrates agents. Each agent has a role and a goal.\n\n"
+    "Tasks describe the work to be done! Crews run tasks in order.\n\n"
+    "Knowledge sources give agents extra context?"
+)
+
+
+def test_chunks_end_on_paragraph_boundaries():
+    chunker = TextChunker(chunk_size=70, strategy="paragraph")
+
+    assert chunker.split(TEXT) == [
+        "CrewAI orchestrates agents. Each agent has a role and a goal.\n\n",
+        "Tasks describe the work to be done! Crews run tasks in order.\n\n",
+        "Knowledge sources give agents extra context?",
+    ]
+
+
+def test_oversized_units_fall_back_to_finer_boundaries():
+    chunker = TextChunker(chunk_size=10, strategy="record")
+
+    assert chunker.split("a,b\nc,d\nthis is a very long record line\n") == [
+        "a,b\nc,d\n",
+        "this is a ",
+        "very long ",
+        "record ",
+        "line\n",
+    ]
+    assert TextChunker(chunk_size=4).split("abcdefghij") == ["abcd", "efgh", "ij"]
+
+
+def test_overlap_repeats_whole_trailing_units():
+    chunker = TextChunker(chunk_size=20, chunk_overlap=8, strategy="sentence")
+
+    assert chunker.split("Aa. Bb. Cc. Dd. Ee. Ff. Gg. Hh.") == [
+        "Aa. Bb. Cc. Dd. Ee. ",
+        "Dd. Ee. Ff. Gg. Hh.",
+    ]
+
+
+def test_chunk_size_is_measured_with_tokenizer():
+    chunker = TextChunker(
+        chunk_size=5, strategy="sentence", tokenizer=lambda text: len(text.split())
+    )
+
+    assert chunker.split("one two three four five six seven. eight.") == [
+        "one two three four five ",
+        "six seven. eight.",
+    ]
+
+
+def test_streamed_segments_report_positions():
+    chunker = TextChunker(chunk_size=12, strategy="record")
+
+    assert list(chunker.chunk([("row1\n", 1), ("row2\n", 2), ("row3\n", 3)])) == [
+        ("row1\nrow2\n", 1, 2),
+        ("row3\n", 3, 3),
+    ]
+
+
+def test_characters_strategy_keeps_fixed_windows():
+    source = StringKnowledgeSource(
+        content="", chunk_size=4, chunk_overlap=1, chunking="characters"
+    )
+
+    assert source._chunk_text("abcdefghij") == ["abcd", "defg", "ghij", "j"]
+
+
+def test_sources_keep_fixed_windows_by_default():
+    source = StringKnowledgeSource(content="", chunk_size=4, chunk_overlap=1)
+
+    assert source._chunk_text("abcdefghij") == ["abcd", "defg", "ghij", "j"]
+    for source_class in (CSVKnowledgeSource, ExcelKnowledgeSource, JSONKnowledgeSource):
+        assert source_class.model_fields["chunking"].default == "characters"
+
+
+def test_overlap_must_be_smaller_than_chunk_size():
+    with pytest.raises(ValueError, match="chunk_overlap"):
+        TextChunker(chunk_size=10, chunk_overlap=10)
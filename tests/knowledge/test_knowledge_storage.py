@@ -0,0 +1,88 @@
+import uuid
+from unittest.mock import patch
+
+import chromadb
+import pytest
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+
+from crewai.knowledge.storage.embedding_pipeline import EmbeddingPipeline, IngestionStats
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+
+
+class CountingEmbedder(EmbeddingFunction):
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.calls.append(list(input))
+        return [[float(len(doc)), 1.0, 0.0] for doc in input]
+
+
+@pytest.fixture
+def embedder():
+    return CountingEmbedder()
+
+
+@pytest.fixture
+def storage(embedder):
+    with patch.object(
+        KnowledgeStorage, "_create_default_embedding_function", return_value=embedder
+    ):
+        storage = KnowledgeStorage(embedding_batch_size=2, embedding_workers=2)
+    storage.collection = chromadb.EphemeralClient().get_or_create_collection(
+        name=f"knowledge_{uuid.uuid4().hex}", embedding_function=embedder
+    )
+    return storage
+
+
+def test_save_embeds_new_documents_in_batches(storage, embedder):
+    stats = storage.save(["a", "bb", "ccc", "a"], metadata={"source": "test"})
+
+    assert sorted(len(call) for call in embedder.calls) == [1, 2]
+    assert stats.chunks == 3
+    assert stats.embedded == 3
+    assert stats.skipped == 0
+    assert stats.batches == 2
+    assert storage.collection.count() == 3
+    assert storage.last_ingestion is stats
+
+
+def test_save_skips_documents_already_stored(storage, embedder):
+    storage.save(["a", "bb", "ccc"])
+    embedder.calls.clear()
+
+    stats = storage.save(["a", "bb", "ccc", "dddd"], metadata={"version": 2})
+
+    assert embedder.calls == [["dddd"]]
+    assert stats.embedded == 1
+    assert stats.skipped == 3
+    stored = storage.collection.get(include=["metadatas"])
+    assert all(metadata == {"version": 2} for metadata in stored["metadatas"])
+
+
+def test_pipeline_retries_failing_batches():
+    attempts = []
+
+    def flaky_embedder(documents):
+        attempts.append(documents)
+        if len(attempts) < 3:
+            raise RuntimeError("rate limited")
+        return [[1.0] for _ in documents]
+
+    pipeline = EmbeddingPipeline(flaky_embedder, max_retries=3, backoff=0)
+    stats = IngestionStats()
+
+    assert pipeline.embed(["a", "b"], stats) == [[1.0], [1.0]]
+    assert stats.retries == 2
+    assert stats.estimated_tokens == 0
+    assert stats.chunks_per_second > 0
+
+
+def test_pipeline_gives_up_after_max_retries():
+    def failing_embedder(documents):
+        raise RuntimeError("down")
+
+    pipeline = EmbeddingPipeline(failing_embedder, max_retries=1, backoff=0)
+
+    with pytest.raises(RuntimeError, match="down"):
+        pipeline.embed(["a"], IngestionStats())
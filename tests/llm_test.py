@@ -6,7 +6,9 @@ import pytest
 from pydantic import BaseModel
 
 from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
-from crewai.llm import CONTEXT_WINDOW_USAGE_RATIO, LLM
+from crewai.agents.cache import SQLiteCacheBackend
+from crewai.llm import CONTEXT_WINDOW_USAGE_RATIO, LLM, stop_stream_when
+from crewai.llms.response_cache import LLMResponseCache
 from crewai.utilities.events import (
     LLMCallCompletedEvent,
     LLMStreamChunkEvent,
@@ -566,8 +568,10 @@ def assert_event_count(
 def mock_emit() -> MagicMock:
     from crewai.utilities.events.crewai_event_bus import CrewAIEventsBus
 
-    with patch.object(CrewAIEventsBus, "emit") as mock_emit:
-        yield mock_emit
+    # Events are only built when someone listens, whatever the console verbosity
+    with patch.object(CrewAIEventsBus, "has_listeners", return_value=True):
+        with patch.object(CrewAIEventsBus, "emit") as mock_emit:
+            yield mock_emit
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
@@ -664,3 +668,270 @@ def test_handle_streaming_tool_calls_no_tools(mock_emit):
         expected_completed_llm_call=1,
         expected_final_chunk_result=response,
     )
+
+
+def _model_response(content=None, tool_calls=None):
+    from litellm.types.utils import Choices, Message, ModelResponse
+
+    return ModelResponse(
+        choices=[
+            Choices(
+                message=Message(content=content, tool_calls=tool_calls),
+                finish_reason="stop",
+                index=0,
+            )
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_acall_uses_async_completion():
+    llm = LLM(model="gpt-4o-mini")
+    with (
+        patch("litellm.acompletion", return_value=_model_response("Hello!")) as acompletion,
+        patch("litellm.completion") as completion,
+    ):
+        response = await llm.acall("Hi")
+
+    assert response == "Hello!"
+    assert acompletion.await_count == 1
+    assert acompletion.call_args.kwargs["messages"] == [
+        {"role": "user", "content": "Hi"}
+    ]
+    completion.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_acall_awaits_async_tool_functions(mock_emit):
+    tool_calls = [
+        {
+            "id": "call_1",
+            "type": "function",
+            "function": {"name": "get_weather", "arguments": '{"location": "Paris"}'},
+        }
+    ]
+
+    async def get_weather(location):
+        return f"The weather in {location} is sunny"
+
+    llm = LLM(model="gpt-4o-mini")
+    with patch(
+        "litellm.acompletion", return_value=_model_response(tool_calls=tool_calls)
+    ):
+        response = await llm.acall(
+            "What is the weather in Paris?",
+            available_functions={"get_weather": get_weather},
+        )
+
+    assert response == "The weather in Paris is sunny"
+    assert_event_count(
+        mock_emit=mock_emit,
+        expected_completed_tool_call=1,
+        expected_tool_usage_started=1,
+        expected_tool_usage_finished=1,
+    )
+
+
+def test_llm_cache_answers_repeated_prompts():
+    llm = LLM(model="gpt-4o-mini", cache=True)
+    with patch(
+        "litellm.completion", return_value=_model_response("Paris")
+    ) as completion:
+        first = llm.call("What is the capital of France?")
+        second = llm.call([{"role": "user", "content": "What is the capital of France?  \n"}])
+
+    assert first == second == "Paris"
+    assert completion.call_count == 1
+    assert llm.cache.hits == 1
+
+
+def test_llm_cache_key_includes_sampling_parameters():
+    cache = LLMResponseCache()
+    cold = LLM(model="gpt-4o-mini", temperature=0, cache=cache)
+    warm = LLM(model="gpt-4o-mini", temperature=1, cache=cache)
+    with patch(
+        "litellm.completion", return_value=_model_response("Paris")
+    ) as completion:
+        cold.call("What is the capital of France?")
+        warm.call("What is the capital of France?")
+        warm.call("What is the capital of France?", tools=[{"type": "function"}])
+
+    assert completion.call_count == 3
+
+
+def test_llm_cache_replays_streamed_chunks(mock_emit):
+    cache = LLMResponseCache()
+    with patch("litellm.completion", return_value=_model_response("It is Paris.")):
+        LLM(model="gpt-4o-mini", cache=cache).call("What is the capital of France?")
+    mock_emit.reset_mock()
+
+    llm = LLM(model="gpt-4o-mini", stream=True, cache=cache)
+    with patch("litellm.completion") as completion:
+        response = llm.call("What is the capital of France?")
+
+    assert response == "It is Paris."
+    completion.assert_not_called()
+    assert_event_count(
+        mock_emit=mock_emit,
+        expected_stream_chunk=3,
+        expected_completed_llm_call=1,
+        expected_final_chunk_result="It is Paris.",
+    )
+
+
+def test_llm_cache_skips_tool_results():
+    tool_calls = [
+        {
+            "id": "call_1",
+            "type": "function",
+            "function": {"name": "get_weather", "arguments": '{"location": "Paris"}'},
+        }
+    ]
+    get_weather = MagicMock(return_value="sunny")
+    llm = LLM(model="gpt-4o-mini", cache=True)
+    with patch(
+        "litellm.completion", return_value=_model_response(tool_calls=tool_calls)
+    ) as completion:
+        for _ in range(2):
+            llm.call("Weather in Paris?", available_functions={"get_weather": get_weather})
+
+    assert completion.call_count == 2
+    assert get_weather.call_count == 2
+
+
+def test_llm_cache_skips_streamed_tool_results():
+    from litellm.types.utils import ChatCompletionDeltaToolCall, Function
+
+    def stream(**kwargs):
+        tool_call = ChatCompletionDeltaToolCall(
+            index=0,
+            id="call_1",
+            type="function",
+            function=Function(name="get_weather", arguments='{"location": "Paris"}'),
+        )
+        yield {"choices": [{"delta": {"content": None, "tool_calls": [tool_call]}}]}
+
+    get_weather = MagicMock(return_value="sunny")
+    llm = LLM(model="gpt-4o-mini", stream=True, cache=True)
+    with patch("litellm.completion", side_effect=stream) as completion:
+        for _ in range(2):
+            response = llm.call(
+                "Weather in Paris?", available_functions={"get_weather": get_weather}
+            )
+
+    assert response == "sunny"
+    assert completion.call_count == 2
+    assert get_weather.call_count == 2
+
+
+def test_llm_cache_persists_in_sqlite(tmp_path):
+    db_path = str(tmp_path / "llm_cache.db")
+    with patch("litellm.completion", return_value=_model_response("Paris")):
+        LLM(
+            model="gpt-4o-mini",
+            cache=LLMResponseCache(backend=SQLiteCacheBackend(db_path=db_path)),
+        ).call("What is the capital of France?")
+
+    llm = LLM(
+        model="gpt-4o-mini",
+        cache=LLMResponseCache(backend=SQLiteCacheBackend(db_path=db_path), ttl=60),
+    )
+    with patch("litellm.completion") as completion:
+        assert llm.call("What is the capital of France?") == "Paris"
+    completion.assert_not_called()
+
+
+def test_llm_cache_semantic_tier():
+    def embedder(texts):
+        return [[1.0, 0.0] if "capital" in text else [0.0, 1.0] for text in texts]
+
+    llm = LLM(
+        model="gpt-4o-mini",
+        cache=LLMResponseCache(embedder=embedder, similarity_threshold=0.9),
+    )
+    with patch(
+        "litellm.completion", return_value=_model_response("Paris")
+    ) as completion:
+        llm.call("What is the capital of France?")
+        assert llm.call("Name the capital of France") == "Paris"
+        llm.call("How are you?")
+
+    assert completion.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_acall_uses_llm_cache():
+    llm = LLM(model="gpt-4o-mini", cache=True)
+    with patch(
+        "litellm.acompletion", return_value=_model_response("Hello!")
+    ) as acompletion:
+        await llm.acall("Hi")
+        response = await llm.acall("Hi")
+
+    assert response == "Hello!"
+    assert acompletion.await_count == 1
+
+
+def test_streaming_stops_when_response_is_complete(mock_emit):
+    pieces = ["Action: search\nAction Input: ", '{"q": 1}', "\nObserv", "ation: made up"]
+    consumed = []
+
+    def stream(**kwargs):
+        for piece in pieces:
+            consumed.append(piece)
+            yield {"choices": [{"delta": {"content": piece}}]}
+
+    text = "".join(pieces[:2])
+    llm = LLM(model="gpt-4o-mini", stream=True)
+    with patch("litellm.completion", side_effect=stream):
+        with stop_stream_when(lambda chunk: len(text) - 2 if "}" in chunk else None):
+            response = llm.call("Search")
+
+    assert response == text[:-2]
+    assert consumed == pieces[:2]
+    assert_event_count(
+        mock_emit=mock_emit,
+        expected_stream_chunk=2,
+        expected_completed_llm_call=1,
+        expected_final_chunk_result=text[:-2],
+    )
+
+
+def test_streaming_stopped_early_records_estimated_usage():
+    def stream(**kwargs):
+        for piece in ['Action: search\nAction Input: {"q": 1}', "\nObservation: x"]:
+            yield {"choices": [{"delta": {"content": piece}}]}
+
+    token_process = TokenProcess()
+    rpm_controller = MagicMock()
+    llm = LLM(model="gpt-4o-mini", stream=True)
+    with patch("litellm.completion", side_effect=stream):
+        with stop_stream_when(lambda chunk: len(chunk) if "}" in chunk else None):
+            llm.call(
+                "Search",
+                callbacks=[TokenCalcHandler(token_process, rpm_controller=rpm_controller)],
+            )
+
+    usage = token_process.get_summary()
+    assert usage.successful_requests == 1
+    assert usage.prompt_tokens > 0
+    assert usage.completion_tokens > 0
+    rpm_controller.record_tokens.assert_called_once_with(usage.total_tokens)
+
+
+def test_streaming_stopped_early_is_not_cached():
+    def stream(**kwargs):
+        for piece in ['Action: search\nAction Input: {"q": 1}', "\nObservation: x"]:
+            yield {"choices": [{"delta": {"content": piece}}]}
+
+    llm = LLM(model="gpt-4o-mini", stream=True, cache=True)
+    with patch("litellm.completion", side_effect=stream) as completion:
+        with stop_stream_when(lambda chunk: len(chunk) if "}" in chunk else None):
+            llm.call("Search")
+        params = completion.call_args.kwargs
+        assert llm.cache.get(params) is None
+
+        response = llm.call("Search")
+
+    assert response.endswith("Observation: x")
+    assert completion.call_count == 2
@@ -0,0 +1,101 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from crewai.memory.contextual.contextual_memory import ContextualMemory
+from crewai.utilities.events.crewai_event_bus import crewai_event_bus
+from crewai.utilities.events.memory_events import MemoryRetrievalCompletedEvent
+
+
+def slow_search(delay, results):
+    def search(*args, **kwargs):
+        time.sleep(delay)
+        return results
+
+    return search
+
+
+@pytest.fixture
+def task():
+    return MagicMock(description="Research AI agents")
+
+
+def make_memory(memory_config=None, stm_delay=0.0, entity_delay=0.0):
+    stm = MagicMock()
+    stm.search.side_effect = slow_search(stm_delay, [{"context": "recent insight"}])
+    em = MagicMock()
+    em.search.side_effect = slow_search(entity_delay, [{"context": "an entity"}])
+    return ContextualMemory(memory_config, stm, None, em, None, None)
+
+
+def test_memories_are_queried_concurrently(task):
+    memory = make_memory(stm_delay=0.3, entity_delay=0.3)
+
+    started_at = time.perf_counter()
+    context = memory.build_context_for_task(task, "")
+
+    assert time.perf_counter() - started_at < 0.5
+    assert context == "Recent Insights:\n- recent insight\nEntities:\n- an entity"
+
+
+def test_slow_memories_are_skipped_after_their_timeout(task):
+    events = []
+    memory = make_memory(
+        {"retrieval_timeout": {"entity": 0.1}}, stm_delay=0.2, entity_delay=2
+    )
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(MemoryRetrievalCompletedEvent)
+        def handler(source, event):
+            events.append(event)
+
+        started_at = time.perf_counter()
+        context = memory.build_context_for_task(task, "")
+
+    assert time.perf_counter() - started_at < 1
+    assert context == "Recent Insights:\n- recent insight"
+    assert [(event.source, event.status) for event in events] == [
+        ("stm", "completed"),
+        ("entity", "timeout"),
+    ]
+    assert events[0].elapsed_seconds >= 0.2
+
+
+def test_retrieval_budget_bounds_every_source(task):
+    memory = make_memory({"retrieval_budget": 0.1}, stm_delay=2, entity_delay=2)
+
+    started_at = time.perf_counter()
+    assert memory.build_context_for_task(task, "") == ""
+    assert time.perf_counter() - started_at < 1
+
+
+def test_hanging_memory_holds_one_thread(task):
+    events = []
+    released = threading.Event()
+    memory = make_memory({"retrieval_timeout": 0.1})
+    memory.em.search.side_effect = lambda *args, **kwargs: (
+        released.wait(5) and [{"context": "an entity"}]
+    )
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(MemoryRetrievalCompletedEvent)
+        def handler(source, event):
+            events.append(event)
+
+        for _ in range(3):
+            context = memory.build_context_for_task(task, "")
+        assert context == "Recent Insights:\n- recent insight"
+        assert memory.em.search.call_count == 1
+        assert [(event.source, event.status) for event in events[-2:]] == [
+            ("stm", "completed"),
+            ("entity", "skipped"),
+        ]
+
+        released.set()
+        time.sleep(0.1)
+        assert "Entities:\n- an entity" in memory.build_context_for_task(task, "")
+    assert memory.em.search.call_count == 2
@@ -1,7 +1,11 @@
+import sqlite3
+import time
+
 import pytest
 
 from crewai.memory.long_term.long_term_memory import LongTermMemory
 from crewai.memory.long_term.long_term_memory_item import LongTermMemoryItem
+from crewai.memory.storage.ltm_sqlite_storage import LTMSQLiteStorage
 
 
 @pytest.fixture
@@ -27,3 +31,89 @@ def test_save_and_search(long_term_memory):
     assert find["metadata"]["quality"] == 0.5
     assert find["metadata"]["task"] == "test_task"
     assert find["metadata"]["expected_output"] == "test_output"
+
+
+def _save(storage, task, datetime, score=0.5, **metadata):
+    storage.save(
+        task_description=task,
+        metadata={"task": task, **metadata},
+        datetime=datetime,
+        score=score,
+    )
+
+
+def test_load_uses_task_hash_and_timestamp_indexes(tmp_path):
+    storage = LTMSQLiteStorage(db_path=str(tmp_path / "ltm.db"))
+    _save(storage, "Research  AI\nagents", "100.0", rank="old")
+    _save(storage, "Research AI agents", "200.0", rank="new")
+    _save(storage, "Write a poem", "300.0")
+
+    results = storage.load("Research AI agents", latest_n=5)
+    assert [result["metadata"]["rank"] for result in results] == ["new", "old"]
+
+    plan = storage._pool.execute(
+        "EXPLAIN QUERY PLAN SELECT metadata FROM long_term_memories "
+        "WHERE task_hash = ? ORDER BY created_at DESC LIMIT 3",
+        ("hash",),
+    )
+    assert "idx_ltm_task_hash" in " ".join(str(row) for row in plan)
+
+
+def test_legacy_databases_are_migrated(tmp_path):
+    db_path = tmp_path / "ltm.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE long_term_memories (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                task_description TEXT,
+                metadata TEXT,
+                datetime TEXT,
+                score REAL
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO long_term_memories (task_description, metadata, datetime, score) "
+            "VALUES ('legacy task', '{\"suggestions\": []}', '1700000000.0', 0.7)"
+        )
+    conn.close()
+
+    storage = LTMSQLiteStorage(db_path=str(db_path))
+    assert storage.load("legacy task", latest_n=1) == [
+        {"metadata": {"suggestions": []}, "datetime": "1700000000.0", "score": 0.7}
+    ]
+
+
+def test_similarity_search_finds_interpolated_tasks(tmp_path):
+    storage = LTMSQLiteStorage(
+        db_path=str(tmp_path / "ltm.db"), similarity_search=True, similarity_threshold=0.7
+    )
+    _save(storage, "Summarize the latest news about Python for the weekly report", "1.0")
+    _save(storage, "Plan a trip to Lisbon", "2.0")
+
+    results = storage.load(
+        "Summarize the latest news about Rust for the weekly report", latest_n=3
+    )
+    assert [result["metadata"]["task"] for result in results] == [
+        "Summarize the latest news about Python for the weekly report"
+    ]
+    assert storage.load("Book a restaurant", latest_n=3) is None
+
+
+def test_retention_policies(tmp_path):
+    storage = LTMSQLiteStorage(
+        db_path=str(tmp_path / "ltm.db"), max_rows_per_task=2, max_age_seconds=3600
+    )
+    now = time.time()
+    for offset in range(4):
+        _save(storage, "task", str(now + offset), index=offset)
+    _save(storage, "other task", str(now - 7200))
+
+    results = storage.load("task", latest_n=5)
+    assert [result["metadata"]["index"] for result in results] == [3, 2]
+    assert storage.load("other task", latest_n=5) is None
+
+    storage.max_rows_per_task = 1
+    storage.compact()
+    assert len(storage.load("task", latest_n=5)) == 1
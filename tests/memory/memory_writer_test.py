@@ -0,0 +1,137 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from crewai.agent import Agent
+from crewai.agents.crew_agent_executor import CrewAgentExecutor
+from crewai.agents.parser import AgentFinish
+from crewai.crew import Crew
+from crewai.memory.contextual.contextual_memory import ContextualMemory
+from crewai.memory.memory_writer import MemoryWriter
+from crewai.memory.storage.rag_storage import RAGStorage
+from crewai.task import Task
+
+
+def _rag_storage():
+    storage = RAGStorage.__new__(RAGStorage)
+    storage.type = "short_term"
+    storage.app = MagicMock()
+    storage.collection = MagicMock()
+    storage._batched = threading.local()
+    return storage
+
+
+def test_flush_waits_for_queued_jobs_in_order():
+    writer = MemoryWriter()
+    saved = []
+    release = threading.Event()
+
+    writer.submit(lambda: release.wait(5))
+    for i in range(5):
+        writer.submit(lambda i=i: saved.append(i))
+
+    assert writer.flush(timeout=0.05) is False
+    release.set()
+    assert writer.flush(timeout=5) is True
+    assert saved == [0, 1, 2, 3, 4]
+
+
+def test_failed_job_does_not_stop_the_writer():
+    writer = MemoryWriter()
+    saved = []
+
+    writer.submit(lambda: 1 / 0)
+    writer.submit(lambda: saved.append("after"))
+
+    assert writer.flush(timeout=5)
+    assert saved == ["after"]
+
+
+def test_invalid_batch_size():
+    with pytest.raises(ValueError):
+        MemoryWriter(max_batch_size=0)
+
+
+def test_rag_storage_batch_adds_documents_in_one_call():
+    storage = _rag_storage()
+
+    with storage.batch():
+        storage.save("first", {"agent": "a"})
+        storage.save("second", {"agent": "b"})
+        storage.collection.add.assert_not_called()
+
+    storage.collection.add.assert_called_once()
+    kwargs = storage.collection.add.call_args.kwargs
+    assert kwargs["documents"] == ["first", "second"]
+    assert kwargs["metadatas"] == [{"agent": "a"}, {"agent": "b"}]
+    assert len(set(kwargs["ids"])) == 2
+
+    storage.save("third", {"agent": "c"})
+    assert storage.collection.add.call_count == 2
+
+
+def test_writer_batches_jobs_queued_while_busy():
+    storage = _rag_storage()
+    memory = MagicMock(storage=storage)
+    writer = MemoryWriter()
+    release = threading.Event()
+
+    writer.submit(lambda: release.wait(5))
+    for i in range(3):
+        writer.submit(lambda i=i: storage.save(f"value {i}", {}), memories=[memory])
+    release.set()
+
+    assert writer.flush(timeout=5)
+    storage.collection.add.assert_called_once()
+    assert storage.collection.add.call_args.kwargs["documents"] == [
+        "value 0",
+        "value 1",
+        "value 2",
+    ]
+
+
+@pytest.fixture
+def crew():
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    task = Task(description="Research AI", expected_output="Notes", agent=agent)
+    return Crew(
+        agents=[agent],
+        tasks=[task],
+        memory_config={"background_writes": True, "read_your_writes": True},
+    )
+
+
+def test_crew_creates_writer_only_when_enabled(crew):
+    assert isinstance(crew._memory_writer, MemoryWriter)
+    assert crew.flush_memory_writes(timeout=1)
+
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    task = Task(description="Research AI", expected_output="Notes", agent=agent)
+    assert Crew(agents=[agent], tasks=[task])._memory_writer is None
+
+
+def test_executor_queues_memory_writes(crew):
+    executor = CrewAgentExecutor.__new__(CrewAgentExecutor)
+    executor.crew = crew
+    executor._write_memories = MagicMock()
+    crew._memory_writer = MagicMock(spec=MemoryWriter)
+    answer = AgentFinish(thought="", output="done", text="done")
+
+    executor._save_to_memory(answer)
+
+    executor._write_memories.assert_not_called()
+    job = crew._memory_writer.submit.call_args.args[0]
+    job()
+    executor._write_memories.assert_called_once_with(answer)
+
+
+def test_contextual_memory_reads_its_writes(crew):
+    writer = MagicMock(spec=MemoryWriter)
+    contextual_memory = ContextualMemory(
+        crew.memory_config, None, None, None, None, None, memory_writer=writer
+    )
+
+    contextual_memory.build_context_for_task(crew.tasks[0], "")
+
+    writer.flush.assert_called_once()
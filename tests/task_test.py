@@ -1493,3 +1493,38 @@ def test_task_interpolation_with_hyphens():
     assert "say hello world" in task.prompt()
 
     assert result.raw == "Hello, World!"
+
+
+@pytest.mark.asyncio
+async def test_aexecute_runs_guardrail_off_the_event_loop():
+    import threading
+
+    from crewai import LLM
+
+    guardrail_threads = []
+
+    def guardrail(output: TaskOutput) -> Tuple[bool, str]:
+        guardrail_threads.append(threading.current_thread())
+        return True, output.raw
+
+    async def fake_acall(self, messages, *args, **kwargs):
+        return "Thought: I know the answer\nFinal Answer: 12"
+
+    agent = Agent(
+        role="Math",
+        goal="Multiply numbers",
+        backstory="You are great at math.",
+        llm=LLM(model="gpt-4o-mini"),
+    )
+    task = Task(
+        description="What is 3 times 4?",
+        expected_output="The product",
+        agent=agent,
+        guardrail=guardrail,
+    )
+
+    with patch.object(LLM, "acall", autospec=True, side_effect=fake_acall):
+        output = await task.aexecute()
+
+    assert output.raw == "12"
+    assert guardrail_threads and guardrail_threads[0] is not threading.current_thread()
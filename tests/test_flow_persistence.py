@@ -1,13 +1,17 @@
 """Test flow state persistence functionality."""
 
+import copy
+import json
 import os
-from typing import Dict
+import sqlite3
+from typing import Dict, List
 
 import pytest
 from pydantic import BaseModel
 
 from crewai.flow.flow import Flow, FlowState, listen, start
 from crewai.flow.persistence import persist
+from crewai.flow.persistence.json_patch import apply_patch, make_patch
 from crewai.flow.persistence.sqlite import SQLiteFlowPersistence
 
 
@@ -208,3 +212,84 @@ def test_persist_decorator_verbose_logging(tmp_path, caplog):
     flow = VerboseFlow(persistence=persistence)
     flow.kickoff()
     assert "Saving flow state" in caplog.text
+
+
+class ListState(FlowState):
+    counter: int = 0
+    items: List[str] = []
+    details: Dict[str, str] = {}
+
+
+def _count_rows(db_path):
+    with sqlite3.connect(db_path) as conn:
+        snapshots = conn.execute("SELECT COUNT(*) FROM flow_states").fetchone()[0]
+        deltas = conn.execute("SELECT COUNT(*) FROM flow_state_deltas").fetchone()[0]
+    return snapshots, deltas
+
+
+def test_delta_persistence_stores_patches(tmp_path):
+    """Test that delta mode stores one snapshot followed by patches."""
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path, mode="delta")
+
+    @persist(persistence)
+    class DeltaFlow(Flow[ListState]):
+        @start()
+        def step_1(self):
+            self.state.counter = 1
+            self.state.items.append("first")
+
+        @listen(step_1)
+        def step_2(self):
+            self.state.counter = 2
+            self.state.items.append("second")
+            self.state.details["status"] = "done"
+
+    flow = DeltaFlow()
+    flow.kickoff()
+
+    assert _count_rows(db_path) == (1, 1)
+    saved_state = persistence.load_state(flow.state.id)
+    assert saved_state["counter"] == 2
+    assert saved_state["items"] == ["first", "second"]
+    assert saved_state["details"] == {"status": "done"}
+
+    restored = DeltaFlow()
+    restored.kickoff(inputs={"id": flow.state.id})
+    assert restored.state.items == ["first", "second", "first", "second"]
+
+
+def test_delta_persistence_compacts_periodically(tmp_path):
+    """Test that delta mode replaces old rows with a snapshot."""
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path, mode="delta", compaction_interval=3)
+
+    for counter in range(10):
+        persistence.save_state("flow-1", "step", {"id": "flow-1", "counter": counter})
+    persistence.flush()
+
+    # Saves 0, 4 and 8 are snapshots, only the last one is kept
+    assert _count_rows(db_path) == (1, 1)
+    assert persistence.load_state("flow-1") == {"id": "flow-1", "counter": 9}
+
+    resumed = SQLiteFlowPersistence(db_path, mode="delta", compaction_interval=3)
+    resumed.save_state("flow-1", "step", {"id": "flow-1", "counter": 10})
+    assert resumed.load_state("flow-1") == {"id": "flow-1", "counter": 10}
+    assert _count_rows(db_path) == (1, 2)
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        ({"a": 1, "b": [1, 2]}, {"a": 1.0, "b": [1, 2, 3], "c": None}),
+        ({"a": {"x/y": [1, {"z": 1}]}}, {"a": {"x/y": [1, {"z": 2}]}}),
+        ({"a": [1, 2, 3], "b": True}, {"a": [3], "b": 1}),
+        ({"a~b": "c"}, {}),
+        ([1], {"a": 1}),
+    ],
+)
+def test_json_patch_round_trip(old, new):
+    patch = make_patch(old, new)
+    result = apply_patch(copy.deepcopy(old), patch)
+    assert result == new
+    assert json.dumps(result) == json.dumps(new)
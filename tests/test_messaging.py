@@ -17,3 +17,16 @@ def test_in_memory_message_bus_and_logger(tmp_path):
     assert rows[0][1] == "queue"
     assert rows[0][2] == "hello"
     logger.close()
+
+
+def test_communication_logger_background_writes(tmp_path):
+    logger = CommunicationLogger(tmp_path / "comm.db", background=True)
+
+    for index in range(50):
+        logger.log("queue", f"message {index}")
+    logger.log_many([("other", "a"), ("other", "b")])
+
+    rows = logger.fetch_all()
+    assert len(rows) == 52
+    assert [row[2] for row in rows if row[1] == "other"] == ["a", "b"]
+    logger.close()
@@ -70,6 +70,21 @@ async def test_ainvoke(basic_function):
     result = await tool.ainvoke(input={"param1": "test"})
     assert result == "test 0"
 
+
+@pytest.mark.asyncio
+async def test_ainvoke_awaits_coroutine_from_sync_wrapper():
+    """Test that ainvoke awaits tools whose sync _run returns a coroutine"""
+    from crewai.tools import tool
+
+    @tool("async_greeter")
+    async def async_greeter(name: str) -> str:
+        """Greet someone asynchronously."""
+        return f"hello {name}"
+
+    structured = async_greeter.to_structured_tool()
+    result = await structured.ainvoke(input={"name": "crew"})
+    assert result == "hello crew"
+
 def test_parse_args_dict(basic_function):
     """Test parsing dictionary arguments"""
     tool = CrewStructuredTool.from_function(func=basic_function, name="test_tool")
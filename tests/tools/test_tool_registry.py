@@ -0,0 +1,116 @@
+from difflib import SequenceMatcher
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+from crewai.tools import BaseTool
+from crewai.tools.tool_registry import ToolRegistry
+
+
+class QueryInput(BaseModel):
+    query: str
+    limit: int = 10
+
+
+def _tool(name: str) -> BaseTool:
+    class NamedTool(BaseTool):
+        description: str = f"Tool named {name}"
+        args_schema: type[BaseModel] = QueryInput
+
+        def _run(self, query: str, limit: int = 10) -> str:
+            return query
+
+    return NamedTool(name=name)
+
+
+def _original_selection(tools, tool_name):
+    """Tool the previous implementation of ToolUsage._select_tool returned."""
+    ordered = sorted(
+        tools,
+        key=lambda tool: SequenceMatcher(
+            None, tool.name.lower().strip(), tool_name.lower().strip()
+        ).ratio(),
+        reverse=True,
+    )
+    for tool in ordered:
+        if (
+            tool.name.lower().strip() == tool_name.lower().strip()
+            or SequenceMatcher(
+                None, tool.name.lower().strip(), tool_name.lower().strip()
+            ).ratio()
+            > 0.85
+        ):
+            return tool
+    return None
+
+
+TOOLS = [
+    _tool(name)
+    for name in [
+        "Search the internet",
+        "Read website content",
+        "Search in a specific website",
+        "Delegate work to coworker",
+        "Ask question to coworker",
+        "file_read_tool",
+        "Directory Read Tool",
+    ]
+]
+
+
+def test_exact_and_alias_lookups():
+    registry = ToolRegistry(TOOLS)
+
+    assert registry.select("  search THE internet ") is TOOLS[0]
+    assert registry.match("File Read Tool") is TOOLS[5]
+    assert registry.match("directory-read_tool") is TOOLS[6]
+    assert registry.get("file_read_tool") is TOOLS[5]
+    assert registry.get("File Read Tool") is None
+
+
+def test_exact_lookup_skips_fuzzy_matching():
+    registry = ToolRegistry(TOOLS)
+
+    with patch.object(registry, "_closest") as closest:
+        assert registry.select("Read website content") is TOOLS[1]
+    closest.assert_not_called()
+
+
+def test_fuzzy_selection_matches_previous_behavior():
+    registry = ToolRegistry(TOOLS)
+
+    for tool_name in [
+        "Search the internt",
+        "Read websites content",
+        "Delegate work to co-worker",
+        "Ask questions to coworker",
+        "Search in specific website",
+        "file read tol",
+        "Unknown tool",
+        "Search",
+        "",
+    ]:
+        assert registry.select(tool_name) is _original_selection(TOOLS, tool_name)
+
+
+def test_fuzzy_misses_are_cached():
+    registry = ToolRegistry(TOOLS, max_cached_misses=1)
+
+    with patch.object(registry, "_closest", return_value=None) as closest:
+        assert registry.select("Unknown tool") is None
+        assert registry.select("Unknown tool") is None
+        assert closest.call_count == 1
+        registry.select("Other tool")
+        registry.select("Unknown tool")
+        assert closest.call_count == 3
+
+
+def test_renderings_are_cached():
+    registry = ToolRegistry(TOOLS[:2])
+
+    assert registry.names == "Search the internet, Read website content"
+    assert registry.plain_description == "\n--\n".join(
+        tool.description for tool in TOOLS[:2]
+    )
+    assert registry.description is registry.description
+    assert registry.argument_names(TOOLS[0]) == {"query", "limit"}
@@ -8,6 +8,7 @@ import pytest
 from pydantic import BaseModel, Field
 
 from crewai import Agent, Task
+from crewai.agents.parser import CrewAgentParser
 from crewai.tools import BaseTool
 from crewai.tools.tool_usage import ToolUsage
 from crewai.utilities.events import crewai_event_bus
@@ -254,6 +255,28 @@ def test_validate_tool_input_valid_json():
     assert arguments == expected_arguments
 
 
+def test_parsed_tool_input_is_not_validated_again():
+    action = CrewAgentParser.parse_text(
+        'Thought: Pick a number\nAction: Random Number Generator\n'
+        'Action Input: {"min_value": 1, "max_value": 10}'
+    )
+    tool_usage = ToolUsage(
+        tools_handler=MagicMock(),
+        tools=[RandomNumberTool()],
+        task=MagicMock(),
+        function_calling_llm=None,
+        agent=MagicMock(),
+        action=action,
+    )
+
+    with patch.object(tool_usage, "_validate_tool_input") as validate:
+        calling = tool_usage._original_tool_calling(action.text, raise_error=True)
+
+    validate.assert_not_called()
+    assert calling.arguments == {"min_value": 1, "max_value": 10}
+    assert calling.arguments is not action.arguments
+
+
 def test_validate_tool_input_python_dict():
     tool_usage = ToolUsage(
         tools_handler=MagicMock(),
@@ -1,7 +1,12 @@
-from unittest.mock import Mock
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
 
 from crewai.utilities.events.base_events import BaseEvent
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
+from crewai.utilities.events.handler_queue import BackgroundHandler
+from crewai.utilities.events.llm_events import LLMCallStartedEvent, LLMCallType
 
 
 class TestEvent(BaseEvent):
@@ -45,3 +50,166 @@ def test_event_bus_error_handling(capfd):
     out, err = capfd.readouterr()
     assert "Simulated handler failure" in out
     assert "Handler 'broken_handler' failed" in out
+
+
+class OtherEvent(BaseEvent):
+    pass
+
+
+def test_handlers_are_resolved_per_event_class():
+    received = []
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(TestEvent)
+        def specific(source, event):
+            received.append("specific")
+
+        @crewai_event_bus.on(BaseEvent)
+        def wildcard(source, event):
+            received.append("wildcard")
+
+        crewai_event_bus.emit("source_object", TestEvent(type="test_event"))
+        crewai_event_bus.emit("source_object", OtherEvent(type="other_event"))
+
+        @crewai_event_bus.on(OtherEvent)
+        def late(source, event):
+            received.append("late")
+
+        crewai_event_bus.emit("source_object", OtherEvent(type="other_event"))
+
+    assert received == ["specific", "wildcard", "wildcard", "wildcard", "late"]
+
+    # Handlers registered in the scope are gone afterwards
+    crewai_event_bus.emit("source_object", TestEvent(type="test_event"))
+    assert len(received) == 5
+
+
+def test_background_handler_does_not_block_emit():
+    release = threading.Event()
+    handled = []
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(TestEvent, background=True)
+        def slow_handler(source, event):
+            release.wait(5)
+            handled.append(event)
+
+        started = time.perf_counter()
+        for _ in range(3):
+            crewai_event_bus.emit("source_object", TestEvent(type="test_event"))
+        assert time.perf_counter() - started < 1
+        assert handled == []
+
+        release.set()
+        assert crewai_event_bus.flush(timeout=5)
+        assert len(handled) == 3
+
+
+def test_async_handlers_run_in_background():
+    handled = []
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(TestEvent)
+        async def async_handler(source, event):
+            await asyncio.sleep(0)
+            handled.append(threading.current_thread().name)
+
+        crewai_event_bus.emit("source_object", TestEvent(type="test_event"))
+        assert crewai_event_bus.flush(timeout=5)
+
+    assert handled == ["crewai-event-handler-async_handler"]
+
+
+def test_background_queue_overflow_policies():
+    def blocked_handler(source, event):
+        release.wait(5)
+        handled.append(event.type)
+
+    release = threading.Event()
+    handled = []
+    dropping = BackgroundHandler(blocked_handler, max_queue_size=2, overflow="drop")
+    coalescing = BackgroundHandler(blocked_handler, max_queue_size=2, overflow="coalesce")
+
+    for handler in (dropping, coalescing):
+        handler("source", OtherEvent(type="blocking"))
+        # Wait for the worker to pick the first event up
+        while handler._queue:
+            time.sleep(0.001)
+        handler("source", TestEvent(type="first"))
+        handler("source", OtherEvent(type="second"))
+        handler("source", TestEvent(type="third"))
+        handler("source", TestEvent(type="fourth"))
+
+    release.set()
+    assert dropping.join(timeout=5) and coalescing.join(timeout=5)
+    assert dropping.dropped == 2
+    assert coalescing.coalesced == 2
+    assert handled.count("first") == 1
+    assert handled.count("fourth") == 1
+
+
+def test_has_listeners():
+    class OtherEvent(BaseEvent):
+        pass
+
+    with crewai_event_bus.scoped_handlers():
+        assert not crewai_event_bus.has_listeners(TestEvent)
+
+        @crewai_event_bus.on(BaseEvent)
+        def handler(source, event):
+            pass
+
+        assert crewai_event_bus.has_listeners(TestEvent)
+        assert crewai_event_bus.has_listeners(OtherEvent)
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(TestEvent)
+        def test_handler(source, event):
+            pass
+
+        assert crewai_event_bus.has_listeners(TestEvent)
+        assert not crewai_event_bus.has_listeners(OtherEvent)
+
+
+def test_conditional_handlers_only_listen_while_enabled():
+    received = []
+    enabled = False
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(TestEvent, when=lambda: enabled)
+        def handler(source, event):
+            received.append(event)
+
+        assert not crewai_event_bus.has_listeners(TestEvent)
+        crewai_event_bus.emit("source", TestEvent(type="test_event"))
+
+        enabled = True
+        assert crewai_event_bus.has_listeners(TestEvent)
+        crewai_event_bus.emit("source", TestEvent(type="test_event"))
+
+    assert len(received) == 1
+
+
+
+
+def test_llm_skips_events_without_listeners():
+    from crewai.llm import LLM
+
+    llm = LLM(model="gpt-4o-mini")
+    with crewai_event_bus.scoped_handlers():
+        with patch.object(crewai_event_bus, "emit") as emit:
+            llm._start_call("Hello", None, None, None)
+            llm._handle_emit_call_events("Hi", LLMCallType.LLM_CALL)
+            emit.assert_not_called()
+
+            @crewai_event_bus.on(LLMCallStartedEvent)
+            def handler(source, event):
+                pass
+
+            llm._start_call("Hello", None, None, None)
+            llm._handle_emit_call_events("Hi", LLMCallType.LLM_CALL)
+            assert [type(call.kwargs["event"]) for call in emit.call_args_list] == [
+                LLMCallStartedEvent
+            ]
@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.utilities import EmbeddingConfigurator
+from crewai.utilities.embedding_cache import (
+    CachedEmbeddingFunction,
+    EmbeddingCache,
+    configure_embedding_cache,
+    embedder_namespace,
+    get_embedding_cache,
+)
+
+
+class CountingEmbedder(EmbeddingFunction):
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.calls.append(list(input))
+        return [np.array([float(len(text)), 1.0], dtype=np.float32) for text in input]
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    configure_embedding_cache()
+    yield
+    configure_embedding_cache()
+
+
+def test_repeated_queries_are_embedded_once():
+    inner = CountingEmbedder()
+    embedder = CachedEmbeddingFunction(inner, "test")
+
+    first = embedder.embed_query(["task description"])
+    second = embedder.embed_query(["task description", "another query"])
+
+    assert inner.calls == [["task description"], ["another query"]]
+    assert np.array_equal(first[0], second[0])
+    assert second[1].tolist() == [13.0, 1.0]
+
+
+def test_documents_are_not_cached():
+    inner = CountingEmbedder()
+    embedder = CachedEmbeddingFunction(inner, "test")
+
+    embedder(["stored document"])
+    embedder(["stored document"])
+
+    assert len(inner.calls) == 2
+
+
+def test_cache_is_shared_between_functions_with_the_same_config():
+    config = {"provider": "openai", "config": {"model": "text-embedding-3-small"}}
+    first_inner, second_inner = CountingEmbedder(), CountingEmbedder()
+    first = CachedEmbeddingFunction(first_inner, embedder_namespace(config))
+    second = CachedEmbeddingFunction(second_inner, embedder_namespace(dict(config)))
+    other = CachedEmbeddingFunction(CountingEmbedder(), embedder_namespace(None))
+
+    first.embed_query(["query"])
+    second.embed_query(["query"])
+    other.embed_query(["query"])
+
+    assert second_inner.calls == []
+    assert len(other.embedding_function.calls) == 1
+
+
+def test_disabled_cache_always_embeds():
+    configure_embedding_cache(enabled=False)
+    inner = CountingEmbedder()
+    embedder = CachedEmbeddingFunction(inner, "test")
+
+    embedder.embed_query(["query"])
+    embedder.embed_query(["query"])
+
+    assert len(inner.calls) == 2
+
+
+def test_disk_cache_survives_new_cache_instances(tmp_path):
+    db_path = str(tmp_path / "embeddings.db")
+    EmbeddingCache(db_path=db_path).set("key", [0.5, 0.25])
+
+    cached = EmbeddingCache(db_path=db_path).get("key")
+
+    assert cached.tolist() == [0.5, 0.25]
+
+
+class ConfiguredEmbedder(CountingEmbedder):
+    def __init__(self, model: str = "small"):
+        super().__init__()
+        self.model = model
+
+    def get_config(self):
+        return {"model": self.model}
+
+
+def test_custom_embedders_are_identified_across_runs():
+    def namespace(embedder):
+        return embedder_namespace({"provider": "custom", "config": {"embedder": embedder}})
+
+    assert namespace(ConfiguredEmbedder()) == namespace(ConfiguredEmbedder())
+    assert namespace(ConfiguredEmbedder()) != namespace(ConfiguredEmbedder("large"))
+    assert namespace(ConfiguredEmbedder) == namespace(ConfiguredEmbedder)
+    assert namespace(CountingEmbedder()) is None
+    assert namespace(lambda: CountingEmbedder()) is None
+
+
+def test_unidentified_embedders_are_only_cached_in_memory(tmp_path):
+    configure_embedding_cache(db_path=str(tmp_path / "embeddings.db"))
+    inner = CountingEmbedder()
+    embedder = CachedEmbeddingFunction(inner, None)
+
+    embedder.embed_query(["query"])
+    embedder.embed_query(["query"])
+    CachedEmbeddingFunction(inner, None).embed_query(["query"])
+
+    assert len(inner.calls) == 2
+    assert get_embedding_cache().disk.get(embedder._key("query")) is None
+
+
+def test_configurator_wraps_embedders_with_cache():
+    inner = CountingEmbedder()
+
+    embedder = EmbeddingConfigurator().configure_embedder(
+        {"provider": "custom", "config": {"embedder": inner}}
+    )
+
+    assert isinstance(embedder, CachedEmbeddingFunction)
+    assert embedder.embedding_function is inner
@@ -0,0 +1,123 @@
+import asyncio
+import threading
+from unittest.mock import patch
+
+from crewai.utilities import RPMController
+
+
+def test_no_limits_never_waits():
+    controller = RPMController()
+    with patch.object(RPMController, "_sleep") as wait:
+        for _ in range(100):
+            assert controller.check_or_wait()
+    wait.assert_not_called()
+
+
+def test_waits_exactly_until_oldest_request_leaves_window():
+    controller = RPMController(max_rpm=2)
+    with (
+        patch("crewai.utilities.rpm_controller.time.monotonic") as monotonic,
+        patch.object(RPMController, "_sleep") as wait,
+    ):
+        monotonic.return_value = 100.0
+        controller.check_or_wait()
+        monotonic.return_value = 110.0
+        controller.check_or_wait()
+        wait.assert_not_called()
+
+        monotonic.return_value = 130.0
+        controller.check_or_wait()
+        wait.assert_called_once_with(30.0)
+
+        # The next free slot is the one reserved by the second request.
+        monotonic.return_value = 131.0
+        controller.check_or_wait()
+        assert wait.call_args[0][0] == 39.0
+
+
+def test_slots_free_up_without_background_timer():
+    controller = RPMController(max_rpm=1)
+    with (
+        patch("crewai.utilities.rpm_controller.time.monotonic") as monotonic,
+        patch.object(RPMController, "_sleep") as wait,
+    ):
+        monotonic.return_value = 0.0
+        controller.check_or_wait()
+        monotonic.return_value = 61.0
+        controller.check_or_wait()
+    wait.assert_not_called()
+
+
+def test_waiting_caller_does_not_hold_lock():
+    controller = RPMController(max_rpm=1)
+    controller.check_or_wait()
+    waiting = threading.Event()
+    release = threading.Event()
+
+    def fake_wait(self, seconds):
+        waiting.set()
+        release.wait(timeout=5)
+
+    with patch.object(RPMController, "_sleep", fake_wait):
+        blocked = threading.Thread(target=controller.check_or_wait)
+        blocked.start()
+        assert waiting.wait(timeout=5)
+        assert controller._lock.acquire(timeout=1)
+        controller._lock.release()
+        release.set()
+        blocked.join(timeout=5)
+
+
+def test_token_budget_delays_next_request():
+    controller = RPMController(max_tpm=1000)
+    with (
+        patch("crewai.utilities.rpm_controller.time.monotonic") as monotonic,
+        patch.object(RPMController, "_sleep") as wait,
+    ):
+        monotonic.return_value = 0.0
+        controller.check_or_wait()
+        controller.record_tokens(600)
+        monotonic.return_value = 5.0
+        controller.check_or_wait()
+        controller.record_tokens(600)
+        wait.assert_not_called()
+
+        monotonic.return_value = 10.0
+        controller.check_or_wait()
+        wait.assert_called_once_with(50.0)
+
+
+def test_callers_waiting_for_token_budget_are_spread_out():
+    controller = RPMController(max_tpm=1000)
+    with (
+        patch("crewai.utilities.rpm_controller.time.monotonic") as monotonic,
+        patch.object(RPMController, "_sleep") as wait,
+    ):
+        for now in (0.0, 10.0):
+            monotonic.return_value = now
+            controller.check_or_wait()
+            controller.record_tokens(500)
+
+        monotonic.return_value = 20.0
+        for _ in range(3):
+            controller.check_or_wait()
+
+    # Each waiting caller reserves about 500 tokens of the budget
+    assert [call.args[0] for call in wait.call_args_list] == [40.0, 50.0, 100.0]
+
+
+def test_async_acquire_does_not_block_event_loop():
+    controller = RPMController(max_rpm=1)
+
+    async def run():
+        with patch(
+            "crewai.utilities.rpm_controller.asyncio.sleep"
+        ) as sleep, patch.object(RPMController, "_sleep") as wait:
+            sleep.return_value = None
+            await controller.acquire()
+            await controller.acquire()
+            sleep.assert_called_once()
+            assert 0 < sleep.call_args[0][0] <= 60
+            wait.assert_not_called()
+
+    asyncio.run(run())
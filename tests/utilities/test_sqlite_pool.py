@@ -0,0 +1,78 @@
+import sqlite3
+import threading
+
+import pytest
+
+from crewai.utilities.sqlite_pool import SQLiteBatchWriter, SQLiteConnectionPool, get_pool
+
+
+def test_pool_reuses_one_connection_per_thread(tmp_path):
+    pool = SQLiteConnectionPool(tmp_path / "pool.db")
+    conn = pool.connection()
+    assert pool.connection() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    # NORMAL is 1
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(pool.connection()))
+    thread.start()
+    thread.join()
+    assert other[0] is not conn
+
+    pool.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        pool.connection()
+
+
+def test_get_pool_is_shared_per_database(tmp_path):
+    pool = get_pool(tmp_path / "shared.db")
+    assert get_pool(str(tmp_path / "shared.db")) is pool
+    assert get_pool(tmp_path / "other.db") is not pool
+
+    pool.close()
+    assert get_pool(tmp_path / "shared.db") is not pool
+
+
+def test_pool_transactions_roll_back_on_error(tmp_path):
+    pool = SQLiteConnectionPool(tmp_path / "pool.db")
+    pool.execute("CREATE TABLE items (name TEXT)")
+    pool.executemany("INSERT INTO items VALUES (?)", [("a",), ("b",)])
+
+    with pytest.raises(ValueError):
+        with pool.transaction() as conn:
+            conn.execute("INSERT INTO items VALUES ('c')")
+            raise ValueError("abort")
+
+    assert pool.execute("SELECT name FROM items ORDER BY name") == [("a",), ("b",)]
+
+
+def test_batch_writer_groups_queued_writes(tmp_path):
+    pool = SQLiteConnectionPool(tmp_path / "pool.db")
+    pool.execute("CREATE TABLE items (name TEXT)")
+    writer = SQLiteBatchWriter(pool)
+
+    for index in range(100):
+        writer.write("INSERT INTO items VALUES (?)", (f"item-{index}",))
+    writer.submit(lambda conn: conn.execute("INSERT INTO items VALUES ('last')"))
+    writer.flush()
+
+    rows = pool.execute("SELECT name FROM items ORDER BY rowid")
+    assert len(rows) == 101
+    assert rows[-1] == ("last",)
+
+
+def test_batch_writer_reports_failed_batches(tmp_path):
+    pool = SQLiteConnectionPool(tmp_path / "pool.db")
+    pool.execute("CREATE TABLE items (name TEXT NOT NULL)")
+    errors = []
+    writer = SQLiteBatchWriter(pool, on_error=errors.append)
+
+    writer.write("INSERT INTO missing VALUES (?)", ("a",))
+    with pytest.raises(sqlite3.OperationalError):
+        writer.flush()
+    assert len(errors) == 1
+
+    writer.write("INSERT INTO items VALUES (?)", ("b",))
+    writer.flush()
+    assert pool.execute("SELECT name FROM items") == [("b",)]
@@ -0,0 +1,118 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+from crewai.utilities.agent_utils import summarize_messages
+from crewai.utilities.i18n import I18N
+from crewai.utilities.summarizer import Summarizer
+
+
+def _llm(model: str, delay: float = 0.0) -> MagicMock:
+    llm = MagicMock()
+    llm.model = model
+    llm.get_context_window_size.return_value = 1000
+    active = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def call(messages, callbacks=None):
+        with lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        time.sleep(delay)
+        with lock:
+            active["now"] -= 1
+        return f"summary of {len(messages[1]['content'])} chars"
+
+    llm.call.side_effect = call
+    llm.active = active
+    return llm
+
+
+def test_chunks_are_split_by_tokens_with_overlap():
+    summarizer = Summarizer(_llm("split"), chunk_tokens=100, overlap_tokens=10)
+    words = " ".join(f"word{index}" for index in range(200))
+
+    chunks = summarizer.split([words])
+
+    assert len(chunks) > 1
+    assert all(summarizer.tokenizer(chunk) <= 100 for chunk in chunks)
+    for previous, chunk in zip(chunks, chunks[1:]):
+        overlap = chunk.split("\n")[0]
+        assert overlap and previous.endswith(overlap)
+
+
+def test_small_texts_are_kept_whole_in_a_chunk():
+    summarizer = Summarizer(_llm("whole"), chunk_tokens=100, overlap_tokens=0)
+
+    assert summarizer.split(["first", "second"]) == ["first\nsecond"]
+
+
+def test_chunks_are_summarized_concurrently():
+    llm = _llm("concurrent", delay=0.05)
+    summarizer = Summarizer(llm, chunk_tokens=50, overlap_tokens=0, max_workers=3)
+
+    summary = summarizer.summarize(["x" * 120] * 6)
+
+    assert llm.call.call_count == 6
+    assert llm.active["max"] == 3
+    assert summary.startswith("summary of")
+
+
+def test_summaries_too_long_together_are_reduced_again():
+    llm = _llm("reduce")
+    summarizer = Summarizer(
+        llm, chunk_tokens=20, overlap_tokens=0, tokenizer=lambda text: len(text) // 2
+    )
+
+    summary = summarizer.summarize(["x" * 40] * 4)
+
+    assert llm.call.call_count == 6
+    assert summarizer.tokenizer(summary) <= 20
+
+
+def test_summaries_of_already_summarized_prefixes_are_reused():
+    llm = _llm("prefix")
+    transcript = ["y" * 150 for _ in range(4)]
+    Summarizer(llm, chunk_tokens=60, overlap_tokens=0).summarize(transcript)
+    calls = llm.call.call_count
+
+    Summarizer(llm, chunk_tokens=60, overlap_tokens=0).summarize(
+        transcript + ["z" * 150]
+    )
+
+    assert llm.call.call_count == calls + 1
+
+
+def test_summarize_messages_replaces_messages_with_summary():
+    llm = _llm("messages")
+    messages = [
+        {"role": "system", "content": "You are a researcher."},
+        {"role": "user", "content": "Find out everything about AI."},
+    ]
+
+    summarize_messages(messages, llm, [], I18N())
+
+    prompt = llm.call.call_args[0][0][1]["content"]
+    assert "You are a researcher.\nFind out everything about AI." in prompt
+    assert messages == [
+        {
+            "role": "user",
+            "content": "This is a summary of our conversation so far:\n"
+            f"summary of {len(prompt)} chars",
+        }
+    ]
+
+
+def test_every_summarization_call_waits_for_the_rate_limit():
+    llm = _llm("rate-limited")
+    request_within_rpm_limit = MagicMock(return_value=True)
+    summarizer = Summarizer(
+        llm,
+        chunk_tokens=50,
+        overlap_tokens=0,
+        request_within_rpm_limit=request_within_rpm_limit,
+    )
+
+    summarizer.summarize(["z" * 120] * 3)
+
+    assert request_within_rpm_limit.call_count == llm.call.call_count == 3